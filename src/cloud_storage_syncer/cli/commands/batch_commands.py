@@ -0,0 +1,90 @@
+"""Batch commands for the CLI."""
+
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from ...core.bandwidth import BandwidthLimiter, parse_size
+from ...services import BatchService, ConfigService, S3Service
+
+app = typer.Typer()
+
+
+@app.command()
+def run(
+    manifest: Annotated[
+        str, typer.Argument(help="JSONL manifest path, or '-' to read stdin")
+    ],
+    workers: Annotated[
+        int, typer.Option("--workers", "-w", help="Concurrent operations", min=1)
+    ] = 8,
+    max_rate: Annotated[
+        float | None,
+        typer.Option("--max-rate", help="Maximum operations started per second"),
+    ] = None,
+    max_bandwidth: Annotated[
+        str | None,
+        typer.Option(help="Maximum total transfer rate in bytes/s, e.g. 10M"),
+    ] = None,
+    config_path: Annotated[Path | None, typer.Option(help="Config file path")] = None,
+):
+    """Run upload/download/delete operations from a JSONL manifest.
+
+    Each manifest line is a JSON object such as
+    {"op": "upload", "local_path": "a.txt", "s3_key": "docs/a.txt"}.
+    One JSON result per line is written to stdout as operations finish.
+    """
+    # Load configuration
+    config_service = ConfigService(config_path)
+    config = config_service.load_config()
+
+    if not config:
+        typer.echo("❌ No configuration found. Run 'config setup' first.", err=True)
+        raise typer.Exit(1)
+
+    if manifest != "-" and not Path(manifest).is_file():
+        typer.echo(f"❌ Manifest not found: {manifest}", err=True)
+        raise typer.Exit(1)
+
+    bandwidth_limiter = None
+    if max_bandwidth:
+        try:
+            bandwidth_limiter = BandwidthLimiter(parse_size(max_bandwidth))
+        except ValueError as e:
+            typer.echo(f"❌ {e}", err=True)
+            raise typer.Exit(1) from e
+
+    # One in-process service so every worker shares the same connection pool
+    s3_service = S3Service(
+        config,
+        max_pool_connections=max(workers, 10),
+        bandwidth_limiter=bandwidth_limiter,
+    )
+    batch_service = BatchService(s3_service, max_workers=workers, max_rate=max_rate)
+
+    success_count = 0
+    failed_count = 0
+
+    stream = sys.stdin if manifest == "-" else open(manifest, encoding="utf-8")
+    try:
+        for result in batch_service.run(stream):
+            typer.echo(json.dumps(asdict(result)))
+            if result.success:
+                success_count += 1
+            else:
+                failed_count += 1
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+    # Summary goes to stderr so stdout stays valid JSONL
+    typer.echo("\n📊 Batch Summary:", err=True)
+    typer.echo(f"   ✅ Successful: {success_count}", err=True)
+    typer.echo(f"   ❌ Failed: {failed_count}", err=True)
+
+    if failed_count:
+        raise typer.Exit(1)
@@ -61,7 +61,10 @@ def setup(
 
     # Save configuration
     if config_service.save_config(config):
-        typer.echo(f"✅ Configuration saved to {config_service.config_path}")
+        typer.echo(
+            f"✅ Configuration saved to {config_service.config_path} "
+            f"(profile: {config_service.profile})"
+        )
     else:
         typer.echo("❌ Failed to save configuration", err=True)
         raise typer.Exit(1)
@@ -80,12 +83,32 @@ def show(
         raise typer.Exit(1)
 
     typer.echo("📋 Current S3 Configuration:")
+    typer.echo(f"   Profile: {config_service.profile}")
     typer.echo(f"   Access Key: {config.access_key[:8]}...")
     typer.echo(f"   Bucket: {config.bucket}")
     typer.echo(f"   Region: {config.region}")
     typer.echo(f"   Config file: {config_service.config_path}")
 
 
+@app.command()
+def profiles(
+    config_path: Annotated[Path | None, typer.Option(help="Config file path")] = None,
+):
+    """List configured profiles."""
+    config_service = ConfigService(config_path)
+    names = config_service.list_profiles()
+
+    if not names:
+        typer.echo("❌ No configuration found. Run 'config setup' first.", err=True)
+        raise typer.Exit(1)
+
+    typer.echo("📋 Profiles:")
+    for name in names:
+        config = ConfigService(config_path, name).load_config()
+        marker = "*" if name == config_service.profile else " "
+        typer.echo(f" {marker} {name:<20} {config.bucket} ({config.region})")
+
+
 @app.command()
 def test(
     config_path: Annotated[Path | None, typer.Option(help="Config file path")] = None,
@@ -0,0 +1,109 @@
+"""Copy commands for the CLI."""
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from ...models import KeyKind, S3StorageClass
+from ...services import ConfigService, S3Service
+
+app = typer.Typer()
+
+
+def copy_or_move(
+    source: str,
+    destination: str,
+    storage_class: S3StorageClass | None,
+    workers: int,
+    config_path: Path | None,
+    move: bool,
+):
+    """Copy or move a file or directory prefix server-side and report results."""
+    # Load configuration
+    config_service = ConfigService(config_path)
+    config = config_service.load_config()
+
+    if not config:
+        typer.echo("❌ No configuration found. Run 'config setup' first.", err=True)
+        raise typer.Exit(1)
+
+    if move and source.rstrip("/") == destination.rstrip("/"):
+        typer.echo("❌ Source and destination are the same", err=True)
+        raise typer.Exit(1)
+
+    verb, done = ("Moving", "moved") if move else ("Copying", "copied")
+    s3_service = S3Service(config, max_pool_connections=max(workers, 10))
+
+    # Determine if it's a single file or directory (one HEAD + one LIST)
+    try:
+        kind = s3_service.resolve_key(source)
+    except Exception as e:
+        typer.echo(f"❌ Failed to look up s3://{config.bucket}/{source}: {e}", err=True)
+        raise typer.Exit(1) from e
+
+    if kind == KeyKind.OBJECT:
+        typer.echo(
+            f"📋 {verb} s3://{config.bucket}/{source} to "
+            f"s3://{config.bucket}/{destination}"
+        )
+        transfer = s3_service.move_file if move else s3_service.copy_file
+        result = transfer(source, destination, storage_class)
+
+        if result.success:
+            typer.echo(f"✅ File {done} successfully!")
+            typer.echo(f"   🗂️  S3 Key: {result.dest_key}")
+        else:
+            typer.echo(f"❌ Failed: {result.error_message}", err=True)
+            raise typer.Exit(1)
+
+    elif kind.is_directory:
+        typer.echo(
+            f"📂 {verb} directory s3://{config.bucket}/{source.rstrip('/')}/ to "
+            f"s3://{config.bucket}/{destination.rstrip('/')}/"
+        )
+        transfer = s3_service.move_directory if move else s3_service.copy_directory
+        try:
+            results = transfer(source, destination, storage_class, workers)
+        except ValueError as e:
+            typer.echo(f"❌ {e}", err=True)
+            raise typer.Exit(1) from e
+
+        successful = sum(1 for r in results if r.success)
+        failed = len(results) - successful
+
+        if failed == 0:
+            typer.echo(f"✅ Directory {done} successfully!")
+            typer.echo(f"   📋 {successful} files {done}")
+        else:
+            typer.echo("⚠️  Completed with errors:")
+            typer.echo(f"   ✅ Successful: {successful}")
+            typer.echo(f"   ❌ Failed: {failed}")
+
+            for result in results:
+                if not result.success:
+                    typer.echo(f"   ❌ {result.source_key}: {result.error_message}")
+
+            raise typer.Exit(1)
+    else:
+        typer.echo(
+            f"❌ No files found matching: s3://{config.bucket}/{source}", err=True
+        )
+        raise typer.Exit(1)
+
+
+@app.command()
+def file(
+    source: Annotated[str, typer.Argument(help="S3 key or directory prefix to copy")],
+    destination: Annotated[str, typer.Argument(help="Destination S3 key or prefix")],
+    storage_class: Annotated[
+        S3StorageClass | None,
+        typer.Option(help="Storage class of the copies (default: keep the source's)"),
+    ] = None,
+    workers: Annotated[
+        int, typer.Option(help="Concurrent copies for directories", min=1)
+    ] = 8,
+    config_path: Annotated[Path | None, typer.Option(help="Config file path")] = None,
+):
+    """Copy a file or directory within the bucket without downloading it."""
+    copy_or_move(source, destination, storage_class, workers, config_path, move=False)
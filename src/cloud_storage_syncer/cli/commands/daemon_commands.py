@@ -0,0 +1,118 @@
+"""Daemon commands for the CLI."""
+
+import logging
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from ...core.bandwidth import BandwidthLimiter, parse_size
+from ...services import ConfigService, DaemonServer, S3Service
+from ...services.daemon_service import DaemonClient, DaemonError, default_socket_path
+
+app = typer.Typer()
+
+
+@app.command()
+def start(
+    socket_path: Annotated[
+        Path | None, typer.Option(help="Unix socket path for the daemon")
+    ] = None,
+    pool_size: Annotated[
+        int, typer.Option(help="Maximum pooled S3 connections")
+    ] = 32,
+    max_bandwidth: Annotated[
+        str | None,
+        typer.Option(help="Maximum total transfer rate in bytes/s, e.g. 10M"),
+    ] = None,
+    config_path: Annotated[Path | None, typer.Option(help="Config file path")] = None,
+):
+    """Run the daemon in the foreground, serving CLI calls over a Unix socket."""
+    config_service = ConfigService(config_path)
+    config = config_service.load_config()
+
+    if not config:
+        typer.echo("❌ No configuration found. Run 'config setup' first.", err=True)
+        raise typer.Exit(1)
+
+    logging.basicConfig(level=logging.INFO)
+
+    bandwidth_limiter = None
+    if max_bandwidth:
+        try:
+            bandwidth_limiter = BandwidthLimiter(parse_size(max_bandwidth))
+        except ValueError as e:
+            typer.echo(f"❌ {e}", err=True)
+            raise typer.Exit(1) from e
+
+    s3_service = S3Service(
+        config, max_pool_connections=pool_size, bandwidth_limiter=bandwidth_limiter
+    )
+
+    # Warm up the client and the first TLS connection before accepting calls
+    if not s3_service.test_connection():
+        typer.echo(
+            "❌ Failed to connect to S3. Please check your configuration.", err=True
+        )
+        raise typer.Exit(1)
+
+    try:
+        server = DaemonServer(s3_service, socket_path)
+    except DaemonError as e:
+        typer.echo(f"❌ {e}", err=True)
+        raise typer.Exit(1) from e
+
+    typer.echo(f"🚀 Daemon serving s3://{config.bucket} on {server.socket_path}")
+    typer.echo("   Press Ctrl+C to stop")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+    typer.echo("👋 Daemon stopped")
+
+
+@app.command()
+def status(
+    socket_path: Annotated[
+        Path | None, typer.Option(help="Unix socket path for the daemon")
+    ] = None,
+):
+    """Show whether the daemon is running."""
+    socket_path = socket_path or default_socket_path()
+
+    try:
+        client = DaemonClient(socket_path, timeout=2.0)
+        info = client.call("ping")
+        client.close()
+    except DaemonError:
+        typer.echo(f"⏹️  Daemon is not running ({socket_path})")
+        raise typer.Exit(1) from None
+
+    typer.echo("✅ Daemon is running")
+    typer.echo(f"   🆔 PID: {info['pid']}")
+    typer.echo(f"   🪣 Bucket: {info['bucket']}")
+    typer.echo(f"   🔌 Socket: {socket_path}")
+
+
+@app.command()
+def stop(
+    socket_path: Annotated[
+        Path | None, typer.Option(help="Unix socket path for the daemon")
+    ] = None,
+):
+    """Stop a running daemon."""
+    socket_path = socket_path or default_socket_path()
+
+    try:
+        client = DaemonClient(socket_path, timeout=2.0)
+        client.call("shutdown")
+        client.close()
+    except DaemonError:
+        typer.echo(f"❌ Daemon is not running ({socket_path})", err=True)
+        raise typer.Exit(1) from None
+
+    typer.echo("✅ Daemon stopped")
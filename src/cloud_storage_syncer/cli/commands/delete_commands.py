@@ -1,11 +1,16 @@
 """Delete commands for the CLI."""
 
+import time
 from pathlib import Path
 from typing import Annotated
 
 import typer
 
-from ...services import ConfigService, S3Service
+from ...models import KeyKind
+from ...services import ConfigService, create_s3_service
+from ...services.plan_service import PlanService
+from ...services.throughput_history import ThroughputHistory
+from ..plan_output import echo_plan
 
 app = typer.Typer()
 
@@ -19,6 +24,13 @@ def file(
         bool,
         typer.Option("--force", "-f", help="Force deletion without additional checks"),
     ] = False,
+    dry_run: Annotated[
+        bool,
+        typer.Option(
+            "--dry-run",
+            help="Show files, requests and estimated time without deleting",
+        ),
+    ] = False,
     config_path: Annotated[Path | None, typer.Option(help="Config file path")] = None,
 ):
     """Delete a file or directory from S3."""
@@ -30,22 +42,36 @@ def file(
         typer.echo("❌ No configuration found. Run 'config setup' first.", err=True)
         raise typer.Exit(1)
 
-    s3_service = S3Service(config)
-
-    # Check if this is a directory by listing objects with the prefix
-    objects = s3_service.list_objects(prefix=s3_key)
-
-    # Determine if it's a single file or directory
-    exact_match = any(obj["key"] == s3_key for obj in objects)
-    has_children = any(obj["key"].startswith(s3_key + "/") for obj in objects)
-
-    if exact_match and not has_children:
+    s3_service = create_s3_service(config, use_daemon=not dry_run)
+
+    # Determine if it's a single file or directory (one HEAD + one LIST)
+    try:
+        kind = s3_service.resolve_key(s3_key)
+    except Exception as e:
+        typer.echo(f"❌ Failed to look up s3://{config.bucket}/{s3_key}: {e}", err=True)
+        raise typer.Exit(1) from e
+
+    history = ThroughputHistory()
+    if dry_run and kind != KeyKind.NONE:
+        location = f"s3://{config.bucket}/{s3_key}"
+        typer.echo(f"🔍 Planning delete of {location}")
+        try:
+            plan = PlanService(s3_service).plan_delete(s3_key, kind.is_directory)
+        except Exception as e:
+            typer.echo(f"❌ Failed to list {location}: {e}", err=True)
+            raise typer.Exit(1) from e
+        echo_plan(plan, history)
+        return
+
+    started = time.monotonic()
+    if kind == KeyKind.OBJECT:
         # Single file delete
         typer.echo(f"🗑️  Deleting s3://{config.bucket}/{s3_key}")
 
         result = s3_service.delete_file(s3_key)
 
         if result.success:
+            history.record("delete", 1, 0, time.monotonic() - started)
             if result.existed_before_delete:
                 typer.echo("✅ File deleted successfully!")
             else:
@@ -55,7 +81,7 @@ def file(
             typer.echo(f"❌ Delete failed: {result.error_message}", err=True)
             raise typer.Exit(1)
 
-    elif has_children or (objects and not exact_match):
+    elif kind.is_directory:
         # Directory delete
         typer.echo(f"🗑️  Deleting directory s3://{config.bucket}/{s3_key}/")
 
@@ -69,6 +95,7 @@ def file(
             for r in results
             if r.success and getattr(r, "existed_before_delete", True)
         )
+        history.record("delete", successful, 0, time.monotonic() - started)
 
         if failed == 0:
             typer.echo("✅ Directory delete successful!")
@@ -1,12 +1,18 @@
 """Download commands for the CLI."""
 
+import time
 from pathlib import Path
 from typing import Annotated
 
 import typer
 
-from ...models import DownloadRequest
-from ...services import ConfigService, S3Service
+from ...core.bandwidth import parse_size
+from ...models import DownloadRequest, KeyKind, TransferPlan
+from ...services import ConfigService, create_s3_service
+from ...services.pack_service import PackService
+from ...services.plan_service import PlanService
+from ...services.throughput_history import ThroughputHistory
+from ..plan_output import echo_plan
 
 app = typer.Typer()
 
@@ -25,6 +31,17 @@ def file(
     force: Annotated[
         bool, typer.Option("--force", help="Overwrite existing files")
     ] = False,
+    max_bandwidth: Annotated[
+        str | None,
+        typer.Option(help="Maximum total transfer rate in bytes/s, e.g. 10M"),
+    ] = None,
+    dry_run: Annotated[
+        bool,
+        typer.Option(
+            "--dry-run",
+            help="Show files, bytes, requests and estimated time without downloading",
+        ),
+    ] = False,
     config_path: Annotated[Path | None, typer.Option(help="Config file path")] = None,
 ):
     """Download a file or directory from S3."""
@@ -36,19 +53,35 @@ def file(
         typer.echo("❌ No configuration found. Run 'config setup' first.", err=True)
         raise typer.Exit(1)
 
-    s3_service = S3Service(config)
-
-    # Check if this is a directory by listing objects with the prefix
-    objects = s3_service.list_objects(prefix=s3_key)
-
-    # Determine if it's a single file or directory
-    exact_match = any(obj["key"] == s3_key for obj in objects)
-    has_children = any(obj["key"].startswith(s3_key + "/") for obj in objects)
-
-    if exact_match and not has_children:
+    try:
+        s3_service = create_s3_service(
+            config, max_bandwidth=max_bandwidth, use_daemon=not dry_run
+        )
+        bandwidth = parse_size(max_bandwidth) if max_bandwidth else None
+    except ValueError as e:
+        typer.echo(f"❌ {e}", err=True)
+        raise typer.Exit(1) from e
+
+    # Determine if it's a single file or directory (one HEAD + one LIST)
+    try:
+        kind = s3_service.resolve_key(s3_key)
+    except Exception as e:
+        typer.echo(f"❌ Failed to look up s3://{config.bucket}/{s3_key}: {e}", err=True)
+        raise typer.Exit(1) from e
+
+    history = ThroughputHistory()
+    started = time.monotonic()
+
+    if kind == KeyKind.OBJECT:
         # Single file download
         request = DownloadRequest(s3_key=s3_key, output_path=output_path, force=force)
 
+        if dry_run:
+            typer.echo(f"🔍 Planning download of s3://{config.bucket}/{s3_key}")
+            plan = PlanService(s3_service).plan_download_file(request)
+            echo_plan(plan, history, bandwidth)
+            return
+
         typer.echo(f"📥 Downloading s3://{config.bucket}/{s3_key}")
         if output_path:
             typer.echo(f"   📍 Target: {output_path}")
@@ -56,6 +89,9 @@ def file(
         result = s3_service.download_file(request)
 
         if result.success:
+            history.record(
+                "download", 1, result.file_size or 0, time.monotonic() - started
+            )
             typer.echo("✅ Download successful!")
             typer.echo(f"   📄 File: {result.local_path}")
             if result.file_size:
@@ -74,7 +110,7 @@ def file(
             typer.echo(f"❌ Download failed: {result.error_message}", err=True)
             raise typer.Exit(1)
 
-    elif has_children or (objects and not exact_match):
+    elif kind.is_directory:
         # Directory download
         if output_path:
             local_dir = Path(output_path)
@@ -83,15 +119,40 @@ def file(
             dir_name = s3_key.rstrip("/").split("/")[-1] or "download"
             local_dir = Path.cwd() / dir_name
 
+        if dry_run:
+            typer.echo(f"🔍 Planning download of s3://{config.bucket}/{s3_key}/")
+            try:
+                plan = PlanService(s3_service).plan_download_directory(
+                    s3_key, local_dir, force
+                )
+            except Exception as e:
+                typer.echo(
+                    f"❌ Failed to list s3://{config.bucket}/{s3_key}: {e}", err=True
+                )
+                raise typer.Exit(1) from e
+            echo_plan(plan, history, bandwidth)
+            return
+
         typer.echo(
             f"📂 Downloading directory s3://{config.bucket}/{s3_key}/ to {local_dir}/"
         )
 
-        results = s3_service.download_directory(s3_key, local_dir, force)
+        # Packed files are written out as regular files, which needs the
+        # S3 client itself rather than the daemon
+        pack_service = PackService(
+            create_s3_service(config, max_bandwidth=max_bandwidth, use_daemon=False)
+        )
+        results = pack_service.download_directory(s3_key, local_dir, force)
 
         # Count results
         successful = sum(1 for r in results if r.success)
         failed = sum(1 for r in results if not r.success)
+        history.record(
+            "download",
+            successful,
+            sum(r.file_size or 0 for r in results if r.success),
+            time.monotonic() - started,
+        )
 
         if failed == 0:
             typer.echo("✅ Directory download successful!")
@@ -109,7 +170,39 @@ def file(
             if successful == 0:
                 raise typer.Exit(1)
     else:
-        typer.echo(
-            f"❌ No files found matching: s3://{config.bucket}/{s3_key}", err=True
+        # Not a regular object or prefix; it may live inside a small-file pack
+        pack_service = PackService(
+            create_s3_service(config, max_bandwidth=max_bandwidth, use_daemon=False)
         )
-        raise typer.Exit(1)
+        member = pack_service.find_member(s3_key)
+
+        if not member:
+            typer.echo(
+                f"❌ No files found matching: s3://{config.bucket}/{s3_key}", err=True
+            )
+            raise typer.Exit(1)
+
+        local_path = DownloadRequest(
+            s3_key=s3_key, output_path=output_path, force=force
+        ).get_local_path()
+
+        if dry_run:
+            # One ranged GET of the member's bytes
+            plan = TransferPlan("download", objects=1, total_bytes=member.size)
+            plan.count("GetObject")
+            typer.echo(f"🔍 Planning download of s3://{config.bucket}/{s3_key}")
+            typer.echo(f"   📦 From pack: {member.pack_key}")
+            echo_plan(plan, history, bandwidth)
+            return
+
+        typer.echo(f"📥 Downloading s3://{config.bucket}/{s3_key}")
+        typer.echo(f"   📦 From pack: {member.pack_key}")
+
+        result = pack_service.download_member(member, local_path, force)
+
+        if result.success:
+            typer.echo("✅ Download successful!")
+            typer.echo(f"   📄 File: {result.local_path}")
+        else:
+            typer.echo(f"❌ Download failed: {result.error_message}", err=True)
+            raise typer.Exit(1)
@@ -0,0 +1,76 @@
+"""S3 event notification commands for the CLI."""
+
+import logging
+import threading
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from ...services import ConfigService
+from ...services.caching_s3_service import CachingS3Service
+from ...services.event_consumer import S3EventConsumer, create_sqs_client
+from ...services.shared_cache import MemoryCache, open_shared_cache
+
+app = typer.Typer()
+
+
+@app.command()
+def consume(
+    queue_url: Annotated[
+        str, typer.Argument(help="URL of the SQS queue the bucket notifies")
+    ],
+    cache_url: Annotated[
+        str,
+        typer.Option(
+            help="Shared web cache to keep fresh (sqlite:///... or redis://...)",
+            envvar="SHARED_CACHE_URL",
+        ),
+    ],
+    endpoint_url: Annotated[
+        str | None,
+        typer.Option(help="SQS-compatible endpoint, e.g. http://localhost:9324"),
+    ] = None,
+    config_path: Annotated[Path | None, typer.Option(help="Config file path")] = None,
+):
+    """Apply S3 event notifications to the shared web cache in the foreground.
+
+    Uploads, deletes and restores made by any client show up in the web API's
+    cached listings as soon as their events arrive.
+    """
+    # Load configuration
+    config_service = ConfigService(config_path)
+    config = config_service.load_config()
+
+    if not config:
+        typer.echo("❌ No configuration found. Run 'config setup' first.", err=True)
+        raise typer.Exit(1)
+
+    try:
+        cache = open_shared_cache(cache_url)
+    except ValueError as e:
+        typer.echo(f"❌ {e}", err=True)
+        raise typer.Exit(1) from e
+    if isinstance(cache, MemoryCache):
+        typer.echo(
+            "❌ A memory cache is private to one process; use sqlite:// or redis://",
+            err=True,
+        )
+        raise typer.Exit(1)
+
+    logging.basicConfig(level=logging.INFO)
+
+    s3_service = CachingS3Service(config, cache)
+    consumer = S3EventConsumer(
+        s3_service, queue_url, create_sqs_client(config, endpoint_url)
+    )
+
+    typer.echo(f"📬 Applying events for s3://{config.bucket} from {queue_url}")
+    typer.echo("   Press Ctrl+C to stop")
+
+    try:
+        consumer.run(threading.Event())
+    except KeyboardInterrupt:
+        pass
+
+    typer.echo("👋 Consumer stopped")
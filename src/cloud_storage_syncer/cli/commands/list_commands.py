@@ -1,11 +1,14 @@
 """List commands for the CLI."""
 
+from functools import partial
 from pathlib import Path
 from typing import Annotated
 
 import typer
 
-from ...services import ConfigService, S3Service
+from ...services import ConfigService, create_s3_service
+from ...services.pack_service import PackService
+from ..inventory_source import is_local_inventory, open_inventory
 
 app = typer.Typer()
 
@@ -20,6 +23,9 @@ def files(
     show_details: Annotated[
         bool, typer.Option("--details", help="Show detailed information")
     ] = False,
+    show_packs: Annotated[
+        bool, typer.Option("--packs", help="List files stored inside packs")
+    ] = False,
 ):
     """List files in S3 bucket."""
     # Load configuration
@@ -35,9 +41,12 @@ def files(
     if prefix:
         typer.echo(f"   🔍 Filter: {prefix}*")
 
-    s3_service = S3Service(config)
+    s3_service = create_s3_service(config, use_daemon=not show_packs)
     objects = s3_service.list_objects(prefix=prefix, max_keys=max_count)
 
+    if show_packs:
+        objects = PackService(s3_service).expand_listing(objects, prefix or "")
+
     if not objects:
         typer.echo("📭 No files found.")
         return
@@ -54,47 +63,55 @@ def files(
         typer.echo("─" * 90)
 
         for obj in objects:
-            size_mb = obj["size"] / (1024 * 1024)
+            size_mb = obj.size / (1024 * 1024)
             if size_mb >= 1:
                 size_str = f"{size_mb:.1f} MB"
             else:
-                size_kb = obj["size"] / 1024
+                size_kb = obj.size / 1024
                 if size_kb >= 1:
                     size_str = f"{size_kb:.1f} KB"
                 else:
-                    size_str = f"{obj['size']} B"
+                    size_str = f"{obj.size} B"
 
-            modified_str = obj["last_modified"].strftime("%Y-%m-%d %H:%M")
+            modified_str = obj.last_modified.strftime("%Y-%m-%d %H:%M")
 
             typer.echo(
-                f"{obj['key']:<35} {size_str:>10} {modified_str:>16} "
-                f"{obj['storage_class']:>15}"
+                f"{obj.key:<35} {size_str:>10} {modified_str:>16} "
+                f"{obj.storage_class:>15}"
             )
     else:
         # Simple view
         for obj in objects:
-            size_mb = obj["size"] / (1024 * 1024)
+            size_mb = obj.size / (1024 * 1024)
             if size_mb >= 1:
                 size_str = f"({size_mb:.1f} MB)"
             else:
-                size_kb = obj["size"] / 1024
+                size_kb = obj.size / 1024
                 if size_kb >= 1:
                     size_str = f"({size_kb:.1f} KB)"
                 else:
-                    size_str = f"({obj['size']} B)"
+                    size_str = f"({obj.size} B)"
 
-            storage_class = obj["storage_class"]
+            storage_class = obj.storage_class
             if storage_class != "STANDARD":
                 storage_info = f" [{storage_class}]"
             else:
                 storage_info = ""
 
-            typer.echo(f"📄 {obj['key']} {size_str}{storage_info}")
+            pack_info = " [packed]" if obj.pack_key else ""
+            typer.echo(f"📄 {obj.key} {size_str}{storage_info}{pack_info}")
 
 
 @app.command()
 def storage_summary(
     prefix: Annotated[str | None, typer.Option(help="Prefix to filter files")] = "",
+    inventory: Annotated[
+        str | None,
+        typer.Option(
+            help="S3 Inventory manifest or its prefix (local path or s3:// URI) "
+            "to read instead of listing the bucket"
+        ),
+    ] = None,
     config_path: Annotated[Path | None, typer.Option(help="Config file path")] = None,
 ):
     """Show storage class summary for files in S3 bucket."""
@@ -102,41 +119,52 @@ def storage_summary(
     config_service = ConfigService(config_path)
     config = config_service.load_config()
 
-    if not config:
+    if not config and not is_local_inventory(inventory):
         typer.echo("❌ No configuration found. Run 'config setup' first.", err=True)
         raise typer.Exit(1)
 
-    # Create S3 service and list objects
-    typer.echo(f"📊 Storage summary for s3://{config.bucket}")
+    if inventory:
+        # Stream the snapshot; nothing is listed from the live bucket
+        inventory_service, _, location = open_inventory(inventory, config)
+        objects = inventory_service.iter_objects(location, prefix=prefix or "")
+    else:
+        # Create S3 service and list objects
+        typer.echo(f"📊 Storage summary for s3://{config.bucket}")
+        s3_service = create_s3_service(config)
+        objects = s3_service.list_objects(
+            prefix=prefix, max_keys=10000
+        )  # Get more for summary
+
     if prefix:
         typer.echo(f"   🔍 Filter: {prefix}*")
 
-    s3_service = S3Service(config)
-    objects = s3_service.list_objects(
-        prefix=prefix, max_keys=10000
-    )  # Get more for summary
-
-    if not objects:
-        typer.echo("📭 No files found.")
-        return
-
     # Calculate storage class statistics
     storage_stats = {}
     total_size = 0
+    total_count = 0
+
+    try:
+        for obj in objects:
+            storage_class = obj.storage_class
+            size = obj.size
+            total_size += size
+            total_count += 1
 
-    for obj in objects:
-        storage_class = obj["storage_class"]
-        size = obj["size"]
-        total_size += size
+            if storage_class not in storage_stats:
+                storage_stats[storage_class] = {"count": 0, "size": 0}
 
-        if storage_class not in storage_stats:
-            storage_stats[storage_class] = {"count": 0, "size": 0}
+            storage_stats[storage_class]["count"] += 1
+            storage_stats[storage_class]["size"] += size
+    except ValueError as e:
+        typer.echo(f"❌ {e}", err=True)
+        raise typer.Exit(1) from e
 
-        storage_stats[storage_class]["count"] += 1
-        storage_stats[storage_class]["size"] += size
+    if not total_count:
+        typer.echo("📭 No files found.")
+        return
 
     typer.echo()
-    typer.echo(f"📈 Total files: {len(objects)}")
+    typer.echo(f"📈 Total files: {total_count}")
 
     # Better size formatting
     if total_size >= 1024 * 1024 * 1024:  # GB
@@ -177,7 +205,29 @@ def storage_summary(
 
 @app.command()
 def search(
-    pattern: Annotated[str, typer.Argument(help="Search pattern for file names")],
+    pattern: Annotated[
+        str,
+        typer.Argument(
+            help="Search pattern: substring, glob such as 'photos/*.jpg', or regex"
+        ),
+    ],
+    regex: Annotated[
+        bool, typer.Option("--regex", help="Treat the pattern as a regex")
+    ] = False,
+    ignore_case: Annotated[
+        bool, typer.Option("--ignore-case", "-i", help="Case-insensitive matching")
+    ] = False,
+    prefix: Annotated[str, typer.Option(help="Prefix to limit search scope")] = "",
+    max_count: Annotated[
+        int, typer.Option("--max", help="Maximum number of matches to show")
+    ] = 1000,
+    inventory: Annotated[
+        str | None,
+        typer.Option(
+            help="S3 Inventory manifest or its prefix (local path or s3:// URI) "
+            "to search instead of listing the bucket"
+        ),
+    ] = None,
     config_path: Annotated[Path | None, typer.Option(help="Config file path")] = None,
 ):
     """Search for files by name pattern."""
@@ -185,20 +235,32 @@ def search(
     config_service = ConfigService(config_path)
     config = config_service.load_config()
 
-    if not config:
+    if not config and not is_local_inventory(inventory):
         typer.echo("❌ No configuration found. Run 'config setup' first.", err=True)
         raise typer.Exit(1)
 
-    # Create S3 service and list objects
-    typer.echo(f"🔍 Searching for files matching '{pattern}' in s3://{config.bucket}")
-
-    s3_service = S3Service(config)
-    all_objects = s3_service.list_objects(max_keys=10000)
-
-    # Filter objects by pattern
-    matching_objects = [
-        obj for obj in all_objects if pattern.lower() in obj["key"].lower()
-    ]
+    if inventory:
+        inventory_service, _, location = open_inventory(inventory, config)
+        search_objects = partial(inventory_service.search_objects, location)
+        typer.echo(f"🔍 Searching for files matching '{pattern}' in the inventory")
+    else:
+        # Create S3 service and list objects
+        typer.echo(
+            f"🔍 Searching for files matching '{pattern}' in s3://{config.bucket}"
+        )
+        search_objects = create_s3_service(config).search_objects
+
+    try:
+        matching_objects = search_objects(
+            pattern,
+            mode="regex" if regex else "auto",
+            ignore_case=ignore_case,
+            prefix=prefix,
+            max_results=max_count,
+        )
+    except ValueError as e:
+        typer.echo(f"❌ {e}", err=True)
+        raise typer.Exit(1) from e
 
     if not matching_objects:
         typer.echo(f"📭 No files found matching '{pattern}'.")
@@ -208,21 +270,21 @@ def search(
     typer.echo()
 
     for obj in matching_objects:
-        size_mb = obj["size"] / (1024 * 1024)
+        size_mb = obj.size / (1024 * 1024)
         if size_mb >= 1:
             size_str = f"({size_mb:.1f} MB)"
         else:
-            size_kb = obj["size"] / 1024
+            size_kb = obj.size / 1024
             if size_kb >= 1:
                 size_str = f"({size_kb:.1f} KB)"
             else:
-                size_str = f"({obj['size']} B)"
+                size_str = f"({obj.size} B)"
 
-        storage_class = obj["storage_class"]
+        storage_class = obj.storage_class
         if storage_class != "STANDARD":
             storage_info = f" [{storage_class}]"
         else:
             storage_info = ""
 
-        modified_str = obj["last_modified"].strftime("%Y-%m-%d %H:%M")
-        typer.echo(f"📄 {obj['key']} {size_str}{storage_info} - {modified_str}")
+        modified_str = obj.last_modified.strftime("%Y-%m-%d %H:%M")
+        typer.echo(f"📄 {obj.key} {size_str}{storage_info} - {modified_str}")
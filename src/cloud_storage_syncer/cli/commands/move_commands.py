@@ -0,0 +1,31 @@
+"""Move commands for the CLI."""
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from ...models import S3StorageClass
+from .copy_commands import copy_or_move
+
+app = typer.Typer()
+
+
+@app.command()
+def file(
+    source: Annotated[str, typer.Argument(help="S3 key or directory prefix to move")],
+    destination: Annotated[str, typer.Argument(help="New S3 key or prefix")],
+    storage_class: Annotated[
+        S3StorageClass | None,
+        typer.Option(help="Storage class at the new key (default: keep the source's)"),
+    ] = None,
+    workers: Annotated[
+        int, typer.Option(help="Concurrent copies for directories", min=1)
+    ] = 8,
+    config_path: Annotated[Path | None, typer.Option(help="Config file path")] = None,
+):
+    """Move or rename a file or directory within the bucket.
+
+    Objects are copied server-side, then the sources are deleted.
+    """
+    copy_or_move(source, destination, storage_class, workers, config_path, move=True)
@@ -0,0 +1,116 @@
+"""Restore commands for the CLI."""
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from ...services import ConfigService, S3Service
+from ...services.restore_service import (
+    DEFAULT_POLL_INTERVAL,
+    RESTORE_TIERS,
+    RestoreService,
+)
+
+app = typer.Typer()
+
+EVENT_ICONS = {
+    "requested": "🧊",
+    "failed": "❌",
+    "restored": "🔓",
+    "downloaded": "📥",
+    "download_failed": "❌",
+}
+
+
+@app.command()
+def file(
+    s3_key: Annotated[
+        str, typer.Argument(help="S3 key (file or directory prefix) to restore")
+    ],
+    days: Annotated[
+        int, typer.Option(help="Days to keep the restored copies", min=1)
+    ] = 7,
+    tier: Annotated[
+        str, typer.Option(help=f"Retrieval tier: {', '.join(RESTORE_TIERS)}")
+    ] = "Standard",
+    download: Annotated[
+        bool,
+        typer.Option(
+            "--download", help="Download each file as soon as it is restored"
+        ),
+    ] = False,
+    output_path: Annotated[
+        Path | None,
+        typer.Option(
+            "--output-path", "-o", help="Directory to download to (default: cwd)"
+        ),
+    ] = None,
+    force: Annotated[
+        bool, typer.Option("--force", help="Overwrite existing files")
+    ] = False,
+    wait: Annotated[
+        bool, typer.Option("--wait", help="Wait until every file is restored")
+    ] = False,
+    timeout: Annotated[
+        float | None, typer.Option(help="Stop waiting after this many seconds")
+    ] = None,
+    poll_interval: Annotated[
+        float, typer.Option(help="Seconds between restore status checks", min=1)
+    ] = DEFAULT_POLL_INTERVAL,
+    workers: Annotated[
+        int, typer.Option(help="Restore requests and downloads in flight", min=1)
+    ] = 16,
+    config_path: Annotated[Path | None, typer.Option(help="Config file path")] = None,
+):
+    """Restore archived (GLACIER, DEEP_ARCHIVE) files so they can be downloaded."""
+    # Load configuration
+    config_service = ConfigService(config_path)
+    config = config_service.load_config()
+
+    if not config:
+        typer.echo("❌ No configuration found. Run 'config setup' first.", err=True)
+        raise typer.Exit(1)
+
+    s3_service = S3Service(config, max_pool_connections=max(workers, 10))
+    restore_service = RestoreService(
+        s3_service, max_workers=workers, poll_interval=poll_interval
+    )
+
+    def on_event(event: str, key: str, detail: str) -> None:
+        suffix = f" ({detail})" if detail else ""
+        typer.echo(f"   {EVENT_ICONS[event]} {event.replace('_', ' ')}: {key}{suffix}")
+
+    typer.echo(f"🧊 Restoring s3://{config.bucket}/{s3_key} ({tier}, {days} days)")
+    try:
+        result = restore_service.restore(
+            s3_key,
+            days=days,
+            tier=tier,
+            download_to=(output_path or Path.cwd()) if download else None,
+            force=force,
+            wait=wait,
+            timeout=timeout,
+            on_event=on_event,
+        )
+    except (ValueError, FileNotFoundError) as e:
+        typer.echo(f"❌ {e}", err=True)
+        raise typer.Exit(1) from e
+    except Exception as e:
+        typer.echo(f"❌ Restore failed: {e}", err=True)
+        raise typer.Exit(1) from e
+
+    downloaded = sum(1 for r in result.downloads if r.success)
+    typer.echo("\n📊 Restore Summary:")
+    typer.echo(f"   🧊 Requested: {len(result.requested)}")
+    typer.echo(f"   ⏳ Already in progress: {len(result.in_progress)}")
+    typer.echo(f"   🔓 Restored: {len(result.restored)}")
+    typer.echo(f"   ⏳ Still restoring: {len(result.pending)}")
+    typer.echo(f"   ❌ Failed: {len(result.failed)}")
+    if download:
+        typer.echo(f"   📥 Downloaded: {downloaded}")
+        typer.echo(f"   ❌ Download failures: {len(result.downloads) - downloaded}")
+
+    # Waiting ran out before everything was readable
+    if not result.ok or ((wait or download) and result.pending):
+        raise typer.Exit(1)
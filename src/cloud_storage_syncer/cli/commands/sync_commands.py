@@ -0,0 +1,138 @@
+"""Sync commands for the CLI."""
+
+import signal
+import threading
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from ...core.coalesce import DELETE, DELETE_TREE, MOVE, Change
+from ...models import S3StorageClass
+from ...services import ConfigService, S3Service
+from ...services.sync_service import SyncService
+from ..inventory_source import open_inventory
+
+app = typer.Typer()
+
+
+@app.command()
+def dir(
+    path: Annotated[Path, typer.Argument(help="Local directory to mirror")],
+    s3_key: Annotated[
+        str | None, typer.Option(help="S3 prefix to mirror the directory to")
+    ] = None,
+    storage_class: Annotated[
+        S3StorageClass | None, typer.Option(help="S3 storage class for uploads")
+    ] = None,
+    delete: Annotated[
+        bool,
+        typer.Option("--delete", help="Delete remote files with no local copy"),
+    ] = False,
+    watch: Annotated[
+        bool,
+        typer.Option("--watch", help="Keep running and upload changes as they happen"),
+    ] = False,
+    debounce: Annotated[
+        float,
+        typer.Option(help="Seconds a file must be quiet before it is synced", min=0),
+    ] = 0.5,
+    workers: Annotated[
+        int, typer.Option(help="Concurrent uploads/deletes", min=1)
+    ] = 8,
+    inventory: Annotated[
+        str | None,
+        typer.Option(
+            help="S3 Inventory manifest or its prefix (local path or s3:// URI) "
+            "to compare against instead of listing the prefix"
+        ),
+    ] = None,
+    config_path: Annotated[Path | None, typer.Option(help="Config file path")] = None,
+):
+    """Mirror a local directory to S3, optionally watching it for changes."""
+    # Load configuration
+    config_service = ConfigService(config_path)
+    config = config_service.load_config()
+
+    if not config:
+        typer.echo("❌ No configuration found. Run 'config setup' first.", err=True)
+        raise typer.Exit(1)
+
+    if not path.is_dir():
+        typer.echo(f"❌ Not a directory: {path}", err=True)
+        raise typer.Exit(1)
+
+    s3_service = S3Service(config, max_pool_connections=max(workers, 10))
+    sync_service = SyncService(
+        s3_service,
+        path,
+        s3_key or "",
+        storage_class=storage_class,
+        max_workers=workers,
+    )
+
+    def report(change: Change, success: bool, error: str):
+        key = sync_service.key_for(change.path)
+        if not success:
+            typer.echo(f"   ❌ {key}: {error}")
+        elif change.action == MOVE:
+            typer.echo(f"   🔀 {sync_service.key_for(change.source)} → {key}")
+        elif change.action == DELETE:
+            typer.echo(f"   🗑️  {key}")
+        elif change.action == DELETE_TREE:
+            typer.echo(f"   🗑️  {key}/")
+        else:
+            typer.echo(f"   📤 {key}")
+
+    remote_objects = None
+    if inventory:
+        inventory_service, manifest, location = open_inventory(inventory, config)
+        if manifest.source_bucket and manifest.source_bucket != config.bucket:
+            typer.echo(
+                f"❌ Inventory is for bucket {manifest.source_bucket}, "
+                f"not {config.bucket}",
+                err=True,
+            )
+            raise typer.Exit(1)
+        remote_objects = inventory_service.iter_objects(
+            location, prefix=sync_service.s3_root
+        )
+
+    typer.echo(f"🔄 Syncing {path} to s3://{config.bucket}/{sync_service.s3_root}")
+    try:
+        successful, failed = sync_service.sync(
+            delete=delete, on_result=report, remote_objects=remote_objects
+        )
+    except Exception as e:
+        typer.echo(f"❌ Sync failed: {e}", err=True)
+        raise typer.Exit(1) from e
+
+    typer.echo("\n📊 Sync Summary:")
+    typer.echo(f"   ✅ Applied: {successful}")
+    typer.echo(f"   ❌ Failed: {failed}")
+
+    if not watch:
+        if failed:
+            raise typer.Exit(1)
+        return
+
+    stop = threading.Event()
+
+    def request_stop(*_):
+        typer.echo("\n⏹️  Stopping, flushing pending changes...")
+        stop.set()
+
+    # Stop through the event so pending changes are flushed, not abandoned
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+    typer.echo(f"\n👀 Watching {path} for changes (Ctrl+C to stop)")
+
+    try:
+        successful, failed = sync_service.watch(
+            stop, debounce=debounce, on_result=report
+        )
+    except ValueError as e:
+        typer.echo(f"❌ {e}", err=True)
+        raise typer.Exit(1) from e
+
+    typer.echo(f"👋 Watch ended: {successful} applied, {failed} failed")
@@ -0,0 +1,103 @@
+"""Transition commands for the CLI."""
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from ...core.bandwidth import format_size, parse_size
+from ...models import S3StorageClass
+from ...services import ConfigService, S3Service
+from ...services.transition_service import TransitionService
+
+app = typer.Typer()
+
+
+@app.command()
+def dir(
+    s3_prefix: Annotated[
+        str, typer.Argument(help="S3 prefix to transition ('' for the whole bucket)")
+    ],
+    storage_class: Annotated[
+        S3StorageClass, typer.Option(help="Storage class to move the objects to")
+    ],
+    min_size: Annotated[
+        str | None,
+        typer.Option(help="Skip objects smaller than this, e.g. 128K"),
+    ] = None,
+    max_size: Annotated[
+        str | None, typer.Option(help="Skip objects larger than this, e.g. 10G")
+    ] = None,
+    older_than: Annotated[
+        float | None,
+        typer.Option(help="Skip objects modified in the last N days", min=0),
+    ] = None,
+    dry_run: Annotated[
+        bool,
+        typer.Option("--dry-run", help="Show what would change without copying"),
+    ] = False,
+    workers: Annotated[int, typer.Option(help="Concurrent copies", min=1)] = 16,
+    config_path: Annotated[Path | None, typer.Option(help="Config file path")] = None,
+):
+    """Change the storage class of every object under a prefix in place.
+
+    Objects are copied onto themselves server-side, so nothing is downloaded.
+    """
+    # Load configuration
+    config_service = ConfigService(config_path)
+    config = config_service.load_config()
+
+    if not config:
+        typer.echo("❌ No configuration found. Run 'config setup' first.", err=True)
+        raise typer.Exit(1)
+
+    try:
+        min_bytes = parse_size(min_size) if min_size else None
+        max_bytes = parse_size(max_size) if max_size else None
+    except ValueError as e:
+        typer.echo(f"❌ {e}", err=True)
+        raise typer.Exit(1) from e
+
+    s3_service = S3Service(config, max_pool_connections=max(workers, 10))
+    transition_service = TransitionService(s3_service, max_workers=workers)
+
+    location = f"s3://{config.bucket}/{s3_prefix.strip('/')}"
+    typer.echo(f"🔍 Scanning {location} for objects to move to {storage_class.value}")
+    try:
+        plan = transition_service.plan(
+            s3_prefix, storage_class, min_bytes, max_bytes, older_than
+        )
+    except Exception as e:
+        typer.echo(f"❌ Failed to list {location}: {e}", err=True)
+        raise typer.Exit(1) from e
+
+    for key in plan.archived:
+        typer.echo(f"   🧊 Skipped (archived, restore first): {key}")
+
+    typer.echo(
+        f"📋 {len(plan.objects)} objects ({format_size(plan.total_bytes)}) to move, "
+        f"{plan.unchanged} already {storage_class.value}"
+    )
+    if dry_run:
+        typer.echo("🧪 Dry run: nothing was copied")
+        return
+    if not plan.objects:
+        return
+
+    results = transition_service.apply(plan)
+    successful = sum(1 for r in results if r.success)
+    failed = len(results) - successful
+
+    if failed == 0:
+        typer.echo("✅ Transition successful!")
+        typer.echo(f"   📋 {successful} objects now {storage_class.value}")
+    else:
+        typer.echo("⚠️  Completed with errors:")
+        typer.echo(f"   ✅ Successful: {successful}")
+        typer.echo(f"   ❌ Failed: {failed}")
+
+        for result in results:
+            if not result.success:
+                typer.echo(f"   ❌ {result.source_key}: {result.error_message}")
+
+        raise typer.Exit(1)
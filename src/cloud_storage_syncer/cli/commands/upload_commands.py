@@ -1,12 +1,21 @@
 """Upload commands for the CLI."""
 
+import time
 from pathlib import Path
 from typing import Annotated
 
 import typer
 
+from ...core.bandwidth import parse_size
+from ...core.compression import check_encoding
+from ...core.scanner import scan_tree
 from ...models import S3StorageClass, UploadRequest
-from ...services import ConfigService, S3Service
+from ...services import ConfigService, create_s3_service
+from ...services.dedup_service import DedupService
+from ...services.pack_service import PackService
+from ...services.plan_service import PlanService
+from ...services.throughput_history import ThroughputHistory
+from ..plan_output import echo_plan
 
 app = typer.Typer()
 
@@ -21,6 +30,61 @@ def file(
     recursive: Annotated[
         bool, typer.Option("--recursive", "-r", help="Upload directory recursively")
     ] = False,
+    pack: Annotated[
+        bool,
+        typer.Option(
+            "--pack", help="Bundle small files into pack objects with an index"
+        ),
+    ] = False,
+    pack_threshold: Annotated[
+        str, typer.Option(help="Files smaller than this are packed, e.g. 1M")
+    ] = "1M",
+    pack_size: Annotated[
+        str, typer.Option(help="Target size of each pack object, e.g. 256M")
+    ] = "256M",
+    max_bandwidth: Annotated[
+        str | None,
+        typer.Option(help="Maximum total transfer rate in bytes/s, e.g. 10M"),
+    ] = None,
+    dedup: Annotated[
+        bool,
+        typer.Option(
+            "--dedup",
+            help="Copy server-side instead of uploading when identical content "
+            "was already uploaded with --dedup",
+        ),
+    ] = False,
+    compress: Annotated[
+        str | None,
+        typer.Option(
+            help="Compress compressible files while uploading: gzip or zstd "
+            "(downloads decompress them)"
+        ),
+    ] = None,
+    include: Annotated[
+        list[str] | None,
+        typer.Option(
+            help="Only upload files whose relative path matches this glob; "
+            "repeatable"
+        ),
+    ] = None,
+    exclude: Annotated[
+        list[str] | None,
+        typer.Option(
+            help="Skip files and directories whose relative path matches this "
+            "glob; repeatable"
+        ),
+    ] = None,
+    workers: Annotated[
+        int, typer.Option(min=1, help="Directories scanned concurrently")
+    ] = 8,
+    dry_run: Annotated[
+        bool,
+        typer.Option(
+            "--dry-run",
+            help="Show files, bytes, requests and estimated time without uploading",
+        ),
+    ] = False,
     config_path: Annotated[Path | None, typer.Option(help="Config file path")] = None,
 ):
     """Upload a file or directory to S3."""
@@ -41,7 +105,34 @@ def file(
     if not storage_class:
         storage_class = S3StorageClass.STANDARD
 
-    s3_service = S3Service(config)
+    try:
+        pack_threshold_bytes = parse_size(pack_threshold)
+        pack_size_bytes = parse_size(pack_size)
+        if compress:
+            check_encoding(compress)
+        # Packing and dedup need direct S3 access that the daemon does not forward
+        s3_service = create_s3_service(
+            config,
+            max_bandwidth=max_bandwidth,
+            use_daemon=not (pack or dedup or dry_run),
+        )
+    except ValueError as e:
+        typer.echo(f"❌ {e}", err=True)
+        raise typer.Exit(1) from e
+
+    history = ThroughputHistory()
+    if dry_run:
+        if pack or dedup:
+            typer.echo("ℹ️  Planned as plain uploads; --pack/--dedup ignored")
+        typer.echo(f"🔍 Planning upload of {path} to s3://{config.bucket}")
+        plan = PlanService(s3_service).plan_upload(
+            path, recursive, include or (), exclude or (), workers
+        )
+        echo_plan(plan, history, parse_size(max_bandwidth) if max_bandwidth else None)
+        return
+
+    started = time.monotonic()
+    upload = DedupService(s3_service).upload_file if dedup else s3_service.upload_file
 
     if path.is_file():
         # Upload single file
@@ -51,65 +142,115 @@ def file(
 
         # Create upload request
         request = UploadRequest(
-            file_path=str(path), s3_key=s3_key, storage_class=storage_class
+            file_path=str(path),
+            s3_key=s3_key,
+            storage_class=storage_class,
+            compression=compress,
         )
 
         # Upload file
         typer.echo(f"📤 Uploading {path.name} to s3://{config.bucket}/{s3_key}")
 
-        result = request.upload_with_service(s3_service)
+        result = upload(request)
 
         if result.success:
+            if not dedup:
+                history.record(
+                    "upload", 1, path.stat().st_size, time.monotonic() - started
+                )
             typer.echo("✅ Upload successful!")
             typer.echo(f"   🗂️  S3 URL: {result.s3_url}")
             typer.echo(f"   📦 Storage Class: {result.storage_class}")
+            if result.copied_from:
+                typer.echo(f"   ♻️  Copied from: {result.copied_from}")
         else:
             typer.echo(f"❌ Upload failed: {result.error_message}", err=True)
             raise typer.Exit(1)
 
     elif path.is_dir():
         # Upload directory
-        # Find files to upload
-        pattern = "**/*" if recursive else "*"
-        files = [f for f in path.glob(pattern) if f.is_file()]
-
-        if not files:
-            typer.echo("❌ No files found to upload.", err=True)
-            raise typer.Exit(1)
-
-        typer.echo(f"📂 Found {len(files)} files to upload")
+        # Files are uploaded as the scan finds them
+        files = scan_tree(
+            path,
+            recursive=recursive,
+            include=include or (),
+            exclude=exclude or (),
+            max_workers=workers,
+        )
+        typer.echo(f"📂 Scanning {path}")
 
         # Upload files
+        found_count = 0
         success_count = 0
+        uploaded_bytes = 0
         failed_files = []
+        small_files = []
+
+        for local_file in files:
+            found_count += 1
+            if pack and local_file.size < pack_threshold_bytes:
+                # Packed once the scan is complete
+                small_files.append(
+                    (local_file.path, local_file.relative, local_file.size)
+                )
+                continue
 
-        for file_path in files:
             # Generate S3 key
-            relative_path = file_path.relative_to(path)
-            file_s3_key = str(relative_path)
+            file_s3_key = local_file.relative
 
             if s3_key:
                 file_s3_key = f"{s3_key.rstrip('/')}/{file_s3_key}"
 
             # Create upload request
             request = UploadRequest(
-                file_path=str(file_path),
+                file_path=str(local_file.path),
                 s3_key=file_s3_key,
                 storage_class=storage_class,
+                compression=compress,
             )
 
-            typer.echo(f"📤 Uploading {relative_path}")
-            result = request.upload_with_service(s3_service)
+            typer.echo(f"📤 Uploading {local_file.relative}")
+            result = upload(request)
 
             if result.success:
                 success_count += 1
-                typer.echo(f"   ✅ s3://{config.bucket}/{file_s3_key}")
+                uploaded_bytes += local_file.size
+                copied = f" (copied from {result.copied_from})" if result.copied_from else ""
+                typer.echo(f"   ✅ s3://{config.bucket}/{file_s3_key}{copied}")
             else:
-                failed_files.append((file_path, result.error_message))
+                failed_files.append((local_file.path, result.error_message))
                 typer.echo(f"   ❌ Failed: {result.error_message}")
 
+        if not found_count:
+            typer.echo("❌ No files found to upload.", err=True)
+            raise typer.Exit(1)
+
+        if small_files:
+            typer.echo(f"📦 Packing {len(small_files)} small files")
+            pack_service = PackService(s3_service)
+            pack_results = pack_service.upload_packed(
+                small_files, s3_key, storage_class, pack_size_bytes
+            )
+            for group, result in pack_results:
+                if result.success:
+                    success_count += len(group)
+                    uploaded_bytes += sum(size for _, _, size in group)
+                    typer.echo(f"   ✅ {result.s3_url} ({len(group)} files)")
+                else:
+                    typer.echo(f"   ❌ Pack failed: {result.error_message}")
+                    failed_files.extend(
+                        (file_path, result.error_message) for file_path, _, _ in group
+                    )
+
+        # Copies made by --dedup would overstate the transfer rate
+        if not dedup:
+            history.record(
+                "upload", success_count, uploaded_bytes, time.monotonic() - started
+            )
+
         # Summary
         typer.echo("\n📊 Upload Summary:")
+        typer.echo(f"   📂 Found: {found_count}")
         typer.echo(f"   ✅ Successful: {success_count}")
         typer.echo(f"   ❌ Failed: {len(failed_files)}")
 
@@ -0,0 +1,84 @@
+"""Verify commands for the CLI."""
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from ...services import ConfigService, S3Service
+from ...services.verify_service import VerifyService
+
+app = typer.Typer()
+
+
+@app.command()
+def dir(
+    path: Annotated[Path, typer.Argument(help="Local directory to compare")],
+    s3_key: Annotated[
+        str | None, typer.Option(help="S3 prefix the directory was uploaded to")
+    ] = None,
+    include: Annotated[
+        list[str] | None,
+        typer.Option(
+            help="Only compare files whose relative path matches this glob; "
+            "repeatable"
+        ),
+    ] = None,
+    exclude: Annotated[
+        list[str] | None,
+        typer.Option(
+            help="Skip files and directories whose relative path matches this "
+            "glob; repeatable"
+        ),
+    ] = None,
+    workers: Annotated[
+        int, typer.Option(help="Objects checked concurrently", min=1)
+    ] = 16,
+    config_path: Annotated[Path | None, typer.Option(help="Config file path")] = None,
+):
+    """Check that a local directory and an S3 prefix hold the same files.
+
+    Objects are compared by their stored checksums, so nothing is downloaded.
+    """
+    # Load configuration
+    config_service = ConfigService(config_path)
+    config = config_service.load_config()
+
+    if not config:
+        typer.echo("❌ No configuration found. Run 'config setup' first.", err=True)
+        raise typer.Exit(1)
+
+    if not path.is_dir():
+        typer.echo(f"❌ Not a directory: {path}", err=True)
+        raise typer.Exit(1)
+
+    s3_service = S3Service(config, max_pool_connections=max(workers, 10))
+    verify_service = VerifyService(s3_service, max_workers=workers)
+
+    typer.echo(f"🔍 Verifying {path} against s3://{config.bucket}/{s3_key or ''}")
+    try:
+        result = verify_service.verify(
+            path, s3_key or "", include=include or (), exclude=exclude or ()
+        )
+    except Exception as e:
+        typer.echo(f"❌ Verify failed: {e}", err=True)
+        raise typer.Exit(1) from e
+
+    for key, reason in result.mismatched:
+        typer.echo(f"   ❌ Mismatch: {key} ({reason})")
+    for key in result.missing:
+        typer.echo(f"   ❓ Missing in S3: {key}")
+    for key in result.extra:
+        typer.echo(f"   ➕ Extra in S3: {key}")
+    for key, reason in result.unverified:
+        typer.echo(f"   ⚠️  Unverified: {key} ({reason})")
+
+    typer.echo("\n📊 Verify Summary:")
+    typer.echo(f"   ✅ Matched: {len(result.matched)}")
+    typer.echo(f"   ❌ Mismatched: {len(result.mismatched)}")
+    typer.echo(f"   ❓ Missing: {len(result.missing)}")
+    typer.echo(f"   ➕ Extra: {len(result.extra)}")
+    typer.echo(f"   ⚠️  Unverified: {len(result.unverified)}")
+
+    if not result.ok:
+        raise typer.Exit(1)
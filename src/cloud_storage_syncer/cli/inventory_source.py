@@ -0,0 +1,29 @@
+"""Shared handling of --inventory sources for the CLI commands."""
+
+import typer
+
+from ..core.inventory import InventoryManifest
+from ..models import S3Config
+from ..services import S3Service
+from ..services.inventory_service import InventoryService
+
+
+def is_local_inventory(inventory: str | None) -> bool:
+    """Whether an inventory source can be read without S3 credentials."""
+    return bool(inventory) and not inventory.startswith("s3://")
+
+
+def open_inventory(
+    inventory: str, config: S3Config | None
+) -> tuple[InventoryService, InventoryManifest, str]:
+    """Locate an inventory manifest, exiting with an error if it is unusable."""
+    inventory_service = InventoryService(S3Service(config) if config else None)
+    try:
+        manifest, location = inventory_service.load_manifest(inventory)
+    except Exception as e:
+        typer.echo(f"❌ Failed to read inventory: {e}", err=True)
+        raise typer.Exit(1) from e
+
+    typer.echo(f"🗃️  Inventory: {location}")
+    typer.echo(f"   🕒 Snapshot: {manifest.created_at:%Y-%m-%d %H:%M} UTC")
+    return inventory_service, manifest, location
@@ -1,15 +1,28 @@
 """Main CLI application using Typer."""
 
+import os
+from typing import Annotated
+
 import typer
 
 from cloud_storage_syncer import __description__, __version__
 
+from ..services.config_service import PROFILE_ENV
 from .commands import (
+    batch_commands,
     config_commands,
+    copy_commands,
+    daemon_commands,
     delete_commands,
     download_commands,
+    events_commands,
     list_commands,
+    move_commands,
+    restore_commands,
+    sync_commands,
+    transition_commands,
     upload_commands,
+    verify_commands,
 )
 
 app = typer.Typer(
@@ -18,12 +31,57 @@ app = typer.Typer(
     add_completion=False,
 )
 
+
+@app.callback()
+def main(
+    profile: Annotated[
+        str | None,
+        typer.Option(
+            "--profile",
+            "-p",
+            help="Configuration profile to use for this invocation",
+            envvar=PROFILE_ENV,
+        ),
+    ] = None,
+) -> None:
+    """Select the configuration profile every command loads."""
+    if profile:
+        # Read by ConfigService, so every command and the daemon check agree
+        os.environ[PROFILE_ENV] = profile
+
+
 # Add command groups
 app.add_typer(config_commands.app, name="config", help="Manage S3 configuration")
 app.add_typer(upload_commands.app, name="upload", help="Upload files to S3")
 app.add_typer(list_commands.app, name="list", help="List and search S3 files")
 app.add_typer(download_commands.app, name="download", help="Download files from S3")
 app.add_typer(delete_commands.app, name="delete", help="Delete files from S3")
+app.add_typer(
+    restore_commands.app, name="restore", help="Restore archived files from Glacier"
+)
+app.add_typer(sync_commands.app, name="sync", help="Mirror directories to S3")
+app.add_typer(
+    verify_commands.app, name="verify", help="Compare local directories with S3"
+)
+app.add_typer(copy_commands.app, name="copy", help="Copy files within S3")
+app.add_typer(move_commands.app, name="move", help="Move files within S3")
+app.add_typer(move_commands.app, name="rename", help="Rename files within S3")
+app.add_typer(
+    transition_commands.app,
+    name="transition",
+    help="Change the storage class of files in place",
+)
+app.add_typer(
+    batch_commands.app, name="batch", help="Run operations from a JSONL manifest"
+)
+app.add_typer(
+    daemon_commands.app, name="daemon", help="Run a warm background S3 worker"
+)
+app.add_typer(
+    events_commands.app,
+    name="events",
+    help="Keep the web cache fresh from S3 event notifications",
+)
 
 
 @app.command()
@@ -0,0 +1,38 @@
+"""Shared output of dry-run plans for the CLI commands."""
+
+import typer
+
+from ..core.bandwidth import format_duration, format_size
+from ..models import TransferPlan
+from ..services.throughput_history import ThroughputHistory
+
+# Skipped objects listed before the rest are only counted
+MAX_SKIPPED_SHOWN = 20
+
+
+def echo_plan(
+    plan: TransferPlan,
+    history: ThroughputHistory,
+    max_bandwidth: int | None = None,
+) -> None:
+    """Print what a dry run found, with requests by type and a time estimate."""
+    for key, reason in plan.skipped[:MAX_SKIPPED_SHOWN]:
+        typer.echo(f"   ⏭️  Would skip {key}: {reason}")
+    if len(plan.skipped) > MAX_SKIPPED_SHOWN:
+        typer.echo(f"   ⏭️  ... and {len(plan.skipped) - MAX_SKIPPED_SHOWN} more")
+
+    typer.echo(f"\n📋 Plan ({plan.operation}):")
+    typer.echo(f"   📂 Objects: {plan.objects}")
+    typer.echo(f"   📊 Size: {format_size(plan.total_bytes)}")
+    if plan.skipped:
+        typer.echo(f"   ⏭️  Skipped: {len(plan.skipped)}")
+    typer.echo(f"   🔁 Requests: {plan.total_requests}")
+    for api_call, count in sorted(plan.requests.items()):
+        typer.echo(f"      {api_call}: {count}")
+
+    seconds = history.estimate(plan, max_bandwidth)
+    if seconds is None:
+        typer.echo(f"   ⏱️  Time: unknown until a real {plan.operation} has run")
+    else:
+        typer.echo(f"   ⏱️  Estimated time: {format_duration(seconds)}")
+    typer.echo("🧪 Dry run: no files were transferred or deleted")
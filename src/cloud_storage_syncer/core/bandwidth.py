@@ -0,0 +1,161 @@
+"""Client-side bandwidth limiting shared by concurrent transfers.
+
+``BandwidthLimiter`` is a token bucket measured in bytes. Transfers take
+tokens in fixed-size quanta and are served in FIFO ticket order, so each
+active transfer gets an equal share: a large file re-queues after every
+quantum and cannot starve small files that start after it.
+"""
+
+import re
+import threading
+
+from .rate_limit import TokenBucket
+
+DEFAULT_QUANTUM = 64 * 1024
+
+_SIZE_UNITS = {
+    "": 1,
+    "B": 1,
+    "K": 1024,
+    "KB": 1024,
+    "KIB": 1024,
+    "M": 1024**2,
+    "MB": 1024**2,
+    "MIB": 1024**2,
+    "G": 1024**3,
+    "GB": 1024**3,
+    "GIB": 1024**3,
+}
+_SIZE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([A-Za-z]*)\s*$")
+
+
+def parse_size(text: str) -> int:
+    """Parse a human-readable byte count such as "512K", "10M" or "1.5G".
+
+    Units are binary (K = 1024 bytes).
+
+    Args:
+        text: Size string
+
+    Returns:
+        Number of bytes
+
+    Raises:
+        ValueError: If the string is not a valid size
+    """
+    match = _SIZE_PATTERN.match(text)
+    if not match or match.group(2).upper() not in _SIZE_UNITS:
+        raise ValueError(f"Invalid size: {text!r}")
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2).upper()])
+
+
+def format_size(size: int) -> str:
+    """Format a byte count for display, e.g. "1.50 GB"."""
+    for unit, factor in (("GB", 1024**3), ("MB", 1024**2), ("KB", 1024)):
+        if size >= factor:
+            return f"{size / factor:.2f} {unit}"
+    return f"{size} B"
+
+
+def format_duration(seconds: float) -> str:
+    """Format a duration for display, e.g. "1h 05m", "3m 20s" or "12s"."""
+    seconds = max(0, round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return f"{hours}h {minutes:02d}m"
+    if minutes:
+        return f"{minutes}m {seconds:02d}s"
+    return f"{seconds}s"
+
+
+class BandwidthLimiter:
+    """Fair token bucket limiting the total byte rate of all transfers."""
+
+    def __init__(
+        self, bytes_per_second: int, quantum: int = DEFAULT_QUANTUM, clock=None
+    ):
+        """Initialize the limiter.
+
+        Args:
+            bytes_per_second: Total rate shared by every transfer
+            quantum: Bytes granted per turn, the unit of fair sharing
+            clock: Monotonic time function, injectable for tests
+
+        Raises:
+            ValueError: If the rate or quantum is not positive
+        """
+        if quantum <= 0:
+            raise ValueError("Quantum must be positive")
+
+        self.bytes_per_second = bytes_per_second
+        self.quantum = quantum
+        self._bucket = TokenBucket(
+            bytes_per_second, capacity=max(bytes_per_second, quantum), clock=clock
+        )
+        self._condition = threading.Condition()
+        self._next_ticket = 0
+        self._serving = 0
+
+    def _acquire_turn(self, amount: int) -> None:
+        """Wait for this caller's FIFO turn and the tokens for one quantum."""
+        with self._condition:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+
+            while True:
+                if ticket == self._serving:
+                    wait = self._bucket.try_acquire(amount)
+                    if wait <= 0:
+                        self._serving += 1
+                        self._condition.notify_all()
+                        return
+                    self._condition.wait(wait)
+                else:
+                    self._condition.wait()
+
+    def consume(self, nbytes: int) -> None:
+        """Block until ``nbytes`` may be transferred.
+
+        Args:
+            nbytes: Bytes about to be sent or just received
+        """
+        while nbytes > 0:
+            chunk = min(nbytes, self.quantum)
+            self._acquire_turn(chunk)
+            nbytes -= chunk
+
+
+class ThrottledReader:
+    """File wrapper whose reads are paced by a BandwidthLimiter."""
+
+    def __init__(self, fileobj, limiter: BandwidthLimiter):
+        """Wrap a readable file object."""
+        self._fileobj = fileobj
+        self._limiter = limiter
+
+    def read(self, size: int = -1) -> bytes:
+        """Read and wait until the bytes fit in the shared budget."""
+        data = self._fileobj.read(size)
+        self._limiter.consume(len(data))
+        return data
+
+    def __getattr__(self, name):
+        return getattr(self._fileobj, name)
+
+
+class ThrottledWriter:
+    """File wrapper whose writes are paced by a BandwidthLimiter."""
+
+    def __init__(self, fileobj, limiter: BandwidthLimiter):
+        """Wrap a writable file object."""
+        self._fileobj = fileobj
+        self._limiter = limiter
+
+    def write(self, data: bytes) -> int:
+        """Wait until the bytes fit in the shared budget, then write them."""
+        self._limiter.consume(len(data))
+        return self._fileobj.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._fileobj, name)
@@ -0,0 +1,151 @@
+"""Debouncing and coalescing of file-system change events.
+
+Editors and producers touch a file many times per save (create, several
+writes, rename over the old copy). ``ChangeCoalescer`` folds every event
+for a path into one pending change and only releases it once the path has
+been quiet for the debounce interval. State is one entry per path with
+pending changes, so memory stays flat however long a watch runs.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+UPLOAD = "upload"
+DELETE = "delete"
+MOVE = "move"
+DELETE_TREE = "delete_tree"
+
+
+@dataclass
+class Change:
+    """One coalesced change to apply to the remote copy."""
+
+    action: str  # UPLOAD, DELETE, MOVE or DELETE_TREE
+    path: Path
+    source: Path | None = None  # Old path of a MOVE
+
+
+@dataclass
+class _Pending:
+    change: Change
+    last_event: float
+
+
+class ChangeCoalescer:
+    """Thread-safe accumulator of per-path changes with a debounce window."""
+
+    def __init__(self, debounce: float = 0.5, clock=None):
+        """Initialize the coalescer.
+
+        Args:
+            debounce: Seconds a path must be quiet before its change is ready
+            clock: Monotonic time function, injectable for tests
+        """
+        self.debounce = debounce
+        self._clock = clock or time.monotonic
+        self._pending: dict[Path, _Pending] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def _set(self, change: Change) -> None:
+        self._pending[change.path] = _Pending(change, self._clock())
+
+    def add(self, change: Change) -> None:
+        """Queue an already-determined change, e.g. from a one-shot plan."""
+        with self._lock:
+            self._set(change)
+
+    def modified(self, path: Path) -> None:
+        """Record that a file was created or written."""
+        with self._lock:
+            current = self._pending.get(path)
+            if current and current.change.action == MOVE:
+                # Written after being moved in: the old copy is stale, but
+                # the move source still has to go
+                self._set_delete(current.change.source)
+            self._set(Change(UPLOAD, path))
+
+    def deleted(self, path: Path) -> None:
+        """Record that a file was removed."""
+        with self._lock:
+            current = self._pending.get(path)
+            if current and current.change.action == MOVE:
+                self._set_delete(current.change.source)
+            self._set(Change(DELETE, path))
+
+    def deleted_tree(self, path: Path) -> None:
+        """Record that a directory was removed along with everything in it."""
+        with self._lock:
+            # The tree delete covers any pending change below the directory
+            for pending_path, pending in list(self._pending.items()):
+                if pending_path == path or not pending_path.is_relative_to(path):
+                    continue
+                del self._pending[pending_path]
+                source = pending.change.source
+                if source is not None and not source.is_relative_to(path):
+                    self._set_delete(source)
+            self._set(Change(DELETE_TREE, path))
+
+    def moved(self, source: Path, dest: Path) -> None:
+        """Record that a file was renamed."""
+        with self._lock:
+            current = self._pending.pop(source, None)
+            if current is None:
+                # Unchanged since the last sync: the remote copy can be moved
+                self._set(Change(MOVE, dest, source))
+                return
+
+            if current.change.action == MOVE:
+                # a -> b -> c collapses to a -> c
+                self._set(Change(MOVE, dest, current.change.source))
+            else:
+                # New content never reached the remote; upload it at its new
+                # name and drop whatever the old name held
+                self._set(Change(UPLOAD, dest))
+                self._set_delete(source)
+
+    def _set_delete(self, path: Path) -> None:
+        """Schedule a delete unless the path has newer pending content."""
+        current = self._pending.get(path)
+        if current is None or current.change.action == DELETE:
+            self._set(Change(DELETE, path))
+
+    def drain(
+        self,
+        busy: set[Path] | frozenset = frozenset(),
+        force: bool = False,
+        limit: int | None = None,
+    ) -> list[Change]:
+        """Take every change whose path has been quiet for the debounce window.
+
+        Args:
+            busy: Paths with a change still being applied; theirs stay queued
+                so changes to one path are applied in order
+            force: Ignore the debounce window, e.g. when shutting down
+            limit: Take at most this many changes
+
+        Returns:
+            Ready changes, removed from the coalescer
+        """
+        now = self._clock()
+        ready = []
+        # A move touches two paths; never release two changes sharing one
+        claimed = set(busy)
+        with self._lock:
+            for path, pending in list(self._pending.items()):
+                if limit is not None and len(ready) >= limit:
+                    break
+                change = pending.change
+                touched = {path} if change.source is None else {path, change.source}
+                if touched & claimed:
+                    continue
+                if force or now - pending.last_event >= self.debounce:
+                    ready.append(change)
+                    claimed |= touched
+                    del self._pending[path]
+        return ready
@@ -0,0 +1,227 @@
+"""Streaming compression for uploads and downloads.
+
+Objects are compressed while they are read for upload and decompressed
+while they are written on download, so no compressed copy of a file is
+ever stored locally. The encoding is recorded in the object's
+``Content-Encoding`` and the original size in its user metadata.
+
+gzip uses zlib from the standard library; zstd needs the optional
+``zstandard`` package.
+"""
+
+import io
+import zlib
+from pathlib import Path
+
+ENCODINGS = ("gzip", "zstd")
+
+# User metadata key holding the size before compression
+UNCOMPRESSED_SIZE_METADATA = "uncompressed-size"
+
+# Smaller files gain too little to be worth the encoding overhead
+MIN_COMPRESS_SIZE = 4 * 1024
+# Bytes from the start of a file compressed to judge unknown types
+PROBE_SIZE = 64 * 1024
+# Compress only when the probe shrinks to at most this fraction
+PROBE_MAX_RATIO = 0.9
+
+# Deciding by suffix avoids reading the file at all for common types
+COMPRESSIBLE_SUFFIXES = frozenset(
+    {
+        ".csv", ".tsv", ".txt", ".log", ".json", ".jsonl", ".ndjson", ".xml",
+        ".html", ".htm", ".md", ".sql", ".yaml", ".yml", ".ini", ".cfg",
+        ".js", ".css", ".svg", ".py", ".tex", ".tar",
+    }
+)
+INCOMPRESSIBLE_SUFFIXES = frozenset(
+    {
+        ".gz", ".tgz", ".zst", ".bz2", ".xz", ".lz4", ".zip", ".7z", ".rar",
+        ".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic", ".mp3", ".mp4",
+        ".mkv", ".mov", ".avi", ".webm", ".flac", ".ogg", ".pdf", ".parquet",
+        ".orc", ".avro",
+    }
+)
+
+# gzip container, not a raw zlib stream
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def _zstandard():
+    """Import the optional zstandard package."""
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ValueError(
+            "zstd compression requires zstandard: "
+            "pip install 'cloud-storage-syncer[compression]'"
+        ) from e
+    return zstandard
+
+
+def check_encoding(encoding: str) -> None:
+    """Check that an encoding is known and usable here.
+
+    Raises:
+        ValueError: If the encoding is unknown or its package is missing
+    """
+    if encoding not in ENCODINGS:
+        raise ValueError(
+            f"Unknown compression: {encoding} (choose from {', '.join(ENCODINGS)})"
+        )
+    if encoding == "zstd":
+        _zstandard()
+
+
+def should_compress(path: Path, size: int | None = None) -> bool:
+    """Decide whether compressing a file is worthwhile.
+
+    Known text and already-compressed formats are decided by suffix;
+    anything else by how well its first bytes compress.
+
+    Args:
+        path: Local file
+        size: File size if already known
+
+    Returns:
+        True if the file should be uploaded compressed
+    """
+    if size is None:
+        size = path.stat().st_size
+    if size < MIN_COMPRESS_SIZE:
+        return False
+
+    suffix = path.suffix.lower()
+    if suffix in COMPRESSIBLE_SUFFIXES:
+        return True
+    if suffix in INCOMPRESSIBLE_SUFFIXES:
+        return False
+
+    with open(path, "rb") as f:
+        sample = f.read(PROBE_SIZE)
+    return len(zlib.compress(sample, 1)) <= len(sample) * PROBE_MAX_RATIO
+
+
+class CompressingReader:
+    """Read-only stream yielding the compressed bytes of a file object.
+
+    Not seekable, so uploaders read it once front to back and buffer at
+    most one part in memory.
+    """
+
+    def __init__(self, fileobj, encoding: str, level: int | None = None):
+        """Wrap a readable binary file object.
+
+        Args:
+            fileobj: Source of uncompressed bytes
+            encoding: "gzip" or "zstd"
+            level: Compression level, the encoding's default if None
+
+        Raises:
+            ValueError: If the encoding is unknown or unavailable
+        """
+        check_encoding(encoding)
+        self._fileobj = fileobj
+        if encoding == "gzip":
+            self._compressor = zlib.compressobj(
+                6 if level is None else level, zlib.DEFLATED, _GZIP_WBITS
+            )
+        else:
+            zstandard = _zstandard()
+            self._compressor = zstandard.ZstdCompressor(
+                level=3 if level is None else level
+            ).compressobj()
+        self._buffer = bytearray()
+        self._finished = False
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to size compressed bytes, all remaining if negative."""
+        while not self._finished and (size < 0 or len(self._buffer) < size):
+            chunk = self._fileobj.read(PROBE_SIZE if size < 0 else max(size, 1))
+            if chunk:
+                self._buffer += self._compressor.compress(chunk)
+            else:
+                self._buffer += self._compressor.flush()
+                self._finished = True
+
+        if size < 0 or size >= len(self._buffer):
+            data = bytes(self._buffer)
+            self._buffer.clear()
+        else:
+            data = bytes(self._buffer[:size])
+            del self._buffer[:size]
+        return data
+
+
+class DecompressingWriter:
+    """Write-only stream decompressing what is written into a file object.
+
+    Not seekable, so downloaders write parts strictly in order.
+    """
+
+    def __init__(self, fileobj, encoding: str):
+        """Wrap a writable binary file object.
+
+        Args:
+            fileobj: Destination of the decompressed bytes
+            encoding: "gzip" or "zstd"
+
+        Raises:
+            ValueError: If the encoding is unknown or unavailable
+        """
+        check_encoding(encoding)
+        self._fileobj = fileobj
+        self._encoding = encoding
+        if encoding == "gzip":
+            self._decompressor = zlib.decompressobj(_GZIP_WBITS)
+        else:
+            self._decompressor = _zstandard().ZstdDecompressor().decompressobj()
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def write(self, data: bytes) -> int:
+        """Decompress a chunk and write the result."""
+        self._fileobj.write(self._decompressor.decompress(data))
+        return len(data)
+
+    def finish(self) -> None:
+        """Write anything still held by the decompressor.
+
+        Raises:
+            ValueError: If the compressed stream was truncated
+        """
+        self._fileobj.write(self._decompressor.flush())
+        if self._encoding == "gzip" and not self._decompressor.eof:
+            raise ValueError("Compressed stream ended early")
+
+
+def decompress(data: bytes, encoding: str, complete: bool = True) -> bytes:
+    """Decompress an in-memory object or the start of one.
+
+    Args:
+        data: Compressed bytes
+        encoding: "gzip" or "zstd"
+        complete: Whether data is the whole stream; a prefix decompresses
+            as far as it goes
+
+    Returns:
+        The decompressed bytes
+
+    Raises:
+        ValueError: If a complete stream is truncated or unusable
+    """
+    out = io.BytesIO()
+    writer = DecompressingWriter(out, encoding)
+    writer.write(data)
+    if complete:
+        writer.finish()
+    return out.getvalue()
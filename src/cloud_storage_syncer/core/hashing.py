@@ -0,0 +1,157 @@
+"""Content hashing of local files.
+
+Files are hashed through a read-only memory map, so large files are not
+copied through Python buffers and hashlib can release the GIL while
+several files are hashed in parallel threads.
+"""
+
+import base64
+import hashlib
+import math
+import mmap
+import zlib
+from pathlib import Path
+
+HASH_ALGORITHMS = ("md5", "sha256", "crc32", "etag", "s3-sha256", "s3-crc32")
+
+# "s3-*" algorithms produce S3 additional checksums; a part size of 0 means a
+# whole-object checksum, otherwise the composite checksum of a multipart upload
+WHOLE_OBJECT = 0
+
+# Uploads switch to multipart at this size and use parts of this size; both
+# must match the TransferConfig S3Service uploads with for ETags to agree
+MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+MULTIPART_THRESHOLD = MULTIPART_CHUNKSIZE
+MAX_UPLOAD_PARTS = 10000
+
+# hashlib releases the GIL per update call; slices bound the time it is held
+_UPDATE_SIZE = 4 * 1024 * 1024
+
+
+def effective_part_size(size: int, part_size: int = MULTIPART_CHUNKSIZE) -> int:
+    """Get the part size the uploader really uses for a file of this size.
+
+    Like boto3, the part size is doubled until the upload fits in 10,000
+    parts.
+    """
+    while math.ceil(size / part_size) > MAX_UPLOAD_PARTS:
+        part_size *= 2
+    return part_size
+
+
+def _update(digest, view: memoryview) -> None:
+    """Feed a buffer to a hash object in bounded slices."""
+    for start in range(0, len(view), _UPDATE_SIZE):
+        digest.update(view[start : start + _UPDATE_SIZE])
+
+
+def _crc32(view: memoryview) -> str:
+    """CRC32 in the base64 big-endian form S3 checksums use."""
+    crc = 0
+    for start in range(0, len(view), _UPDATE_SIZE):
+        crc = zlib.crc32(view[start : start + _UPDATE_SIZE], crc)
+    return base64.b64encode(crc.to_bytes(4, "big")).decode("ascii")
+
+
+def _multipart_etag(view: memoryview, part_size: int) -> str:
+    """ETag S3 assigns to an upload of these bytes, including the quotes."""
+    if len(view) < MULTIPART_THRESHOLD:
+        return f'"{hashlib.md5(view).hexdigest()}"'
+
+    part_size = effective_part_size(len(view), part_size)
+    combined = hashlib.md5()
+    parts = 0
+    for start in range(0, len(view), part_size):
+        combined.update(hashlib.md5(view[start : start + part_size]).digest())
+        parts += 1
+    return f'"{combined.hexdigest()}-{parts}"'
+
+
+def _s3_checksum(view: memoryview, algorithm: str, part_size: int) -> str:
+    """S3 additional checksum of an upload of these bytes.
+
+    A multipart upload's composite checksum is the checksum of the
+    concatenated binary part checksums, followed by "-<part count>".
+    """
+
+    def digest(data: memoryview) -> bytes:
+        if algorithm == "s3-crc32":
+            crc = 0
+            for start in range(0, len(data), _UPDATE_SIZE):
+                crc = zlib.crc32(data[start : start + _UPDATE_SIZE], crc)
+            return crc.to_bytes(4, "big")
+        sha = hashlib.sha256()
+        _update(sha, data)
+        return sha.digest()
+
+    if part_size == WHOLE_OBJECT:
+        return base64.b64encode(digest(view)).decode("ascii")
+
+    part_digests = [
+        digest(view[start : start + part_size])
+        for start in range(0, max(len(view), 1), part_size)
+    ]
+    combined = digest(memoryview(b"".join(part_digests)))
+    return f"{base64.b64encode(combined).decode('ascii')}-{len(part_digests)}"
+
+
+def hash_bytes(
+    view: memoryview, algorithm: str, part_size: int = MULTIPART_CHUNKSIZE
+) -> str:
+    """Hash an in-memory buffer.
+
+    Args:
+        view: Data to hash
+        algorithm: "md5" or "sha256" (hex), "crc32" (base64, as S3 reports
+            checksums), "etag" (the quoted ETag of an upload), or
+            "s3-sha256" / "s3-crc32" (S3 additional checksum of an upload)
+        part_size: Upload part size for "etag"; for "s3-*", WHOLE_OBJECT or
+            the part size of a multipart upload
+
+    Returns:
+        The digest string
+
+    Raises:
+        ValueError: If the algorithm is unknown
+    """
+    if algorithm in ("md5", "sha256"):
+        digest = hashlib.new(algorithm)
+        _update(digest, view)
+        return digest.hexdigest()
+    if algorithm == "crc32":
+        return _crc32(view)
+    if algorithm == "etag":
+        return _multipart_etag(view, part_size)
+    if algorithm in ("s3-sha256", "s3-crc32"):
+        return _s3_checksum(view, algorithm, part_size)
+    raise ValueError(f"Unknown hash algorithm: {algorithm}")
+
+
+def hash_file(
+    path: Path, algorithm: str, part_size: int = MULTIPART_CHUNKSIZE
+) -> str:
+    """Hash a file through a memory map.
+
+    Args:
+        path: File to hash
+        algorithm: See hash_bytes
+        part_size: See hash_bytes
+
+    Returns:
+        The digest string
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the algorithm is unknown
+    """
+    with open(path, "rb") as f:
+        # Empty files cannot be mapped
+        if f.seek(0, 2) == 0:
+            return hash_bytes(memoryview(b""), algorithm, part_size)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                return hash_bytes(view, algorithm, part_size)
+            finally:
+                view.release()
+
@@ -0,0 +1,181 @@
+"""S3 Inventory manifest and report parsing.
+
+An inventory delivery is a ``manifest.json`` naming one or more data files
+(gzipped CSV or Parquet) that together list every object in the source
+bucket. Rows are turned into ``ObjectEntry`` values one at a time, so a
+report with tens of millions of rows is never held in memory.
+"""
+
+import csv
+import json
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from urllib.parse import unquote_plus
+
+from ..models import ObjectEntry
+
+MANIFEST_NAME = "manifest.json"
+INVENTORY_FORMATS = ("CSV", "Parquet")
+
+# CSV schema names mapped to the column names Parquet reports use
+_CSV_COLUMNS = {
+    "Key": "key",
+    "Size": "size",
+    "LastModifiedDate": "last_modified_date",
+    "ETag": "e_tag",
+    "StorageClass": "storage_class",
+    "IsLatest": "is_latest",
+    "IsDeleteMarker": "is_delete_marker",
+}
+REQUIRED_COLUMNS = ("key", "size")
+
+
+@dataclass
+class InventoryManifest:
+    """Parsed inventory manifest."""
+
+    source_bucket: str
+    destination_bucket: str
+    file_format: str
+    columns: list[str]
+    files: list[str]
+    creation_timestamp: int = 0  # Milliseconds since the epoch
+
+    @property
+    def created_at(self) -> datetime:
+        """When the inventory snapshot was taken."""
+        return datetime.fromtimestamp(self.creation_timestamp / 1000, tz=UTC)
+
+
+def _bucket_from_arn(value: str) -> str:
+    """Strip the "arn:aws:s3:::" prefix from a destination bucket."""
+    return value.rsplit(":", 1)[-1]
+
+
+def parse_manifest(data: bytes) -> InventoryManifest:
+    """Parse a manifest.json document.
+
+    Args:
+        data: Raw manifest JSON
+
+    Returns:
+        Parsed manifest; for CSV, ``columns`` are normalized to the Parquet
+        column names (empty for Parquet, whose files describe themselves)
+
+    Raises:
+        ValueError: If the manifest is malformed or its format unsupported
+    """
+    try:
+        manifest = json.loads(data)
+        file_format = manifest["fileFormat"]
+        files = [item["key"] for item in manifest["files"]]
+    except (json.JSONDecodeError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid inventory manifest: {e}") from e
+
+    if file_format not in INVENTORY_FORMATS:
+        raise ValueError(f"Unsupported inventory format: {file_format}")
+
+    columns = []
+    if file_format == "CSV":
+        schema = [name.strip() for name in manifest.get("fileSchema", "").split(",")]
+        columns = [_CSV_COLUMNS.get(name, name) for name in schema]
+        missing = [name for name in REQUIRED_COLUMNS if name not in columns]
+        if missing:
+            raise ValueError(f"Inventory schema lacks columns: {', '.join(missing)}")
+
+    return InventoryManifest(
+        source_bucket=manifest.get("sourceBucket", ""),
+        destination_bucket=_bucket_from_arn(manifest.get("destinationBucket", "")),
+        file_format=file_format,
+        columns=columns,
+        files=files,
+        creation_timestamp=int(manifest.get("creationTimestamp", 0)),
+    )
+
+
+def _parse_time(value) -> int:
+    """Convert an inventory timestamp to epoch seconds."""
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    if not value:
+        return 0
+    return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp())
+
+
+def _is_true(value) -> bool:
+    """Read a boolean column that may be a bool or a "true"/"false" string."""
+    if isinstance(value, str):
+        return value.lower() == "true"
+    return bool(value)
+
+
+def entry_from_record(record: dict) -> ObjectEntry | None:
+    """Build a listing entry from one inventory row.
+
+    Args:
+        record: Row keyed by Parquet column names, key already decoded
+
+    Returns:
+        The entry, or None for delete markers and non-current versions
+    """
+    if _is_true(record.get("is_delete_marker")):
+        return None
+    if "is_latest" in record and not _is_true(record["is_latest"]):
+        return None
+
+    etag = record.get("e_tag") or ""
+    return ObjectEntry(
+        key=record["key"],
+        size=int(record.get("size") or 0),
+        mtime=_parse_time(record.get("last_modified_date")),
+        etag=f'"{etag}"' if etag else "",
+        storage_class=record.get("storage_class") or "STANDARD",
+    )
+
+
+def iter_csv_entries(
+    lines: Iterable[str], columns: list[str], prefix: str = ""
+) -> Iterator[ObjectEntry]:
+    """Stream entries out of a decompressed CSV inventory file.
+
+    Args:
+        lines: Text lines of the CSV file
+        columns: Column names from the manifest
+        prefix: Only yield keys starting with this prefix
+
+    Yields:
+        Current, non-deleted objects under the prefix
+    """
+    key_column = columns.index("key")
+    for row in csv.reader(lines):
+        if len(row) != len(columns):
+            continue
+        key = unquote_plus(row[key_column])
+        if not key.startswith(prefix):
+            continue
+        record = dict(zip(columns, row, strict=True))
+        record["key"] = key
+        entry = entry_from_record(record)
+        if entry is not None:
+            yield entry
+
+
+def iter_record_entries(
+    records: Iterable[dict], prefix: str = ""
+) -> Iterator[ObjectEntry]:
+    """Stream entries out of Parquet rows.
+
+    Args:
+        records: Rows keyed by column name
+        prefix: Only yield keys starting with this prefix
+
+    Yields:
+        Current, non-deleted objects under the prefix
+    """
+    for record in records:
+        if not record["key"].startswith(prefix):
+            continue
+        entry = entry_from_record(record)
+        if entry is not None:
+            yield entry
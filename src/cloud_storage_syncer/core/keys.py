@@ -0,0 +1,8 @@
+"""Helpers for treating S3 keys as paths."""
+
+
+def directory_prefix(s3_prefix: str) -> str:
+    """Ensure a non-empty prefix ends with "/" for directory-like behavior."""
+    if s3_prefix and not s3_prefix.endswith("/"):
+        return s3_prefix + "/"
+    return s3_prefix
@@ -0,0 +1,23 @@
+"""JSON form of get_object_info results.
+
+The daemon sends these over its socket and the shared cache stores them,
+so the one datetime field is carried as an ISO 8601 string.
+"""
+
+from datetime import datetime
+
+
+def encode_object_info(info: dict) -> dict:
+    """Make a get_object_info result JSON-serializable."""
+    encoded = dict(info)
+    if isinstance(encoded.get("last_modified"), datetime):
+        encoded["last_modified"] = encoded["last_modified"].isoformat()
+    return encoded
+
+
+def decode_object_info(info: dict) -> dict:
+    """Restore a get_object_info result from its JSON form."""
+    decoded = dict(info)
+    if isinstance(decoded.get("last_modified"), str):
+        decoded["last_modified"] = datetime.fromisoformat(decoded["last_modified"])
+    return decoded
@@ -0,0 +1,173 @@
+"""Small-file packing into tar pack objects with a sidecar index.
+
+A pack is a plain tar archive stored under ``<prefix>/.packs/``. Next to it
+a JSON index records where each member's bytes start inside the pack, so a
+single file can be fetched back with one ranged GET. Packs stay readable
+with standard ``tar`` tools.
+"""
+
+import json
+import tarfile
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+PACK_DIR = ".packs"
+PACK_SUFFIX = ".tar"
+INDEX_SUFFIX = ".index.json"
+INDEX_VERSION = 1
+
+
+@dataclass
+class PackMember:
+    """Location of one packed file."""
+
+    s3_key: str
+    pack_key: str
+    offset: int
+    size: int
+    mtime: float
+
+    @property
+    def byte_range(self) -> str | None:
+        """HTTP Range header value covering the member's bytes.
+
+        None for an empty member: no range can cover zero bytes, and S3
+        answers an unsatisfiable one with the whole pack.
+        """
+        if self.size == 0:
+            return None
+        return f"bytes={self.offset}-{self.offset + self.size - 1}"
+
+
+def pack_root(s3_prefix: str | None) -> str:
+    """Normalize an upload prefix into a key root ending with "/" (or empty)."""
+    if not s3_prefix:
+        return ""
+    return s3_prefix.rstrip("/") + "/"
+
+
+def new_pack_key(root: str) -> str:
+    """Generate a unique pack object key under a root."""
+    return f"{root}{PACK_DIR}/pack-{uuid.uuid4().hex}{PACK_SUFFIX}"
+
+
+def index_key_for(pack_key: str) -> str:
+    """Get the sidecar index key for a pack key."""
+    return pack_key + INDEX_SUFFIX
+
+
+def is_index_key(s3_key: str) -> bool:
+    """Check whether a key is a pack index."""
+    return f"/{PACK_DIR}/" in f"/{s3_key}" and s3_key.endswith(INDEX_SUFFIX)
+
+
+def is_pack_key(s3_key: str) -> bool:
+    """Check whether a key is a pack object."""
+    return f"/{PACK_DIR}/" in f"/{s3_key}" and s3_key.endswith(PACK_SUFFIX)
+
+
+def root_of_pack(pack_key: str) -> str:
+    """Get the key root a pack's member paths are relative to."""
+    marker = f"{PACK_DIR}/"
+    return pack_key[: pack_key.rindex(marker)]
+
+
+def group_files(
+    files: Iterable[tuple[Path, str, int]], max_pack_size: int
+) -> list[list[tuple[Path, str, int]]]:
+    """Split files into groups whose total size stays under max_pack_size.
+
+    Args:
+        files: (local path, relative key, size) tuples
+        max_pack_size: Target maximum bytes of file data per pack
+
+    Returns:
+        Groups of files, one per pack
+    """
+    groups = []
+    current = []
+    current_size = 0
+
+    for entry in files:
+        size = entry[2]
+        if current and current_size + size > max_pack_size:
+            groups.append(current)
+            current = []
+            current_size = 0
+        current.append(entry)
+        current_size += size
+
+    if current:
+        groups.append(current)
+    return groups
+
+
+def write_pack(files: Iterable[tuple[Path, str, int]], pack_path: Path) -> dict:
+    """Write files into a tar pack and build its index.
+
+    Args:
+        files: (local path, relative key, size) tuples
+        pack_path: Local path of the pack file to create
+
+    Returns:
+        Index mapping each relative key to its offset, size and mtime
+    """
+    entries = {}
+
+    with tarfile.open(pack_path, mode="w", format=tarfile.PAX_FORMAT) as tar:
+        for local_path, relative_key, _ in files:
+            tarinfo = tar.gettarinfo(str(local_path), arcname=relative_key)
+            with open(local_path, "rb") as f:
+                tar.addfile(tarinfo, f)
+
+            # Data is padded to whole blocks; the header precedes it
+            padded = -(-tarinfo.size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+            entries[relative_key] = {
+                "offset": tar.offset - padded,
+                "size": tarinfo.size,
+                "mtime": tarinfo.mtime,
+            }
+
+    return {"version": INDEX_VERSION, "files": entries}
+
+
+def dump_index(index: dict, pack_key: str) -> bytes:
+    """Serialize a pack index, recording which pack it describes."""
+    return json.dumps({**index, "pack_key": pack_key}).encode("utf-8")
+
+
+def load_index(data: bytes, index_key: str) -> list[PackMember]:
+    """Parse a pack index into members with absolute S3 keys.
+
+    Args:
+        data: Raw index JSON
+        index_key: Key the index was read from
+
+    Returns:
+        Members described by the index
+
+    Raises:
+        ValueError: If the index is malformed or has an unknown version
+    """
+    try:
+        index = json.loads(data)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid pack index {index_key}: {e}") from e
+
+    if index.get("version") != INDEX_VERSION:
+        raise ValueError(f"Unsupported pack index version in {index_key}")
+
+    pack_key = index_key[: -len(INDEX_SUFFIX)]
+    root = root_of_pack(pack_key)
+    return [
+        PackMember(
+            s3_key=root + relative_key,
+            pack_key=pack_key,
+            offset=entry["offset"],
+            size=entry["size"],
+            mtime=entry["mtime"],
+        )
+        for relative_key, entry in index["files"].items()
+    ]
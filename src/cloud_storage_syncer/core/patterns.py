@@ -0,0 +1,145 @@
+"""Key pattern matching with literal-prefix extraction.
+
+Patterns are compiled once into a ``KeyMatcher``. Its ``prefix`` is the
+longest literal text every matching key must start with, which callers push
+down as the S3 listing ``Prefix`` so only that subtree is listed.
+"""
+
+import fnmatch
+import re
+from dataclasses import dataclass, field
+
+PATTERN_MODES = ("auto", "substring", "glob", "regex")
+
+_GLOB_META = "*?["
+_REGEX_META = set(".^$*+?{}[]|()\\")
+_REGEX_OPTIONAL = set("*?{")
+
+
+def glob_literal_prefix(pattern: str) -> str:
+    """Get the literal text before the first glob wildcard."""
+    for index, char in enumerate(pattern):
+        if char in _GLOB_META:
+            return pattern[:index]
+    return pattern
+
+
+def regex_literal_prefix(pattern: str) -> str:
+    """Get the literal text every match of an anchored regex starts with.
+
+    Only patterns anchored with ``^`` or ``\\A`` have a prefix. Alternation
+    anywhere disables extraction, since a branch may start differently.
+    """
+    if "|" in pattern:
+        return ""
+    if pattern.startswith("^"):
+        index = 1
+    elif pattern.startswith("\\A"):
+        index = 2
+    else:
+        return ""
+
+    literal = []
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\":
+            escaped = pattern[index + 1 : index + 2]
+            # \d, \w, \b, ... are classes or assertions, not literals
+            if not escaped or escaped.isalnum():
+                break
+            literal.append(escaped)
+            index += 2
+        elif char in _REGEX_META:
+            break
+        else:
+            literal.append(char)
+            index += 1
+
+    # A quantifier allowing zero repetitions makes the last char optional
+    if literal and index < len(pattern) and pattern[index] in _REGEX_OPTIONAL:
+        literal.pop()
+    return "".join(literal)
+
+
+@dataclass
+class KeyMatcher:
+    """Compiled key pattern."""
+
+    pattern: str
+    mode: str
+    ignore_case: bool = False
+    prefix: str = ""
+    _regex: re.Pattern | None = field(default=None, repr=False)
+
+    def matches(self, key: str) -> bool:
+        """Check whether an S3 key matches the pattern."""
+        if self.mode == "substring":
+            return self.pattern.lower() in key.lower()
+        if self.mode == "glob":
+            return self._regex.match(key) is not None
+        return self._regex.search(key) is not None
+
+
+def compile_pattern(
+    pattern: str, mode: str = "auto", ignore_case: bool = False
+) -> KeyMatcher:
+    """Compile a search pattern.
+
+    Args:
+        pattern: Pattern text
+        mode: "substring" (case-insensitive containment), "glob" (fnmatch
+            over the whole key, "*" also crosses "/"), "regex" (re.search),
+            or "auto" (glob if the pattern has wildcards, else substring)
+        ignore_case: Case-insensitive glob/regex matching; disables prefix
+            push-down because S3 prefixes are case-sensitive
+
+    Returns:
+        Compiled matcher
+
+    Raises:
+        ValueError: If the mode is unknown or the regex is invalid
+    """
+    if mode not in PATTERN_MODES:
+        raise ValueError(f"Unknown pattern mode: {mode}")
+
+    if mode == "auto":
+        mode = "glob" if any(char in pattern for char in _GLOB_META) else "substring"
+
+    if mode == "substring":
+        return KeyMatcher(pattern=pattern, mode=mode, ignore_case=True)
+
+    flags = re.IGNORECASE if ignore_case else 0
+    if mode == "glob":
+        regex = re.compile(fnmatch.translate(pattern), flags)
+        prefix = glob_literal_prefix(pattern)
+    else:
+        try:
+            regex = re.compile(pattern, flags)
+        except re.error as e:
+            raise ValueError(f"Invalid regular expression: {e}") from e
+        prefix = regex_literal_prefix(pattern)
+
+    return KeyMatcher(
+        pattern=pattern,
+        mode=mode,
+        ignore_case=ignore_case,
+        prefix="" if ignore_case else prefix,
+        _regex=regex,
+    )
+
+
+def listing_prefix(matcher: KeyMatcher, prefix: str = "") -> str | None:
+    """Combine a caller's scope prefix with the pattern's literal prefix.
+
+    Args:
+        matcher: Compiled pattern
+        prefix: Scope the caller already restricts the search to
+
+    Returns:
+        The narrower of the two prefixes, or None if they cannot both hold
+    """
+    if matcher.prefix.startswith(prefix):
+        return matcher.prefix
+    if prefix.startswith(matcher.prefix):
+        return prefix
+    return None
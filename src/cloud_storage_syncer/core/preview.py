@@ -0,0 +1,151 @@
+"""Preview generation for images, text and delimited tables.
+
+Previews are small derived files: a downsized JPEG for images, the first
+lines of text files, and the header and first rows of CSV/TSV files as
+JSON. Text previews only need the start of an object, so callers fetch a
+bounded prefix instead of the whole file.
+
+Image thumbnails need the optional ``Pillow`` package.
+"""
+
+import csv
+import io
+import json
+from pathlib import PurePosixPath
+
+IMAGE = "image"
+TEXT = "text"
+TABLE = "table"
+
+MEDIA_TYPES = {
+    IMAGE: "image/jpeg",
+    TEXT: "text/plain; charset=utf-8",
+    TABLE: "application/json",
+}
+
+IMAGE_SUFFIXES = frozenset(
+    {".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp", ".tif", ".tiff"}
+)
+TABLE_DELIMITERS = {".csv": ",", ".tsv": "\t"}
+TEXT_SUFFIXES = frozenset(
+    {
+        ".txt", ".log", ".md", ".json", ".jsonl", ".ndjson", ".xml", ".html",
+        ".htm", ".yaml", ".yml", ".ini", ".cfg", ".toml", ".sql", ".py", ".js",
+        ".css", ".sh",
+    }
+)
+
+# Bytes fetched from the start of a text or table object
+TEXT_PREVIEW_BYTES = 64 * 1024
+# Larger images are not fetched just to be thumbnailed
+MAX_IMAGE_SOURCE_SIZE = 64 * 1024 * 1024
+THUMBNAIL_QUALITY = 85
+
+
+def preview_kind(s3_key: str) -> str | None:
+    """Get the kind of preview a key supports, by its suffix.
+
+    Returns:
+        IMAGE, TEXT or TABLE, or None if no preview is available
+    """
+    suffix = PurePosixPath(s3_key).suffix.lower()
+    if suffix in IMAGE_SUFFIXES:
+        return IMAGE
+    if suffix in TABLE_DELIMITERS:
+        return TABLE
+    if suffix in TEXT_SUFFIXES:
+        return TEXT
+    return None
+
+
+def _head_lines(data: bytes, lines: int, complete: bool) -> tuple[list[str], bool]:
+    """Decode the first lines of a possibly truncated text prefix.
+
+    Returns:
+        (lines, whether more text follows)
+    """
+    text = data.decode("utf-8", errors="replace")
+    head = text.splitlines()
+    if not complete and head and not text.endswith(("\n", "\r")):
+        # The last line was cut off by the byte limit
+        head.pop()
+    truncated = not complete or len(head) > lines
+    return head[:lines], truncated
+
+
+def text_preview(data: bytes, lines: int, complete: bool) -> bytes:
+    """Build a text preview.
+
+    Args:
+        data: Start of the object
+        lines: Maximum lines to keep
+        complete: Whether data is the whole object
+
+    Returns:
+        UTF-8 text of the first lines
+    """
+    head, _ = _head_lines(data, lines, complete)
+    return "\n".join(head).encode("utf-8")
+
+
+def table_preview(data: bytes, rows: int, delimiter: str, complete: bool) -> bytes:
+    """Build a table preview.
+
+    Args:
+        data: Start of the object
+        rows: Maximum data rows to keep (the header is extra)
+        delimiter: Field delimiter
+        complete: Whether data is the whole object
+
+    Returns:
+        JSON with "header", "rows" and "truncated"
+    """
+    head, truncated = _head_lines(data, rows + 1, complete)
+    records = list(csv.reader(head, delimiter=delimiter))
+    return json.dumps(
+        {
+            "header": records[0] if records else [],
+            "rows": records[1:],
+            "truncated": truncated,
+        }
+    ).encode("utf-8")
+
+
+def image_thumbnail(data: bytes, size: int) -> bytes:
+    """Downsize an image to fit in a size x size box.
+
+    Args:
+        data: Complete image file
+        size: Longest side of the thumbnail in pixels
+
+    Returns:
+        JPEG bytes
+
+    Raises:
+        ValueError: If Pillow is not installed or the image cannot be read
+    """
+    try:
+        from PIL import Image, ImageOps, UnidentifiedImageError
+    except ImportError as e:
+        raise ValueError(
+            "Image previews require Pillow: "
+            "pip install 'cloud-storage-syncer[preview]'"
+        ) from e
+
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            # draft() lets JPEG decode at a reduced scale, much faster
+            image.draft("RGB", (size, size))
+            image = ImageOps.exif_transpose(image)
+            image.thumbnail((size, size))
+            if image.mode != "RGB":
+                # JPEG has no alpha; flatten onto white
+                background = Image.new("RGB", image.size, "white")
+                rgba = image.convert("RGBA")
+                background.paste(rgba, mask=rgba.getchannel("A"))
+                image = background
+            out = io.BytesIO()
+            image.save(out, "JPEG", quality=THUMBNAIL_QUALITY, optimize=True)
+            return out.getvalue()
+    except (UnidentifiedImageError, OSError) as e:
+        raise ValueError(f"Cannot read image: {e}") from e
@@ -0,0 +1,70 @@
+"""Token bucket rate limiting shared by concurrent workers."""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    ``acquire`` blocks until the requested amount is available.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None, clock=None):
+        """Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second, must be positive
+            capacity: Maximum burst size, defaults to one second of tokens
+            clock: Monotonic time function, injectable for tests
+
+        Raises:
+            ValueError: If rate or capacity is not positive
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity is not None else max(self.rate, 1.0)
+        if self.capacity <= 0:
+            raise ValueError("Capacity must be positive")
+
+        self._clock = clock or time.monotonic
+        self._tokens = self.capacity
+        self._updated = self._clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last update."""
+        now = self._clock()
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def try_acquire(self, amount: float = 1.0) -> float:
+        """Take tokens if available.
+
+        Args:
+            amount: Tokens to take, clamped to the bucket capacity
+
+        Returns:
+            0.0 if the tokens were taken, otherwise seconds to wait before
+            enough tokens will be available
+        """
+        amount = min(amount, self.capacity)
+        with self._lock:
+            self._refill()
+            if self._tokens >= amount:
+                self._tokens -= amount
+                return 0.0
+            return (amount - self._tokens) / self.rate
+
+    def acquire(self, amount: float = 1.0) -> None:
+        """Block until the tokens are available and take them."""
+        while True:
+            wait = self.try_acquire(amount)
+            if wait <= 0:
+                return
+            time.sleep(wait)
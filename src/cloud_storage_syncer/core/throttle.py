@@ -0,0 +1,271 @@
+"""Adaptive concurrency and retry control for S3 requests.
+
+S3 answers request bursts with ``SlowDown``/503. ``AdaptiveLimiter`` keeps
+an AIMD concurrency window (grow by one slot per window of successes, halve
+on throttling), retries throttled and transient failures with exponential
+backoff and full jitter, and tracks the request rate per key prefix so a
+prefix that was throttled is held just under the highest rate it sustained.
+"""
+
+import random
+import threading
+import time
+from collections.abc import Callable
+from typing import TypeVar
+
+from botocore.exceptions import (
+    ClientError,
+    ConnectionError,
+    ReadTimeoutError,
+)
+
+T = TypeVar("T")
+
+THROTTLE_ERROR_CODES = frozenset(
+    {
+        "SlowDown",
+        "Throttling",
+        "ThrottlingException",
+        "RequestLimitExceeded",
+        "TooManyRequestsException",
+        "503",
+    }
+)
+TRANSIENT_ERROR_CODES = frozenset(
+    {"InternalError", "RequestTimeout", "ServiceUnavailable", "500", "502", "504"}
+)
+
+
+def is_throttle_error(error: Exception) -> bool:
+    """Check whether an error means S3 wants us to slow down."""
+    if not isinstance(error, ClientError):
+        return False
+    code = error.response.get("Error", {}).get("Code", "")
+    status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    return code in THROTTLE_ERROR_CODES or status == 503
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Check whether an error is worth retrying without slowing down."""
+    if isinstance(error, ConnectionError | ReadTimeoutError):
+        return True
+    if not isinstance(error, ClientError):
+        return False
+    code = error.response.get("Error", {}).get("Code", "")
+    status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    return code in TRANSIENT_ERROR_CODES or status in (500, 502, 504)
+
+
+class _PrefixState:
+    """Request rate bookkeeping for one key prefix."""
+
+    __slots__ = ("window_start", "count", "throttled", "rate_limit", "sustained_rate")
+
+    def __init__(self, now: float):
+        """Start a measurement window at ``now``."""
+        self.window_start = now
+        self.count = 0
+        self.throttled = False
+        self.rate_limit: float | None = None
+        self.sustained_rate = 0.0
+
+
+class AdaptiveLimiter:
+    """Shared AIMD limiter with backoff for all S3 request paths."""
+
+    def __init__(
+        self,
+        initial_concurrency: int = 8,
+        min_concurrency: int = 1,
+        max_concurrency: int = 64,
+        max_attempts: int = 6,
+        base_delay: float = 0.1,
+        max_delay: float = 20.0,
+        decrease_factor: float = 0.5,
+        rate_window: float = 1.0,
+        prefix_depth: int = 1,
+        clock: Callable[[], float] | None = None,
+        sleep: Callable[[float], None] | None = None,
+        rng: random.Random | None = None,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            initial_concurrency: Starting number of requests in flight
+            min_concurrency: Lower bound for the concurrency window
+            max_concurrency: Upper bound for the concurrency window
+            max_attempts: Attempts per call, including the first one
+            base_delay: First backoff ceiling in seconds
+            max_delay: Largest backoff ceiling in seconds
+            decrease_factor: Multiplier applied to the window on throttling
+            rate_window: Seconds per per-prefix rate measurement window
+            prefix_depth: Key segments that identify a rate-tracked prefix
+            clock: Monotonic time function, injectable for tests
+            sleep: Sleep function, injectable for tests
+            rng: Random source for jitter, injectable for tests
+        """
+        if not 1 <= min_concurrency <= initial_concurrency <= max_concurrency:
+            raise ValueError("Concurrency bounds must satisfy min <= initial <= max")
+
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.decrease_factor = decrease_factor
+        self.rate_window = rate_window
+        self.prefix_depth = prefix_depth
+
+        self._clock = clock or time.monotonic
+        self._sleep = sleep or time.sleep
+        self._rng = rng or random.Random()
+
+        self._limit = float(initial_concurrency)
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self._condition = threading.Condition()
+        self._prefixes: dict[str, _PrefixState] = {}
+
+    @property
+    def concurrency(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    def prefix_of(self, key: str) -> str:
+        """Get the rate-tracked prefix for an S3 key."""
+        return "/".join(key.split("/")[: self.prefix_depth])
+
+    def sustained_rate(self, prefix: str) -> float:
+        """Highest request rate a prefix handled in a window without errors."""
+        with self._condition:
+            state = self._prefixes.get(prefix)
+            return state.sustained_rate if state else 0.0
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Full-jitter backoff for a zero-based retry attempt."""
+        ceiling = min(self.max_delay, self.base_delay * (2**attempt))
+        return self._rng.uniform(0, ceiling)
+
+    def _prefix_state(self, prefix: str, now: float) -> _PrefixState:
+        """Get the prefix state, rolling its measurement window if due."""
+        state = self._prefixes.get(prefix)
+        if state is None:
+            state = self._prefixes[prefix] = _PrefixState(now)
+            return state
+
+        elapsed = now - state.window_start
+        if elapsed >= self.rate_window:
+            rate = state.count / elapsed
+            if not state.throttled:
+                state.sustained_rate = max(state.sustained_rate, rate)
+                # Probe upwards again after a clean window
+                if state.rate_limit is not None:
+                    state.rate_limit += max(1.0, state.rate_limit * 0.05)
+            state.window_start = now
+            state.count = 0
+            state.throttled = False
+        return state
+
+    def _prefix_wait(self, prefix: str) -> float:
+        """Seconds to wait before the prefix may take another request."""
+        now = self._clock()
+        state = self._prefix_state(prefix, now)
+        if state.rate_limit is None:
+            state.count += 1
+            return 0.0
+
+        allowed = state.rate_limit * max(now - state.window_start, self.rate_window)
+        if state.count < allowed:
+            state.count += 1
+            return 0.0
+        return state.window_start + (state.count + 1) / state.rate_limit - now
+
+    def acquire(self, prefix: str = "") -> None:
+        """Block until a concurrency slot and the prefix rate allow a request."""
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+        while True:
+            with self._condition:
+                wait = self._prefix_wait(prefix)
+            if wait <= 0:
+                return
+            self._sleep(wait)
+
+    def release(self, prefix: str = "", throttled: bool = False) -> None:
+        """Return a slot and adjust the window for the request outcome."""
+        with self._condition:
+            self._in_flight -= 1
+            now = self._clock()
+
+            if throttled:
+                state = self._prefix_state(prefix, now)
+                state.throttled = True
+                observed = state.count / max(now - state.window_start, self.rate_window)
+                state.rate_limit = max(1.0, observed * self.decrease_factor)
+
+                # One decrease per congestion event, not one per failed request
+                if now - self._last_decrease >= self.rate_window:
+                    self._limit = max(
+                        float(self.min_concurrency), self._limit * self.decrease_factor
+                    )
+                    self._last_decrease = now
+            else:
+                self._limit = min(
+                    float(self.max_concurrency), self._limit + 1.0 / self._limit
+                )
+
+            self._condition.notify_all()
+
+    def call(self, fn: Callable[..., T], *args, s3_key: str = "", **kwargs) -> T:
+        """Run an S3 request under the limiter, retrying when appropriate.
+
+        Args:
+            fn: Client method or transfer function to run
+            *args: Positional arguments for fn
+            s3_key: S3 key or prefix the request targets, used for
+                per-prefix rate tracking
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Whatever fn returns
+
+        Raises:
+            Exception: The last error once retries are exhausted, or any
+                error that is neither throttling nor transient
+        """
+        prefix = self.prefix_of(s3_key)
+
+        for attempt in range(self.max_attempts):
+            self.acquire(prefix)
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                throttled = is_throttle_error(e)
+                self.release(prefix, throttled=throttled)
+                retryable = throttled or is_transient_error(e)
+                if not retryable or attempt == self.max_attempts - 1:
+                    raise
+                self._sleep(self.backoff_delay(attempt))
+                continue
+
+            self.release(prefix)
+            return result
+
+        raise AssertionError("unreachable")
+
+
+_default_limiter: AdaptiveLimiter | None = None
+_default_limiter_lock = threading.Lock()
+
+
+def get_default_limiter() -> AdaptiveLimiter:
+    """Get the process-wide limiter shared by every S3Service."""
+    global _default_limiter
+    if _default_limiter is None:
+        with _default_limiter_lock:
+            if _default_limiter is None:
+                _default_limiter = AdaptiveLimiter()
+    return _default_limiter
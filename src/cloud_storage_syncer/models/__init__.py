@@ -1,10 +1,18 @@
 """Data models package."""
 
+from .batch import BatchOperation, BatchResult
 from .config import S3Config
+from .copy import CopyResult
 from .delete import DeleteRequest, DeleteResult
 from .download import DownloadRequest, DownloadResult
+from .key_kind import KeyKind
+from .object_entry import ObjectEntry
+from .restore import RestoreResult
 from .storage import S3StorageClass
+from .transfer_plan import TransferPlan
+from .transition import TransitionPlan
 from .upload import UploadRequest, UploadResult
+from .verify import VerifyResult
 
 __all__ = [
     "S3Config",
@@ -15,4 +23,13 @@ __all__ = [
     "DownloadResult",
     "DeleteRequest",
     "DeleteResult",
+    "CopyResult",
+    "BatchOperation",
+    "BatchResult",
+    "KeyKind",
+    "ObjectEntry",
+    "RestoreResult",
+    "TransferPlan",
+    "TransitionPlan",
+    "VerifyResult",
 ]
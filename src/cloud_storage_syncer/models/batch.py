@@ -0,0 +1,93 @@
+"""Batch manifest operation and result models."""
+
+from dataclasses import dataclass
+
+from .storage import S3StorageClass
+
+BATCH_OPERATIONS = ("upload", "download", "delete")
+
+
+@dataclass
+class BatchOperation:
+    """One line of a batch manifest."""
+
+    line: int
+    op: str
+    s3_key: str
+    local_path: str | None = None
+    storage_class: S3StorageClass | None = None
+    force: bool = False
+
+    def __post_init__(self):
+        """Post-initialization validation."""
+        if self.op not in BATCH_OPERATIONS:
+            raise ValueError(f"Unknown operation: {self.op}")
+        if not self.s3_key or not self.s3_key.strip():
+            raise ValueError("S3 key cannot be empty")
+        if self.op == "upload" and not self.local_path:
+            raise ValueError("Upload requires local_path")
+
+    @classmethod
+    def from_dict(cls, data: dict, line: int) -> "BatchOperation":
+        """Create an operation from a decoded manifest line.
+
+        Args:
+            data: Manifest entry, e.g. {"op": "upload", "s3_key": "...",
+                "local_path": "...", "storage_class": "STANDARD_IA"}
+            line: 1-based manifest line number
+
+        Returns:
+            Batch operation
+
+        Raises:
+            ValueError: If the entry is malformed
+        """
+        if not isinstance(data, dict):
+            raise ValueError("Manifest entry must be a JSON object")
+        for name in ("op", "s3_key", "local_path", "storage_class"):
+            if data.get(name) is not None and not isinstance(data[name], str):
+                raise ValueError(f"{name} must be a string")
+        # bool("false") is True, so only a JSON boolean is accepted
+        if not isinstance(data.get("force", False), bool):
+            raise ValueError("force must be true or false")
+
+        storage_class = data.get("storage_class")
+        return cls(
+            line=line,
+            op=data.get("op", ""),
+            s3_key=data.get("s3_key", ""),
+            local_path=data.get("local_path"),
+            storage_class=S3StorageClass(storage_class) if storage_class else None,
+            force=data.get("force", False),
+        )
+
+
+@dataclass
+class BatchResult:
+    """Result of one batch manifest line."""
+
+    line: int
+    op: str
+    s3_key: str
+    success: bool
+    error_message: str | None = None
+
+    @classmethod
+    def success_result(cls, operation: BatchOperation) -> "BatchResult":
+        """Create a successful batch result."""
+        return cls(
+            line=operation.line, op=operation.op, s3_key=operation.s3_key, success=True
+        )
+
+    @classmethod
+    def error_result(
+        cls, line: int, op: str, s3_key: str, error_message: str
+    ) -> "BatchResult":
+        """Create a failed batch result."""
+        return cls(
+            line=line,
+            op=op,
+            s3_key=s3_key,
+            success=False,
+            error_message=error_message,
+        )
@@ -0,0 +1,30 @@
+"""Copy and move result models."""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class CopyResult:
+    """Result of a server-side copy or move of one object."""
+
+    success: bool
+    source_key: str
+    dest_key: str
+    error_message: str | None = None
+
+    @classmethod
+    def success_result(cls, source_key: str, dest_key: str) -> "CopyResult":
+        """Create a successful copy result."""
+        return cls(success=True, source_key=source_key, dest_key=dest_key)
+
+    @classmethod
+    def error_result(
+        cls, source_key: str, dest_key: str, error_message: str
+    ) -> "CopyResult":
+        """Create a failed copy result."""
+        return cls(
+            success=False,
+            source_key=source_key,
+            dest_key=dest_key,
+            error_message=error_message,
+        )
@@ -11,6 +11,7 @@ class DownloadRequest:
     s3_key: str
     output_path: str | None = None
     force: bool = False
+    etag: str | None = None  # Only download this version of the object
 
     def __post_init__(self):
         """Post-initialization validation."""
@@ -0,0 +1,17 @@
+"""S3 key resolution result enumeration."""
+
+from enum import StrEnum
+
+
+class KeyKind(StrEnum):
+    """What an S3 key refers to."""
+
+    OBJECT = "OBJECT"  # A single object, nothing below it
+    PREFIX = "PREFIX"  # Objects exist below "<key>/", no object at the key
+    BOTH = "BOTH"  # An object at the key and objects below "<key>/"
+    NONE = "NONE"  # Neither
+
+    @property
+    def is_directory(self) -> bool:
+        """Whether the key should be treated as a directory."""
+        return self in (KeyKind.PREFIX, KeyKind.BOTH)
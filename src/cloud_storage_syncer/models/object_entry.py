@@ -0,0 +1,83 @@
+"""Compact listing entry model."""
+
+import sys
+from dataclasses import astuple, dataclass
+from datetime import UTC, datetime
+
+from .storage import ARCHIVED_STORAGE_CLASSES, RESTORE_DONE, RESTORE_ONGOING
+
+
+@dataclass(slots=True)
+class ObjectEntry:
+    """One object in a bucket listing.
+
+    Slotted and kept to plain scalars so that multi-million object listings
+    stay small: the modification time is an epoch integer rather than a
+    datetime and storage classes are interned, so every STANDARD entry
+    points at the same string.
+    """
+
+    key: str
+    size: int
+    mtime: int  # Seconds since the epoch, UTC
+    etag: str
+    storage_class: str = "STANDARD"
+    pack_key: str | None = None  # Set for files stored inside a pack
+    restore_status: str | None = None  # Only set when listed with RestoreStatus
+
+    def __post_init__(self):
+        self.storage_class = sys.intern(self.storage_class)
+
+    @classmethod
+    def from_s3(cls, obj: dict) -> "ObjectEntry":
+        """Build an entry from a ListObjectsV2 ``Contents`` item."""
+        restore = obj.get("RestoreStatus")
+        restore_status = None
+        if restore is not None:
+            in_progress = restore.get("IsRestoreInProgress")
+            restore_status = RESTORE_ONGOING if in_progress else RESTORE_DONE
+        return cls(
+            key=obj["Key"],
+            size=obj["Size"],
+            mtime=int(obj["LastModified"].timestamp()),
+            etag=obj["ETag"],
+            storage_class=obj.get("StorageClass", "STANDARD"),
+            restore_status=restore_status,
+        )
+
+    @classmethod
+    def from_row(cls, row: list) -> "ObjectEntry":
+        """Rebuild an entry from a row made by to_row."""
+        return cls(*row)
+
+    def to_row(self) -> list:
+        """Convert to a positional row, which keeps large JSON listings small."""
+        return list(astuple(self))
+
+    @property
+    def last_modified(self) -> datetime:
+        """Modification time as an aware UTC datetime."""
+        return datetime.fromtimestamp(self.mtime, tz=UTC)
+
+    @property
+    def needs_restore(self) -> bool:
+        """Whether the object is archived with no restored copy to read."""
+        return (
+            self.storage_class in ARCHIVED_STORAGE_CLASSES
+            and self.restore_status != RESTORE_DONE
+        )
+
+    def to_dict(self) -> dict:
+        """Convert to the dictionary shape listings have always used."""
+        data = {
+            "key": self.key,
+            "size": self.size,
+            "last_modified": self.last_modified,
+            "etag": self.etag,
+            "storage_class": self.storage_class,
+        }
+        if self.pack_key is not None:
+            data["pack_key"] = self.pack_key
+        if self.restore_status is not None:
+            data["restore_status"] = self.restore_status
+        return data
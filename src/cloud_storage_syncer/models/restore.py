@@ -0,0 +1,22 @@
+"""Restore result models."""
+
+from dataclasses import dataclass, field
+
+from .download import DownloadResult
+
+
+@dataclass
+class RestoreResult:
+    """Outcome of restoring the archived objects under a key or prefix."""
+
+    requested: list[str] = field(default_factory=list)  # Restores started now
+    in_progress: list[str] = field(default_factory=list)  # Started earlier
+    restored: list[str] = field(default_factory=list)  # Readable copy available
+    pending: list[str] = field(default_factory=list)  # Not restored when returning
+    failed: list[tuple[str, str]] = field(default_factory=list)  # (key, reason)
+    downloads: list[DownloadResult] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every restore request and download succeeded."""
+        return not self.failed and all(r.success for r in self.downloads)
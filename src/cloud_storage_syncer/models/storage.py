@@ -13,3 +13,18 @@ class S3StorageClass(str, Enum):
     GLACIER_IR = "GLACIER_IR"  # Instant Retrieval
     GLACIER = "GLACIER"  # Flexible Retrieval
     DEEP_ARCHIVE = "DEEP_ARCHIVE"
+
+
+# Classes whose objects must be restored with RestoreObject before a GET
+ARCHIVED_STORAGE_CLASSES = frozenset(
+    {S3StorageClass.GLACIER.value, S3StorageClass.DEEP_ARCHIVE.value}
+)
+
+# Restore states reported by HEAD and by listings with RestoreStatus
+RESTORE_ONGOING = "ongoing"
+RESTORE_DONE = "restored"
+
+
+def archived_message(storage_class: str) -> str:
+    """Explain why an archived object cannot be downloaded yet."""
+    return f"Archived in {storage_class}; run 'restore' first"
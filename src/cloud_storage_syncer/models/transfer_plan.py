@@ -0,0 +1,23 @@
+"""Dry-run transfer plan models."""
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class TransferPlan:
+    """What an upload, download or delete would do, without doing it."""
+
+    operation: str  # "upload", "download" or "delete"
+    objects: int = 0  # Objects that would be transferred or deleted
+    total_bytes: int = 0
+    skipped: list[tuple[str, str]] = field(default_factory=list)  # (key, reason)
+    requests: dict[str, int] = field(default_factory=dict)  # By S3 API call
+
+    def count(self, api_call: str, n: int = 1) -> None:
+        """Add n requests of an S3 API call, e.g. "PutObject"."""
+        self.requests[api_call] = self.requests.get(api_call, 0) + n
+
+    @property
+    def total_requests(self) -> int:
+        """Requests of every type."""
+        return sum(self.requests.values())
@@ -0,0 +1,20 @@
+"""Storage class transition models."""
+
+from dataclasses import dataclass, field
+
+from .object_entry import ObjectEntry
+
+
+@dataclass
+class TransitionPlan:
+    """Objects under a prefix selected to change storage class."""
+
+    storage_class: str
+    objects: list[ObjectEntry] = field(default_factory=list)
+    unchanged: int = 0  # Matching objects already in the storage class
+    archived: list[str] = field(default_factory=list)  # Need a restore first
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes that would be rewritten."""
+        return sum(obj.size for obj in self.objects)
@@ -16,6 +16,8 @@ class UploadRequest:
     file_path: str
     s3_key: str
     storage_class: S3StorageClass | None = None
+    metadata: dict[str, str] | None = None  # User metadata stored with the object
+    compression: str | None = None  # "gzip" or "zstd" for compressible files
 
     def upload_with_service(self, s3_service: "S3Service") -> "UploadResult":
         """Upload file using the provided S3 service.
@@ -37,19 +39,28 @@ class UploadResult:
     error_message: str = ""
     s3_url: str = ""
     storage_class: str = ""
+    copied_from: str = ""  # Source key when the object was copied server-side
 
     @classmethod
-    def success(cls, s3_url: str, storage_class: str = "STANDARD") -> "UploadResult":
+    def success(
+        cls, s3_url: str, storage_class: str = "STANDARD", copied_from: str = ""
+    ) -> "UploadResult":
         """Create successful result.
 
         Args:
             s3_url: S3 URL of uploaded file
             storage_class: Storage class used
+            copied_from: Key the content was copied from instead of uploaded
 
         Returns:
             Success result
         """
-        return cls(success=True, s3_url=s3_url, storage_class=storage_class)
+        return cls(
+            success=True,
+            s3_url=s3_url,
+            storage_class=storage_class,
+            copied_from=copied_from,
+        )
 
     @classmethod
     def error(cls, error_message: str) -> "UploadResult":
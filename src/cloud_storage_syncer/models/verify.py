@@ -0,0 +1,23 @@
+"""Verification result models."""
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class VerifyResult:
+    """Outcome of comparing a local directory with an S3 prefix.
+
+    Keys are full S3 keys; local files are reported under the key they
+    would be uploaded to.
+    """
+
+    matched: list[str] = field(default_factory=list)
+    mismatched: list[tuple[str, str]] = field(default_factory=list)  # (key, reason)
+    missing: list[str] = field(default_factory=list)  # Local file, no object
+    extra: list[str] = field(default_factory=list)  # Object, no local file
+    unverified: list[tuple[str, str]] = field(default_factory=list)  # (key, reason)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every file and object was confirmed to match."""
+        return not (self.mismatched or self.missing or self.extra or self.unverified)
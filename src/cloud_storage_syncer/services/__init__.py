@@ -1,6 +1,14 @@
 """Service layer for cloud storage operations."""
 
+from .batch_service import BatchService
 from .config_service import ConfigService
+from .daemon_service import DaemonServer, create_s3_service
 from .s3_service import S3Service
 
-__all__ = ["S3Service", "ConfigService"]
+__all__ = [
+    "S3Service",
+    "ConfigService",
+    "BatchService",
+    "DaemonServer",
+    "create_s3_service",
+]
@@ -0,0 +1,168 @@
+"""Batch service for running manifest operations concurrently."""
+
+import json
+import logging
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from ..core.rate_limit import TokenBucket
+from ..models import (
+    BatchOperation,
+    BatchResult,
+    DownloadRequest,
+    UploadRequest,
+)
+from ..models.batch import BATCH_OPERATIONS
+from .s3_service import S3Service
+
+logger = logging.getLogger(__name__)
+
+
+class BatchService:
+    """Service for executing JSONL manifests over one S3 service."""
+
+    def __init__(
+        self,
+        s3_service: S3Service,
+        max_workers: int = 8,
+        max_rate: float | None = None,
+        allowed_operations: Iterable[str] = BATCH_OPERATIONS,
+    ):
+        """Initialize batch service.
+
+        Args:
+            s3_service: Service shared by all workers
+            max_workers: Number of operations running at the same time
+            max_rate: Maximum operations started per second, None for no limit
+            allowed_operations: Operations this caller may run
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.s3_service = s3_service
+        self.max_workers = max_workers
+        self.allowed_operations = frozenset(allowed_operations)
+        self._rate_limiter = TokenBucket(max_rate) if max_rate else None
+
+    def parse_manifest(
+        self, lines: Iterable[str | bytes]
+    ) -> Iterator[BatchOperation | BatchResult]:
+        """Parse manifest lines lazily.
+
+        Malformed lines become failed results instead of aborting the batch.
+
+        Args:
+            lines: JSONL manifest lines
+
+        Yields:
+            BatchOperation for valid lines, BatchResult for invalid ones
+        """
+        for line_number, line in enumerate(lines, start=1):
+            if isinstance(line, bytes):
+                line = line.decode("utf-8")
+            if not line.strip():
+                continue
+
+            data = {}
+            try:
+                data = json.loads(line)
+                operation = BatchOperation.from_dict(data, line_number)
+            except ValueError as e:
+                if not isinstance(data, dict):
+                    data = {}
+                op, s3_key = data.get("op", ""), data.get("s3_key", "")
+                op = op if isinstance(op, str) else ""
+                s3_key = s3_key if isinstance(s3_key, str) else ""
+                yield BatchResult.error_result(
+                    line_number, op, s3_key, f"Invalid manifest line: {e}"
+                )
+                continue
+
+            if operation.op not in self.allowed_operations:
+                yield BatchResult.error_result(
+                    line_number,
+                    operation.op,
+                    operation.s3_key,
+                    f"Operation not allowed here: {operation.op}",
+                )
+                continue
+
+            yield operation
+
+    def execute(self, operation: BatchOperation) -> BatchResult:
+        """Run a single operation.
+
+        Args:
+            operation: Parsed manifest operation
+
+        Returns:
+            Result for the manifest line
+        """
+        try:
+            if operation.op == "upload":
+                result = self.s3_service.upload_file(
+                    UploadRequest(
+                        file_path=operation.local_path,
+                        s3_key=operation.s3_key,
+                        storage_class=operation.storage_class,
+                    )
+                )
+            elif operation.op == "download":
+                result = self.s3_service.download_file(
+                    DownloadRequest(
+                        s3_key=operation.s3_key,
+                        output_path=operation.local_path,
+                        force=operation.force,
+                    )
+                )
+            else:
+                result = self.s3_service.delete_file(operation.s3_key)
+        except Exception as e:
+            logger.error(f"Unexpected error in batch line {operation.line}: {e}")
+            return BatchResult.error_result(
+                operation.line, operation.op, operation.s3_key, f"Failed: {e}"
+            )
+
+        if result.success:
+            return BatchResult.success_result(operation)
+        return BatchResult.error_result(
+            operation.line,
+            operation.op,
+            operation.s3_key,
+            result.error_message or f"{operation.op} failed",
+        )
+
+    def run(self, lines: Iterable[str | bytes]) -> Iterator[BatchResult]:
+        """Run a manifest and stream results as operations finish.
+
+        The manifest is read lazily and at most twice ``max_workers``
+        operations are queued, so memory stays flat for large manifests.
+
+        Args:
+            lines: JSONL manifest lines
+
+        Yields:
+            One BatchResult per non-empty manifest line, in completion order
+        """
+        max_pending = self.max_workers * 2
+        pending: set[Future] = set()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for item in self.parse_manifest(lines):
+                if isinstance(item, BatchResult):
+                    yield item
+                    continue
+
+                if self._rate_limiter:
+                    self._rate_limiter.acquire()
+                pending.add(executor.submit(self.execute, item))
+
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
@@ -0,0 +1,184 @@
+"""S3 service that shares listing and metadata results through a cache."""
+
+import logging
+
+from botocore.exceptions import ClientError
+
+from ..core.bandwidth import BandwidthLimiter
+from ..core.object_info import decode_object_info, encode_object_info
+from ..models import (
+    DeleteResult,
+    ObjectEntry,
+    S3Config,
+    S3StorageClass,
+    UploadRequest,
+    UploadResult,
+)
+from .s3_service import S3Service
+from .shared_cache import SharedCache
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached listing or HEAD result is served before asking S3 again
+DEFAULT_CACHE_TTL = 30.0
+
+
+def _listing_scope(prefix: str) -> str:
+    """Get the directory whose changes can alter a listing of this prefix."""
+    return prefix[: prefix.rfind("/") + 1]
+
+
+def _key_scopes(s3_key: str) -> set[str]:
+    """Get every directory containing a key, from the bucket root down."""
+    return {s3_key[: i + 1] for i, c in enumerate(s3_key) if c == "/"} | {""}
+
+
+class CachingS3Service(S3Service):
+    """S3Service whose listings and object metadata go through a SharedCache.
+
+    With a cache shared by several web workers, a listing or HEAD made by
+    one worker is reused by the others, so adding workers does not multiply
+    the requests sent to S3. Writes made through any worker invalidate the
+    affected entries: listings are keyed by a generation counter of the
+    directory they cover, which writes bump for every directory containing
+    the written key, and HEAD results are dropped per key. Changes made
+    outside this service are picked up once the TTL expires, or at once
+    when an S3EventConsumer feeds them to invalidate().
+    """
+
+    def __init__(
+        self,
+        config: S3Config,
+        cache: SharedCache,
+        ttl: float = DEFAULT_CACHE_TTL,
+        max_pool_connections: int = 10,
+        bandwidth_limiter: BandwidthLimiter | None = None,
+    ):
+        """Initialize the service.
+
+        Args:
+            config: S3 configuration
+            cache: Cache shared with the other workers
+            ttl: Seconds a cached result stays valid
+            max_pool_connections: Connection pool size of the client
+            bandwidth_limiter: Transfer budget shared with other services
+        """
+        super().__init__(
+            config,
+            max_pool_connections=max_pool_connections,
+            bandwidth_limiter=bandwidth_limiter,
+        )
+        self.cache = cache
+        self.ttl = ttl
+        # Buckets are the namespace: profiles on the same bucket share entries
+        self._namespace = f"s3:{config.region}:{config.bucket}"
+
+    def list_objects(
+        self, prefix: str = "", max_keys: int = 1000
+    ) -> list[ObjectEntry]:
+        """List objects, reusing a listing cached by any worker.
+
+        Args:
+            prefix: Prefix to filter objects
+            max_keys: Maximum number of objects to return
+
+        Returns:
+            Listing entries
+        """
+        scope = _listing_scope(prefix)
+        generation = self.cache.counter(f"{self._namespace}:generation:{scope}")
+        cache_key = f"{self._namespace}:list:{generation}:{max_keys}:{prefix}"
+        rows = self.cache.get(cache_key)
+        if rows is not None:
+            return [ObjectEntry.from_row(row) for row in rows]
+
+        # Failed listings are not cached, unlike the empty list they return
+        try:
+            objects = list(self.iter_objects(prefix=prefix, max_keys=max_keys))
+        except ClientError as e:
+            logger.error(f"Error listing objects: {e}")
+            return []
+        except Exception as e:
+            logger.error(f"Unexpected error listing objects: {e}")
+            return []
+
+        self.cache.set(cache_key, [obj.to_row() for obj in objects], self.ttl)
+        return objects
+
+    def get_object_info(self, s3_key: str) -> dict | None:
+        """Get object metadata, reusing a HEAD result cached by any worker.
+
+        Args:
+            s3_key: S3 object key
+
+        Returns:
+            Object metadata dict if found, None otherwise
+        """
+        cache_key = f"{self._namespace}:head:{s3_key}"
+        info = self.cache.get(cache_key)
+        if info is not None:
+            return decode_object_info(info)
+
+        # Missing objects are not cached so a fresh upload shows up at once
+        info = super().get_object_info(s3_key)
+        if info is not None:
+            self.cache.set(cache_key, encode_object_info(info), self.ttl)
+        return info
+
+    def invalidate(self, s3_keys: list[str]) -> None:
+        """Drop cached results that writes to these keys made stale.
+
+        Only listings of directories containing one of the keys are
+        invalidated; listings elsewhere in the bucket stay cached.
+
+        Args:
+            s3_keys: Keys that were written, deleted or restored
+        """
+        for scope in set().union(*map(_key_scopes, s3_keys)):
+            self.cache.incr(f"{self._namespace}:generation:{scope}")
+        for s3_key in s3_keys:
+            self.cache.delete(f"{self._namespace}:head:{s3_key}")
+
+    def upload_file(self, request: UploadRequest) -> UploadResult:
+        """Upload a file and invalidate its cached results."""
+        result = super().upload_file(request)
+        self.invalidate([request.s3_key])
+        return result
+
+    def copy_object(
+        self,
+        source_key: str,
+        dest_key: str,
+        storage_class: S3StorageClass | None = None,
+        source_info: dict | None = None,
+    ) -> UploadResult:
+        """Copy an object and invalidate the destination's cached results."""
+        result = super().copy_object(source_key, dest_key, storage_class, source_info)
+        self.invalidate([dest_key])
+        return result
+
+    def complete_presigned_upload(
+        self, s3_key: str, upload_id: str, etags: dict[int, str]
+    ) -> UploadResult:
+        """Finish a presigned upload and invalidate its cached results."""
+        result = super().complete_presigned_upload(s3_key, upload_id, etags)
+        self.invalidate([s3_key])
+        return result
+
+    def restore_object(self, s3_key: str, days: int, tier: str) -> str:
+        """Request a restore and invalidate the object's cached metadata."""
+        status = super().restore_object(s3_key, days, tier)
+        self.invalidate([s3_key])
+        return status
+
+    def delete_file(self, s3_key: str) -> DeleteResult:
+        """Delete a file and invalidate its cached results."""
+        result = super().delete_file(s3_key)
+        self.invalidate([s3_key])
+        return result
+
+    def delete_objects(self, s3_keys: list[str]) -> list[DeleteResult]:
+        """Delete objects and invalidate their cached results."""
+        results = super().delete_objects(s3_keys)
+        self.invalidate(s3_keys)
+        return results
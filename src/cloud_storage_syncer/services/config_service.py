@@ -2,58 +2,115 @@
 
 import json
 import os
+import threading
 from pathlib import Path
 
 from ..models import S3Config
 
+# Settings at the top level of the file form this profile; others are kept
+# under "profiles"
+DEFAULT_PROFILE = "default"
+
+# Profile used when none is given, e.g. set by the CLI's --profile option
+PROFILE_ENV = "CLOUD_STORAGE_SYNCER_PROFILE"
+
+_CONFIG_FIELDS = ("access_key", "secret_key", "bucket", "region")
+
+# Parsed config files by path, with the (mtime_ns, size) they were read at
+_cache: dict[Path, tuple[tuple[int, int], dict]] = {}
+_cache_lock = threading.Lock()
+
+
+def _read_config_file(path: Path) -> dict | None:
+    """Read a config file, reusing the parsed copy while the file is unchanged.
+
+    Returns:
+        Parsed JSON object, or None if the file is missing or malformed
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    with _cache_lock:
+        cached = _cache.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(data, dict):
+        return None
+
+    with _cache_lock:
+        _cache[path] = (version, data)
+    return data
+
 
 class ConfigService:
     """Service for managing configuration."""
 
-    def __init__(self, config_path: Path | None = None):
+    def __init__(self, config_path: Path | None = None, profile: str | None = None):
         """Initialize configuration service.
 
         Args:
             config_path: Path to config file, defaults to
                 ~/.cloud_storage_syncer/config.json
+            profile: Named profile to use, defaults to $CLOUD_STORAGE_SYNCER_PROFILE
+                or "default"
         """
         if config_path is None:
             config_path = Path.home() / ".cloud_storage_syncer" / "config.json"
 
         self.config_path = config_path
+        self.profile = profile or os.getenv(PROFILE_ENV) or DEFAULT_PROFILE
 
     def load_config(self) -> S3Config | None:
-        """Load configuration from file.
+        """Load the selected profile's configuration.
+
+        The file is only parsed again after it changes, so calling this per
+        request is cheap.
 
         Returns:
             S3Config if found and valid, None otherwise
         """
-        if not self.config_path.exists():
+        data = _read_config_file(self.config_path)
+        if data is None:
             return None
 
-        try:
-            with open(self.config_path) as f:
-                data = json.load(f)
-
-            # Validate required fields
-            required_fields = ["access_key", "secret_key", "bucket", "region"]
-            if not all(field in data for field in required_fields):
+        if self.profile != DEFAULT_PROFILE:
+            data = data.get("profiles", {}).get(self.profile)
+            if not isinstance(data, dict):
                 return None
 
-            config = S3Config(
-                access_key=data["access_key"],
-                secret_key=data["secret_key"],
-                bucket=data["bucket"],
-                region=data["region"],
-            )
+        # Validate required fields
+        if not all(isinstance(data.get(name), str) for name in _CONFIG_FIELDS):
+            return None
 
-            return config if config.is_valid() else None
+        config = S3Config(**{name: data[name] for name in _CONFIG_FIELDS})
+        return config if config.is_valid() else None
 
-        except (json.JSONDecodeError, KeyError, TypeError):
-            return None
+    def list_profiles(self) -> list[str]:
+        """List the profiles with valid configuration in the file.
+
+        Returns:
+            Profile names, "default" first if it is configured
+        """
+        data = _read_config_file(self.config_path) or {}
+        names = [DEFAULT_PROFILE] if data.get("bucket") else []
+        names.extend(sorted(data.get("profiles", {})))
+        return [
+            name
+            for name in names
+            if ConfigService(self.config_path, name).load_config() is not None
+        ]
 
     def save_config(self, config: S3Config) -> bool:
-        """Save configuration to file.
+        """Save configuration to the selected profile, keeping the others.
 
         Args:
             config: S3 configuration to save
@@ -65,44 +122,68 @@ class ConfigService:
             return False
 
         try:
-            # Create directory if it doesn't exist
-            self.config_path.parent.mkdir(parents=True, exist_ok=True)
-
-            data = {
-                "access_key": config.access_key,
-                "secret_key": config.secret_key,
-                "bucket": config.bucket,
-                "region": config.region,
-            }
-
-            with open(self.config_path, "w") as f:
-                json.dump(data, f, indent=2)
-
-            # Set restrictive permissions for security
-            os.chmod(self.config_path, 0o600)
-
+            data = dict(_read_config_file(self.config_path) or {})
+            values = {name: getattr(config, name) for name in _CONFIG_FIELDS}
+            if self.profile == DEFAULT_PROFILE:
+                data.update(values)
+            else:
+                data["profiles"] = {**data.get("profiles", {}), self.profile: values}
+            self._write(data)
             return True
 
         except Exception:
             return False
 
     def config_exists(self) -> bool:
-        """Check if configuration file exists.
+        """Check if configuration exists for the selected profile.
 
         Returns:
-            True if config file exists, False otherwise
+            True if the profile is configured, False otherwise
         """
-        return self.config_path.exists()
+        data = _read_config_file(self.config_path)
+        if data is None:
+            return self.config_path.exists() and self.profile == DEFAULT_PROFILE
+        if self.profile == DEFAULT_PROFILE:
+            return any(name in data for name in _CONFIG_FIELDS)
+        return self.profile in data.get("profiles", {})
 
     def delete_config(self) -> bool:
-        """Delete configuration file.
+        """Delete the selected profile, and the file once nothing is left.
 
         Returns:
             True if deleted successfully, False otherwise
         """
         try:
-            if self.config_path.exists():
+            data = dict(_read_config_file(self.config_path) or {})
+            if self.profile == DEFAULT_PROFILE:
+                for name in _CONFIG_FIELDS:
+                    data.pop(name, None)
+            else:
+                profiles = dict(data.get("profiles", {}))
+                profiles.pop(self.profile, None)
+                data["profiles"] = profiles
+                if not profiles:
+                    del data["profiles"]
+
+            if data:
+                self._write(data)
+            elif self.config_path.exists():
                 self.config_path.unlink()
             return True
         except Exception:
             return False
+
+    def _write(self, data: dict) -> None:
+        """Write the whole file with restrictive permissions."""
+        # Create directory if it doesn't exist
+        self.config_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(self.config_path, "w") as f:
+            json.dump(data, f, indent=2)
+
+        # Set restrictive permissions for security
+        os.chmod(self.config_path, 0o600)
+
+        # The rewrite may land within the filesystem's mtime granularity
+        with _cache_lock:
+            _cache.pop(self.config_path, None)
@@ -0,0 +1,432 @@
+"""Local daemon that keeps a warm S3 service behind a Unix socket."""
+
+import hashlib
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+from dataclasses import asdict
+from pathlib import Path
+
+from .. import __version__
+from ..core.bandwidth import BandwidthLimiter, parse_size
+from ..core.object_info import decode_object_info, encode_object_info
+from ..models import (
+    DeleteResult,
+    DownloadRequest,
+    DownloadResult,
+    KeyKind,
+    ObjectEntry,
+    S3Config,
+    S3StorageClass,
+    UploadRequest,
+    UploadResult,
+)
+from .s3_service import S3Service
+
+logger = logging.getLogger(__name__)
+
+SOCKET_ENV = "CLOUD_STORAGE_SYNCER_SOCKET"
+NO_DAEMON_ENV = "CLOUD_STORAGE_SYNCER_NO_DAEMON"
+
+
+class DaemonError(RuntimeError):
+    """Raised when the daemon cannot be reached or reports a failure."""
+
+
+def default_socket_path() -> Path:
+    """Get the daemon socket path.
+
+    Returns:
+        Path from CLOUD_STORAGE_SYNCER_SOCKET, or
+        ~/.cloud_storage_syncer/daemon.sock
+    """
+    socket_path = os.getenv(SOCKET_ENV)
+    if socket_path:
+        return Path(socket_path)
+    return Path.home() / ".cloud_storage_syncer" / "daemon.sock"
+
+
+def config_fingerprint(config: S3Config) -> str:
+    """Identify a configuration without exposing its credentials."""
+    material = f"{config.access_key}\0{config.bucket}\0{config.region}"
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:16]
+
+
+def _decode_upload_request(data: dict) -> UploadRequest:
+    """Rebuild an UploadRequest sent by a client."""
+    storage_class = data.get("storage_class")
+    return UploadRequest(
+        file_path=data["file_path"],
+        s3_key=data["s3_key"],
+        storage_class=S3StorageClass(storage_class) if storage_class else None,
+        metadata=data.get("metadata"),
+        compression=data.get("compression"),
+    )
+
+
+class _DaemonHandler(socketserver.StreamRequestHandler):
+    """Serve newline-delimited JSON requests on one client connection."""
+
+    def handle(self):
+        """Answer requests until the client disconnects."""
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            message = {}
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("Request must be a JSON object")
+                message = request
+                result = self.server.dispatch(message.get("op", ""), message)
+                response = {"ok": True, "result": result}
+            except Exception as e:
+                logger.error(f"Daemon request failed: {e}")
+                response = {"ok": False, "error": str(e)}
+
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+            if message.get("op") == "shutdown":
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server holding one warm S3Service for all CLI calls."""
+
+    daemon_threads = True
+
+    def __init__(self, s3_service: S3Service, socket_path: Path | None = None):
+        """Bind the daemon socket.
+
+        Args:
+            s3_service: Service whose client and connection pool are reused
+            socket_path: Socket location, defaults to default_socket_path()
+
+        Raises:
+            DaemonError: If another daemon is already listening on the socket
+        """
+        self.s3_service = s3_service
+        self.socket_path = socket_path or default_socket_path()
+
+        if self.socket_path.exists():
+            if _is_listening(self.socket_path):
+                raise DaemonError(f"Daemon already running on {self.socket_path}")
+            self.socket_path.unlink()
+
+        self.socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Only the owner may talk to a daemon holding their credentials; the
+        # umask makes bind create the socket as 0600 rather than chmod-ing
+        # it afterwards, which would leave it briefly open to others
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(str(self.socket_path), _DaemonHandler)
+        finally:
+            os.umask(old_umask)
+
+    def server_close(self):
+        """Close the socket and remove the socket file."""
+        super().server_close()
+        try:
+            self.socket_path.unlink()
+        except OSError:
+            pass
+
+    def dispatch(self, op: str, message: dict):
+        """Run one operation against the warm service.
+
+        Args:
+            op: Operation name
+            message: Decoded request with the operation arguments
+
+        Returns:
+            JSON-serializable operation result
+        """
+        service = self.s3_service
+        args = message.get("args", {})
+
+        if op in ("ping", "shutdown"):
+            return {
+                "pid": os.getpid(),
+                "version": __version__,
+                "bucket": service.config.bucket,
+                "fingerprint": config_fingerprint(service.config),
+            }
+        if op == "test_connection":
+            return service.test_connection()
+        if op == "upload_file":
+            return asdict(service.upload_file(_decode_upload_request(args)))
+        if op == "download_file":
+            return asdict(service.download_file(DownloadRequest(**args)))
+        if op == "delete_file":
+            return asdict(service.delete_file(args["s3_key"]))
+        if op == "download_directory":
+            results = service.download_directory(
+                args["s3_prefix"], Path(args["local_base_path"]), args["force"]
+            )
+            return [asdict(r) for r in results]
+        if op == "delete_directory":
+            results = service.delete_directory(args["s3_prefix"], args["force"])
+            return [asdict(r) for r in results]
+        if op == "list_objects":
+            objects = service.list_objects(args["prefix"], args["max_keys"])
+            return [obj.to_row() for obj in objects]
+        if op == "get_object_info":
+            info = service.get_object_info(args["s3_key"])
+            return encode_object_info(info) if info else None
+        if op == "file_exists":
+            return service.file_exists(args["s3_key"])
+        if op == "search_objects":
+            objects = service.search_objects(**args)
+            return [obj.to_row() for obj in objects]
+        if op == "resolve_key":
+            return service.resolve_key(args["s3_key"]).value
+
+        raise ValueError(f"Unknown daemon operation: {op}")
+
+
+def _is_listening(socket_path: Path) -> bool:
+    """Check whether something accepts connections on the socket."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+            return True
+        except OSError:
+            return False
+
+
+class DaemonClient:
+    """Client side of the daemon protocol, one persistent connection."""
+
+    def __init__(self, socket_path: Path | None = None, timeout: float | None = None):
+        """Connect to a running daemon.
+
+        Args:
+            socket_path: Socket location, defaults to default_socket_path()
+            timeout: Socket timeout in seconds, None to wait indefinitely
+
+        Raises:
+            DaemonError: If the daemon is not reachable
+        """
+        self.socket_path = socket_path or default_socket_path()
+        self._lock = threading.Lock()
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        try:
+            self._sock.connect(str(self.socket_path))
+        except OSError as e:
+            self._sock.close()
+            raise DaemonError(f"Daemon not reachable at {self.socket_path}: {e}") from e
+        self._reader = self._sock.makefile("rb")
+
+    def call(self, op: str, **args):
+        """Send one request and wait for its response.
+
+        Raises:
+            DaemonError: If the connection breaks or the operation fails
+        """
+        payload = json.dumps({"op": op, "args": args}).encode("utf-8") + b"\n"
+        with self._lock:
+            try:
+                self._sock.sendall(payload)
+                line = self._reader.readline()
+            except OSError as e:
+                raise DaemonError(f"Lost connection to daemon: {e}") from e
+
+        if not line:
+            raise DaemonError("Daemon closed the connection")
+
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise DaemonError(response.get("error", "Unknown daemon error"))
+        return response.get("result")
+
+    def set_timeout(self, timeout: float | None):
+        """Change the socket timeout for subsequent calls."""
+        self._sock.settimeout(timeout)
+
+    def close(self):
+        """Close the connection."""
+        self._reader.close()
+        self._sock.close()
+
+
+class RemoteS3Service:
+    """S3Service stand-in that forwards every call to the daemon."""
+
+    def __init__(self, config: S3Config, client: DaemonClient):
+        """Wrap a connected daemon client.
+
+        Args:
+            config: Configuration the daemon was matched against
+            client: Connected daemon client
+        """
+        self.config = config
+        self._daemon = client
+
+    def test_connection(self) -> bool:
+        """Test the daemon's S3 connection."""
+        return self._daemon.call("test_connection")
+
+    def upload_file(self, request: UploadRequest) -> UploadResult:
+        """Upload a file through the daemon."""
+        # The daemon has its own working directory, so send absolute paths
+        result = self._daemon.call(
+            "upload_file",
+            file_path=str(Path(request.file_path).absolute()),
+            s3_key=request.s3_key,
+            storage_class=request.storage_class.value
+            if request.storage_class
+            else None,
+            metadata=request.metadata,
+            compression=request.compression,
+        )
+        return UploadResult(**result)
+
+    def download_file(self, request: DownloadRequest) -> DownloadResult:
+        """Download a file through the daemon."""
+        result = self._daemon.call(
+            "download_file",
+            s3_key=request.s3_key,
+            output_path=str(request.get_local_path().absolute()),
+            force=request.force,
+            etag=request.etag,
+        )
+        return DownloadResult(**result)
+
+    def delete_file(self, s3_key: str) -> DeleteResult:
+        """Delete a file through the daemon."""
+        return DeleteResult(**self._daemon.call("delete_file", s3_key=s3_key))
+
+    def download_directory(
+        self, s3_prefix: str, local_base_path: Path, force: bool = False
+    ) -> list[DownloadResult]:
+        """Download a directory through the daemon."""
+        results = self._daemon.call(
+            "download_directory",
+            s3_prefix=s3_prefix,
+            local_base_path=str(Path(local_base_path).absolute()),
+            force=force,
+        )
+        return [DownloadResult(**r) for r in results]
+
+    def delete_directory(
+        self, s3_prefix: str, force: bool = False
+    ) -> list[DeleteResult]:
+        """Delete a directory through the daemon."""
+        results = self._daemon.call(
+            "delete_directory", s3_prefix=s3_prefix, force=force
+        )
+        return [DeleteResult(**r) for r in results]
+
+    def list_objects(
+        self, prefix: str = "", max_keys: int = 1000
+    ) -> list[ObjectEntry]:
+        """List objects through the daemon."""
+        objects = self._daemon.call("list_objects", prefix=prefix, max_keys=max_keys)
+        return [ObjectEntry.from_row(row) for row in objects]
+
+    def get_object_info(self, s3_key: str) -> dict | None:
+        """Get object metadata through the daemon."""
+        info = self._daemon.call("get_object_info", s3_key=s3_key)
+        return decode_object_info(info) if info else None
+
+    def file_exists(self, s3_key: str) -> bool:
+        """Check object existence through the daemon."""
+        return self._daemon.call("file_exists", s3_key=s3_key)
+
+    def search_objects(
+        self,
+        pattern: str,
+        mode: str = "auto",
+        ignore_case: bool = False,
+        prefix: str = "",
+        max_results: int | None = 1000,
+    ) -> list[ObjectEntry]:
+        """Search object keys through the daemon."""
+        objects = self._daemon.call(
+            "search_objects",
+            pattern=pattern,
+            mode=mode,
+            ignore_case=ignore_case,
+            prefix=prefix,
+            max_results=max_results,
+        )
+        return [ObjectEntry.from_row(row) for row in objects]
+
+    def resolve_key(self, s3_key: str) -> KeyKind:
+        """Resolve a key through the daemon."""
+        return KeyKind(self._daemon.call("resolve_key", s3_key=s3_key))
+
+
+def connect_daemon(
+    config: S3Config, socket_path: Path | None = None
+) -> RemoteS3Service | None:
+    """Connect to a running daemon serving the same configuration.
+
+    Args:
+        config: Configuration the caller would otherwise use directly
+        socket_path: Socket location, defaults to default_socket_path()
+
+    Returns:
+        RemoteS3Service if a matching daemon answers, None otherwise
+    """
+    if os.getenv(NO_DAEMON_ENV):
+        return None
+
+    socket_path = socket_path or default_socket_path()
+    if not socket_path.exists():
+        return None
+
+    try:
+        client = DaemonClient(socket_path, timeout=2.0)
+    except DaemonError as e:
+        logger.debug(f"Not using daemon: {e}")
+        return None
+
+    try:
+        info = client.call("ping")
+    except (DaemonError, ValueError) as e:
+        logger.debug(f"Not using daemon: {e}")
+        client.close()
+        return None
+
+    if info.get("fingerprint") != config_fingerprint(config):
+        logger.debug("Daemon serves a different configuration, not using it")
+        client.close()
+        return None
+
+    # Transfers may legitimately take longer than the handshake allowance
+    client.set_timeout(None)
+    return RemoteS3Service(config, client)
+
+
+def create_s3_service(
+    config: S3Config, max_bandwidth: str | None = None, use_daemon: bool = True
+) -> S3Service | RemoteS3Service:
+    """Get a service for CLI commands, preferring a running daemon.
+
+    Args:
+        config: S3 configuration
+        max_bandwidth: Per-invocation bandwidth limit such as "10M". The
+            daemon applies its own limit, so setting this uses a local service.
+        use_daemon: False when the caller needs S3Service features the daemon
+            protocol does not forward
+
+    Returns:
+        RemoteS3Service when a matching daemon is running, S3Service otherwise
+
+    Raises:
+        ValueError: If max_bandwidth is not a valid size
+    """
+    if max_bandwidth:
+        return S3Service(
+            config, bandwidth_limiter=BandwidthLimiter(parse_size(max_bandwidth))
+        )
+    if use_daemon:
+        return connect_daemon(config) or S3Service(config)
+    return S3Service(config)
@@ -0,0 +1,201 @@
+"""Deduplicating uploads backed by a local content-hash index."""
+
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+
+from ..core.compression import UNCOMPRESSED_SIZE_METADATA
+from ..models import S3StorageClass, UploadRequest, UploadResult
+from .hash_service import HashCache
+from .s3_service import S3Service
+
+logger = logging.getLogger(__name__)
+
+HASH_METADATA_KEY = "sha256"
+DEDUP_MIN_SIZE = 1024 * 1024
+
+# Objects in these classes must be restored before they can be copied
+_UNCOPYABLE_STORAGE_CLASSES = frozenset({"GLACIER", "DEEP_ARCHIVE"})
+
+
+def default_index_path() -> Path:
+    """Get the default location of the dedup index."""
+    return Path.home() / ".cloud_storage_syncer" / "dedup.db"
+
+
+class DedupIndex:
+    """SQLite map from content hash to the keys known to hold that content."""
+
+    def __init__(self, db_path: Path | None = None):
+        """Open (creating if needed) the index.
+
+        Args:
+            db_path: SQLite file, defaults to ~/.cloud_storage_syncer/dedup.db
+        """
+        self.db_path = db_path or default_index_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS objects ("
+                " bucket TEXT NOT NULL,"
+                " s3_key TEXT NOT NULL,"
+                " sha256 TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " PRIMARY KEY (bucket, s3_key))"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS objects_by_hash"
+                " ON objects (bucket, sha256, size)"
+            )
+
+    def lookup(self, bucket: str, sha256: str, size: int) -> list[str]:
+        """Get keys recorded with the given content, most recent first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT s3_key FROM objects"
+                " WHERE bucket = ? AND sha256 = ? AND size = ?"
+                " ORDER BY rowid DESC",
+                (bucket, sha256, size),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def record(self, bucket: str, s3_key: str, sha256: str, size: int) -> None:
+        """Remember that a key holds the given content."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO objects (bucket, s3_key, sha256, size)"
+                " VALUES (?, ?, ?, ?)",
+                (bucket, s3_key, sha256, size),
+            )
+
+    def forget(self, bucket: str, s3_key: str) -> None:
+        """Drop a key, e.g. after finding it deleted or changed."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM objects WHERE bucket = ? AND s3_key = ?",
+                (bucket, s3_key),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+class DedupService:
+    """Upload files, copying server-side when the content is already stored."""
+
+    def __init__(
+        self,
+        s3_service: S3Service,
+        index: DedupIndex | None = None,
+        min_size: int = DEDUP_MIN_SIZE,
+        hash_cache: HashCache | None = None,
+    ):
+        """Initialize dedup service.
+
+        Args:
+            s3_service: Service used for all S3 requests
+            index: Hash index, defaults to the one in the user's home
+            min_size: Files smaller than this are uploaded without hashing,
+                since a copy request saves nothing over a small PUT
+            hash_cache: Local file hash cache, defaults to the one in the
+                user's home
+        """
+        self.s3_service = s3_service
+        self.index = index or DedupIndex()
+        self.min_size = min_size
+        self.hash_cache = hash_cache or HashCache()
+
+    @property
+    def bucket(self) -> str:
+        """Bucket uploads go to."""
+        return self.s3_service.config.bucket
+
+    def upload_file(self, request: UploadRequest) -> UploadResult:
+        """Upload a file unless identical content already exists in the bucket.
+
+        Candidates from the index are confirmed with a HEAD: the object must
+        still exist with the same size and SHA-256 metadata. Uploaded objects
+        get that metadata so later uploads can match them.
+
+        Args:
+            request: Upload request
+
+        Returns:
+            Upload result; copied_from is set when no bytes were sent
+        """
+        file_path = Path(request.file_path)
+        if not file_path.is_file():
+            return self.s3_service.upload_file(request)
+
+        size = file_path.stat().st_size
+        if size < self.min_size:
+            return self.s3_service.upload_file(request)
+
+        try:
+            sha256 = self.hash_cache.get(file_path, "sha256")
+        except OSError as e:
+            return UploadResult.error(f"Failed to hash file: {e}")
+
+        for candidate in self.index.lookup(self.bucket, sha256, size):
+            info = self.s3_service.get_object_info(candidate)
+            if not self._holds_content(info, sha256, size):
+                self.index.forget(self.bucket, candidate)
+                continue
+            storage_class = (
+                request.storage_class.value if request.storage_class else "STANDARD"
+            )
+            if candidate == request.s3_key and info["storage_class"] == storage_class:
+                # Already stored at this key; nothing to send or copy
+                return UploadResult.success(
+                    s3_url=f"s3://{self.bucket}/{candidate}",
+                    storage_class=storage_class,
+                    copied_from=candidate,
+                )
+            if info["storage_class"] in _UNCOPYABLE_STORAGE_CLASSES:
+                continue
+
+            result = self.s3_service.copy_object(
+                candidate,
+                request.s3_key,
+                S3StorageClass(storage_class),
+                source_info=info,
+            )
+            if result.success:
+                self.index.record(self.bucket, request.s3_key, sha256, size)
+                return result
+            logger.error(f"Copy from {candidate} failed, uploading instead")
+            break
+
+        metadata = {**(request.metadata or {}), HASH_METADATA_KEY: sha256}
+        result = self.s3_service.upload_file(
+            UploadRequest(
+                file_path=request.file_path,
+                s3_key=request.s3_key,
+                storage_class=request.storage_class,
+                metadata=metadata,
+                compression=request.compression,
+            )
+        )
+        if result.success:
+            self.index.record(self.bucket, request.s3_key, sha256, size)
+        return result
+
+    @staticmethod
+    def _holds_content(info: dict | None, sha256: str, size: int) -> bool:
+        """Check a HEAD result against the expected content."""
+        if info is None:
+            return False
+        metadata = info.get("metadata", {})
+        if info.get("content_encoding"):
+            # A compressed object's size is that of the stored bytes
+            stored_size = metadata.get(UNCOMPRESSED_SIZE_METADATA)
+        else:
+            stored_size = info["size"]
+        return (
+            str(stored_size) == str(size)
+            and metadata.get(HASH_METADATA_KEY) == sha256
+        )
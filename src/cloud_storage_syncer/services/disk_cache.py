@@ -0,0 +1,165 @@
+"""Size-bounded on-disk cache with least-recently-used eviction."""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_TEMP_PREFIX = ".tmp-"
+
+
+def default_cache_dir(name: str) -> Path:
+    """Get the default location of a named cache directory."""
+    return Path.home() / ".cloud_storage_syncer" / name
+
+
+class DiskLRUCache:
+    """Directory of cached blobs bounded by total size.
+
+    Entries are files named by the SHA-256 of their key. Recency is kept in
+    memory and mirrored to file mtimes, so the eviction order survives a
+    restart. Callers put the version of the source (e.g. the ETag) in the
+    key, so an entry never has to be invalidated, only evicted.
+
+    Several processes (e.g. uvicorn workers) may share one directory: every
+    put re-reads sizes and mtimes from the directory before evicting, so
+    the limit holds for all of them together rather than for each.
+    """
+
+    def __init__(self, root: Path, max_bytes: int):
+        """Open (creating if needed) the cache directory.
+
+        Args:
+            root: Directory holding the cached files
+            max_bytes: Total size above which least recently used entries
+                are removed
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total = 0
+
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.startswith(_TEMP_PREFIX):
+                    # Left behind by a write that never finished
+                    Path(entry.path).unlink(missing_ok=True)
+        with self._lock:
+            self._rescan()
+            self._evict()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes currently held."""
+        return self._total
+
+    def path_for(self, key: str) -> Path:
+        """Get the file an entry is (or would be) stored in."""
+        return self.root / hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Path | None:
+        """Look up an entry, marking it most recently used.
+
+        Returns:
+            Path of the cached file, or None on a miss
+        """
+        path = self.path_for(key)
+        with self._lock:
+            try:
+                os.utime(path)
+                if path.name not in self._entries:
+                    # Added by another process sharing the directory
+                    size = path.stat().st_size
+                    self._entries[path.name] = size
+                    self._total += size
+            except FileNotFoundError:
+                # Never cached, or evicted by another process
+                self._total -= self._entries.pop(path.name, 0)
+                return None
+            self._entries.move_to_end(path.name)
+        return path
+
+    def temp_path(self) -> Path:
+        """Create an empty temporary file to be filled and passed to put_file.
+
+        It lives in the cache directory, so moving it into place is atomic,
+        and is removed on the next start if never committed.
+        """
+        fd, temp_name = tempfile.mkstemp(prefix=_TEMP_PREFIX, dir=self.root)
+        os.close(fd)
+        return Path(temp_name)
+
+    def put(self, key: str, data: bytes) -> Path:
+        """Store an entry, evicting old ones if the cache is over its size.
+
+        Returns:
+            Path of the cached file
+        """
+        temp_path = self.temp_path()
+        try:
+            temp_path.write_bytes(data)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        return self.put_file(key, temp_path)
+
+    def put_file(self, key: str, temp_path: Path) -> Path:
+        """Move a fully written file from temp_path() into the cache.
+
+        Returns:
+            Path of the cached file
+        """
+        path = self.path_for(key)
+        size = temp_path.stat().st_size
+        # Atomic, so readers never see a partial file
+        os.replace(temp_path, path)
+        with self._lock:
+            # Other processes may have added or used entries since
+            self._rescan()
+            self._total -= self._entries.pop(path.name, 0)
+            self._entries[path.name] = size
+            self._total += size
+            self._evict()
+        return path
+
+    def _rescan(self) -> None:
+        """Rebuild sizes and recency order from the files in the directory."""
+        files = []
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                # Temporary files are other writers' entries still being filled
+                if not entry.is_file() or entry.name.startswith(_TEMP_PREFIX):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    # Evicted by another process sharing the directory
+                    continue
+                files.append((stat.st_mtime_ns, entry.name, stat.st_size))
+
+        # mtimes are coarse, so entries touched within one tick keep the
+        # order this process last saw them in
+        known = {name: i for i, name in enumerate(self._entries)}
+        files.sort(key=lambda f: (f[0], known.get(f[1], -1), f[1]))
+        self._entries = OrderedDict((name, size) for _, name, size in files)
+        self._total = sum(self._entries.values())
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until under max_bytes."""
+        # The newest entry is kept even if it alone exceeds the limit
+        while self._total > self.max_bytes and len(self._entries) > 1:
+            name, size = self._entries.popitem(last=False)
+            self._total -= size
+            (self.root / name).unlink(missing_ok=True)
+            logger.debug(f"Evicted {name} ({size} bytes) from {self.root}")
@@ -0,0 +1,125 @@
+"""Read-through disk cache for serving downloads."""
+
+import logging
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import BinaryIO
+
+from ..models import DownloadRequest
+from .disk_cache import DiskLRUCache
+from .s3_service import S3Service
+
+logger = logging.getLogger(__name__)
+
+# Attempts to open an entry that may be evicted between lookup and open
+OPEN_ATTEMPTS = 3
+
+
+class DownloadCache:
+    """Disk cache of whole objects with single-flight fetching.
+
+    Entries are keyed by the object's ETag, checked with a HEAD request on
+    every open, so an overwritten object is never served stale. Concurrent
+    opens of the same uncached version share one S3 download.
+    """
+
+    def __init__(self, cache: DiskLRUCache, max_object_size: int | None = None):
+        """Initialize the download cache.
+
+        Args:
+            cache: Disk cache the downloaded objects are kept in
+            max_object_size: Larger objects are streamed from a private
+                temporary file instead of being cached; defaults to a
+                quarter of the cache size
+        """
+        self.cache = cache
+        self.max_object_size = (
+            cache.max_bytes // 4 if max_object_size is None else max_object_size
+        )
+        self._lock = threading.Lock()
+        self._inflight: dict[str, Future] = {}
+
+    def open(self, s3_service: S3Service, s3_key: str) -> tuple[BinaryIO, dict]:
+        """Open the current version of an object for reading.
+
+        The returned file stays readable even if its entry is evicted while
+        it is being served.
+
+        Args:
+            s3_service: Service used for the HEAD and any download
+            s3_key: S3 object key
+
+        Returns:
+            (open binary file, get_object_info result)
+
+        Raises:
+            FileNotFoundError: If the object does not exist
+            RuntimeError: If the download fails
+        """
+        info = s3_service.get_object_info(s3_key)
+        if info is None:
+            raise FileNotFoundError(f"File not found in S3: {s3_key}")
+
+        if info["size"] > self.max_object_size:
+            temp_path = self._download(s3_service, s3_key, info["etag"])
+            try:
+                # Unlinked once open; the data lives until the file is closed
+                return open(temp_path, "rb"), info
+            finally:
+                temp_path.unlink(missing_ok=True)
+
+        cache_key = f"{info['etag']}:{s3_key}"
+        for _ in range(OPEN_ATTEMPTS):
+            path = self._fetch(s3_service, s3_key, info["etag"], cache_key)
+            try:
+                return open(path, "rb"), info
+            except FileNotFoundError:
+                logger.debug(f"Cached {s3_key} was evicted before it was opened")
+        raise RuntimeError(f"Cache too small to serve {s3_key}")
+
+    def _fetch(
+        self, s3_service: S3Service, s3_key: str, etag: str, cache_key: str
+    ) -> Path:
+        """Get the cached file, downloading it once for all waiting callers."""
+        path = self.cache.get(cache_key)
+        if path is not None:
+            return path
+
+        with self._lock:
+            future = self._inflight.get(cache_key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[cache_key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            # Another leader may have finished between the lookup and the lock
+            path = self.cache.get(cache_key)
+            if path is None:
+                temp_path = self._download(s3_service, s3_key, etag)
+                path = self.cache.put_file(cache_key, temp_path)
+            future.set_result(path)
+            return path
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[cache_key]
+
+    def _download(self, s3_service: S3Service, s3_key: str, etag: str) -> Path:
+        """Download one version of an object to a temporary file."""
+        temp_path = self.cache.temp_path()
+        result = s3_service.download_file(
+            DownloadRequest(
+                s3_key=s3_key, output_path=str(temp_path), force=True, etag=etag
+            )
+        )
+        if not result.success:
+            temp_path.unlink(missing_ok=True)
+            raise RuntimeError(result.error_message or f"Failed to download {s3_key}")
+        return temp_path
@@ -0,0 +1,167 @@
+"""Consumer of S3 event notifications that keeps cached listings fresh."""
+
+import json
+import logging
+import threading
+from urllib.parse import unquote_plus
+
+import boto3
+from botocore.exceptions import BotoCoreError, ClientError
+
+from ..models import S3Config
+from .caching_s3_service import CachingS3Service
+
+logger = logging.getLogger(__name__)
+
+# Event types that change what a listing or HEAD of the key returns
+CACHED_EVENT_TYPES = (
+    "ObjectCreated:",
+    "ObjectRemoved:",
+    "ObjectRestore:",
+    "LifecycleTransition",
+)
+
+# Long polling keeps an idle queue at about three requests a minute
+DEFAULT_WAIT_SECONDS = 20
+MAX_MESSAGES = 10
+RETRY_DELAY = 5.0
+
+
+def create_sqs_client(config: S3Config, endpoint_url: str | None = None):
+    """Create an SQS client with the profile's credentials.
+
+    Args:
+        config: S3 configuration whose credentials and region are used
+        endpoint_url: SQS-compatible endpoint, e.g. a local ElasticMQ,
+            None for AWS
+
+    Returns:
+        boto3 SQS client
+    """
+    return boto3.client(
+        "sqs",
+        aws_access_key_id=config.access_key,
+        aws_secret_access_key=config.secret_key,
+        region_name=config.region,
+        endpoint_url=endpoint_url,
+    )
+
+
+def parse_event_keys(body: str, bucket: str) -> list[str]:
+    """Extract the keys changed by one S3 event notification message.
+
+    Accepts notifications sent straight to SQS and ones relayed through
+    SNS. Test events, other event types and other buckets yield no keys.
+
+    Args:
+        body: SQS message body
+        bucket: Bucket whose keys to return
+
+    Returns:
+        Decoded object keys
+
+    Raises:
+        ValueError: If the body is not an S3 event notification
+    """
+    try:
+        event = json.loads(body)
+        if event.get("Type") == "Notification":
+            event = json.loads(event["Message"])
+        if event.get("Event") == "s3:TestEvent":
+            return []
+
+        keys = []
+        for record in event["Records"]:
+            if not record["eventName"].startswith(CACHED_EVENT_TYPES):
+                continue
+            if record["s3"]["bucket"]["name"] != bucket:
+                continue
+            # Keys are URL-encoded, with spaces as "+"
+            keys.append(unquote_plus(record["s3"]["object"]["key"]))
+        return keys
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"Not an S3 event notification: {e}") from e
+
+
+class S3EventConsumer:
+    """Apply S3 event notifications from an SQS queue to a CachingS3Service.
+
+    Each batch of created, removed, restored or transitioned keys drops the
+    cached listings of their directories and their cached HEAD results, so
+    the cache no longer has to expire to see changes made by other clients.
+    Messages are deleted only after their keys are applied.
+    """
+
+    def __init__(self, s3_service: CachingS3Service, queue_url: str, sqs_client):
+        """Initialize the consumer.
+
+        Args:
+            s3_service: Service whose cache the events are applied to
+            queue_url: URL of the queue the bucket notifies
+            sqs_client: SQS client, see create_sqs_client
+        """
+        self.s3_service = s3_service
+        self.queue_url = queue_url
+        self.sqs = sqs_client
+
+    def poll(self, wait_seconds: int = DEFAULT_WAIT_SECONDS) -> int:
+        """Receive one batch of messages and apply it.
+
+        Args:
+            wait_seconds: Long-poll time when the queue is empty
+
+        Returns:
+            Number of changed keys applied
+
+        Raises:
+            ClientError: If receiving from the queue fails
+        """
+        response = self.sqs.receive_message(
+            QueueUrl=self.queue_url,
+            MaxNumberOfMessages=MAX_MESSAGES,
+            WaitTimeSeconds=wait_seconds,
+        )
+        messages = response.get("Messages", [])
+        if not messages:
+            return 0
+
+        bucket = self.s3_service.config.bucket
+        keys = []
+        for message in messages:
+            try:
+                keys.extend(parse_event_keys(message["Body"], bucket))
+            except ValueError as e:
+                # Redelivering would fail the same way, so it is dropped
+                logger.warning(f"Skipping message {message.get('MessageId')}: {e}")
+
+        if keys:
+            self.s3_service.invalidate(keys)
+            logger.info(f"Applied {len(keys)} changed keys")
+
+        response = self.sqs.delete_message_batch(
+            QueueUrl=self.queue_url,
+            Entries=[
+                {"Id": str(i), "ReceiptHandle": message["ReceiptHandle"]}
+                for i, message in enumerate(messages)
+            ],
+        )
+        for failure in response.get("Failed", []):
+            # Redelivery only invalidates the keys again, which is harmless
+            logger.warning(f"Failed to delete message: {failure.get('Message')}")
+        return len(keys)
+
+    def run(
+        self, stop: threading.Event, wait_seconds: int = DEFAULT_WAIT_SECONDS
+    ) -> None:
+        """Poll until stop is set, retrying after queue errors.
+
+        Args:
+            stop: Event that ends the loop after the current poll
+            wait_seconds: Long-poll time when the queue is empty
+        """
+        while not stop.is_set():
+            try:
+                self.poll(wait_seconds)
+            except (ClientError, BotoCoreError) as e:
+                logger.error(f"Error receiving S3 events: {e}")
+                stop.wait(RETRY_DELAY)
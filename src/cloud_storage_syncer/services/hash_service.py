@@ -0,0 +1,136 @@
+"""Persistent cache of local file hashes."""
+
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from ..core.hashing import HASH_ALGORITHMS, MULTIPART_CHUNKSIZE, hash_file
+
+logger = logging.getLogger(__name__)
+
+
+def default_cache_path() -> Path:
+    """Get the default location of the hash cache."""
+    return Path.home() / ".cloud_storage_syncer" / "hashes.db"
+
+
+class HashCache:
+    """SQLite cache of file digests keyed by file identity.
+
+    A file is identified by (device, inode) and its digest is reused while
+    size and mtime_ns are unchanged, so unchanged files are never re-read.
+    The database uses WAL mode and can be shared by concurrent processes.
+    """
+
+    def __init__(self, db_path: Path | None = None, max_workers: int = 8):
+        """Open (creating if needed) the cache.
+
+        Args:
+            db_path: SQLite file, defaults to ~/.cloud_storage_syncer/hashes.db
+            max_workers: Threads hashing cache misses in hash_files
+        """
+        self.db_path = db_path or default_cache_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS hashes ("
+                " dev INTEGER NOT NULL,"
+                " ino INTEGER NOT NULL,"
+                " algorithm TEXT NOT NULL,"
+                " part_size INTEGER NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " mtime_ns INTEGER NOT NULL,"
+                " digest TEXT NOT NULL,"
+                " PRIMARY KEY (dev, ino, algorithm, part_size))"
+            )
+
+    def get(
+        self, path: Path, algorithm: str, part_size: int = MULTIPART_CHUNKSIZE
+    ) -> str:
+        """Get a file's digest, hashing it only if it changed since last time.
+
+        Args:
+            path: File to hash
+            algorithm: One of core.hashing.HASH_ALGORITHMS
+            part_size: Upload part size, only significant for "etag" and
+                "s3-*" (see core.hashing.hash_bytes)
+
+        Returns:
+            The digest string
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the algorithm is unknown
+        """
+        if algorithm not in HASH_ALGORITHMS:
+            raise ValueError(f"Unknown hash algorithm: {algorithm}")
+        if algorithm in ("md5", "sha256", "crc32"):
+            part_size = 0
+
+        stat = os.stat(path)
+        key = (stat.st_dev, stat.st_ino, algorithm, part_size)
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size, mtime_ns, digest FROM hashes"
+                " WHERE dev = ? AND ino = ? AND algorithm = ? AND part_size = ?",
+                key,
+            ).fetchone()
+        if row and row[0] == stat.st_size and row[1] == stat.st_mtime_ns:
+            return row[2]
+
+        digest = hash_file(path, algorithm, part_size)
+
+        # A file modified while being hashed must not be cached as unchanged
+        after = os.stat(path)
+        if (after.st_size, after.st_mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+            return digest
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO hashes"
+                " (dev, ino, algorithm, part_size, size, mtime_ns, digest)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (*key, stat.st_size, stat.st_mtime_ns, digest),
+            )
+        return digest
+
+    def hash_files(
+        self,
+        paths: Iterable[Path],
+        algorithm: str,
+        part_size: int = MULTIPART_CHUNKSIZE,
+    ) -> dict[Path, str | None]:
+        """Hash many files, reading cache misses in parallel.
+
+        Args:
+            paths: Files to hash
+            algorithm: One of core.hashing.HASH_ALGORITHMS
+            part_size: Upload part size, only significant for "etag" and
+                "s3-*"
+
+        Returns:
+            Digest per path, None for files that could not be read
+        """
+
+        def hash_one(path: Path) -> tuple[Path, str | None]:
+            try:
+                return path, self.get(path, algorithm, part_size)
+            except OSError as e:
+                logger.error(f"Failed to hash {path}: {e}")
+                return path, None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return dict(executor.map(hash_one, paths))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
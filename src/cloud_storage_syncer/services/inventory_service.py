@@ -0,0 +1,237 @@
+"""Inventory service for reading S3 Inventory reports as a listing source."""
+
+import gzip
+import io
+import logging
+import shutil
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+from ..core.inventory import (
+    MANIFEST_NAME,
+    InventoryManifest,
+    iter_csv_entries,
+    iter_record_entries,
+    parse_manifest,
+)
+from ..core.patterns import compile_pattern, listing_prefix
+from ..models import ObjectEntry
+from .s3_service import S3Service
+
+logger = logging.getLogger(__name__)
+
+PARQUET_COLUMNS = (
+    "key",
+    "size",
+    "last_modified_date",
+    "e_tag",
+    "storage_class",
+    "is_latest",
+    "is_delete_marker",
+)
+
+
+def _split_s3_uri(uri: str) -> tuple[str, str]:
+    """Split "s3://bucket/key" into bucket and key."""
+    bucket, _, key = uri[len("s3://") :].partition("/")
+    if not bucket:
+        raise ValueError(f"Invalid S3 URI: {uri}")
+    return bucket, key
+
+
+class InventoryService:
+    """Service streaming object entries out of S3 Inventory snapshots.
+
+    A source is a manifest.json file, or a directory/prefix holding one or
+    more inventory deliveries (the newest manifest is used). Sources may be
+    local paths or "s3://bucket/prefix" URIs. Object data is never listed;
+    only the inventory files themselves are read.
+    """
+
+    def __init__(self, s3_service: S3Service | None = None):
+        """Initialize inventory service.
+
+        Args:
+            s3_service: Service used to read inventories stored in S3;
+                only local sources work without it
+        """
+        self.s3_service = s3_service
+
+    def load_manifest(self, source: str) -> tuple[InventoryManifest, str]:
+        """Locate and parse the manifest for a source.
+
+        Args:
+            source: Local path or S3 URI of a manifest or its parent prefix
+
+        Returns:
+            Parsed manifest and the location it was read from
+
+        Raises:
+            ValueError: If no manifest is found or it cannot be parsed
+        """
+        if source.startswith("s3://"):
+            bucket, key = _split_s3_uri(source)
+            if not key.endswith(MANIFEST_NAME):
+                key = self._latest_s3_manifest(bucket, key)
+            data = self._s3_client_call("get_object", bucket, key)["Body"].read()
+            return parse_manifest(data), f"s3://{bucket}/{key}"
+
+        path = Path(source).expanduser()
+        if path.is_dir():
+            manifests = sorted(path.rglob(MANIFEST_NAME))
+            if not manifests:
+                raise ValueError(f"No {MANIFEST_NAME} found under {path}")
+            path = manifests[-1]
+        if not path.is_file():
+            raise ValueError(f"Inventory manifest not found: {path}")
+        return parse_manifest(path.read_bytes()), str(path)
+
+    def iter_objects(self, source: str, prefix: str = "") -> Iterator[ObjectEntry]:
+        """Stream every current object recorded in an inventory snapshot.
+
+        Args:
+            source: Local path or S3 URI of a manifest or its parent prefix
+            prefix: Only yield keys starting with this prefix
+
+        Yields:
+            Listing entries, one data file at a time
+
+        Raises:
+            ValueError: If the inventory cannot be located or parsed
+        """
+        manifest, location = self.load_manifest(source)
+        for data_key in manifest.files:
+            if location.startswith("s3://"):
+                bucket = manifest.destination_bucket or _split_s3_uri(location)[0]
+                yield from self._iter_s3_file(manifest, bucket, data_key, prefix)
+            else:
+                path = self._local_data_path(Path(location), data_key)
+                yield from self._iter_local_file(manifest, path, prefix)
+
+    def search_objects(
+        self,
+        source: str,
+        pattern: str,
+        mode: str = "auto",
+        ignore_case: bool = False,
+        prefix: str = "",
+        max_results: int | None = 1000,
+    ) -> list[ObjectEntry]:
+        """Search an inventory snapshot like S3Service.search_objects.
+
+        Args:
+            source: Local path or S3 URI of a manifest or its parent prefix
+            pattern: Pattern text, see core.patterns.compile_pattern
+            mode: "auto", "substring", "glob" or "regex"
+            ignore_case: Case-insensitive glob/regex matching
+            prefix: Restrict the search to this prefix
+            max_results: Stop after this many matches, None for all
+
+        Returns:
+            Matching listing entries
+
+        Raises:
+            ValueError: If the pattern, mode or inventory is invalid
+        """
+        matcher = compile_pattern(pattern, mode=mode, ignore_case=ignore_case)
+        scope = listing_prefix(matcher, prefix)
+        if scope is None:
+            return []
+
+        matches = []
+        for obj in self.iter_objects(source, prefix=scope):
+            if matcher.matches(obj.key):
+                matches.append(obj)
+                if max_results is not None and len(matches) >= max_results:
+                    break
+        return matches
+
+    def _s3_client_call(self, method: str, bucket: str, key: str) -> dict:
+        """Call an S3 client method for an inventory object."""
+        if self.s3_service is None:
+            raise ValueError("Reading an inventory from S3 requires a configuration")
+        return self.s3_service.limiter.call(
+            getattr(self.s3_service.client, method), Bucket=bucket, Key=key, s3_key=key
+        )
+
+    def _latest_s3_manifest(self, bucket: str, prefix: str) -> str:
+        """Find the newest manifest below an S3 prefix."""
+        if self.s3_service is None:
+            raise ValueError("Reading an inventory from S3 requires a configuration")
+        # Delivery folders are named by timestamp, so keys sort chronologically
+        latest = None
+        for obj in self.s3_service.iter_objects(prefix=prefix, bucket=bucket):
+            if obj.key.endswith(f"/{MANIFEST_NAME}") and (
+                latest is None or obj.key > latest
+            ):
+                latest = obj.key
+        if latest is None:
+            raise ValueError(f"No {MANIFEST_NAME} found under s3://{bucket}/{prefix}")
+        return latest
+
+    def _local_data_path(self, manifest_path: Path, data_key: str) -> Path:
+        """Find a data file of a locally copied inventory.
+
+        Data keys are relative to the destination prefix, which is some
+        ancestor of the manifest's directory.
+        """
+        for ancestor in manifest_path.parents:
+            candidate = ancestor / data_key
+            if candidate.is_file():
+                return candidate
+        # Flat copies keep data files next to the manifest
+        for candidate in (
+            manifest_path.parent / Path(data_key).name,
+            manifest_path.parent / "data" / Path(data_key).name,
+        ):
+            if candidate.is_file():
+                return candidate
+        raise ValueError(f"Inventory data file not found: {data_key}")
+
+    def _iter_local_file(
+        self, manifest: InventoryManifest, path: Path, prefix: str
+    ) -> Iterator[ObjectEntry]:
+        """Stream entries from a local data file."""
+        if manifest.file_format == "Parquet":
+            yield from self._iter_parquet(path, prefix)
+            return
+        with gzip.open(path, "rt", encoding="utf-8", newline="") as f:
+            yield from iter_csv_entries(f, manifest.columns, prefix)
+
+    def _iter_s3_file(
+        self, manifest: InventoryManifest, bucket: str, key: str, prefix: str
+    ) -> Iterator[ObjectEntry]:
+        """Stream entries from a data file stored in S3."""
+        body = self._s3_client_call("get_object", bucket, key)["Body"]
+        try:
+            if manifest.file_format == "Parquet":
+                # Parquet keeps its schema in a footer, so it needs a seekable file
+                with tempfile.TemporaryFile() as f:
+                    shutil.copyfileobj(body, f)
+                    f.seek(0)
+                    yield from self._iter_parquet(f, prefix)
+                return
+            with io.TextIOWrapper(
+                gzip.GzipFile(fileobj=body), encoding="utf-8", newline=""
+            ) as f:
+                yield from iter_csv_entries(f, manifest.columns, prefix)
+        finally:
+            body.close()
+
+    def _iter_parquet(self, source, prefix: str) -> Iterator[ObjectEntry]:
+        """Stream entries from a Parquet data file in record batches."""
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ValueError(
+                "Parquet inventories require pyarrow: "
+                "pip install 'cloud-storage-syncer[inventory]'"
+            ) from e
+
+        parquet_file = pq.ParquetFile(source)
+        columns = [
+            name for name in PARQUET_COLUMNS if name in parquet_file.schema_arrow.names
+        ]
+        for batch in parquet_file.iter_batches(columns=columns):
+            yield from iter_record_entries(batch.to_pylist(), prefix)
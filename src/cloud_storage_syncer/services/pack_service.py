@@ -0,0 +1,353 @@
+"""Pack service for uploading small files as packs and reading them back."""
+
+import logging
+import tempfile
+from pathlib import Path
+
+from botocore.exceptions import ClientError
+
+from ..core.bandwidth import ThrottledWriter
+from ..core.packing import (
+    INDEX_SUFFIX,
+    PACK_DIR,
+    PackMember,
+    dump_index,
+    group_files,
+    index_key_for,
+    is_index_key,
+    load_index,
+    new_pack_key,
+    pack_root,
+    write_pack,
+)
+from ..models import (
+    DownloadResult,
+    ObjectEntry,
+    S3StorageClass,
+    UploadRequest,
+    UploadResult,
+)
+from .s3_service import S3Service
+
+logger = logging.getLogger(__name__)
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+class PackService:
+    """Service for small-file packs stored alongside regular objects."""
+
+    def __init__(self, s3_service: S3Service):
+        """Initialize pack service.
+
+        Args:
+            s3_service: Service used for all S3 requests
+        """
+        self.s3_service = s3_service
+        self._index_cache: dict[str, list[PackMember]] = {}
+
+    @property
+    def bucket(self) -> str:
+        """Bucket holding the packs."""
+        return self.s3_service.config.bucket
+
+    def upload_packed(
+        self,
+        files: list[tuple[Path, str, int]],
+        s3_prefix: str | None,
+        storage_class: S3StorageClass | None = None,
+        max_pack_size: int = 256 * 1024 * 1024,
+    ) -> list[tuple[list[tuple[Path, str, int]], UploadResult]]:
+        """Bundle files into packs and upload each pack with its index.
+
+        Indexes are always stored as STANDARD so members stay addressable
+        while the pack itself sits in an archive storage class.
+
+        Args:
+            files: (local path, key relative to s3_prefix, size) tuples
+            s3_prefix: Upload prefix the relative keys live under
+            storage_class: Storage class for the pack objects
+            max_pack_size: Target maximum bytes of file data per pack
+
+        Returns:
+            (files in the pack, upload result) for every pack
+        """
+        root = pack_root(s3_prefix)
+        results = []
+
+        for group in group_files(files, max_pack_size):
+            pack_key = new_pack_key(root)
+            results.append((group, self._upload_pack(group, pack_key, storage_class)))
+
+        return results
+
+    def _upload_pack(
+        self,
+        group: list[tuple[Path, str, int]],
+        pack_key: str,
+        storage_class: S3StorageClass | None,
+    ) -> UploadResult:
+        """Write one pack to a temporary file and upload it and its index."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pack_path = Path(temp_dir) / "pack.tar"
+            try:
+                index = write_pack(group, pack_path)
+            except OSError as e:
+                return UploadResult.error(f"Failed to build pack: {e}")
+
+            result = self.s3_service.upload_file(
+                UploadRequest(
+                    file_path=str(pack_path), s3_key=pack_key, storage_class=storage_class
+                )
+            )
+
+        if not result.success:
+            return result
+
+        index_key = index_key_for(pack_key)
+        try:
+            self.s3_service.limiter.call(
+                self.s3_service.client.put_object,
+                Bucket=self.bucket,
+                Key=index_key,
+                Body=dump_index(index, pack_key),
+                ContentType="application/json",
+                s3_key=index_key,
+            )
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            logger.error(f"AWS client error writing pack index: {e}")
+            return UploadResult.error(f"AWS error ({error_code}) writing index: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error writing pack index: {e}")
+            return UploadResult.error(f"Writing pack index failed: {e}")
+
+        logger.info(f"Uploaded pack {pack_key} with {len(group)} files")
+        return result
+
+    def read_index(self, index_key: str) -> list[PackMember]:
+        """Fetch and parse a pack index, caching it for this service.
+
+        Args:
+            index_key: S3 key of the index
+
+        Returns:
+            Members of the pack
+        """
+        if index_key not in self._index_cache:
+            response = self.s3_service.limiter.call(
+                self.s3_service.client.get_object,
+                Bucket=self.bucket,
+                Key=index_key,
+                s3_key=index_key,
+            )
+            self._index_cache[index_key] = load_index(
+                response["Body"].read(), index_key
+            )
+        return self._index_cache[index_key]
+
+    def expand_listing(
+        self, objects: list[ObjectEntry], prefix: str = ""
+    ) -> list[ObjectEntry]:
+        """Replace pack internals in a listing with the files they contain.
+
+        Args:
+            objects: Entries returned by S3Service.list_objects
+            prefix: Prefix the listing was made with
+
+        Returns:
+            Listing with pack and index objects swapped for member entries
+            (members have pack_key set)
+        """
+        expanded = []
+        packs = {}
+
+        for obj in objects:
+            if f"/{PACK_DIR}/" in f"/{obj.key}":
+                if is_index_key(obj.key):
+                    packs[obj.key[: -len(INDEX_SUFFIX)]] = obj.key
+                continue
+            expanded.append(obj)
+
+        pack_objects = {obj.key: obj for obj in objects if obj.key in packs}
+        for pack_key, index_key in packs.items():
+            pack = pack_objects.get(pack_key)
+            try:
+                members = self.read_index(index_key)
+            except Exception as e:
+                logger.error(f"Failed to read pack index {index_key}: {e}")
+                continue
+            for member in members:
+                if member.s3_key.startswith(prefix):
+                    expanded.append(self._member_entry(member, pack))
+
+        return expanded
+
+    def _member_entry(
+        self, member: PackMember, pack: ObjectEntry | None
+    ) -> ObjectEntry:
+        """Build a listing entry for a packed file."""
+        return ObjectEntry(
+            key=member.s3_key,
+            size=member.size,
+            mtime=int(member.mtime),
+            etag=pack.etag if pack else "",
+            storage_class=pack.storage_class if pack else "STANDARD",
+            pack_key=member.pack_key,
+        )
+
+    def find_member(self, s3_key: str) -> PackMember | None:
+        """Find a packed file by its logical key.
+
+        Looks for pack indexes in the ``.packs/`` directory of every
+        ancestor of the key, nearest first.
+
+        Args:
+            s3_key: Logical key of the file
+
+        Returns:
+            The member if some pack contains it, None otherwise
+        """
+        parts = s3_key.split("/")[:-1]
+        roots = ["/".join(parts[:depth]) + "/" for depth in range(len(parts), 0, -1)]
+        roots.append("")
+
+        for root in roots:
+            for index_key in self._index_keys(root):
+                try:
+                    members = self.read_index(index_key)
+                except Exception as e:
+                    logger.error(f"Failed to read pack index {index_key}: {e}")
+                    continue
+                for member in members:
+                    if member.s3_key == s3_key:
+                        return member
+        return None
+
+    def _index_keys(self, root: str) -> list[str]:
+        """List the pack indexes in a root's ``.packs/`` directory."""
+        return [
+            obj.key
+            for obj in self.s3_service.iter_objects(prefix=f"{root}{PACK_DIR}/")
+            if is_index_key(obj.key)
+        ]
+
+    def download_directory(
+        self, s3_prefix: str, local_base_path: Path, force: bool = False
+    ) -> list[DownloadResult]:
+        """Download a prefix with packed files written out as regular files.
+
+        Regular objects are downloaded as by S3Service.download_directory.
+        Packs are not downloaded themselves; each member under the prefix is
+        fetched with a ranged GET, whether its pack sits below the prefix or
+        in the ``.packs/`` directory of an ancestor.
+
+        Args:
+            s3_prefix: S3 prefix to download (acts as directory)
+            local_base_path: Local directory to download to
+            force: Whether to overwrite existing files
+
+        Returns:
+            List of DownloadResult for each file
+        """
+        root = pack_root(s3_prefix)
+        results = []
+
+        try:
+            index_keys = []
+            for obj in self.s3_service.iter_objects(prefix=root, restore_status=True):
+                if f"/{PACK_DIR}/" in f"/{obj.key}":
+                    if is_index_key(obj.key):
+                        index_keys.append(obj.key)
+                    continue
+                if obj.key == root:
+                    continue
+                local_path = local_base_path / obj.key[len(root) :]
+                results.append(self.s3_service.download_entry(obj, local_path, force))
+
+            parts = root.split("/")[:-1]
+            for depth in range(len(parts) - 1, -1, -1):
+                ancestor = "/".join(parts[:depth]) + "/" if depth else ""
+                index_keys.extend(self._index_keys(ancestor))
+
+            for index_key in index_keys:
+                try:
+                    members = self.read_index(index_key)
+                except Exception as e:
+                    logger.error(f"Failed to read pack index {index_key}: {e}")
+                    results.append(
+                        DownloadResult.error_result(
+                            index_key, f"Failed to read pack index: {e}"
+                        )
+                    )
+                    continue
+                for member in members:
+                    if member.s3_key.startswith(root):
+                        local_path = local_base_path / member.s3_key[len(root) :]
+                        results.append(self.download_member(member, local_path, force))
+        except Exception as e:
+            logger.error(f"Unexpected error during directory download: {e}")
+            results.append(
+                DownloadResult.error_result(
+                    s3_prefix, f"Directory download failed: {e}"
+                )
+            )
+
+        if not results:
+            return [
+                DownloadResult.error_result(s3_prefix, "No files found with this prefix")
+            ]
+        return results
+
+    def download_member(
+        self, member: PackMember, local_path: Path, force: bool = False
+    ) -> DownloadResult:
+        """Download one packed file with a ranged GET.
+
+        Args:
+            member: Packed file to fetch
+            local_path: Where to write it
+            force: Whether to overwrite an existing local file
+
+        Returns:
+            DownloadResult with success/failure information
+        """
+        if local_path.exists() and not force:
+            return DownloadResult.error_result(
+                member.s3_key,
+                f"Local file already exists: {local_path}. Use --force to replace it.",
+            )
+
+        try:
+            local_path.parent.mkdir(parents=True, exist_ok=True)
+            self.s3_service.limiter.call(
+                self._fetch_range, member, local_path, s3_key=member.pack_key
+            )
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            logger.error(f"AWS client error during packed download: {e}")
+            return DownloadResult.error_result(
+                member.s3_key, f"AWS error ({error_code}): {e}"
+            )
+        except Exception as e:
+            logger.error(f"Unexpected error during packed download: {e}")
+            return DownloadResult.error_result(member.s3_key, f"Download failed: {e}")
+
+        return DownloadResult.success_result(member.s3_key, str(local_path), member.size)
+
+    def _fetch_range(self, member: PackMember, local_path: Path):
+        """Stream a member's byte range into a local file."""
+        if member.byte_range is None:
+            # Nothing to fetch for an empty file
+            local_path.write_bytes(b"")
+            return
+
+        response = self.s3_service.client.get_object(
+            Bucket=self.bucket, Key=member.pack_key, Range=member.byte_range
+        )
+        with open(local_path, "wb") as f:
+            out = f
+            if self.s3_service.bandwidth_limiter is not None:
+                out = ThrottledWriter(f, self.s3_service.bandwidth_limiter)
+            for chunk in response["Body"].iter_chunks(READ_CHUNK_SIZE):
+                out.write(chunk)
@@ -0,0 +1,227 @@
+"""Dry-run planning of uploads, downloads and deletes."""
+
+from collections.abc import Iterable
+from pathlib import Path
+
+from ..core.hashing import (
+    MULTIPART_CHUNKSIZE,
+    MULTIPART_THRESHOLD,
+    effective_part_size,
+)
+from ..core.keys import directory_prefix
+from ..core.scanner import scan_tree
+from ..models import DownloadRequest, TransferPlan
+from ..models.storage import ARCHIVED_STORAGE_CLASSES, RESTORE_DONE, archived_message
+from .s3_service import S3Service
+
+# ListObjectsV2 returns at most this many keys per page
+LIST_PAGE_SIZE = 1000
+
+
+def _count_upload(plan: TransferPlan, size: int) -> None:
+    """Add the requests boto3's transfer manager makes to upload a file."""
+    if size < MULTIPART_THRESHOLD:
+        plan.count("PutObject")
+        return
+    part_size = effective_part_size(size)
+    plan.count("CreateMultipartUpload")
+    plan.count("UploadPart", -(-size // part_size))
+    plan.count("CompleteMultipartUpload")
+
+
+def _count_download(plan: TransferPlan, size: int) -> None:
+    """Add the requests S3Service.download_file makes for an object.
+
+    One HEAD checks the object, another sizes the transfer, then objects
+    from the multipart threshold up are fetched as ranged GETs.
+    """
+    plan.count("HeadObject", 2)
+    if size < MULTIPART_THRESHOLD:
+        plan.count("GetObject")
+    else:
+        plan.count("GetObject", -(-size // MULTIPART_CHUNKSIZE))
+
+
+def _count_resolve(plan: TransferPlan, s3_key: str) -> None:
+    """Add the requests S3Service.resolve_key makes."""
+    if not s3_key.endswith("/"):
+        plan.count("HeadObject")
+    plan.count("ListObjectsV2")
+
+
+class PlanService:
+    """Work out what a transfer would do without transferring anything.
+
+    Plans stream the local scan or the listing like the real commands do,
+    so planning a huge tree needs no more memory than running it. Request
+    counts follow the code paths the commands take, including the lookup
+    that decides whether a key is a file or a directory.
+    """
+
+    def __init__(self, s3_service: S3Service):
+        """Initialize the service.
+
+        Args:
+            s3_service: S3 service used for listings
+        """
+        self.s3_service = s3_service
+
+    def plan_upload(
+        self,
+        path: Path,
+        recursive: bool = False,
+        include: Iterable[str] = (),
+        exclude: Iterable[str] = (),
+        max_workers: int = 8,
+    ) -> TransferPlan:
+        """Plan uploading a file or directory as plain (unpacked) uploads.
+
+        Args:
+            path: Local file or directory
+            recursive: Include subdirectories
+            include: Glob patterns of files to upload
+            exclude: Glob patterns of files and directories to skip
+            max_workers: Directories scanned concurrently
+
+        Returns:
+            Upload plan
+        """
+        plan = TransferPlan("upload")
+        # Bucket access is checked once before the first upload
+        plan.count("ListObjectsV2")
+
+        if path.is_file():
+            sizes = [path.stat().st_size]
+        else:
+            sizes = (
+                local_file.size
+                for local_file in scan_tree(
+                    path,
+                    recursive=recursive,
+                    include=include,
+                    exclude=exclude,
+                    max_workers=max_workers,
+                )
+            )
+        for size in sizes:
+            plan.objects += 1
+            plan.total_bytes += size
+            _count_upload(plan, size)
+        return plan
+
+    def plan_download_file(self, request: DownloadRequest) -> TransferPlan:
+        """Plan downloading one object.
+
+        Args:
+            request: Download request as the command would make it
+
+        Returns:
+            Download plan
+
+        Raises:
+            ClientError: If the object cannot be looked up
+        """
+        plan = TransferPlan("download")
+        _count_resolve(plan, request.s3_key)
+
+        # The download's own HEAD finds every reason to skip the object
+        info = self.s3_service.get_object_info(request.s3_key)
+        if info is None:
+            plan.count("HeadObject")
+            plan.skipped.append((request.s3_key, "Not found"))
+            return plan
+        if (
+            info["storage_class"] in ARCHIVED_STORAGE_CLASSES
+            and info.get("restore_status") != RESTORE_DONE
+        ):
+            plan.count("HeadObject")
+            plan.skipped.append(
+                (request.s3_key, archived_message(info["storage_class"]))
+            )
+            return plan
+        local_path = request.get_local_path()
+        if local_path.exists() and not request.force:
+            plan.count("HeadObject")
+            plan.skipped.append((request.s3_key, f"Local file exists: {local_path}"))
+            return plan
+
+        plan.objects = 1
+        plan.total_bytes = info["size"]
+        _count_download(plan, info["size"])
+        return plan
+
+    def plan_download_directory(
+        self, s3_prefix: str, local_base_path: Path, force: bool = False
+    ) -> TransferPlan:
+        """Plan downloading every object under a prefix.
+
+        Args:
+            s3_prefix: S3 prefix to download
+            local_base_path: Local directory it would be written to
+            force: Whether existing local files would be overwritten
+
+        Returns:
+            Download plan
+
+        Raises:
+            ClientError: If a listing request fails
+        """
+        plan = TransferPlan("download")
+        _count_resolve(plan, s3_prefix)
+
+        prefix = directory_prefix(s3_prefix)
+        listed = 0
+        for obj in self.s3_service.iter_objects(prefix=prefix, restore_status=True):
+            listed += 1
+            relative_path = obj.key[len(prefix) :]
+            if not relative_path:
+                continue
+            if obj.needs_restore:
+                plan.skipped.append((obj.key, archived_message(obj.storage_class)))
+                continue
+            local_path = local_base_path / relative_path
+            if local_path.exists() and not force:
+                # Found by the HEAD the download makes before giving up
+                plan.count("HeadObject")
+                plan.skipped.append((obj.key, f"Local file exists: {local_path}"))
+                continue
+            plan.objects += 1
+            plan.total_bytes += obj.size
+            _count_download(plan, obj.size)
+
+        plan.count("ListObjectsV2", max(1, -(-listed // LIST_PAGE_SIZE)))
+        return plan
+
+    def plan_delete(self, s3_key: str, directory: bool) -> TransferPlan:
+        """Plan deleting an object or every object under a prefix.
+
+        Args:
+            s3_key: Key or prefix to delete
+            directory: Delete the prefix rather than the object
+
+        Returns:
+            Delete plan
+
+        Raises:
+            ClientError: If a listing request fails
+        """
+        plan = TransferPlan("delete")
+        _count_resolve(plan, s3_key)
+
+        if directory:
+            listed = 0
+            for obj in self.s3_service.iter_objects(prefix=directory_prefix(s3_key)):
+                listed += 1
+                plan.objects += 1
+                plan.total_bytes += obj.size
+            plan.count("ListObjectsV2", max(1, -(-listed // LIST_PAGE_SIZE)))
+        else:
+            # Planning-only HEAD, for the size
+            info = self.s3_service.get_object_info(s3_key)
+            plan.objects = 1
+            plan.total_bytes = info["size"] if info else 0
+
+        # Each delete checks existence first, then deletes
+        plan.count("HeadObject", plan.objects)
+        plan.count("DeleteObject", plan.objects)
+        return plan
@@ -0,0 +1,113 @@
+"""Preview service producing cached thumbnails and text previews."""
+
+import logging
+
+from ..core.compression import ENCODINGS, decompress
+from ..core.preview import (
+    IMAGE,
+    MAX_IMAGE_SOURCE_SIZE,
+    MEDIA_TYPES,
+    TABLE,
+    TABLE_DELIMITERS,
+    TEXT_PREVIEW_BYTES,
+    image_thumbnail,
+    preview_kind,
+    table_preview,
+    text_preview,
+)
+from .disk_cache import DiskLRUCache
+from .s3_service import S3Service
+
+logger = logging.getLogger(__name__)
+
+
+class PreviewService:
+    """Service generating previews of objects, cached on local disk.
+
+    Cache entries are keyed by the object's ETag, so a repeat view costs a
+    single HEAD request and an overwritten object gets a fresh preview.
+    """
+
+    def __init__(self, s3_service: S3Service, cache: DiskLRUCache):
+        """Initialize preview service.
+
+        Args:
+            s3_service: Service used for all S3 requests
+            cache: Disk cache the generated previews are kept in
+        """
+        self.s3_service = s3_service
+        self.cache = cache
+
+    def get_preview(
+        self, s3_key: str, size: int = 256, lines: int = 50
+    ) -> tuple[bytes, str]:
+        """Get a preview of an object, generating it on a cache miss.
+
+        Args:
+            s3_key: S3 object key
+            size: Longest side of image thumbnails in pixels
+            lines: Lines of text, or rows of a table, to include
+
+        Returns:
+            (preview bytes, media type)
+
+        Raises:
+            FileNotFoundError: If the object does not exist
+            ValueError: If the object has no preview (unsupported type, an
+                image too large to fetch, or Pillow missing)
+            ClientError: If reading the object fails
+        """
+        kind = preview_kind(s3_key)
+        if kind is None:
+            raise ValueError(f"No preview available for {s3_key}")
+
+        info = self.s3_service.get_object_info(s3_key)
+        if info is None:
+            raise FileNotFoundError(f"File not found in S3: {s3_key}")
+
+        option = size if kind == IMAGE else lines
+        cache_key = f"{kind}:{option}:{info['etag']}:{s3_key}"
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            try:
+                return cached.read_bytes(), MEDIA_TYPES[kind]
+            except FileNotFoundError:
+                # Evicted between lookup and read; regenerate
+                pass
+
+        content = self._generate(s3_key, info, kind, size, lines)
+        self.cache.put(cache_key, content)
+        return content, MEDIA_TYPES[kind]
+
+    def _generate(
+        self, s3_key: str, info: dict, kind: str, size: int, lines: int
+    ) -> bytes:
+        """Fetch as much of the object as the preview needs and build it."""
+        encoding = info.get("content_encoding")
+        if encoding not in ENCODINGS:
+            encoding = None
+
+        if kind == IMAGE:
+            if info["size"] > MAX_IMAGE_SOURCE_SIZE:
+                raise ValueError(
+                    f"Image too large to preview ({info['size']} bytes)"
+                )
+            data = self.s3_service.read_bytes(s3_key, etag=info["etag"])
+            if encoding:
+                data = decompress(data, encoding)
+            return image_thumbnail(data, size)
+
+        complete = info["size"] <= TEXT_PREVIEW_BYTES
+        data = b""
+        if info["size"]:
+            # Pinned to the ETag so the preview matches its cache key
+            data = self.s3_service.read_bytes(
+                s3_key, length=TEXT_PREVIEW_BYTES, etag=info["etag"]
+            )
+        if encoding:
+            data = decompress(data, encoding, complete=complete)
+
+        if kind == TABLE:
+            suffix = "." + s3_key.rsplit(".", 1)[-1].lower()
+            return table_preview(data, lines, TABLE_DELIMITERS[suffix], complete)
+        return text_preview(data, lines, complete)
@@ -0,0 +1,198 @@
+"""Restore service for bringing archived objects back and downloading them."""
+
+import logging
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from ..models import DownloadRequest, KeyKind, ObjectEntry, RestoreResult
+from ..models.storage import ARCHIVED_STORAGE_CLASSES, RESTORE_DONE
+from .s3_service import RESTORE_REQUESTED, S3Service
+
+logger = logging.getLogger(__name__)
+
+RESTORE_TIERS = ("Expedited", "Standard", "Bulk")
+
+# Standard retrievals take hours, so there is no point polling much faster
+DEFAULT_POLL_INTERVAL = 300.0
+
+# Called with an event name ("requested", "failed", "restored", "downloaded",
+# "download_failed"), the key, and a detail such as an error or local path
+EventCallback = Callable[[str, str, str], None]
+
+
+class RestoreService:
+    """Service restoring GLACIER and DEEP_ARCHIVE objects in bulk.
+
+    Restore requests are sent concurrently, then the prefix is listed with
+    each object's restore state, so one request checks up to 1000 objects
+    instead of one HEAD per object. Downloads start as soon as an object
+    becomes readable, while others are still being restored.
+    """
+
+    def __init__(
+        self,
+        s3_service: S3Service,
+        max_workers: int = 16,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ):
+        """Initialize restore service.
+
+        Args:
+            s3_service: Service used for all S3 requests
+            max_workers: Maximum restore requests and downloads in flight
+            poll_interval: Seconds between restore status checks
+        """
+        self.s3_service = s3_service
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+
+    def restore(
+        self,
+        s3_key: str,
+        days: int = 7,
+        tier: str = "Standard",
+        download_to: Path | None = None,
+        force: bool = False,
+        wait: bool = False,
+        timeout: float | None = None,
+        on_event: EventCallback | None = None,
+    ) -> RestoreResult:
+        """Restore the archived objects at a key or under a directory prefix.
+
+        Args:
+            s3_key: Object key or directory prefix
+            days: Days restored copies are kept
+            tier: Retrieval tier, one of RESTORE_TIERS
+            download_to: Directory to download every object to (archived
+                ones once restored); implies waiting
+            force: Overwrite existing local files
+            wait: Wait until every archived object is restored
+            timeout: Seconds to wait at most, None to wait indefinitely
+            on_event: Called as each object is requested, restored or
+                downloaded
+
+        Returns:
+            Restore result; keys still restoring are listed as pending
+
+        Raises:
+            ValueError: If days or tier is invalid
+            FileNotFoundError: If nothing exists at the key
+            ClientError: If listing fails
+        """
+        if tier not in RESTORE_TIERS:
+            raise ValueError(f"Tier must be one of: {', '.join(RESTORE_TIERS)}")
+        if days < 1:
+            raise ValueError("Days must be at least 1")
+
+        prefix, single = self._scope(s3_key)
+        result = RestoreResult()
+        pending: set[str] = set()
+        downloads: list[Future] = []
+
+        def emit(event: str, key: str, detail: str = "") -> None:
+            if on_event:
+                on_event(event, key, detail)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+
+            def available(key: str) -> None:
+                if download_to is None:
+                    return
+                relative = key.rsplit("/", 1)[-1] if single else key[len(prefix) :]
+                request = DownloadRequest(
+                    s3_key=key, output_path=str(download_to / relative), force=force
+                )
+                future = executor.submit(self.s3_service.download_file, request)
+                future.add_done_callback(report)
+                downloads.append(future)
+
+            def report(future: Future) -> None:
+                download = future.result()
+                if download.success:
+                    emit("downloaded", download.s3_key, download.local_path or "")
+                else:
+                    error = download.error_message or ""
+                    emit("download_failed", download.s3_key, error)
+
+            requests = {}
+            for entry in self._list(prefix, single):
+                if entry.storage_class not in ARCHIVED_STORAGE_CLASSES:
+                    available(entry.key)
+                elif entry.restore_status == RESTORE_DONE:
+                    result.restored.append(entry.key)
+                    available(entry.key)
+                elif entry.restore_status is not None:
+                    result.in_progress.append(entry.key)
+                    pending.add(entry.key)
+                else:
+                    future = executor.submit(
+                        self.s3_service.restore_object, entry.key, days, tier
+                    )
+                    requests[future] = entry.key
+
+            for future in as_completed(requests):
+                key = requests[future]
+                try:
+                    status = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to restore {key}: {e}")
+                    result.failed.append((key, str(e)))
+                    emit("failed", key, str(e))
+                    continue
+                if status == RESTORE_DONE:
+                    result.restored.append(key)
+                    emit("restored", key)
+                    available(key)
+                    continue
+                if status == RESTORE_REQUESTED:
+                    result.requested.append(key)
+                else:
+                    result.in_progress.append(key)
+                emit("requested", key, status)
+                pending.add(key)
+
+            if wait or download_to is not None:
+                deadline = None if timeout is None else time.monotonic() + timeout
+                while pending and (deadline is None or time.monotonic() < deadline):
+                    time.sleep(self.poll_interval)
+                    for key in self._poll(prefix, pending):
+                        pending.discard(key)
+                        result.restored.append(key)
+                        emit("restored", key)
+                        available(key)
+
+        result.pending = sorted(pending)
+        result.downloads = [future.result() for future in downloads]
+        return result
+
+    def _scope(self, s3_key: str) -> tuple[str, bool]:
+        """Get the listing prefix for a key and whether it is a single object."""
+        kind = self.s3_service.resolve_key(s3_key)
+        if kind == KeyKind.OBJECT:
+            return s3_key, True
+        if kind.is_directory:
+            return s3_key.rstrip("/") + "/", False
+        raise FileNotFoundError(f"No files found matching: {s3_key}")
+
+    def _list(self, prefix: str, single: bool) -> Iterator[ObjectEntry]:
+        """List the objects in scope with their restore state."""
+        # A key sorts before every other key it is a prefix of
+        for entry in self.s3_service.iter_objects(
+            prefix, max_keys=1 if single else None, restore_status=True
+        ):
+            if entry.key != prefix or single:
+                yield entry
+
+    def _poll(self, prefix: str, pending: set[str]) -> list[str]:
+        """List the prefix once and get the pending keys now restored."""
+        last = max(pending)
+        restored = []
+        for entry in self.s3_service.iter_objects(prefix, restore_status=True):
+            if entry.key > last:
+                # Listings are sorted, so no pending key can follow
+                break
+            if entry.key in pending and entry.restore_status == RESTORE_DONE:
+                restored.append(entry.key)
+        return restored
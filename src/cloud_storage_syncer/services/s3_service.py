@@ -1,31 +1,143 @@
 """S3 service for cloud storage operations."""
 
+import io
 import logging
+import threading
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
+from urllib.parse import quote
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
+from ..core.bandwidth import BandwidthLimiter, ThrottledReader, ThrottledWriter
+from ..core.compression import (
+    ENCODINGS,
+    UNCOMPRESSED_SIZE_METADATA,
+    CompressingReader,
+    DecompressingWriter,
+    should_compress,
+)
+from ..core.hashing import (
+    MULTIPART_CHUNKSIZE,
+    MULTIPART_THRESHOLD,
+    effective_part_size,
+)
+from ..core.keys import directory_prefix
+from ..core.packing import PACK_DIR
+from ..core.patterns import compile_pattern, listing_prefix
+from ..core.throttle import AdaptiveLimiter, get_default_limiter
 from ..models import (
+    CopyResult,
     DeleteResult,
     DownloadRequest,
     DownloadResult,
+    KeyKind,
+    ObjectEntry,
     S3Config,
+    S3StorageClass,
     UploadRequest,
     UploadResult,
 )
+from ..models.storage import (
+    ARCHIVED_STORAGE_CLASSES,
+    RESTORE_DONE,
+    RESTORE_ONGOING,
+    archived_message,
+)
 
 logger = logging.getLogger(__name__)
 
+NOT_FOUND_ERROR_CODES = frozenset({"NoSuchKey", "NotFound", "404"})
+
+# CopyObject handles sources up to 5 GiB; larger ones need UploadPartCopy
+MAX_COPY_OBJECT_SIZE = 5 * 1024**3
+COPY_PART_SIZE = 512 * 1024**2
+COPY_WORKERS = 8
+
+# get_object_info fields a multipart copy sets on the new object, which S3
+# copies by itself only for CopyObject
+COPIED_HEADERS = {
+    "content_type": "ContentType",
+    "content_encoding": "ContentEncoding",
+    "content_disposition": "ContentDisposition",
+    "content_language": "ContentLanguage",
+    "cache_control": "CacheControl",
+}
+
+# Explicit so local multipart ETags (core.hashing) match what S3 computes
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD, multipart_chunksize=MULTIPART_CHUNKSIZE
+)
+
+# Attempts per part request of a transfer, retried by botocore
+TRANSFER_MAX_ATTEMPTS = 5
+
+# Additional checksum stored with every upload, checked by "verify dir"
+UPLOAD_CHECKSUM_ALGORITHM = "SHA256"
+
+# Chunk size for reading object bodies into memory
+READ_CHUNK_SIZE = 1024 * 1024
+
+# DeleteObjects accepts at most 1000 keys per request
+DELETE_BATCH_SIZE = 1000
+
+# Presigned URLs are valid for an hour by default; SigV4 caps them at 7 days
+PRESIGN_EXPIRES_IN = 3600
+MAX_PRESIGN_EXPIRES_IN = 7 * 24 * 3600
+
+# Largest object a multipart upload can create
+MAX_OBJECT_SIZE = 5 * 1024**4
+
+# restore_object outcome when S3 accepted a new restore request
+RESTORE_REQUESTED = "requested"
+
+
+def _is_not_found(error: ClientError) -> bool:
+    """Check whether a client error means the object does not exist."""
+    return error.response.get("Error", {}).get("Code") in NOT_FOUND_ERROR_CODES
+
+
+def _parse_restore(header: str | None) -> str | None:
+    """Get the restore state from a HEAD response's Restore header."""
+    if header is None:
+        return None
+    if 'ongoing-request="true"' in header:
+        return RESTORE_ONGOING
+    return RESTORE_DONE
+
+
+def _check_expires_in(expires_in: int) -> None:
+    """Reject presigned URL lifetimes S3 would not honour."""
+    if not 1 <= expires_in <= MAX_PRESIGN_EXPIRES_IN:
+        raise ValueError(
+            f"expires_in must be between 1 and {MAX_PRESIGN_EXPIRES_IN} seconds"
+        )
+
 
 class S3Service:
     """Service for S3 operations."""
 
-    def __init__(self, config: S3Config):
+    def __init__(
+        self,
+        config: S3Config,
+        max_pool_connections: int = 10,
+        limiter: AdaptiveLimiter | None = None,
+        bandwidth_limiter: BandwidthLimiter | None = None,
+    ):
         """Initialize S3 service with configuration.
 
         Args:
             config: S3 configuration
+            max_pool_connections: Size of the HTTP connection pool kept by the
+                client, shared by all threads using this service
+            limiter: Concurrency/retry controller for every S3 request,
+                defaults to the process-wide limiter
+            bandwidth_limiter: Byte-rate limit shared by all transfers of this
+                service, None for unlimited
 
         Raises:
             ValueError: If configuration is invalid
@@ -34,25 +146,62 @@ class S3Service:
             raise ValueError("Invalid S3 configuration")
 
         self.config = config
+        self.max_pool_connections = max_pool_connections
+        self.limiter = limiter or get_default_limiter()
+        self.bandwidth_limiter = bandwidth_limiter
         self._client = None
+        self._transfer_client = None
+        self._client_lock = threading.Lock()
         self._bucket_exists_cache: bool | None = None
 
     @property
     def client(self):
         """Get S3 client, creating it if necessary."""
         if self._client is None:
-            try:
-                self._client = boto3.client(
-                    "s3",
-                    aws_access_key_id=self.config.access_key,
-                    aws_secret_access_key=self.config.secret_key,
-                    region_name=self.config.region,
-                )
-            except Exception as e:
-                logger.error(f"Failed to create S3 client: {e}")
-                raise
+            with self._client_lock:
+                if self._client is None:
+                    # Retries and backoff are owned by the limiter
+                    self._client = self._create_client(total_max_attempts=1)
         return self._client
 
+    @property
+    def transfer_client(self):
+        """Get the S3 client the transfer manager uses, creating it if necessary.
+
+        The limiter only sees a whole transfer, so this client keeps
+        botocore's retries: a failed part request is retried on its own
+        instead of restarting the transfer from the first byte.
+        """
+        if self._transfer_client is None:
+            with self._client_lock:
+                if self._transfer_client is None:
+                    self._transfer_client = self._create_client(
+                        total_max_attempts=TRANSFER_MAX_ATTEMPTS
+                    )
+        return self._transfer_client
+
+    def _create_client(self, total_max_attempts: int):
+        """Create an S3 client making at most total_max_attempts per request."""
+        try:
+            return boto3.client(
+                "s3",
+                aws_access_key_id=self.config.access_key,
+                aws_secret_access_key=self.config.secret_key,
+                region_name=self.config.region,
+                config=Config(
+                    max_pool_connections=self.max_pool_connections,
+                    # Presigned URLs would otherwise use SigV2
+                    signature_version="s3v4",
+                    retries={
+                        "mode": "standard",
+                        "total_max_attempts": total_max_attempts,
+                    },
+                ),
+            )
+        except Exception as e:
+            logger.error(f"Failed to create S3 client: {e}")
+            raise
+
     def test_connection(self) -> bool:
         """Test S3 connection and bucket access.
 
@@ -61,7 +210,9 @@ class S3Service:
         """
         try:
             # Try to list objects in the bucket (with limit 1 to minimize cost)
-            self.client.list_objects_v2(Bucket=self.config.bucket, MaxKeys=1)
+            self.limiter.call(
+                self.client.list_objects_v2, Bucket=self.config.bucket, MaxKeys=1
+            )
             self._bucket_exists_cache = True
             return True
         except NoCredentialsError:
@@ -104,12 +255,27 @@ class S3Service:
 
         try:
             # Upload file with storage class
-            extra_args = {}
+            extra_args = {"ChecksumAlgorithm": UPLOAD_CHECKSUM_ALGORITHM}
             if request.storage_class:
                 extra_args["StorageClass"] = request.storage_class.value
-
-            self.client.upload_file(
-                str(file_path), self.config.bucket, request.s3_key, ExtraArgs=extra_args
+            metadata = dict(request.metadata or {})
+
+            encoding = None
+            size = file_path.stat().st_size
+            if request.compression and should_compress(file_path, size):
+                encoding = request.compression
+                extra_args["ContentEncoding"] = encoding
+                metadata[UNCOMPRESSED_SIZE_METADATA] = str(size)
+            if metadata:
+                extra_args["Metadata"] = metadata
+
+            self.limiter.call(
+                self._transfer_upload,
+                file_path,
+                request.s3_key,
+                extra_args,
+                encoding,
+                s3_key=request.s3_key,
             )
 
             logger.info(
@@ -131,6 +297,394 @@ class S3Service:
             logger.error(f"Unexpected error during upload: {e}")
             return UploadResult.error(f"Upload failed: {e}")
 
+    def _transfer_upload(
+        self,
+        file_path: Path,
+        s3_key: str,
+        extra_args: dict,
+        encoding: str | None = None,
+    ):
+        """Send a local file, compressed while it is read if encoding is set.
+
+        Paced by the bandwidth limiter if one is set, counting the bytes
+        actually sent.
+        """
+        if self.bandwidth_limiter is None and encoding is None:
+            self.transfer_client.upload_file(
+                str(file_path),
+                self.config.bucket,
+                s3_key,
+                ExtraArgs=extra_args,
+                Config=TRANSFER_CONFIG,
+            )
+            return
+
+        # Reopened on every attempt so retries start from the first byte
+        with open(file_path, "rb") as f:
+            reader = f
+            if encoding:
+                reader = CompressingReader(reader, encoding)
+            if self.bandwidth_limiter is not None:
+                reader = ThrottledReader(reader, self.bandwidth_limiter)
+            self.transfer_client.upload_fileobj(
+                reader,
+                self.config.bucket,
+                s3_key,
+                ExtraArgs=extra_args,
+                Config=TRANSFER_CONFIG,
+            )
+
+    def _transfer_download(
+        self,
+        s3_key: str,
+        local_path: Path,
+        encoding: str | None = None,
+    ):
+        """Fetch an object, decompressing it while it is written if encoded.
+
+        Paced by the bandwidth limiter if one is set.
+        """
+        if self.bandwidth_limiter is None and encoding is None:
+            self.transfer_client.download_file(
+                self.config.bucket, s3_key, str(local_path)
+            )
+            return
+
+        with open(local_path, "wb") as f:
+            writer = f
+            decompressor = None
+            if encoding:
+                writer = decompressor = DecompressingWriter(f, encoding)
+            if self.bandwidth_limiter is not None:
+                writer = ThrottledWriter(writer, self.bandwidth_limiter)
+            self.transfer_client.download_fileobj(
+                self.config.bucket, s3_key, writer
+            )
+            if decompressor:
+                decompressor.finish()
+
+    def copy_object(
+        self,
+        source_key: str,
+        dest_key: str,
+        storage_class: S3StorageClass | None = None,
+        source_info: dict | None = None,
+    ) -> UploadResult:
+        """Copy an object within the bucket without transferring its bytes.
+
+        Sources over 5 GiB are copied as a multipart upload whose parts are
+        copied server-side in parallel.
+
+        Args:
+            source_key: Key of the existing object
+            dest_key: Key to create
+            storage_class: Storage class of the copy, the source's if None
+            source_info: get_object_info result (or at least "size") for the
+                source, fetched if not given
+
+        Returns:
+            Upload result for the destination, with copied_from set
+        """
+        try:
+            needs_head = source_info is None or (
+                source_info["size"] > MAX_COPY_OBJECT_SIZE
+                and "metadata" not in source_info
+            )
+            if needs_head:
+                source_info = self.get_object_info(source_key)
+                if source_info is None:
+                    return UploadResult.error(f"Copy source not found: {source_key}")
+
+            if storage_class:
+                storage_class_value = storage_class.value
+            else:
+                storage_class_value = source_info.get("storage_class", "STANDARD")
+
+            if source_info["size"] <= MAX_COPY_OBJECT_SIZE:
+                self.limiter.call(
+                    self.client.copy_object,
+                    Bucket=self.config.bucket,
+                    Key=dest_key,
+                    CopySource={"Bucket": self.config.bucket, "Key": source_key},
+                    StorageClass=storage_class_value,
+                    MetadataDirective="COPY",
+                    s3_key=dest_key,
+                )
+            else:
+                self._multipart_copy(
+                    source_key, dest_key, storage_class_value, source_info
+                )
+
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            logger.error(f"AWS client error during copy: {e}")
+            return UploadResult.error(f"AWS error ({error_code}): {e}")
+
+        except Exception as e:
+            logger.error(f"Unexpected error during copy: {e}")
+            return UploadResult.error(f"Copy failed: {e}")
+
+        logger.info(f"Copied s3://{self.config.bucket}/{source_key} to {dest_key}")
+        return UploadResult.success(
+            s3_url=f"s3://{self.config.bucket}/{dest_key}",
+            storage_class=storage_class_value,
+            copied_from=source_key,
+        )
+
+    def _multipart_copy(
+        self, source_key: str, dest_key: str, storage_class: str, source_info: dict
+    ):
+        """Copy a large object part by part with UploadPartCopy."""
+        size = source_info["size"]
+        # Multipart copies do not carry the source's metadata or headers over
+        headers = {
+            param: source_info[field]
+            for field, param in COPIED_HEADERS.items()
+            if source_info.get(field)
+        }
+        upload = self.limiter.call(
+            self.client.create_multipart_upload,
+            Bucket=self.config.bucket,
+            Key=dest_key,
+            StorageClass=storage_class,
+            Metadata=source_info.get("metadata", {}),
+            **headers,
+            s3_key=dest_key,
+        )
+        upload_id = upload["UploadId"]
+
+        def copy_part(part_number: int, start: int) -> dict:
+            end = min(start + COPY_PART_SIZE, size) - 1
+            response = self.limiter.call(
+                self.client.upload_part_copy,
+                Bucket=self.config.bucket,
+                Key=dest_key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                CopySource={"Bucket": self.config.bucket, "Key": source_key},
+                CopySourceRange=f"bytes={start}-{end}",
+                s3_key=dest_key,
+            )
+            return {"PartNumber": part_number, "ETag": response["CopyPartResult"]["ETag"]}
+
+        try:
+            with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+                parts = list(
+                    executor.map(
+                        copy_part,
+                        range(1, -(-size // COPY_PART_SIZE) + 1),
+                        range(0, size, COPY_PART_SIZE),
+                    )
+                )
+            self.limiter.call(
+                self.client.complete_multipart_upload,
+                Bucket=self.config.bucket,
+                Key=dest_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+                s3_key=dest_key,
+            )
+        except Exception:
+            try:
+                self.limiter.call(
+                    self.client.abort_multipart_upload,
+                    Bucket=self.config.bucket,
+                    Key=dest_key,
+                    UploadId=upload_id,
+                    s3_key=dest_key,
+                )
+            except ClientError as e:
+                logger.error(f"Failed to abort multipart copy {upload_id}: {e}")
+            raise
+
+    def restore_object(self, s3_key: str, days: int, tier: str) -> str:
+        """Ask S3 to make a temporary readable copy of an archived object.
+
+        Args:
+            s3_key: Key of a GLACIER or DEEP_ARCHIVE object
+            days: Days the restored copy is kept
+            tier: Retrieval tier ("Expedited", "Standard" or "Bulk")
+
+        Returns:
+            RESTORE_REQUESTED, RESTORE_ONGOING if a restore was already
+            running, or RESTORE_DONE if a restored copy already exists (its
+            expiry is extended to the given days)
+
+        Raises:
+            ClientError: If S3 rejects the request
+        """
+        try:
+            response = self.limiter.call(
+                self.client.restore_object,
+                Bucket=self.config.bucket,
+                Key=s3_key,
+                RestoreRequest={
+                    "Days": days,
+                    "GlacierJobParameters": {"Tier": tier},
+                },
+                s3_key=s3_key,
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "RestoreAlreadyInProgress":
+                return RESTORE_ONGOING
+            raise
+
+        # 202 Accepted starts a restore; 200 OK means one is already readable
+        if response["ResponseMetadata"]["HTTPStatusCode"] == 200:
+            return RESTORE_DONE
+        logger.info(f"Requested {tier} restore of {s3_key} for {days} days")
+        return RESTORE_REQUESTED
+
+    def presign_download(
+        self, s3_key: str, expires_in: int = PRESIGN_EXPIRES_IN
+    ) -> str:
+        """Create a URL that downloads an object straight from S3.
+
+        Signing is local; no request is sent and the key is not checked.
+
+        Args:
+            s3_key: S3 object key
+            expires_in: Seconds the URL stays valid
+
+        Returns:
+            Presigned GET URL, served as an attachment named after the key
+
+        Raises:
+            ValueError: If expires_in is out of range
+        """
+        _check_expires_in(expires_in)
+        filename = quote(s3_key.rsplit("/", 1)[-1])
+        return self.client.generate_presigned_url(
+            "get_object",
+            Params={
+                "Bucket": self.config.bucket,
+                "Key": s3_key,
+                "ResponseContentDisposition": f"attachment; filename*=UTF-8''{filename}",
+            },
+            ExpiresIn=expires_in,
+        )
+
+    def presign_upload(
+        self,
+        s3_key: str,
+        size: int,
+        storage_class: S3StorageClass | None = None,
+        expires_in: int = PRESIGN_EXPIRES_IN,
+    ) -> dict:
+        """Start a multipart upload whose parts are PUT straight to S3.
+
+        Parts use the same size as uploads from this tool, so the ETag S3
+        computes can be checked by "verify dir". The client PUTs each part to
+        its URL, then passes the returned ETags to complete_presigned_upload.
+
+        Args:
+            s3_key: Key to create
+            size: Size of the file in bytes
+            storage_class: Storage class of the object (STANDARD if None)
+            expires_in: Seconds the part URLs stay valid
+
+        Returns:
+            Dict with "upload_id", "part_size" and "parts", a list of
+            {"part_number", "url"}
+
+        Raises:
+            ValueError: If size or expires_in is out of range
+            ClientError: If the upload cannot be created
+        """
+        _check_expires_in(expires_in)
+        if not 0 <= size <= MAX_OBJECT_SIZE:
+            raise ValueError(f"Size must be between 0 and {MAX_OBJECT_SIZE} bytes")
+        storage_class = storage_class or S3StorageClass.STANDARD
+
+        upload = self.limiter.call(
+            self.client.create_multipart_upload,
+            Bucket=self.config.bucket,
+            Key=s3_key,
+            StorageClass=storage_class.value,
+            s3_key=s3_key,
+        )
+        upload_id = upload["UploadId"]
+        part_size = effective_part_size(size)
+        part_count = max(1, -(-size // part_size))
+        parts = [
+            {
+                "part_number": part_number,
+                "url": self.client.generate_presigned_url(
+                    "upload_part",
+                    Params={
+                        "Bucket": self.config.bucket,
+                        "Key": s3_key,
+                        "UploadId": upload_id,
+                        "PartNumber": part_number,
+                    },
+                    ExpiresIn=expires_in,
+                ),
+            }
+            for part_number in range(1, part_count + 1)
+        ]
+        logger.info(f"Presigned {part_count} parts of {s3_key} ({upload_id})")
+        return {"upload_id": upload_id, "part_size": part_size, "parts": parts}
+
+    def complete_presigned_upload(
+        self, s3_key: str, upload_id: str, etags: dict[int, str]
+    ) -> UploadResult:
+        """Finish a multipart upload started by presign_upload.
+
+        Args:
+            s3_key: Key being created
+            upload_id: Upload ID returned by presign_upload
+            etags: ETag returned by S3 for each part number
+
+        Returns:
+            Upload result
+        """
+        try:
+            self.limiter.call(
+                self.client.complete_multipart_upload,
+                Bucket=self.config.bucket,
+                Key=s3_key,
+                UploadId=upload_id,
+                MultipartUpload={
+                    "Parts": [
+                        {"PartNumber": number, "ETag": etags[number]}
+                        for number in sorted(etags)
+                    ]
+                },
+                s3_key=s3_key,
+            )
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            logger.error(f"AWS client error completing upload of {s3_key}: {e}")
+            return UploadResult.error(f"AWS error ({error_code}): {e}")
+
+        logger.info(f"Completed presigned upload of s3://{self.config.bucket}/{s3_key}")
+        return UploadResult.success(s3_url=f"s3://{self.config.bucket}/{s3_key}")
+
+    def abort_presigned_upload(self, s3_key: str, upload_id: str) -> bool:
+        """Abort a multipart upload started by presign_upload.
+
+        Args:
+            s3_key: Key that was being created
+            upload_id: Upload ID returned by presign_upload
+
+        Returns:
+            True if aborted (or already gone), False on error
+        """
+        try:
+            self.limiter.call(
+                self.client.abort_multipart_upload,
+                Bucket=self.config.bucket,
+                Key=s3_key,
+                UploadId=upload_id,
+                s3_key=s3_key,
+            )
+            return True
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "NoSuchUpload":
+                return True
+            logger.error(f"Failed to abort upload {upload_id}: {e}")
+            return False
+
     def get_object_info(self, s3_key: str) -> dict | None:
         """Get information about an S3 object.
 
@@ -141,15 +695,27 @@ class S3Service:
             Object metadata dict if found, None otherwise
         """
         try:
-            response = self.client.head_object(Bucket=self.config.bucket, Key=s3_key)
+            response = self.limiter.call(
+                self.client.head_object,
+                Bucket=self.config.bucket,
+                Key=s3_key,
+                s3_key=s3_key,
+            )
             return {
                 "size": response["ContentLength"],
                 "last_modified": response["LastModified"],
                 "etag": response["ETag"],
                 "storage_class": response.get("StorageClass", "STANDARD"),
+                "metadata": response.get("Metadata", {}),
+                "content_encoding": response.get("ContentEncoding"),
+                "content_type": response.get("ContentType"),
+                "content_disposition": response.get("ContentDisposition"),
+                "content_language": response.get("ContentLanguage"),
+                "cache_control": response.get("CacheControl"),
+                "restore_status": _parse_restore(response.get("Restore")),
             }
         except ClientError as e:
-            if e.response["Error"]["Code"] == "NoSuchKey":
+            if _is_not_found(e):
                 return None
             logger.error(f"Error getting object info: {e}")
             return None
@@ -157,7 +723,130 @@ class S3Service:
             logger.error(f"Unexpected error getting object info: {e}")
             return None
 
-    def list_objects(self, prefix: str = "", max_keys: int = 1000) -> list[dict]:
+    def read_bytes(
+        self, s3_key: str, length: int | None = None, etag: str | None = None
+    ) -> bytes:
+        """Read an object, or only its first bytes, into memory.
+
+        Args:
+            s3_key: S3 object key
+            length: Read at most this many bytes from the start, None for all
+            etag: Only read this version; a newer one fails the request
+                instead of being returned
+
+        Returns:
+            The stored (possibly still compressed) bytes
+
+        Raises:
+            ClientError: If the object is missing, changed or unreadable
+        """
+        params = {"Bucket": self.config.bucket, "Key": s3_key}
+        if length is not None:
+            params["Range"] = f"bytes=0-{max(length, 1) - 1}"
+        if etag:
+            params["IfMatch"] = etag
+
+        def fetch() -> bytes:
+            response = self.client.get_object(**params)
+            out = io.BytesIO()
+            writer = out
+            if self.bandwidth_limiter is not None:
+                writer = ThrottledWriter(out, self.bandwidth_limiter)
+            for chunk in response["Body"].iter_chunks(READ_CHUNK_SIZE):
+                writer.write(chunk)
+            return out.getvalue()
+
+        return self.limiter.call(fetch, s3_key=s3_key)
+
+    def get_object_attributes(self, s3_key: str) -> dict | None:
+        """Get an object's size, ETag and additional checksums without its body.
+
+        Args:
+            s3_key: S3 object key
+
+        Returns:
+            Dict with "size", "etag", "checksums" (algorithm name such as
+            "SHA256" to base64 value), "checksum_type" ("COMPOSITE",
+            "FULL_OBJECT" or None), "parts" (part count, 0 if not multipart)
+            and "part_size" (size of the first part if S3 reports it), or
+            None if the object does not exist
+
+        Raises:
+            ClientError: If the request fails for another reason
+        """
+        try:
+            response = self.limiter.call(
+                self.client.get_object_attributes,
+                Bucket=self.config.bucket,
+                Key=s3_key,
+                ObjectAttributes=["ETag", "Checksum", "ObjectParts", "ObjectSize"],
+                MaxParts=1,
+                s3_key=s3_key,
+            )
+        except ClientError as e:
+            if _is_not_found(e):
+                return None
+            raise
+
+        checksum = response.get("Checksum", {})
+        object_parts = response.get("ObjectParts", {})
+        first_parts = object_parts.get("Parts", [])
+        # Unlike HeadObject, GetObjectAttributes returns the ETag unquoted
+        etag = response.get("ETag", "").strip('"')
+        return {
+            "size": response.get("ObjectSize"),
+            "etag": f'"{etag}"',
+            "checksums": {
+                name[len("Checksum") :]: value
+                for name, value in checksum.items()
+                if name.startswith("Checksum") and name != "ChecksumType"
+            },
+            "checksum_type": checksum.get("ChecksumType"),
+            "parts": object_parts.get("TotalPartsCount", 0),
+            "part_size": first_parts[0].get("Size") if first_parts else None,
+        }
+
+    def iter_objects(
+        self,
+        prefix: str = "",
+        max_keys: int | None = None,
+        bucket: str | None = None,
+        restore_status: bool = False,
+    ) -> Iterator[ObjectEntry]:
+        """Iterate over objects page by page without building the full list.
+
+        Args:
+            prefix: Prefix to filter objects
+            max_keys: Maximum number of objects to yield, None for all
+            bucket: Bucket to list, defaults to the configured bucket
+            restore_status: Also fetch the restore state of archived objects
+
+        Yields:
+            Listing entries
+
+        Raises:
+            ClientError: If a listing request fails
+        """
+        params = {"Bucket": bucket or self.config.bucket, "Prefix": prefix}
+        if restore_status:
+            params["OptionalObjectAttributes"] = ["RestoreStatus"]
+        yielded = 0
+
+        while max_keys is None or yielded < max_keys:
+            params["MaxKeys"] = 1000 if max_keys is None else min(1000, max_keys - yielded)
+            page = self.limiter.call(self.client.list_objects_v2, **params, s3_key=prefix)
+
+            for obj in page.get("Contents", []):
+                yield ObjectEntry.from_s3(obj)
+                yielded += 1
+
+            if not page.get("IsTruncated"):
+                break
+            params["ContinuationToken"] = page["NextContinuationToken"]
+
+    def list_objects(
+        self, prefix: str = "", max_keys: int = 1000
+    ) -> list[ObjectEntry]:
         """List objects in the S3 bucket.
 
         Args:
@@ -165,32 +854,10 @@ class S3Service:
             max_keys: Maximum number of objects to return
 
         Returns:
-            List of object information dictionaries
+            Listing entries
         """
         try:
-            paginator = self.client.get_paginator("list_objects_v2")
-            page_iterator = paginator.paginate(
-                Bucket=self.config.bucket,
-                Prefix=prefix,
-                PaginationConfig={"MaxItems": max_keys},
-            )
-
-            objects = []
-            for page in page_iterator:
-                if "Contents" in page:
-                    for obj in page["Contents"]:
-                        objects.append(
-                            {
-                                "key": obj["Key"],
-                                "size": obj["Size"],
-                                "last_modified": obj["LastModified"],
-                                "etag": obj["ETag"],
-                                "storage_class": obj.get("StorageClass", "STANDARD"),
-                            }
-                        )
-
-            return objects
-
+            return list(self.iter_objects(prefix=prefix, max_keys=max_keys))
         except ClientError as e:
             logger.error(f"Error listing objects: {e}")
             return []
@@ -198,6 +865,95 @@ class S3Service:
             logger.error(f"Unexpected error listing objects: {e}")
             return []
 
+    def search_objects(
+        self,
+        pattern: str,
+        mode: str = "auto",
+        ignore_case: bool = False,
+        prefix: str = "",
+        max_results: int | None = 1000,
+    ) -> list[ObjectEntry]:
+        """Search object keys by substring, glob or regex.
+
+        The pattern's literal leading text is pushed down as the listing
+        prefix, so "photos/2024/*.jpg" only lists "photos/2024/".
+
+        Args:
+            pattern: Pattern text, see core.patterns.compile_pattern
+            mode: "auto", "substring", "glob" or "regex"
+            ignore_case: Case-insensitive glob/regex matching
+            prefix: Restrict the search to this prefix
+            max_results: Stop after this many matches, None for all
+
+        Returns:
+            Matching listing entries
+
+        Raises:
+            ValueError: If the pattern or mode is invalid
+            ClientError: If a listing request fails
+        """
+        matcher = compile_pattern(pattern, mode=mode, ignore_case=ignore_case)
+        scope = listing_prefix(matcher, prefix)
+        if scope is None:
+            return []
+
+        matches = []
+        for obj in self.iter_objects(prefix=scope):
+            if matcher.matches(obj.key):
+                matches.append(obj)
+                if max_results is not None and len(matches) >= max_results:
+                    break
+        return matches
+
+    def resolve_key(self, s3_key: str) -> KeyKind:
+        """Decide whether a key names an object, a directory prefix, or both.
+
+        Costs at most one HEAD and one single-key, delimited LIST, however
+        many objects live under the key.
+
+        Args:
+            s3_key: S3 key as given by the user
+
+        Returns:
+            KeyKind describing the key
+
+        Raises:
+            ClientError: If S3 rejects a request for a reason other than
+                the object not existing
+        """
+        is_object = False
+        if not s3_key.endswith("/"):
+            try:
+                self.limiter.call(
+                    self.client.head_object,
+                    Bucket=self.config.bucket,
+                    Key=s3_key,
+                    s3_key=s3_key,
+                )
+                is_object = True
+            except ClientError as e:
+                if not _is_not_found(e):
+                    raise
+
+        prefix = directory_prefix(s3_key)
+        page = self.limiter.call(
+            self.client.list_objects_v2,
+            Bucket=self.config.bucket,
+            Prefix=prefix,
+            Delimiter="/",
+            MaxKeys=1,
+            s3_key=prefix,
+        )
+        has_children = bool(page.get("Contents") or page.get("CommonPrefixes"))
+
+        if is_object and has_children:
+            return KeyKind.BOTH
+        if is_object:
+            return KeyKind.OBJECT
+        if has_children:
+            return KeyKind.PREFIX
+        return KeyKind.NONE
+
     def file_exists(self, s3_key: str) -> bool:
         """Check if a file exists in S3.
 
@@ -208,10 +964,15 @@ class S3Service:
             True if file exists, False otherwise
         """
         try:
-            self.client.head_object(Bucket=self.config.bucket, Key=s3_key)
+            self.limiter.call(
+                self.client.head_object,
+                Bucket=self.config.bucket,
+                Key=s3_key,
+                s3_key=s3_key,
+            )
             return True
         except ClientError as e:
-            if e.response["Error"]["Code"] == "NoSuchKey":
+            if _is_not_found(e):
                 return False
             logger.error(f"Error checking if file exists: {e}")
             return False
@@ -229,11 +990,27 @@ class S3Service:
             DownloadResult with success/failure information
         """
         try:
-            # Check if S3 file exists
-            if not self.file_exists(request.s3_key):
+            # Check if S3 file exists; its encoding decides decompression
+            info = self.get_object_info(request.s3_key)
+            if info is None:
                 return DownloadResult.error_result(
                     request.s3_key, f"File not found in S3: {request.s3_key}"
                 )
+            if request.etag and info["etag"] != request.etag:
+                return DownloadResult.error_result(
+                    request.s3_key,
+                    f"Object changed: ETag is {info['etag']}, not {request.etag}",
+                )
+            if (
+                info["storage_class"] in ARCHIVED_STORAGE_CLASSES
+                and info.get("restore_status") != RESTORE_DONE
+            ):
+                return DownloadResult.error_result(
+                    request.s3_key, archived_message(info["storage_class"])
+                )
+            encoding = info.get("content_encoding")
+            if encoding not in ENCODINGS:
+                encoding = None
 
             # Determine local storage path
             local_path = request.get_local_path()
@@ -250,10 +1027,26 @@ class S3Service:
             local_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Download file
-            self.client.download_file(
-                self.config.bucket, request.s3_key, str(local_path)
+            self.limiter.call(
+                self._transfer_download,
+                request.s3_key,
+                local_path,
+                encoding,
+                s3_key=request.s3_key,
             )
 
+            # The transfer manager takes no IfMatch, so check the version is
+            # still the requested one once the bytes are on disk
+            if request.etag:
+                after = self.get_object_info(request.s3_key)
+                if after is None or after["etag"] != request.etag:
+                    local_path.unlink(missing_ok=True)
+                    return DownloadResult.error_result(
+                        request.s3_key,
+                        f"Object changed during download: ETag is no longer "
+                        f"{request.etag}",
+                    )
+
             # Get file size
             file_size = local_path.stat().st_size
 
@@ -291,7 +1084,12 @@ class S3Service:
 
             # Execute delete operation
             # Note: S3 delete_object is idempotent - doesn't fail if file doesn't exist
-            self.client.delete_object(Bucket=self.config.bucket, Key=s3_key)
+            self.limiter.call(
+                self.client.delete_object,
+                Bucket=self.config.bucket,
+                Key=s3_key,
+                s3_key=s3_key,
+            )
 
             logger.info(
                 f"Delete operation completed for s3://{self.config.bucket}/{s3_key} "
@@ -308,6 +1106,28 @@ class S3Service:
             logger.error(f"Unexpected error during delete: {e}")
             return DeleteResult.error_result(s3_key, f"Delete failed: {e}")
 
+    def download_entry(
+        self, obj: ObjectEntry, local_path: Path, force: bool = False
+    ) -> DownloadResult:
+        """Download one listed object, failing archived ones without a request.
+
+        Args:
+            obj: Listing entry, listed with restore_status=True
+            local_path: Where to write the object
+            force: Whether to overwrite an existing local file
+
+        Returns:
+            DownloadResult with success/failure information
+        """
+        # Archived objects would fail the GET; skip the requests
+        if obj.needs_restore:
+            return DownloadResult.error_result(
+                obj.key, archived_message(obj.storage_class)
+            )
+        return self.download_file(
+            DownloadRequest(s3_key=obj.key, output_path=str(local_path), force=force)
+        )
+
     def download_directory(
         self, s3_prefix: str, local_base_path: Path, force: bool = False
     ) -> list[DownloadResult]:
@@ -324,53 +1144,38 @@ class S3Service:
         results = []
 
         try:
-            # List all objects with the prefix
-            objects = self.list_objects(prefix=s3_prefix)
-
-            if not objects:
-                return [
-                    DownloadResult.error_result(
-                        s3_prefix, "No files found with this prefix"
-                    )
-                ]
-
             # Ensure prefix ends with / for directory-like behavior
-            normalized_prefix = (
-                s3_prefix.rstrip("/") + "/"
-                if s3_prefix and not s3_prefix.endswith("/")
-                else s3_prefix
-            )
+            normalized_prefix = directory_prefix(s3_prefix)
 
-            for obj in objects:
-                s3_key = obj["key"]
+            # Stream the listing so the first download starts after one page
+            for obj in self.iter_objects(prefix=normalized_prefix, restore_status=True):
+                s3_key = obj.key
 
                 # Skip if this is just the prefix itself (empty directory marker)
                 if s3_key == normalized_prefix:
                     continue
 
                 # Calculate relative path within the directory
-                if normalized_prefix:
-                    if not s3_key.startswith(normalized_prefix):
-                        continue
-                    relative_path = s3_key[len(normalized_prefix) :]
-                else:
-                    relative_path = s3_key
+                relative_path = s3_key[len(normalized_prefix) :]
 
                 # Skip empty relative paths (shouldn't happen but be safe)
                 if not relative_path:
                     continue
 
-                # Create local path
-                local_file_path = local_base_path / relative_path
+                # Pack internals are fetched member by member by PackService
+                if f"/{PACK_DIR}/" in f"/{s3_key}":
+                    continue
 
-                # Create download request
-                download_request = DownloadRequest(
-                    s3_key=s3_key, output_path=str(local_file_path), force=force
+                results.append(
+                    self.download_entry(obj, local_base_path / relative_path, force)
                 )
 
-                # Download the file
-                result = self.download_file(download_request)
-                results.append(result)
+            if not results:
+                return [
+                    DownloadResult.error_result(
+                        s3_prefix, "No files found with this prefix"
+                    )
+                ]
 
         except Exception as e:
             logger.error(f"Unexpected error during directory download: {e}")
@@ -397,17 +1202,15 @@ class S3Service:
         results = []
 
         try:
-            # List all objects with the prefix
-            objects = self.list_objects(prefix=s3_prefix)
-
-            if not objects:
-                return [DeleteResult.success_result(s3_prefix, existed=False)]
-
-            for obj in objects:
-                s3_key = obj["key"]
+            # Only keys below "<prefix>/", never siblings such as "<prefix>2/"
+            for obj in self.iter_objects(prefix=directory_prefix(s3_prefix)):
+                s3_key = obj.key
                 result = self.delete_file(s3_key)
                 results.append(result)
 
+            if not results:
+                return [DeleteResult.success_result(s3_prefix, existed=False)]
+
         except Exception as e:
             logger.error(f"Unexpected error during directory delete: {e}")
             results.append(
@@ -415,3 +1218,223 @@ class S3Service:
             )
 
         return results
+
+    def delete_objects(self, s3_keys: list[str]) -> list[DeleteResult]:
+        """Delete many objects with batched DeleteObjects requests.
+
+        Args:
+            s3_keys: Keys to delete
+
+        Returns:
+            List of DeleteResult for each key
+        """
+        results = []
+
+        for start in range(0, len(s3_keys), DELETE_BATCH_SIZE):
+            batch = s3_keys[start : start + DELETE_BATCH_SIZE]
+            try:
+                response = self.limiter.call(
+                    self.client.delete_objects,
+                    Bucket=self.config.bucket,
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+                    s3_key=batch[0],
+                )
+            except ClientError as e:
+                error_code = e.response["Error"]["Code"]
+                logger.error(f"AWS client error during batch delete: {e}")
+                results.extend(
+                    DeleteResult.error_result(key, f"AWS error ({error_code}): {e}")
+                    for key in batch
+                )
+                continue
+            except Exception as e:
+                logger.error(f"Unexpected error during batch delete: {e}")
+                results.extend(
+                    DeleteResult.error_result(key, f"Delete failed: {e}")
+                    for key in batch
+                )
+                continue
+
+            # Quiet mode only reports the keys that failed
+            errors = {
+                error["Key"]: f"AWS error ({error['Code']}): {error['Message']}"
+                for error in response.get("Errors", [])
+            }
+            for key in batch:
+                if key in errors:
+                    results.append(DeleteResult.error_result(key, errors[key]))
+                else:
+                    results.append(DeleteResult.success_result(key))
+
+        return results
+
+    def copy_file(
+        self,
+        source_key: str,
+        dest_key: str,
+        storage_class: S3StorageClass | None = None,
+    ) -> CopyResult:
+        """Copy one object server-side.
+
+        Args:
+            source_key: Key of the existing object
+            dest_key: Key to create
+            storage_class: Storage class of the copy, the source's if None
+
+        Returns:
+            CopyResult with success/failure information
+        """
+        result = self.copy_object(source_key, dest_key, storage_class)
+        if not result.success:
+            return CopyResult.error_result(source_key, dest_key, result.error_message)
+        return CopyResult.success_result(source_key, dest_key)
+
+    def move_file(
+        self,
+        source_key: str,
+        dest_key: str,
+        storage_class: S3StorageClass | None = None,
+    ) -> CopyResult:
+        """Move (rename) one object: copy it server-side, then delete the source.
+
+        Args:
+            source_key: Key of the existing object
+            dest_key: New key
+            storage_class: Storage class at the new key, the source's if None
+
+        Returns:
+            CopyResult with success/failure information
+        """
+        if source_key == dest_key:
+            # The copy would succeed in place and the delete remove the only copy
+            return CopyResult.error_result(
+                source_key, dest_key, "Source and destination are the same key"
+            )
+
+        result = self.copy_file(source_key, dest_key, storage_class)
+        if not result.success:
+            return result
+
+        deleted = self.delete_file(source_key)
+        if not deleted.success:
+            return CopyResult.error_result(
+                source_key,
+                dest_key,
+                f"Copied, but deleting the source failed: {deleted.error_message}",
+            )
+        return result
+
+    def copy_directory(
+        self,
+        source_prefix: str,
+        dest_prefix: str,
+        storage_class: S3StorageClass | None = None,
+        max_workers: int = COPY_WORKERS,
+    ) -> list[CopyResult]:
+        """Copy every object under a prefix to another prefix concurrently.
+
+        Args:
+            source_prefix: Prefix to copy (acts as directory)
+            dest_prefix: Prefix the objects are copied to
+            storage_class: Storage class of the copies, each source's if None
+            max_workers: Maximum concurrent copy requests
+
+        Returns:
+            List of CopyResult for each object, in source key order
+
+        Raises:
+            ValueError: If the destination lies inside the source
+        """
+        source_root = directory_prefix(source_prefix)
+        dest_root = directory_prefix(dest_prefix)
+        if dest_root.startswith(source_root):
+            raise ValueError(
+                f"Cannot copy {source_prefix} into itself ({dest_prefix})"
+            )
+
+        def copy_entry(obj: ObjectEntry) -> CopyResult:
+            dest_key = dest_root + obj.key[len(source_root) :]
+            result = self.copy_object(
+                obj.key,
+                dest_key,
+                storage_class,
+                source_info={"size": obj.size, "storage_class": obj.storage_class},
+            )
+            if not result.success:
+                return CopyResult.error_result(obj.key, dest_key, result.error_message)
+            return CopyResult.success_result(obj.key, dest_key)
+
+        results = []
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pending = set()
+                for obj in self.iter_objects(prefix=source_root):
+                    # Bound the queue so huge prefixes are not buffered in memory
+                    if len(pending) >= max_workers * 4:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        results.extend(future.result() for future in done)
+                    pending.add(executor.submit(copy_entry, obj))
+                results.extend(future.result() for future in pending)
+        except Exception as e:
+            logger.error(f"Unexpected error during directory copy: {e}")
+            results.append(
+                CopyResult.error_result(
+                    source_prefix, dest_prefix, f"Directory copy failed: {e}"
+                )
+            )
+
+        # Futures finish in any order; keep the result (and delete) order stable
+        results.sort(key=lambda result: result.source_key)
+        return results
+
+    def move_directory(
+        self,
+        source_prefix: str,
+        dest_prefix: str,
+        storage_class: S3StorageClass | None = None,
+        max_workers: int = COPY_WORKERS,
+    ) -> list[CopyResult]:
+        """Move every object under a prefix to another prefix.
+
+        Objects are copied concurrently; sources that copied successfully are
+        then removed with batched DeleteObjects requests.
+
+        Args:
+            source_prefix: Prefix to move (acts as directory)
+            dest_prefix: Prefix the objects are moved to
+            storage_class: Storage class at the new keys, each source's if None
+            max_workers: Maximum concurrent copy requests
+
+        Returns:
+            List of CopyResult for each object
+
+        Raises:
+            ValueError: If the destination lies inside (or is) the source
+        """
+        if directory_prefix(source_prefix) == directory_prefix(dest_prefix):
+            raise ValueError(f"Cannot move {source_prefix} onto itself")
+
+        results = self.copy_directory(
+            source_prefix, dest_prefix, storage_class, max_workers
+        )
+
+        copied = [result.source_key for result in results if result.success]
+        failed_deletes = {
+            deleted.s3_key: deleted.error_message
+            for deleted in self.delete_objects(copied)
+            if not deleted.success
+        }
+        if not failed_deletes:
+            return results
+
+        return [
+            CopyResult.error_result(
+                result.source_key,
+                result.dest_key,
+                "Copied, but deleting the source failed: "
+                f"{failed_deletes[result.source_key]}",
+            )
+            if result.source_key in failed_deletes
+            else result
+            for result in results
+        ]
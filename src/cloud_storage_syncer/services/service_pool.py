@@ -0,0 +1,82 @@
+"""Pool of warm S3 services, one per configuration profile."""
+
+import logging
+import threading
+
+from ..core.bandwidth import BandwidthLimiter
+from ..models import S3Config
+from .caching_s3_service import DEFAULT_CACHE_TTL, CachingS3Service
+from .s3_service import S3Service
+from .shared_cache import SharedCache
+
+logger = logging.getLogger(__name__)
+
+
+class S3ServicePool:
+    """Keep one S3Service, and so one pooled client, per profile.
+
+    A long-running process such as the web API gets the same warm client
+    for every request to a profile instead of building a new one each
+    time. A profile whose configuration changes gets a fresh service.
+    """
+
+    def __init__(
+        self,
+        bandwidth_limiter: BandwidthLimiter | None = None,
+        cache: SharedCache | None = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+    ):
+        """Initialize an empty pool.
+
+        Args:
+            bandwidth_limiter: Transfer budget shared by every service
+            cache: Cache for listings and metadata shared with other
+                processes, None to always ask S3
+            cache_ttl: Seconds a cached result stays valid
+        """
+        self.bandwidth_limiter = bandwidth_limiter
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        self._lock = threading.Lock()
+        self._services: dict[tuple[str, int], tuple[S3Config, S3Service]] = {}
+
+    def get(
+        self, profile: str, config: S3Config, max_pool_connections: int = 10
+    ) -> S3Service:
+        """Get the service for a profile, creating it on first use.
+
+        Args:
+            profile: Profile name
+            config: The profile's current configuration
+            max_pool_connections: Connection pool size of the client
+
+        Returns:
+            Shared S3Service
+        """
+        key = (profile, max_pool_connections)
+        with self._lock:
+            entry = self._services.get(key)
+            if entry is None or entry[0] != config:
+                if entry is not None:
+                    logger.info(f"Configuration of profile {profile} changed")
+                if self.cache is None:
+                    service = S3Service(
+                        config,
+                        max_pool_connections=max_pool_connections,
+                        bandwidth_limiter=self.bandwidth_limiter,
+                    )
+                else:
+                    service = CachingS3Service(
+                        config,
+                        self.cache,
+                        ttl=self.cache_ttl,
+                        max_pool_connections=max_pool_connections,
+                        bandwidth_limiter=self.bandwidth_limiter,
+                    )
+                entry = (config, service)
+                self._services[key] = entry
+            return entry[1]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._services)
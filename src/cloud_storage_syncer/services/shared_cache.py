@@ -0,0 +1,215 @@
+"""Key-value cache backends that several processes can share."""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+
+# Expired SQLite rows are purged once every this many writes
+_PURGE_EVERY = 1000
+
+
+class SharedCache:
+    """Interface of the cache backends.
+
+    Values are anything JSON-serializable and expire after a TTL. Counters
+    never expire; callers bump one to invalidate every key built from it.
+    """
+
+    def get(self, key: str) -> Any | None:
+        """Get a value, or None if missing or expired."""
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a value for ttl seconds."""
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """Remove a value if present."""
+        raise NotImplementedError
+
+    def counter(self, key: str) -> int:
+        """Get a counter's value, 0 if never incremented."""
+        raise NotImplementedError
+
+    def incr(self, key: str) -> int:
+        """Increment a counter and return its new value."""
+        raise NotImplementedError
+
+
+class MemoryCache(SharedCache):
+    """Cache private to one process, for single-worker deployments and tests."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: dict[str, tuple[float, str]] = {}
+        self._counters: dict[str, int] = {}
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.time():
+                del self._values[key]
+                return None
+        # Stored encoded so callers never share mutable values
+        return json.loads(entry[1])
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        encoded = json.dumps(value)
+        with self._lock:
+            self._values[key] = (time.time() + ttl, encoded)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._values.pop(key, None)
+
+    def counter(self, key: str) -> int:
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+
+class SQLiteCache(SharedCache):
+    """Cache in an SQLite file in WAL mode, shared by processes on one host.
+
+    WAL lets readers proceed while another process writes, so worker
+    processes only contend on writes.
+    """
+
+    def __init__(self, db_path: Path):
+        """Open (creating if needed) the cache database.
+
+        Args:
+            db_path: SQLite file
+        """
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            # Losing the last writes in a power cut is fine for a cache
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " expires REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS counters ("
+                " key TEXT PRIMARY KEY,"
+                " value INTEGER NOT NULL)"
+            )
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache WHERE key = ? AND expires >= ?",
+                (key, time.time()),
+            ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        encoded = json.dumps(value)
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)",
+                (key, encoded, now + ttl),
+            )
+            self._writes += 1
+            if self._writes % _PURGE_EVERY == 0:
+                self._conn.execute("DELETE FROM cache WHERE expires < ?", (now,))
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def counter(self, key: str) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM counters WHERE key = ?", (key,)
+            ).fetchone()
+        return 0 if row is None else row[0]
+
+    def incr(self, key: str) -> int:
+        with self._lock, self._conn:
+            return self._conn.execute(
+                "INSERT INTO counters (key, value) VALUES (?, 1)"
+                " ON CONFLICT (key) DO UPDATE SET value = value + 1"
+                " RETURNING value",
+                (key,),
+            ).fetchone()[0]
+
+
+class RedisCache(SharedCache):
+    """Cache in Redis or a Redis-compatible server, shared across hosts."""
+
+    def __init__(self, url: str):
+        """Connect to the server.
+
+        Args:
+            url: Server URL such as redis://localhost:6379/0
+
+        Raises:
+            ValueError: If the redis package is not installed
+        """
+        try:
+            import redis
+        except ImportError as e:
+            raise ValueError(
+                "Redis caching needs redis: "
+                "pip install 'cloud-storage-syncer[redis]'"
+            ) from e
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Any | None:
+        value = self._client.get(key)
+        return None if value is None else json.loads(value)
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self._client.set(key, json.dumps(value), px=max(1, int(ttl * 1000)))
+
+    def delete(self, key: str) -> None:
+        self._client.delete(key)
+
+    def counter(self, key: str) -> int:
+        return int(self._client.get(key) or 0)
+
+    def incr(self, key: str) -> int:
+        return self._client.incr(key)
+
+
+def open_shared_cache(url: str) -> SharedCache:
+    """Open a cache backend from a URL.
+
+    Args:
+        url: "memory://", "sqlite:///path/to/cache.db" or "redis://host:port/db"
+
+    Returns:
+        Cache backend
+
+    Raises:
+        ValueError: If the scheme is unknown or the backend is unavailable
+    """
+    parsed = urlparse(url)
+    if parsed.scheme == "memory":
+        return MemoryCache()
+    if parsed.scheme == "sqlite":
+        if not parsed.path:
+            raise ValueError(f"SQLite cache URL needs a path: {url}")
+        return SQLiteCache(Path(parsed.path))
+    if parsed.scheme in ("redis", "rediss", "unix"):
+        return RedisCache(url)
+    raise ValueError(f"Unknown cache URL scheme: {url}")
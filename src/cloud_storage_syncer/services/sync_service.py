@@ -0,0 +1,340 @@
+"""Sync service for mirroring a local directory to an S3 prefix."""
+
+import logging
+import os
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from ..core.coalesce import (
+    DELETE,
+    DELETE_TREE,
+    MOVE,
+    UPLOAD,
+    Change,
+    ChangeCoalescer,
+)
+from ..core.packing import PACK_DIR
+from ..core.scanner import scan_tree
+from ..models import ObjectEntry, S3StorageClass, UploadRequest
+from .hash_service import HashCache
+from .s3_service import S3Service
+
+logger = logging.getLogger(__name__)
+
+# Called with each applied change, whether it succeeded, and an error message
+ResultCallback = Callable[[Change, bool, str], None]
+
+
+class _WatchHandler:
+    """Feed watchdog file and directory events into a ChangeCoalescer.
+
+    Observer only needs a ``dispatch`` method, so watchdog's handler base
+    class is not required.
+    """
+
+    def __init__(self, coalescer: ChangeCoalescer, root: Path):
+        self.coalescer = coalescer
+        self.root = root
+
+    def dispatch(self, event) -> None:
+        path = Path(os.fsdecode(event.src_path))
+        if event.is_directory:
+            self._dispatch_directory(event, path)
+            return
+
+        if event.event_type in ("created", "modified", "closed"):
+            self.coalescer.modified(path)
+        elif event.event_type == "deleted":
+            self.coalescer.deleted(path)
+        elif event.event_type == "moved":
+            dest = Path(os.fsdecode(event.dest_path))
+            if dest.is_relative_to(self.root):
+                self.coalescer.moved(path, dest)
+            else:
+                self.coalescer.deleted(path)
+
+    def _dispatch_directory(self, event, path: Path) -> None:
+        # A new directory is followed by events for the files put in it, but
+        # one deleted or moved as a whole may not get an event per file
+        if event.event_type == "deleted":
+            self.coalescer.deleted_tree(path)
+        elif event.event_type == "moved":
+            dest = Path(os.fsdecode(event.dest_path))
+            if not dest.is_relative_to(self.root):
+                self.coalescer.deleted_tree(path)
+                return
+            for dirpath, _, filenames in os.walk(dest):
+                for name in filenames:
+                    moved_to = Path(dirpath) / name
+                    self.coalescer.moved(path / moved_to.relative_to(dest), moved_to)
+
+
+class SyncService:
+    """Service mirroring a local directory tree to an S3 prefix."""
+
+    def __init__(
+        self,
+        s3_service: S3Service,
+        local_root: Path,
+        s3_prefix: str = "",
+        storage_class: S3StorageClass | None = None,
+        hash_cache: HashCache | None = None,
+        max_workers: int = 8,
+    ):
+        """Initialize sync service.
+
+        Args:
+            s3_service: Service used for all S3 requests
+            local_root: Local directory to mirror
+            s3_prefix: Prefix the directory is mirrored under
+            storage_class: Storage class for uploads
+            hash_cache: Local file hash cache, defaults to the one in the
+                user's home
+            max_workers: Maximum changes applied concurrently
+        """
+        self.s3_service = s3_service
+        self.local_root = local_root.absolute()
+        self.s3_root = s3_prefix.strip("/") + "/" if s3_prefix.strip("/") else ""
+        self.storage_class = storage_class
+        self.hash_cache = hash_cache or HashCache()
+        self.max_workers = max_workers
+
+    def key_for(self, path: Path) -> str:
+        """Map a local path to its S3 key."""
+        return self.s3_root + path.relative_to(self.local_root).as_posix()
+
+    def plan(
+        self, delete: bool = False, remote_objects: Iterable[ObjectEntry] | None = None
+    ) -> list[Change]:
+        """Compare the local tree with the remote prefix.
+
+        A file is uploaded when its key is missing remotely or its size or
+        ETag differs. ETags are computed through the hash cache with the
+        uploader's part size, so unchanged files are not re-read.
+
+        Args:
+            delete: Also remove remote objects with no local file
+            remote_objects: Objects under the prefix to compare against, e.g.
+                from an inventory snapshot; the prefix is listed live if None
+
+        Returns:
+            Changes that bring the remote prefix up to date
+        """
+        if remote_objects is None:
+            remote_objects = self.s3_service.iter_objects(prefix=self.s3_root)
+        remote = {
+            obj.key: obj
+            for obj in remote_objects
+            # Pack internals are managed by upload --pack, not by sync
+            if f"/{PACK_DIR}/" not in f"/{obj.key}"
+        }
+
+        local = sorted(
+            scan_tree(self.local_root, max_workers=self.max_workers),
+            key=lambda f: f.relative,
+        )
+
+        changes = []
+        for file in local:
+            obj = remote.pop(self.s3_root + file.relative, None)
+            if obj is None or obj.size != file.size:
+                changes.append(Change(UPLOAD, file.path))
+                continue
+            try:
+                if self.hash_cache.get(file.path, "etag") != obj.etag:
+                    changes.append(Change(UPLOAD, file.path))
+            except OSError as e:
+                logger.error(f"Failed to hash {file.path}: {e}")
+
+        if delete:
+            changes.extend(
+                Change(DELETE, self.local_root / key[len(self.s3_root) :])
+                for key in sorted(remote)
+            )
+        return changes
+
+    def apply(self, change: Change) -> tuple[bool, str]:
+        """Apply one change to the remote prefix.
+
+        Args:
+            change: Change to apply
+
+        Returns:
+            (success, error message)
+        """
+        key = self.key_for(change.path)
+
+        if change.action == UPLOAD:
+            if not change.path.is_file():
+                # Gone again before its turn; a delete event follows
+                return True, ""
+            result = self.s3_service.upload_file(
+                UploadRequest(
+                    file_path=str(change.path),
+                    s3_key=key,
+                    storage_class=self.storage_class,
+                )
+            )
+            return result.success, result.error_message
+
+        if change.action == DELETE:
+            result = self.s3_service.delete_file(key)
+            return result.success, result.error_message or ""
+
+        if change.action == MOVE:
+            source_key = self.key_for(change.source)
+            result = self.s3_service.move_file(source_key, key, self.storage_class)
+            if result.success:
+                return True, ""
+            # The old copy may never have been uploaded; send the file itself
+            logger.info(f"Server-side move of {source_key} failed, uploading {key}")
+            success, error = self.apply(Change(UPLOAD, change.path))
+            if success:
+                self.s3_service.delete_file(source_key)
+            return success, error
+
+        if change.action == DELETE_TREE:
+            # Keys whose file has been put back since are left alone
+            stale = [
+                obj.key
+                for obj in self.s3_service.iter_objects(prefix=f"{key}/")
+                if f"/{PACK_DIR}/" not in f"/{obj.key}"
+                and not (self.local_root / obj.key[len(self.s3_root) :]).exists()
+            ]
+            results = self.s3_service.delete_objects(stale)
+            errors = [r.error_message for r in results if not r.success]
+            return not errors, errors[0] if errors else ""
+
+        raise ValueError(f"Unknown change action: {change.action}")
+
+    def sync(
+        self,
+        delete: bool = False,
+        on_result: ResultCallback | None = None,
+        remote_objects: Iterable[ObjectEntry] | None = None,
+    ) -> tuple[int, int]:
+        """Bring the remote prefix up to date once.
+
+        Args:
+            delete: Also remove remote objects with no local file
+            on_result: Called after each change is applied
+            remote_objects: Remote side to compare against, see plan()
+
+        Returns:
+            (successful, failed) change counts
+        """
+        coalescer = ChangeCoalescer(debounce=0)
+        for change in self.plan(delete=delete, remote_objects=remote_objects):
+            coalescer.add(change)
+        return self.apply_changes(coalescer, flush=True, on_result=on_result)
+
+    def apply_changes(
+        self,
+        coalescer: ChangeCoalescer,
+        stop: threading.Event | None = None,
+        flush: bool = False,
+        on_result: ResultCallback | None = None,
+        tick: float = 0.1,
+    ) -> tuple[int, int]:
+        """Apply ready changes on a bounded worker pool until stopped.
+
+        Changes to one path are never applied concurrently, and at most
+        twice ``max_workers`` changes are taken out of the coalescer at a
+        time, so bursts of events do not pile up as queued tasks.
+
+        Args:
+            coalescer: Source of changes
+            stop: Keep waiting for new changes until this is set; None to
+                return as soon as the coalescer is empty
+            flush: Apply still-debouncing changes before returning
+            on_result: Called after each change is applied
+            tick: Seconds between checks for ready changes
+
+        Returns:
+            (successful, failed) change counts
+        """
+        counts = [0, 0]
+        in_flight: dict[Future, Change] = {}
+
+        def collect(done) -> None:
+            for future in done:
+                change = in_flight.pop(future)
+                try:
+                    success, error = future.result()
+                except Exception as e:
+                    success, error = False, str(e)
+                counts[0 if success else 1] += 1
+                if on_result:
+                    on_result(change, success, error)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while True:
+                stopping = stop is None or stop.is_set()
+                busy = set()
+                for change in in_flight.values():
+                    busy.add(change.path)
+                    if change.source is not None:
+                        busy.add(change.source)
+
+                room = self.max_workers * 2 - len(in_flight)
+                ready = coalescer.drain(busy, force=stopping and flush, limit=room)
+                for change in ready:
+                    in_flight[executor.submit(self.apply, change)] = change
+
+                if stopping and not in_flight and (not flush or not len(coalescer)):
+                    break
+
+                if in_flight:
+                    done, _ = wait(in_flight, timeout=tick, return_when=FIRST_COMPLETED)
+                    collect(done)
+                elif stop is not None and not stopping:
+                    stop.wait(tick)
+
+        return counts[0], counts[1]
+
+    def watch(
+        self,
+        stop: threading.Event,
+        debounce: float = 0.5,
+        on_result: ResultCallback | None = None,
+    ) -> tuple[int, int]:
+        """Upload changes as they happen until stopped.
+
+        Requires the optional ``watchdog`` package (inotify on Linux).
+
+        Args:
+            stop: Set to end the watch; pending changes are flushed first
+            debounce: Seconds a file must be quiet before it is synced
+            on_result: Called after each change is applied
+
+        Returns:
+            (successful, failed) change counts
+
+        Raises:
+            ValueError: If watchdog is not installed
+        """
+        try:
+            from watchdog.observers import Observer
+        except ImportError as e:
+            raise ValueError(
+                "Watching requires watchdog: "
+                "pip install 'cloud-storage-syncer[watch]'"
+            ) from e
+
+        coalescer = ChangeCoalescer(debounce=debounce)
+        observer = Observer()
+        observer.schedule(
+            _WatchHandler(coalescer, self.local_root),
+            str(self.local_root),
+            recursive=True,
+        )
+        observer.start()
+        try:
+            return self.apply_changes(
+                coalescer, stop=stop, flush=True, on_result=on_result
+            )
+        finally:
+            observer.stop()
+            observer.join()
@@ -0,0 +1,117 @@
+"""Recently measured transfer throughput, kept between runs."""
+
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from ..models import TransferPlan
+
+logger = logging.getLogger(__name__)
+
+# Runs kept per operation; older ones stop counting towards the rates
+MAX_SAMPLES = 20
+
+
+class ThroughputHistory:
+    """Throughput of the last runs of each operation, used to estimate time.
+
+    Each run is one (objects, bytes, seconds) sample. The rates are totals
+    over the kept samples, so long runs weigh more than short ones.
+    """
+
+    def __init__(self, path: Path | None = None):
+        """Initialize the history.
+
+        Args:
+            path: JSON file, defaults to ~/.cloud_storage_syncer/throughput.json
+        """
+        if path is None:
+            path = Path.home() / ".cloud_storage_syncer" / "throughput.json"
+        self.path = path
+
+    def _load(self) -> dict[str, list[list[float]]]:
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def record(
+        self, operation: str, objects: int, total_bytes: int, seconds: float
+    ) -> None:
+        """Add a finished run; failures to save are only logged.
+
+        Args:
+            operation: "upload", "download" or "delete"
+            objects: Objects transferred or deleted
+            total_bytes: Bytes transferred
+            seconds: Wall-clock duration of the run
+        """
+        if objects <= 0 or seconds <= 0:
+            return
+
+        data = self._load()
+        samples = data.get(operation, []) + [[objects, total_bytes, seconds]]
+        data[operation] = samples[-MAX_SAMPLES:]
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".tmp-")
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            # Atomic, so a concurrent run never reads a half-written file
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to save throughput history: {e}")
+
+    def rates(self, operation: str) -> tuple[float, float] | None:
+        """Get the measured rates of an operation.
+
+        Returns:
+            (objects per second, bytes per second), or None before any run
+        """
+        try:
+            samples = [
+                (float(o), float(b), float(s))
+                for o, b, s in self._load().get(operation, [])
+                if s > 0
+            ]
+        except (TypeError, ValueError):
+            return None
+        if not samples:
+            return None
+        seconds = sum(s for _, _, s in samples)
+        return (
+            sum(o for o, _, _ in samples) / seconds,
+            sum(b for _, b, _ in samples) / seconds,
+        )
+
+    def estimate(
+        self, plan: TransferPlan, max_bandwidth: int | None = None
+    ) -> float | None:
+        """Estimate how long a plan would take to run.
+
+        Whichever is slower at the measured rates, the per-object requests
+        or the bytes, bounds the run.
+
+        Args:
+            plan: Planned transfer
+            max_bandwidth: Byte rate limit the run would use, if any
+
+        Returns:
+            Seconds, or None if the operation was never measured
+        """
+        rates = self.rates(plan.operation)
+        if rates is None:
+            return None
+        objects_rate, bytes_rate = rates
+
+        seconds = plan.objects / objects_rate if objects_rate else 0.0
+        if plan.total_bytes and bytes_rate:
+            seconds = max(seconds, plan.total_bytes / bytes_rate)
+        if plan.total_bytes and max_bandwidth:
+            seconds = max(seconds, plan.total_bytes / max_bandwidth)
+        return seconds
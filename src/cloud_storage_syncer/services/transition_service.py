@@ -0,0 +1,123 @@
+"""Transition service for changing the storage class of objects in place."""
+
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from ..models import CopyResult, ObjectEntry, S3StorageClass, TransitionPlan
+from .s3_service import S3Service
+
+logger = logging.getLogger(__name__)
+
+SECONDS_PER_DAY = 24 * 3600
+
+
+class TransitionService:
+    """Service moving objects under a prefix to another storage class.
+
+    Each object is copied onto itself with the new class, so no bytes pass
+    through this machine; objects over 5 GiB become multipart copies.
+    """
+
+    def __init__(self, s3_service: S3Service, max_workers: int = 16):
+        """Initialize transition service.
+
+        Args:
+            s3_service: Service used for all S3 requests
+            max_workers: Maximum copies in flight
+        """
+        self.s3_service = s3_service
+        self.max_workers = max_workers
+
+    def plan(
+        self,
+        s3_prefix: str,
+        storage_class: S3StorageClass,
+        min_size: int | None = None,
+        max_size: int | None = None,
+        older_than_days: float | None = None,
+    ) -> TransitionPlan:
+        """Select the objects under a prefix that would change class.
+
+        Args:
+            s3_prefix: Prefix to transition (acts as directory, "" for all)
+            storage_class: Target storage class
+            min_size: Skip objects smaller than this many bytes
+            max_size: Skip objects larger than this many bytes
+            older_than_days: Skip objects modified more recently
+
+        Returns:
+            Plan listing the objects to copy
+
+        Raises:
+            ClientError: If listing the prefix fails
+        """
+        prefix = s3_prefix.strip("/") + "/" if s3_prefix.strip("/") else ""
+        cutoff = None
+        if older_than_days is not None:
+            cutoff = time.time() - older_than_days * SECONDS_PER_DAY
+
+        plan = TransitionPlan(storage_class=storage_class.value)
+        for obj in self.s3_service.iter_objects(prefix=prefix, restore_status=True):
+            if min_size is not None and obj.size < min_size:
+                continue
+            if max_size is not None and obj.size > max_size:
+                continue
+            if cutoff is not None and obj.mtime > cutoff:
+                continue
+            if obj.storage_class == storage_class.value:
+                plan.unchanged += 1
+            elif obj.needs_restore:
+                plan.archived.append(obj.key)
+            else:
+                plan.objects.append(obj)
+        return plan
+
+    def apply(
+        self,
+        plan: TransitionPlan,
+        on_result: Callable[[CopyResult], None] | None = None,
+    ) -> list[CopyResult]:
+        """Copy every planned object onto itself with the new class.
+
+        Args:
+            plan: Plan from plan()
+            on_result: Called as each copy finishes
+
+        Returns:
+            Copy results in key order
+        """
+        storage_class = S3StorageClass(plan.storage_class)
+        results = []
+
+        def transition(obj: ObjectEntry) -> CopyResult:
+            result = self.s3_service.copy_object(
+                obj.key,
+                obj.key,
+                storage_class,
+                source_info={"size": obj.size, "storage_class": obj.storage_class},
+            )
+            if not result.success:
+                return CopyResult.error_result(obj.key, obj.key, result.error_message)
+            return CopyResult.success_result(obj.key, obj.key)
+
+        def collect(done) -> None:
+            for future in done:
+                result = future.result()
+                results.append(result)
+                if on_result:
+                    on_result(result)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = set()
+            for obj in plan.objects:
+                # Bound the queue so huge plans are not all submitted at once
+                if len(pending) >= self.max_workers * 4:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                pending.add(executor.submit(transition, obj))
+            collect(pending)
+
+        results.sort(key=lambda result: result.source_key)
+        return results
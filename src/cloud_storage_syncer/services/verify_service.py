@@ -0,0 +1,193 @@
+"""Verify service for comparing a local directory with an S3 prefix."""
+
+import logging
+import math
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from ..core.compression import ENCODINGS, UNCOMPRESSED_SIZE_METADATA
+from ..core.hashing import MULTIPART_THRESHOLD, WHOLE_OBJECT, effective_part_size
+from ..core.packing import PACK_DIR
+from ..core.scanner import LocalFile, scan_tree
+from ..models import VerifyResult
+from .hash_service import HashCache
+from .s3_service import S3Service
+
+logger = logging.getLogger(__name__)
+
+# S3 checksum algorithms that can be recomputed locally, preferred first,
+# with the matching HashCache algorithm
+VERIFIABLE_CHECKSUMS = {"SHA256": "s3-sha256", "CRC32": "s3-crc32"}
+
+MATCHED = "matched"
+MISMATCHED = "mismatched"
+MISSING = "missing"
+UNVERIFIED = "unverified"
+
+
+class VerifyService:
+    """Service checking that objects hold the same bytes as local files.
+
+    Objects are compared through GetObjectAttributes, so no object body is
+    downloaded. Local checksums go through the hash cache, so a repeated
+    verify of an unchanged tree does not re-read the files.
+    """
+
+    def __init__(
+        self,
+        s3_service: S3Service,
+        hash_cache: HashCache | None = None,
+        max_workers: int = 16,
+    ):
+        """Initialize verify service.
+
+        Args:
+            s3_service: Service used for all S3 requests
+            hash_cache: Local file hash cache, defaults to the one in the
+                user's home
+            max_workers: Maximum objects checked concurrently
+        """
+        self.s3_service = s3_service
+        self.hash_cache = hash_cache or HashCache()
+        self.max_workers = max_workers
+
+    def verify(
+        self,
+        local_root: Path,
+        s3_prefix: str = "",
+        include: Iterable[str] = (),
+        exclude: Iterable[str] = (),
+    ) -> VerifyResult:
+        """Compare a local directory with the objects under a prefix.
+
+        Args:
+            local_root: Local directory
+            s3_prefix: Prefix the directory was uploaded under
+            include: Only compare files matching these globs (see scan_tree)
+            exclude: Skip files matching these globs (see scan_tree)
+
+        Returns:
+            Matched, mismatched, missing, extra and unverified keys
+
+        Raises:
+            ClientError: If listing the prefix fails
+        """
+        s3_root = s3_prefix.strip("/") + "/" if s3_prefix.strip("/") else ""
+        remote = {
+            obj.key: obj
+            for obj in self.s3_service.iter_objects(prefix=s3_root)
+            # Pack internals are managed by upload --pack
+            if f"/{PACK_DIR}/" not in f"/{obj.key}"
+        }
+        result = VerifyResult()
+
+        def record(key: str, status: str, reason: str = "") -> None:
+            if status == MATCHED:
+                result.matched.append(key)
+            elif status == MISSING:
+                result.missing.append(key)
+            elif status == MISMATCHED:
+                result.mismatched.append((key, reason))
+            else:
+                result.unverified.append((key, reason))
+
+        def collect(done) -> None:
+            for future in done:
+                record(*future.result())
+
+        files = scan_tree(
+            local_root,
+            include=include,
+            exclude=exclude,
+            max_workers=min(self.max_workers, 8),
+        )
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = set()
+            for file in files:
+                key = s3_root + file.relative
+                obj = remote.pop(key, None)
+                if obj is None:
+                    record(key, MISSING)
+                    continue
+                if obj.size > file.size:
+                    # Settled by the listing, no request needed; smaller
+                    # objects may be stored compressed
+                    record(
+                        key, MISMATCHED, f"size {obj.size} != local {file.size}"
+                    )
+                    continue
+                # Bound the queue so huge trees are not buffered in memory
+                if len(pending) >= self.max_workers * 4:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                pending.add(executor.submit(self._check, file, key))
+            collect(pending)
+
+        result.extra = sorted(remote)
+        for keys in (result.matched, result.missing, result.mismatched):
+            keys.sort()
+        result.unverified.sort()
+        return result
+
+    def _check(self, file: LocalFile, key: str) -> tuple[str, str, str]:
+        """Compare one file with its object.
+
+        Returns:
+            (key, status, reason)
+        """
+        try:
+            attributes = self.s3_service.get_object_attributes(key)
+            if attributes is None:
+                return key, MISSING, ""
+            if attributes["size"] != file.size:
+                return self._check_compressed(file, key, attributes["size"])
+
+            checksums = attributes["checksums"]
+            name = next((n for n in VERIFIABLE_CHECKSUMS if checksums.get(n)), None)
+            if name:
+                algorithm, remote = VERIFIABLE_CHECKSUMS[name], checksums[name]
+            else:
+                name, algorithm, remote = "ETag", "etag", attributes["etag"]
+
+            value, _, suffix = remote.strip('"').partition("-")
+            composite = bool(suffix) or attributes["checksum_type"] == "COMPOSITE"
+            if not composite:
+                part_size = WHOLE_OBJECT
+            else:
+                part_size = attributes["part_size"] or effective_part_size(file.size)
+                parts = int(suffix) if suffix else attributes["parts"]
+                if parts and math.ceil(file.size / part_size) != parts:
+                    return key, UNVERIFIED, f"unknown part size for {parts} parts"
+
+            if algorithm == "etag" and not composite:
+                # A single-part ETag is the MD5 of the body
+                algorithm = "md5"
+            elif algorithm == "etag" and file.size < MULTIPART_THRESHOLD:
+                # Local multipart ETags are only computed above the threshold
+                return key, UNVERIFIED, "no checksum stored"
+
+            local = self.hash_cache.get(file.path, algorithm, part_size)
+            if local.strip('"').partition("-")[0] != value:
+                return key, MISMATCHED, f"{name} differs"
+            return key, MATCHED, ""
+
+        except Exception as e:
+            logger.error(f"Failed to verify {key}: {e}")
+            return key, UNVERIFIED, str(e)
+
+    def _check_compressed(
+        self, file: LocalFile, key: str, size: int
+    ) -> tuple[str, str, str]:
+        """Classify an object whose size differs from the local file.
+
+        Objects uploaded with compression keep the original size in their
+        metadata. Their checksums cover the compressed bytes, so they can
+        only be verified by downloading them.
+        """
+        info = self.s3_service.get_object_info(key) or {}
+        encoding = info.get("content_encoding")
+        original = info.get("metadata", {}).get(UNCOMPRESSED_SIZE_METADATA)
+        if encoding in ENCODINGS and original == str(file.size):
+            return key, UNVERIFIED, f"stored {encoding}-compressed"
+        return key, MISMATCHED, f"size {size} != local {file.size}"
@@ -19,6 +19,9 @@ class ApiErrorCode:
     DELETE_FAILED = "FILE_004"
     LIST_FAILED = "FILE_005"
     SEARCH_FAILED = "FILE_006"
+    BATCH_FAILED = "FILE_007"
+    COPY_FAILED = "FILE_008"
+    PREVIEW_UNAVAILABLE = "FILE_009"
 
     # S3 service errors
     S3_CONNECTION_ERROR = "S3_001"
@@ -86,3 +89,46 @@ class FileDeleteResponse(BaseModel):
 
     s3_key: str
     deleted: bool
+
+
+class FileCopyRequest(BaseModel):
+    """Request model for copying or moving a file or directory."""
+
+    source_key: str
+    dest_key: str
+    storage_class: str | None = None  # Keep the source's class if omitted
+
+
+class TransitionRequest(BaseModel):
+    """Request model for changing the storage class of a prefix."""
+
+    prefix: str
+    storage_class: str
+    min_size: int | None = None  # Bytes
+    max_size: int | None = None  # Bytes
+    older_than_days: float | None = None
+    dry_run: bool = False
+
+
+class PresignUploadRequest(BaseModel):
+    """Request model for starting a presigned multipart upload."""
+
+    s3_key: str
+    size: int
+    storage_class: str = "STANDARD"
+    expires_in: int = 3600
+
+
+class PresignedPart(BaseModel):
+    """Part of a presigned upload, with the ETag S3 returned for it."""
+
+    part_number: int
+    etag: str
+
+
+class PresignCompleteRequest(BaseModel):
+    """Request model for completing or aborting a presigned upload."""
+
+    s3_key: str
+    upload_id: str
+    parts: list[PresignedPart] = []  # Not needed to abort
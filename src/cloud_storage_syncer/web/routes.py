@@ -1,37 +1,110 @@
 """File operations API routes."""
 # ruff: noqa: B008
 
-import io
+import functools
+import json
 import os
+from dataclasses import asdict
 from pathlib import Path
 from urllib.parse import quote
 
 from fastapi import APIRouter, File, Form, HTTPException, Query, Request, UploadFile
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 
-from ..models.download import DownloadRequest
+from ..core.bandwidth import BandwidthLimiter, parse_size
+from ..models.key_kind import KeyKind
 from ..models.storage import S3StorageClass
 from ..models.upload import UploadRequest
+from ..services.batch_service import BatchService
+from ..services.caching_s3_service import DEFAULT_CACHE_TTL
 from ..services.config_service import ConfigService
+from ..services.disk_cache import DiskLRUCache, default_cache_dir
+from ..services.download_cache import DownloadCache
+from ..services.preview_service import PreviewService
 from ..services.s3_service import S3Service
+from ..services.service_pool import S3ServicePool
+from ..services.shared_cache import open_shared_cache
+from ..services.transition_service import TransitionService
 from ..web.auth import require_auth
 from ..web.models import (
     ApiErrorCode,
     ApiResponse,
+    FileCopyRequest,
     FileDeleteResponse,
     FileListResponse,
     FileUploadResponse,
+    PresignCompleteRequest,
+    PresignUploadRequest,
+    TransitionRequest,
 )
 
 router = APIRouter(prefix="/files", tags=["files"])
 
+# Per-process transfer budget shared by every request, e.g. MAX_BANDWIDTH=50M
+_max_bandwidth = os.getenv("MAX_BANDWIDTH")
+bandwidth_limiter = BandwidthLimiter(parse_size(_max_bandwidth)) if _max_bandwidth else None
+
+# Listings and HEAD results shared by every worker process, e.g.
+# SHARED_CACHE_URL=sqlite:///var/cache/css/shared.db or redis://localhost:6379/0
+_shared_cache_url = os.getenv("SHARED_CACHE_URL")
+shared_cache = open_shared_cache(_shared_cache_url) if _shared_cache_url else None
+
+# One warm client per profile; requests pick a profile with this header
+PROFILE_HEADER = "X-Profile"
+service_pool = S3ServicePool(
+    bandwidth_limiter,
+    cache=shared_cache,
+    cache_ttl=float(os.getenv("SHARED_CACHE_TTL", DEFAULT_CACHE_TTL)),
+)
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+@functools.cache
+def get_preview_cache() -> DiskLRUCache:
+    """Get the process-wide preview cache.
+
+    Located by PREVIEW_CACHE_DIR and bounded by PREVIEW_CACHE_SIZE (e.g. 2G).
+    """
+    cache_dir = os.getenv("PREVIEW_CACHE_DIR")
+    return DiskLRUCache(
+        Path(cache_dir) if cache_dir else default_cache_dir("previews"),
+        parse_size(os.getenv("PREVIEW_CACHE_SIZE", "1G")),
+    )
+
 
-def get_s3_service() -> S3Service:
-    """Get configured S3 service instance."""
+@functools.cache
+def get_download_cache() -> DownloadCache:
+    """Get the process-wide download cache.
+
+    Located by DOWNLOAD_CACHE_DIR and bounded by DOWNLOAD_CACHE_SIZE (e.g. 20G).
+    """
+    cache_dir = os.getenv("DOWNLOAD_CACHE_DIR")
+    return DownloadCache(
+        DiskLRUCache(
+            Path(cache_dir) if cache_dir else default_cache_dir("downloads"),
+            parse_size(os.getenv("DOWNLOAD_CACHE_SIZE", "5G")),
+        )
+    )
+
+
+def get_s3_service(request: Request, max_pool_connections: int = 10) -> S3Service:
+    """Get the warm S3 service for the request's profile (X-Profile header)."""
     config_path = os.getenv("CONFIG_PATH")
-    config_service = ConfigService(Path(config_path) if config_path else None)
-    config = config_service.load_config()
+    profile = request.headers.get(PROFILE_HEADER)
+    config_service = ConfigService(Path(config_path) if config_path else None, profile)
+
+    if profile and not config_service.config_exists():
+        raise HTTPException(
+            status_code=400,
+            detail=ApiResponse.error_response(
+                error=f"Unknown profile: {profile}",
+                error_code=ApiErrorCode.INVALID_REQUEST,
+                message="Profile not found",
+            ).dict(),
+        )
 
+    config = config_service.load_config()
     if not config or not config.is_valid():
         raise HTTPException(
             status_code=500,
@@ -42,7 +115,7 @@ def get_s3_service() -> S3Service:
             ).dict(),
         )
 
-    return S3Service(config)
+    return service_pool.get(config_service.profile, config, max_pool_connections)
 
 
 @router.get("/list")
@@ -55,11 +128,15 @@ async def list_files(
     require_auth(request)
 
     try:
-        s3_service = get_s3_service()
+        s3_service = get_s3_service(request)
         objects = s3_service.list_objects(prefix=prefix, max_keys=max_keys)
 
         return ApiResponse.success_response(
-            data=FileListResponse(files=objects, total_count=len(objects), prefix=prefix).dict(),
+            data=FileListResponse(
+                files=[obj.to_dict() for obj in objects],
+                total_count=len(objects),
+                prefix=prefix,
+            ).dict(),
             message=f"Found {len(objects)} files",
         )
 
@@ -85,7 +162,7 @@ async def upload_file(
         import os
         import tempfile
 
-        s3_service = get_s3_service()
+        s3_service = get_s3_service(request)
 
         # Use filename if s3_key not provided
         if not s3_key:
@@ -140,95 +217,283 @@ async def upload_file(
 
 
 @router.get("/download/{s3_key:path}")
-async def download_file(request: Request, s3_key: str):
-    """Download file from S3 bucket."""
+def download_file(request: Request, s3_key: str):
+    """Download file from S3 bucket, served through the local download cache."""
+    # Plain def: the HEAD and any cache fill run in the threadpool
     require_auth(request)
 
     try:
-        s3_service = get_s3_service()
-
-        # Create a unique temporary file to download to
-        import os
-        import tempfile
-        import uuid
-
-        # Use with statement to ensure proper cleanup
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create unique filename to avoid conflicts
-            unique_filename = f"download_{uuid.uuid4().hex}_{s3_key.replace('/', '_')}"
-            temp_path = os.path.join(temp_dir, unique_filename)
-
-            # Create download request with temporary file path
-            download_request = DownloadRequest(s3_key=s3_key, output_path=temp_path)
+        f, info = get_download_cache().open(get_s3_service(request), s3_key)
+    except HTTPException:
+        raise
+    except FileNotFoundError as e:
+        raise HTTPException(
+            status_code=404,
+            detail=ApiResponse.error_response(
+                error=str(e),
+                error_code=ApiErrorCode.FILE_NOT_FOUND,
+                message="File not found or download failed",
+            ).dict(),
+        ) from e
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=ApiResponse.error_response(
+                error=str(e),
+                error_code=ApiErrorCode.DOWNLOAD_FAILED,
+                message="Failed to download file",
+            ).dict(),
+        ) from e
 
-            # Download file to temporary location
-            result = s3_service.download_file(download_request)
+    def stream_file():
+        with f:
+            while chunk := f.read(DOWNLOAD_CHUNK_SIZE):
+                yield chunk
+
+    # Handle filename encoding for non-ASCII characters
+    filename = s3_key.split("/")[-1]
+    encoded_filename = quote(filename)
+
+    return StreamingResponse(
+        stream_file(),
+        media_type="application/octet-stream",
+        headers={
+            "Content-Disposition": f"attachment; filename*=UTF-8''{encoded_filename}",
+            # The cached file is decompressed, so its size can differ from S3's
+            "Content-Length": str(os.fstat(f.fileno()).st_size),
+            "ETag": info["etag"],
+        },
+    )
+
+
+@router.get("/preview/{s3_key:path}")
+def preview_file(
+    request: Request,
+    s3_key: str,
+    size: int = Query(256, ge=16, le=2048, description="Thumbnail size in pixels"),
+    lines: int = Query(50, ge=1, le=1000, description="Text lines or table rows"),
+):
+    """Get an image thumbnail or the head of a text/CSV file."""
+    # Plain def: fetching and resizing run in the threadpool, so a gallery
+    # of previews does not block the event loop
+    require_auth(request)
 
-            if result.success:
-                # Read the downloaded file content
-                with open(temp_path, "rb") as f:
-                    file_content = f.read()
-
-                # Handle filename encoding for non-ASCII characters
-                filename = s3_key.split("/")[-1]
-                encoded_filename = quote(filename)
-
-                # Create streaming response
-                return StreamingResponse(
-                    io.BytesIO(file_content),
-                    media_type="application/octet-stream",
-                    headers={"Content-Disposition": f"attachment; filename*=UTF-8''{encoded_filename}"},
-                )
-            else:
-                raise HTTPException(
-                    status_code=404,
-                    detail=ApiResponse.error_response(
-                        error=result.error_message or "File not found",
-                        error_code=ApiErrorCode.FILE_NOT_FOUND,
-                        message="File not found or download failed",
-                    ).dict(),
-                )
+    try:
+        preview_service = PreviewService(
+            get_s3_service(request), get_preview_cache()
+        )
+        content, media_type = preview_service.get_preview(
+            s3_key, size=size, lines=lines
+        )
+        return Response(content=content, media_type=media_type)
 
     except HTTPException:
         raise
+    except FileNotFoundError as e:
+        raise HTTPException(
+            status_code=404,
+            detail=ApiResponse.error_response(
+                error=str(e),
+                error_code=ApiErrorCode.FILE_NOT_FOUND,
+                message="File not found",
+            ).dict(),
+        ) from e
+    except ValueError as e:
+        raise HTTPException(
+            status_code=415,
+            detail=ApiResponse.error_response(
+                error=str(e),
+                error_code=ApiErrorCode.PREVIEW_UNAVAILABLE,
+                message="No preview available for this file",
+            ).dict(),
+        ) from e
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=ApiResponse.error_response(
                 error=str(e),
                 error_code=ApiErrorCode.DOWNLOAD_FAILED,
-                message="Failed to download file",
+                message="Failed to generate preview",
             ).dict(),
         ) from e
 
 
+@router.get("/presign/download/{s3_key:path}")
+def presign_download(
+    request: Request,
+    s3_key: str,
+    expires_in: int = Query(3600, description="Seconds the URL stays valid"),
+):
+    """Get a URL the client downloads the file from directly, bypassing the API."""
+    require_auth(request)
+
+    try:
+        s3_service = get_s3_service(request)
+        info = s3_service.get_object_info(s3_key)
+        if info is None:
+            return ApiResponse.error_response(
+                error=f"File not found in S3: {s3_key}",
+                error_code=ApiErrorCode.FILE_NOT_FOUND,
+                message="File not found",
+            )
+        url = s3_service.presign_download(s3_key, expires_in)
+
+    except ValueError as e:
+        return ApiResponse.error_response(
+            error=str(e),
+            error_code=ApiErrorCode.VALIDATION_ERROR,
+            message="Invalid presign request",
+        )
+    except Exception as e:
+        return ApiResponse.error_response(
+            error=str(e),
+            error_code=ApiErrorCode.DOWNLOAD_FAILED,
+            message="Failed to presign download",
+        )
+
+    return ApiResponse.success_response(
+        data={
+            "s3_key": s3_key,
+            "url": url,
+            "size": info["size"],
+            "etag": info["etag"],
+            "expires_in": expires_in,
+        },
+        message="Download URL created",
+    )
+
+
+@router.post("/presign/upload")
+def presign_upload(request: Request, body: PresignUploadRequest):
+    """Start an upload whose parts the client PUTs directly to S3."""
+    require_auth(request)
+
+    try:
+        if not body.s3_key.strip():
+            raise ValueError("S3 key cannot be empty")
+        upload = get_s3_service(request).presign_upload(
+            body.s3_key,
+            body.size,
+            S3StorageClass(body.storage_class),
+            body.expires_in,
+        )
+
+    except ValueError as e:
+        return ApiResponse.error_response(
+            error=str(e),
+            error_code=ApiErrorCode.VALIDATION_ERROR,
+            message="Invalid presign request",
+        )
+    except Exception as e:
+        return ApiResponse.error_response(
+            error=str(e),
+            error_code=ApiErrorCode.UPLOAD_FAILED,
+            message="Failed to start upload",
+        )
+
+    return ApiResponse.success_response(
+        data={"s3_key": body.s3_key, "expires_in": body.expires_in, **upload},
+        message=f"Upload started with {len(upload['parts'])} parts",
+    )
+
+
+@router.post("/presign/upload/complete")
+def complete_presigned_upload(request: Request, body: PresignCompleteRequest):
+    """Finish a presigned upload once every part has been PUT."""
+    require_auth(request)
+
+    if not body.parts:
+        return ApiResponse.error_response(
+            error="No parts given",
+            error_code=ApiErrorCode.VALIDATION_ERROR,
+            message="Invalid complete request",
+        )
+
+    try:
+        result = get_s3_service(request).complete_presigned_upload(
+            body.s3_key,
+            body.upload_id,
+            {part.part_number: part.etag for part in body.parts},
+        )
+    except Exception as e:
+        return ApiResponse.error_response(
+            error=str(e),
+            error_code=ApiErrorCode.UPLOAD_FAILED,
+            message="Failed to complete upload",
+        )
+
+    if not result.success:
+        return ApiResponse.error_response(
+            error=result.error_message,
+            error_code=ApiErrorCode.UPLOAD_FAILED,
+            message="Failed to complete upload",
+        )
+    return ApiResponse.success_response(
+        data={"s3_key": body.s3_key, "s3_url": result.s3_url},
+        message="File uploaded successfully",
+    )
+
+
+@router.post("/presign/upload/abort")
+def abort_presigned_upload(request: Request, body: PresignCompleteRequest):
+    """Abort a presigned upload, discarding the parts already PUT."""
+    require_auth(request)
+
+    try:
+        s3_service = get_s3_service(request)
+        if not s3_service.abort_presigned_upload(body.s3_key, body.upload_id):
+            raise RuntimeError(f"Failed to abort upload {body.upload_id}")
+    except Exception as e:
+        return ApiResponse.error_response(
+            error=str(e),
+            error_code=ApiErrorCode.UPLOAD_FAILED,
+            message="Failed to abort upload",
+        )
+    return ApiResponse.success_response(
+        data={"s3_key": body.s3_key, "upload_id": body.upload_id},
+        message="Upload aborted",
+    )
+
+
 @router.get("/search")
 async def search_files(
     request: Request,
     pattern: str = Query(..., description="Search pattern"),
     prefix: str = Query("", description="Prefix to limit search scope"),
+    mode: str = Query("auto", description="auto, substring, glob or regex"),
+    ignore_case: bool = Query(False, description="Case-insensitive glob/regex matching"),
+    max_results: int = Query(1000, ge=1, description="Maximum number of matches to return"),
 ):
     """Search files in S3 bucket."""
     require_auth(request)
 
     try:
-        s3_service = get_s3_service()
-
-        # Get all objects with prefix
-        all_objects = s3_service.list_objects(prefix=prefix, max_keys=1000)
-
-        # Filter by pattern (simple substring search)
-        matching_files = [obj for obj in all_objects if pattern.lower() in obj.get("key", "").lower()]
+        s3_service = get_s3_service(request)
+
+        # Lists only the subtree the pattern's literal prefix allows
+        matching_files = s3_service.search_objects(
+            pattern,
+            mode=mode,
+            ignore_case=ignore_case,
+            prefix=prefix,
+            max_results=max_results,
+        )
 
         return ApiResponse.success_response(
             data={
-                "files": matching_files,
+                "files": [obj.to_dict() for obj in matching_files],
                 "total_count": len(matching_files),
                 "prefix": prefix,
             },
             message=f"Found {len(matching_files)} matching files",
         )
 
+    except ValueError as e:
+        return ApiResponse.error_response(
+            error=str(e),
+            error_code=ApiErrorCode.VALIDATION_ERROR,
+            message="Invalid search pattern",
+        )
     except Exception as e:
         return ApiResponse.error_response(
             error=str(e),
@@ -257,7 +522,7 @@ async def delete_file(
         )
 
     try:
-        s3_service = get_s3_service()
+        s3_service = get_s3_service(request)
 
         # Delete file
         result = s3_service.delete_file(s3_key)
@@ -303,7 +568,7 @@ async def delete_directory(
         )
 
     try:
-        s3_service = get_s3_service()
+        s3_service = get_s3_service(request)
 
         # Delete directory recursively
         results = s3_service.delete_directory(prefix, force)
@@ -343,3 +608,183 @@ async def delete_directory(
             error_code=ApiErrorCode.DELETE_FAILED,
             message="Failed to delete directory",
         )
+
+
+def _copy_or_move(request: Request, body: FileCopyRequest, move: bool) -> ApiResponse:
+    """Copy or move a file or directory prefix server-side."""
+    verb = "moved" if move else "copied"
+    try:
+        storage_class = S3StorageClass(body.storage_class) if body.storage_class else None
+        if not body.source_key.strip() or not body.dest_key.strip():
+            raise ValueError("Source and destination keys cannot be empty")
+        if move and body.source_key.rstrip("/") == body.dest_key.rstrip("/"):
+            raise ValueError("Source and destination are the same")
+
+        s3_service = get_s3_service(request)
+        kind = s3_service.resolve_key(body.source_key)
+
+        if kind == KeyKind.OBJECT:
+            transfer = s3_service.move_file if move else s3_service.copy_file
+            results = [transfer(body.source_key, body.dest_key, storage_class)]
+        elif kind.is_directory:
+            transfer = s3_service.move_directory if move else s3_service.copy_directory
+            results = transfer(body.source_key, body.dest_key, storage_class)
+        else:
+            return ApiResponse.error_response(
+                error=f"No files found matching: {body.source_key}",
+                error_code=ApiErrorCode.FILE_NOT_FOUND,
+                message=f"Nothing to {'move' if move else 'copy'}",
+            )
+
+    except ValueError as e:
+        return ApiResponse.error_response(
+            error=str(e),
+            error_code=ApiErrorCode.VALIDATION_ERROR,
+            message="Invalid copy request",
+        )
+    except Exception as e:
+        return ApiResponse.error_response(
+            error=str(e),
+            error_code=ApiErrorCode.COPY_FAILED,
+            message=f"Failed to {'move' if move else 'copy'} files",
+        )
+
+    successful = sum(1 for r in results if r.success)
+    failed = [r for r in results if not r.success]
+    data = {
+        "source_key": body.source_key,
+        "dest_key": body.dest_key,
+        f"{verb}_count": successful,
+        "failed_count": len(failed),
+    }
+
+    if not failed:
+        return ApiResponse.success_response(
+            data=data, message=f"{successful} files {verb} successfully"
+        )
+    return ApiResponse(
+        success=False,
+        data={**data, "failed_keys": [r.source_key for r in failed][:10]},
+        message=f"{successful} files {verb}, {len(failed)} failed",
+        error=failed[0].error_message or "",
+        error_code=ApiErrorCode.COPY_FAILED,
+    )
+
+
+@router.post("/copy")
+def copy_files(request: Request, body: FileCopyRequest):
+    """Copy a file or directory within the bucket server-side."""
+    # Plain def: prefix copies make many S3 round trips in the threadpool
+    require_auth(request)
+    return _copy_or_move(request, body, move=False)
+
+
+@router.post("/move")
+def move_files(request: Request, body: FileCopyRequest):
+    """Move (rename) a file or directory within the bucket server-side."""
+    # Plain def: prefix copies make many S3 round trips in the threadpool
+    require_auth(request)
+    return _copy_or_move(request, body, move=True)
+
+
+@router.post("/transition")
+def transition_files(request: Request, body: TransitionRequest):
+    """Change the storage class of every object under a prefix in place."""
+    # Plain def: the listing and copies run in the threadpool
+    require_auth(request)
+
+    try:
+        storage_class = S3StorageClass(body.storage_class)
+        transition_service = TransitionService(
+            get_s3_service(request, max_pool_connections=16)
+        )
+        plan = transition_service.plan(
+            body.prefix,
+            storage_class,
+            body.min_size,
+            body.max_size,
+            body.older_than_days,
+        )
+        results = [] if body.dry_run else transition_service.apply(plan)
+
+    except ValueError as e:
+        return ApiResponse.error_response(
+            error=str(e),
+            error_code=ApiErrorCode.VALIDATION_ERROR,
+            message="Invalid transition request",
+        )
+    except Exception as e:
+        return ApiResponse.error_response(
+            error=str(e),
+            error_code=ApiErrorCode.COPY_FAILED,
+            message="Failed to transition files",
+        )
+
+    failed = [r for r in results if not r.success]
+    data = {
+        "prefix": body.prefix,
+        "storage_class": plan.storage_class,
+        "dry_run": body.dry_run,
+        "object_count": len(plan.objects),
+        "total_bytes": plan.total_bytes,
+        "unchanged_count": plan.unchanged,
+        "archived_keys": plan.archived[:10],
+        "transitioned_count": len(results) - len(failed),
+        "failed_count": len(failed),
+    }
+
+    if not failed:
+        verb = "would move" if body.dry_run else "moved"
+        return ApiResponse.success_response(
+            data=data,
+            message=f"{len(plan.objects)} files {verb} to {plan.storage_class}",
+        )
+    return ApiResponse(
+        success=False,
+        data={**data, "failed_keys": [r.source_key for r in failed][:10]},
+        message=f"{len(results) - len(failed)} files moved, {len(failed)} failed",
+        error=failed[0].error_message or "",
+        error_code=ApiErrorCode.COPY_FAILED,
+    )
+
+
+@router.post("/batch")
+async def batch_operations(
+    request: Request,
+    max_workers: int = Query(8, ge=1, le=32, description="Concurrent operations"),
+    max_rate: float | None = Query(None, gt=0, description="Maximum operations started per second"),
+):
+    """Run a JSONL manifest of operations and stream one JSON result per line.
+
+    Only server-side operations (delete) are accepted, since upload and
+    download entries would refer to paths on the API host.
+    """
+    require_auth(request)
+
+    try:
+        s3_service = get_s3_service(request, max_pool_connections=max(max_workers, 10))
+        manifest = await request.body()
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=ApiResponse.error_response(
+                error=str(e),
+                error_code=ApiErrorCode.BATCH_FAILED,
+                message="Failed to run batch",
+            ).dict(),
+        ) from e
+
+    batch_service = BatchService(
+        s3_service,
+        max_workers=max_workers,
+        max_rate=max_rate,
+        allowed_operations=("delete",),
+    )
+
+    def stream_results():
+        for result in batch_service.run(manifest.splitlines()):
+            yield json.dumps(asdict(result)) + "\n"
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
@@ -0,0 +1,142 @@
+"""Shared fixtures and S3 stand-ins for the test suite."""
+
+import hashlib
+from contextlib import contextmanager
+from datetime import UTC, datetime
+
+import pytest
+from botocore.stub import Stubber
+
+from cloud_storage_syncer.models import (
+    CopyResult,
+    DeleteResult,
+    ObjectEntry,
+    S3Config,
+    UploadResult,
+)
+from cloud_storage_syncer.services import S3Service
+
+BUCKET = "test-bucket"
+CONFIG = S3Config(
+    access_key="test_key",
+    secret_key="test_secret",
+    bucket=BUCKET,
+    region="us-east-1",
+)
+MODIFIED = datetime(2025, 1, 2, tzinfo=UTC)
+
+
+def etag(data):
+    """ETag S3 gives a single-part upload of data."""
+    return f'"{hashlib.md5(data).hexdigest()}"'
+
+
+@contextmanager
+def stubbed(s3_service):
+    """Stub a service's client; the Stubber is kept as s3_service.stubber."""
+    with Stubber(s3_service.client) as stubber:
+        s3_service.stubber = stubber
+        yield s3_service
+        stubber.assert_no_pending_responses()
+
+
+@pytest.fixture
+def service():
+    """S3Service whose client is stubbed, with no real network access."""
+    with stubbed(S3Service(CONFIG)) as s3_service:
+        yield s3_service
+
+
+def listed(key, size=1, **fields):
+    """Build a ListObjectsV2 content entry, e.g. with StorageClass="GLACIER"."""
+    return {"Key": key, "Size": size, "LastModified": MODIFIED, "ETag": '"e"', **fields}
+
+
+def stub_list(service, prefix, contents, restore_status=False):
+    """Queue a ListObjectsV2 response.
+
+    Args:
+        service: Service from the service fixture or stubbed()
+        prefix: Prefix the listing is expected for
+        contents: Keys, or entries built with listed()
+        restore_status: Whether the listing asks for RestoreStatus, as
+            downloads and restores do
+    """
+    params = {"Bucket": BUCKET, "Prefix": prefix, "MaxKeys": 1000}
+    if restore_status:
+        params["OptionalObjectAttributes"] = ["RestoreStatus"]
+    entries = [listed(c) if isinstance(c, str) else c for c in contents]
+    service.stubber.add_response("list_objects_v2", {"Contents": entries}, params)
+
+
+def stub_head(service, key, found=True, size=1, **fields):
+    """Queue a HEAD response, or a 404 if not found."""
+    if not found:
+        service.stubber.add_client_error("head_object", "404", http_status_code=404)
+        return
+    service.stubber.add_response(
+        "head_object",
+        {"ContentLength": size, "LastModified": MODIFIED, "ETag": '"e"', **fields},
+        {"Bucket": BUCKET, "Key": key},
+    )
+
+
+class MemoryS3Service:
+    """In-memory stand-in for S3Service holding object bodies.
+
+    Every write is logged in calls, e.g. ("upload", key).
+    """
+
+    def __init__(self, objects=None):
+        self.config = CONFIG
+        self.objects = dict(objects or {})  # key -> body
+        self.metadata = {}  # key -> user metadata
+        self.encodings = {}  # key -> Content-Encoding, for compressed objects
+        self.calls = []
+
+    def iter_objects(self, prefix="", max_keys=None, restore_status=False):
+        keys = sorted(key for key in self.objects if key.startswith(prefix))
+        for key in keys[:max_keys]:
+            data = self.objects[key]
+            yield ObjectEntry(key=key, size=len(data), mtime=0, etag=etag(data))
+
+    def get_object_info(self, s3_key):
+        if s3_key not in self.objects:
+            return None
+        return {
+            "size": len(self.objects[s3_key]),
+            "storage_class": "STANDARD",
+            "metadata": dict(self.metadata.get(s3_key, {})),
+            "content_encoding": self.encodings.get(s3_key),
+        }
+
+    def upload_file(self, request):
+        self.calls.append(("upload", request.s3_key))
+        with open(request.file_path, "rb") as f:
+            self.objects[request.s3_key] = f.read()
+        self.metadata[request.s3_key] = dict(request.metadata or {})
+        return UploadResult.success(s3_url=f"s3://{BUCKET}/{request.s3_key}")
+
+    def copy_object(self, source_key, dest_key, storage_class=None, source_info=None):
+        self.calls.append(("copy", source_key, dest_key))
+        self.objects[dest_key] = self.objects[source_key]
+        self.metadata[dest_key] = dict(self.metadata.get(source_key, {}))
+        return UploadResult.success(
+            s3_url=f"s3://{BUCKET}/{dest_key}", copied_from=source_key
+        )
+
+    def delete_file(self, s3_key):
+        self.calls.append(("delete", s3_key))
+        existed = self.objects.pop(s3_key, None) is not None
+        self.metadata.pop(s3_key, None)
+        return DeleteResult.success_result(s3_key, existed)
+
+    def delete_objects(self, s3_keys):
+        return [self.delete_file(s3_key) for s3_key in s3_keys]
+
+    def move_file(self, source_key, dest_key, storage_class=None):
+        self.calls.append(("move", source_key, dest_key))
+        if source_key not in self.objects:
+            return CopyResult.error_result(source_key, dest_key, "not found")
+        self.objects[dest_key] = self.objects.pop(source_key)
+        return CopyResult.success_result(source_key, dest_key)
@@ -0,0 +1,78 @@
+"""Tests for client-side bandwidth limiting."""
+
+import io
+import threading
+import time
+
+import pytest
+
+from cloud_storage_syncer.core.bandwidth import (
+    BandwidthLimiter,
+    ThrottledReader,
+    format_duration,
+    format_size,
+    parse_size,
+)
+
+
+class TestParseSize:
+    """Test parse_size."""
+
+    def test_units(self):
+        """Test plain bytes and binary units."""
+        assert parse_size("100") == 100
+        assert parse_size("512K") == 512 * 1024
+        assert parse_size("10M") == 10 * 1024**2
+        assert parse_size("1.5G") == int(1.5 * 1024**3)
+        assert parse_size("2mib") == 2 * 1024**2
+
+    def test_invalid(self):
+        """Test invalid sizes are rejected."""
+        with pytest.raises(ValueError):
+            parse_size("fast")
+        with pytest.raises(ValueError):
+            parse_size("10X")
+
+    def test_format_size(self):
+        """Test byte counts are shown in the largest fitting unit."""
+        assert format_size(512) == "512 B"
+        assert format_size(1536) == "1.50 KB"
+        assert format_size(3 * 1024**3) == "3.00 GB"
+
+    def test_format_duration(self):
+        """Test durations are shown in hours, minutes and seconds."""
+        assert format_duration(12.4) == "12s"
+        assert format_duration(200) == "3m 20s"
+        assert format_duration(3900) == "1h 05m"
+
+
+class TestBandwidthLimiter:
+    """Test BandwidthLimiter."""
+
+    def test_reader_is_transparent(self):
+        """Test the throttled reader returns the wrapped data."""
+        limiter = BandwidthLimiter(1024**3)
+        reader = ThrottledReader(io.BytesIO(b"hello world"), limiter)
+        assert reader.read(5) == b"hello"
+        assert reader.tell() == 5
+        assert reader.read() == b" world"
+
+    def test_small_transfer_is_not_starved(self):
+        """Test a small transfer finishes long before a large one."""
+        quantum = 10 * 1024
+        limiter = BandwidthLimiter(20 * quantum, quantum=quantum)
+        finished = {}
+
+        def transfer(name, nbytes):
+            limiter.consume(nbytes)
+            finished[name] = time.monotonic()
+
+        large = threading.Thread(target=transfer, args=("large", 35 * quantum))
+        large.start()
+        time.sleep(0.1)
+        small = threading.Thread(target=transfer, args=("small", quantum))
+        small.start()
+        large.join()
+        small.join()
+
+        assert finished["small"] < finished["large"]
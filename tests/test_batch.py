@@ -0,0 +1,115 @@
+"""Tests for batch manifest execution."""
+
+import json
+
+from cloud_storage_syncer.core.rate_limit import TokenBucket
+from cloud_storage_syncer.models import DeleteResult, UploadResult
+from cloud_storage_syncer.services.batch_service import BatchService
+
+
+class FakeS3Service:
+    """Minimal stand-in for S3Service."""
+
+    def __init__(self):
+        self.calls = []
+
+    def upload_file(self, request):
+        self.calls.append(("upload", request.s3_key))
+        return UploadResult.success(s3_url=f"s3://bucket/{request.s3_key}")
+
+    def delete_file(self, s3_key):
+        self.calls.append(("delete", s3_key))
+        if s3_key == "locked.txt":
+            return DeleteResult.error_result(s3_key, "AccessDenied")
+        return DeleteResult.success_result(s3_key)
+
+
+def manifest(*entries):
+    """Build manifest lines from dicts or raw strings."""
+    return [e if isinstance(e, str) else json.dumps(e) for e in entries]
+
+
+class TestBatchService:
+    """Test BatchService."""
+
+    def test_runs_mixed_operations(self):
+        """Test every manifest line produces one result."""
+        service = FakeS3Service()
+        batch = BatchService(service, max_workers=4)
+
+        results = list(
+            batch.run(
+                manifest(
+                    {"op": "upload", "local_path": "a.txt", "s3_key": "a.txt"},
+                    {"op": "delete", "s3_key": "b.txt"},
+                    "",
+                    {"op": "delete", "s3_key": "locked.txt"},
+                )
+            )
+        )
+
+        by_line = {r.line: r for r in results}
+        assert sorted(by_line) == [1, 2, 4]
+        assert by_line[1].success is True
+        assert by_line[2].success is True
+        assert by_line[4].success is False
+        assert by_line[4].error_message == "AccessDenied"
+        assert sorted(service.calls) == [
+            ("delete", "b.txt"),
+            ("delete", "locked.txt"),
+            ("upload", "a.txt"),
+        ]
+
+    def test_invalid_lines_are_reported(self):
+        """Test malformed lines fail without stopping the batch."""
+        service = FakeS3Service()
+        batch = BatchService(service, max_workers=2)
+
+        results = list(
+            batch.run(
+                manifest(
+                    "not json",
+                    {"op": "rename", "s3_key": "x"},
+                    {"op": "upload", "s3_key": "no-local-path"},
+                    {"op": "delete", "s3_key": 42},
+                    {"op": "upload", "s3_key": "x", "local_path": ["a"]},
+                    {"op": "upload", "s3_key": "x", "local_path": "a", "force": "false"},
+                    {"op": "delete", "s3_key": "ok.txt"},
+                )
+            )
+        )
+
+        failed = sorted(r.line for r in results if not r.success)
+        assert failed == [1, 2, 3, 4, 5, 6]
+        assert all(isinstance(r.s3_key, str) for r in results if r.line in (4, 5))
+        assert service.calls == [("delete", "ok.txt")]
+
+    def test_disallowed_operations(self):
+        """Test operations outside allowed_operations are rejected."""
+        service = FakeS3Service()
+        batch = BatchService(service, allowed_operations=("delete",))
+
+        results = list(
+            batch.run(
+                manifest({"op": "upload", "local_path": "a", "s3_key": "a"})
+            )
+        )
+
+        assert results[0].success is False
+        assert "not allowed" in results[0].error_message
+        assert service.calls == []
+
+
+class TestTokenBucket:
+    """Test TokenBucket."""
+
+    def test_refills_over_time(self):
+        """Test tokens refill at the configured rate."""
+        now = [0.0]
+        bucket = TokenBucket(rate=10, capacity=10, clock=lambda: now[0])
+
+        assert bucket.try_acquire(10) == 0.0
+        assert bucket.try_acquire(5) == 0.5
+
+        now[0] = 0.5
+        assert bucket.try_acquire(5) == 0.0
@@ -0,0 +1,161 @@
+"""Tests for streaming compression of uploads and downloads."""
+
+import gzip
+import io
+import os
+
+import pytest
+
+from cloud_storage_syncer.core.compression import (
+    CompressingReader,
+    DecompressingWriter,
+    should_compress,
+)
+from cloud_storage_syncer.models import DownloadRequest, S3Config, UploadRequest
+from cloud_storage_syncer.services import S3Service
+
+TEXT = b"timestamp,level,message\n" + b"2025-01-01,INFO,all good\n" * 2000
+
+
+class FakeClient:
+    """Minimal S3 client storing object bodies and upload arguments."""
+
+    def __init__(self):
+        self.objects = {}
+
+    def upload_fileobj(self, fileobj, bucket, key, ExtraArgs=None, Config=None):
+        # Read in small pieces, like the transfer manager does
+        body = b""
+        while chunk := fileobj.read(1000):
+            body += chunk
+        self.objects[key] = (body, ExtraArgs or {})
+
+    def upload_file(self, filename, bucket, key, ExtraArgs=None, Config=None):
+        with open(filename, "rb") as f:
+            self.upload_fileobj(f, bucket, key, ExtraArgs)
+
+    def head_object(self, Bucket, Key):
+        body, extra_args = self.objects[Key]
+        response = {
+            "ContentLength": len(body),
+            "LastModified": None,
+            "ETag": '"e"',
+            "Metadata": extra_args.get("Metadata", {}),
+        }
+        if "ContentEncoding" in extra_args:
+            response["ContentEncoding"] = extra_args["ContentEncoding"]
+        return response
+
+    def download_fileobj(self, bucket, key, fileobj, ExtraArgs=None):
+        body, _ = self.objects[key]
+        for start in range(0, len(body), 777):
+            fileobj.write(body[start : start + 777])
+
+    def download_file(self, bucket, key, filename, ExtraArgs=None):
+        with open(filename, "wb") as f:
+            self.download_fileobj(bucket, key, f)
+
+
+@pytest.fixture
+def service():
+    """S3Service backed by the in-memory client."""
+    s3_service = S3Service(
+        S3Config(
+            access_key="test_key",
+            secret_key="test_secret",
+            bucket="test-bucket",
+            region="us-east-1",
+        )
+    )
+    s3_service._client = s3_service._transfer_client = FakeClient()
+    s3_service._bucket_exists_cache = True
+    return s3_service
+
+
+class TestCompressionStreams:
+    """Test the compressing reader and decompressing writer."""
+
+    def test_round_trip_in_small_chunks(self):
+        """Test gzip output is a valid stream and decodes back in pieces."""
+        reader = CompressingReader(io.BytesIO(TEXT), "gzip")
+        compressed = b""
+        while chunk := reader.read(100):
+            compressed += chunk
+
+        assert gzip.decompress(compressed) == TEXT
+        assert len(compressed) < len(TEXT) / 10
+
+        out = io.BytesIO()
+        writer = DecompressingWriter(out, "gzip")
+        for start in range(0, len(compressed), 7):
+            writer.write(compressed[start : start + 7])
+        writer.finish()
+        assert out.getvalue() == TEXT
+
+    def test_truncated_stream_is_an_error(self):
+        """Test a cut-off download is not silently accepted."""
+        compressed = gzip.compress(TEXT)
+        writer = DecompressingWriter(io.BytesIO(), "gzip")
+        writer.write(compressed[: len(compressed) // 2])
+        with pytest.raises(ValueError):
+            writer.finish()
+
+    def test_unknown_encoding(self):
+        """Test only gzip and zstd are accepted."""
+        with pytest.raises(ValueError):
+            CompressingReader(io.BytesIO(), "brotli")
+
+    def test_should_compress(self, tmp_path):
+        """Test suffixes decide known types and a probe decides the rest."""
+        (tmp_path / "tiny.csv").write_bytes(b"a,b\n")
+        (tmp_path / "log.csv").write_bytes(TEXT)
+        (tmp_path / "photo.jpg").write_bytes(TEXT)
+        (tmp_path / "data.bin").write_bytes(TEXT)
+        (tmp_path / "random.bin").write_bytes(os.urandom(100_000))
+
+        assert not should_compress(tmp_path / "tiny.csv")
+        assert should_compress(tmp_path / "log.csv")
+        assert not should_compress(tmp_path / "photo.jpg")
+        assert should_compress(tmp_path / "data.bin")
+        assert not should_compress(tmp_path / "random.bin")
+
+
+class TestCompressedTransfers:
+    """Test S3Service compresses on upload and decompresses on download."""
+
+    def test_upload_and_download(self, service, tmp_path):
+        """Test the object is stored gzip-encoded and restored byte for byte."""
+        source = tmp_path / "app.log"
+        source.write_bytes(TEXT)
+
+        result = service.upload_file(
+            UploadRequest(file_path=str(source), s3_key="logs/app.log", compression="gzip")
+        )
+
+        assert result.success
+        body, extra_args = service.client.objects["logs/app.log"]
+        assert gzip.decompress(body) == TEXT
+        assert extra_args["ContentEncoding"] == "gzip"
+        assert extra_args["Metadata"] == {"uncompressed-size": str(len(TEXT))}
+
+        target = tmp_path / "restored.log"
+        download = service.download_file(
+            DownloadRequest(s3_key="logs/app.log", output_path=str(target))
+        )
+
+        assert download.success
+        assert download.file_size == len(TEXT)
+        assert target.read_bytes() == TEXT
+
+    def test_incompressible_files_are_sent_as_is(self, service, tmp_path):
+        """Test files the probe rejects are uploaded without an encoding."""
+        source = tmp_path / "archive.zip"
+        source.write_bytes(TEXT)
+
+        service.upload_file(
+            UploadRequest(file_path=str(source), s3_key="a.zip", compression="gzip")
+        )
+
+        body, extra_args = service.client.objects["a.zip"]
+        assert body == TEXT
+        assert "ContentEncoding" not in extra_args
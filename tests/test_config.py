@@ -0,0 +1,82 @@
+"""Tests for configuration profiles and the per-profile service pool."""
+
+import json
+import os
+
+from cloud_storage_syncer.models import S3Config
+from cloud_storage_syncer.services import ConfigService
+from cloud_storage_syncer.services import config_service as config_service_module
+from cloud_storage_syncer.services.service_pool import S3ServicePool
+
+MAIN = S3Config(access_key="AK1", secret_key="s1", bucket="main", region="us-east-1")
+ARCHIVE = S3Config(access_key="AK2", secret_key="s2", bucket="cold", region="eu-west-1")
+
+
+class TestConfigService:
+    """Test cached loading and named profiles."""
+
+    def test_parsed_file_is_reused_until_it_changes(self, tmp_path, monkeypatch):
+        """Test repeat loads skip parsing and an edit is picked up."""
+        path = tmp_path / "config.json"
+        ConfigService(path).save_config(MAIN)
+        loads = []
+        real_load = json.load
+        monkeypatch.setattr(
+            config_service_module.json,
+            "load",
+            lambda f: loads.append(1) or real_load(f),
+        )
+
+        for _ in range(3):
+            assert ConfigService(path).load_config() == MAIN
+        assert len(loads) == 1
+
+        data = json.loads(path.read_text())
+        path.write_text(json.dumps({**data, "bucket": "renamed-bucket"}))
+        os.utime(path, ns=(1, 1))
+        assert ConfigService(path).load_config().bucket == "renamed-bucket"
+        assert len(loads) == 2
+
+    def test_profiles(self, tmp_path, monkeypatch):
+        """Test profiles are stored side by side and selected by name or env."""
+        path = tmp_path / "config.json"
+        ConfigService(path).save_config(MAIN)
+        ConfigService(path, "archive").save_config(ARCHIVE)
+
+        assert ConfigService(path).load_config() == MAIN
+        assert ConfigService(path, "archive").load_config() == ARCHIVE
+        assert ConfigService(path, "missing").load_config() is None
+        assert ConfigService(path).list_profiles() == ["default", "archive"]
+
+        monkeypatch.setenv(config_service_module.PROFILE_ENV, "archive")
+        assert ConfigService(path).load_config() == ARCHIVE
+
+        assert ConfigService(path, "archive").delete_config()
+        assert ConfigService(path).list_profiles() == ["default"]
+        assert ConfigService(path, "default").load_config() == MAIN
+
+    def test_legacy_file_is_the_default_profile(self, tmp_path):
+        """Test a flat file written by older versions still loads."""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps(MAIN.__dict__))
+
+        assert ConfigService(path, "default").load_config() == MAIN
+        assert ConfigService(path, "default").delete_config()
+        assert not path.exists()
+
+
+class TestS3ServicePool:
+    """Test warm services are shared per profile."""
+
+    def test_one_service_per_profile_and_config(self):
+        """Test reuse for the same config and a fresh service after a change."""
+        pool = S3ServicePool()
+
+        main = pool.get("default", MAIN)
+        assert pool.get("default", MAIN) is main
+        assert pool.get("archive", ARCHIVE) is not main
+
+        rotated = S3Config(**{**MAIN.__dict__, "secret_key": "rotated"})
+        assert pool.get("default", rotated) is not main
+        assert pool.get("default", rotated).config == rotated
+        assert len(pool) == 2
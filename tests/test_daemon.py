@@ -0,0 +1,161 @@
+"""Tests for the daemon service."""
+
+import json
+import socket
+import stat
+import threading
+from datetime import UTC, datetime
+
+import pytest
+
+from cloud_storage_syncer.models import (
+    DeleteResult,
+    ObjectEntry,
+    S3Config,
+    S3StorageClass,
+    UploadRequest,
+    UploadResult,
+)
+from cloud_storage_syncer.services.daemon_service import (
+    DaemonClient,
+    DaemonError,
+    DaemonServer,
+    connect_daemon,
+)
+
+from .conftest import CONFIG
+
+
+class FakeS3Service:
+    """Minimal stand-in for S3Service."""
+
+    def __init__(self, config):
+        self.config = config
+        self.uploads = []
+
+    def upload_file(self, request):
+        self.uploads.append(request)
+        return UploadResult.success(
+            s3_url=f"s3://{self.config.bucket}/{request.s3_key}",
+            storage_class=request.storage_class.value,
+        )
+
+    def delete_file(self, s3_key):
+        return DeleteResult.success_result(s3_key, existed=False)
+
+    def list_objects(self, prefix="", max_keys=1000):
+        return [
+            ObjectEntry(
+                key=f"{prefix}a.txt",
+                size=3,
+                mtime=int(datetime(2025, 1, 2, tzinfo=UTC).timestamp()),
+                etag='"abc"',
+            )
+        ]
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    """Run a daemon around a fake service for one test."""
+    service = FakeS3Service(CONFIG)
+    server = DaemonServer(service, tmp_path / "d.sock")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, service
+    server.shutdown()
+    server.server_close()
+
+
+class TestDaemon:
+    """Test daemon request forwarding."""
+
+    def test_forwards_operations(self, daemon, tmp_path):
+        """Test calls through the remote service reach the warm service."""
+        server, service = daemon
+        remote = connect_daemon(CONFIG, server.socket_path)
+        assert remote is not None
+
+        result = remote.upload_file(
+            UploadRequest(
+                file_path="relative.txt",
+                s3_key="docs/relative.txt",
+                storage_class=S3StorageClass.STANDARD_IA,
+            )
+        )
+        assert result.success is True
+        assert result.s3_url == "s3://test-bucket/docs/relative.txt"
+        assert service.uploads[0].storage_class == S3StorageClass.STANDARD_IA
+        assert service.uploads[0].file_path.startswith("/")
+
+        deleted = remote.delete_file("gone.txt")
+        assert deleted.success is True
+        assert deleted.existed_before_delete is False
+
+        objects = remote.list_objects(prefix="docs/")
+        assert objects[0].key == "docs/a.txt"
+        assert objects[0].last_modified == datetime(2025, 1, 2, tzinfo=UTC)
+
+    def test_ignores_daemon_with_other_config(self, daemon):
+        """Test a daemon for another bucket is not used."""
+        server, _ = daemon
+        other = S3Config(
+            access_key="test_key",
+            secret_key="test_secret",
+            bucket="other-bucket",
+            region="us-east-1",
+        )
+        assert connect_daemon(other, server.socket_path) is None
+
+    def test_no_daemon(self, tmp_path):
+        """Test missing socket falls back to direct access."""
+        assert connect_daemon(CONFIG, tmp_path / "missing.sock") is None
+        with pytest.raises(DaemonError):
+            DaemonClient(tmp_path / "missing.sock")
+
+    def test_failed_ping_closes_client(self, tmp_path, monkeypatch):
+        """Test a socket that accepts but never answers is closed and skipped."""
+        closed = []
+        original_close = DaemonClient.close
+
+        def close(client):
+            closed.append(client)
+            original_close(client)
+
+        monkeypatch.setattr(DaemonClient, "close", close)
+        socket_path = tmp_path / "mute.sock"
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+            listener.bind(str(socket_path))
+            listener.listen()
+            # The connection is queued but the "daemon" hangs up unanswered
+            accepted = threading.Thread(target=lambda: listener.accept()[0].close())
+            accepted.start()
+
+            assert connect_daemon(CONFIG, socket_path) is None
+            accepted.join()
+
+        assert len(closed) == 1
+
+    def test_unknown_operation(self, daemon):
+        """Test unknown operations are reported as errors."""
+        server, _ = daemon
+        client = DaemonClient(server.socket_path)
+        with pytest.raises(DaemonError, match="Unknown daemon operation"):
+            client.call("format_disk")
+        client.close()
+
+    def test_non_object_request(self, daemon):
+        """Test a request that is not a JSON object gets an error reply."""
+        server, _ = daemon
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(server.socket_path))
+            stream = sock.makefile("rwb")
+            stream.write(b"[1, 2]\n")
+            stream.flush()
+            reply = json.loads(stream.readline())
+
+        assert reply == {"ok": False, "error": "Request must be a JSON object"}
+
+    def test_socket_is_owner_only(self, daemon):
+        """Test the socket is created readable by its owner only."""
+        server, _ = daemon
+        assert stat.S_IMODE(server.socket_path.stat().st_mode) == 0o600
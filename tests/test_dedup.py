@@ -0,0 +1,92 @@
+"""Tests for deduplicating uploads."""
+
+import hashlib
+
+import pytest
+
+from cloud_storage_syncer.models import UploadRequest
+from cloud_storage_syncer.services.dedup_service import DedupIndex, DedupService
+from cloud_storage_syncer.services.hash_service import HashCache
+
+from .conftest import MemoryS3Service
+
+
+@pytest.fixture
+def dedup(tmp_path):
+    """Dedup service over a fake S3 and a temporary index."""
+    index = DedupIndex(tmp_path / "dedup.db")
+    hash_cache = HashCache(tmp_path / "hashes.db")
+    yield DedupService(
+        MemoryS3Service(), index=index, min_size=0, hash_cache=hash_cache
+    )
+    index.close()
+    hash_cache.close()
+
+
+class TestDedupService:
+    """Test content-hash deduplication."""
+
+    def test_identical_content_is_copied(self, dedup, tmp_path):
+        """Test a second upload of the same bytes becomes a server-side copy."""
+        first = tmp_path / "a.bin"
+        second = tmp_path / "b.bin"
+        first.write_bytes(b"artifact" * 100)
+        second.write_bytes(b"artifact" * 100)
+
+        dedup.upload_file(UploadRequest(file_path=str(first), s3_key="v1/a.bin"))
+        result = dedup.upload_file(
+            UploadRequest(file_path=str(second), s3_key="v2/a.bin")
+        )
+
+        assert result.copied_from == "v1/a.bin"
+        assert dedup.s3_service.calls == [
+            ("upload", "v1/a.bin"),
+            ("copy", "v1/a.bin", "v2/a.bin"),
+        ]
+        digest = hashlib.sha256(b"artifact" * 100).hexdigest()
+        assert dedup.s3_service.metadata["v1/a.bin"]["sha256"] == digest
+
+    def test_compressed_source_is_matched(self, dedup, tmp_path):
+        """Test a compressed copy matches on its uncompressed size."""
+        path = tmp_path / "a.bin"
+        path.write_bytes(b"artifact" * 100)
+        dedup.upload_file(UploadRequest(file_path=str(path), s3_key="v1/a.bin"))
+        # Stand in for what a --compress upload stores
+        dedup.s3_service.objects["v1/a.bin"] = b"smaller"
+        dedup.s3_service.encodings["v1/a.bin"] = "zstd"
+        dedup.s3_service.metadata["v1/a.bin"]["uncompressed-size"] = "800"
+
+        result = dedup.upload_file(UploadRequest(file_path=str(path), s3_key="v2/a.bin"))
+
+        assert result.copied_from == "v1/a.bin"
+
+    def test_stale_entries_fall_back_to_upload(self, dedup, tmp_path):
+        """Test a deleted source is forgotten and the file is uploaded."""
+        path = tmp_path / "a.bin"
+        path.write_bytes(b"data")
+        dedup.upload_file(UploadRequest(file_path=str(path), s3_key="old"))
+        del dedup.s3_service.objects["old"]
+
+        result = dedup.upload_file(UploadRequest(file_path=str(path), s3_key="new"))
+
+        assert result.copied_from == ""
+        assert dedup.s3_service.calls == [("upload", "old"), ("upload", "new")]
+        digest = hashlib.sha256(b"data").hexdigest()
+        assert dedup.index.lookup("test-bucket", digest, 4) == ["new"]
+
+    def test_small_files_skip_hashing(self, tmp_path):
+        """Test files under the size threshold are uploaded as usual."""
+        index = DedupIndex(tmp_path / "dedup.db")
+        hash_cache = HashCache(tmp_path / "hashes.db")
+        service = DedupService(
+            MemoryS3Service(), index=index, min_size=1024, hash_cache=hash_cache
+        )
+        path = tmp_path / "a.bin"
+        path.write_bytes(b"tiny")
+
+        service.upload_file(UploadRequest(file_path=str(path), s3_key="a"))
+        service.upload_file(UploadRequest(file_path=str(path), s3_key="b"))
+
+        assert service.s3_service.calls == [("upload", "a"), ("upload", "b")]
+        index.close()
+        hash_cache.close()
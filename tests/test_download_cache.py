@@ -0,0 +1,118 @@
+"""Tests for the read-through download cache."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cloud_storage_syncer.models import DownloadResult
+from cloud_storage_syncer.services.disk_cache import DiskLRUCache
+from cloud_storage_syncer.services.download_cache import DownloadCache
+
+
+class FakeS3Service:
+    """Stand-in for S3Service counting downloads of each object."""
+
+    def __init__(self, objects):
+        # key -> (body, etag)
+        self.objects = objects
+        self.downloads = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def get_object_info(self, s3_key):
+        if s3_key not in self.objects:
+            return None
+        body, etag = self.objects[s3_key]
+        return {"size": len(body), "etag": etag}
+
+    def download_file(self, request):
+        self.downloads.append(request.s3_key)
+        self.release.wait(5)
+        body, etag = self.objects[request.s3_key]
+        if request.etag != etag:
+            return DownloadResult(
+                success=False,
+                s3_key=request.s3_key,
+                local_path=request.output_path,
+                error_message="Object changed",
+            )
+        with open(request.output_path, "wb") as f:
+            f.write(body)
+        return DownloadResult(
+            success=True,
+            s3_key=request.s3_key,
+            local_path=request.output_path,
+            file_size=len(body),
+        )
+
+
+def read(cache, s3_service, s3_key):
+    """Open a key through the cache and read it whole."""
+    f, _ = cache.open(s3_service, s3_key)
+    with f:
+        return f.read()
+
+
+class TestDownloadCache:
+    """Test caching, validation and single-flight fetching."""
+
+    def test_repeat_downloads_hit_the_cache(self, tmp_path):
+        """Test a second open downloads nothing and a new ETag re-fetches."""
+        s3_service = FakeS3Service({"a.bin": (b"one", '"v1"')})
+        cache = DownloadCache(DiskLRUCache(tmp_path, 1024))
+
+        assert read(cache, s3_service, "a.bin") == b"one"
+        assert read(cache, s3_service, "a.bin") == b"one"
+        assert s3_service.downloads == ["a.bin"]
+
+        s3_service.objects["a.bin"] = (b"two", '"v2"')
+        assert read(cache, s3_service, "a.bin") == b"two"
+        assert len(s3_service.downloads) == 2
+
+    def test_concurrent_opens_share_one_download(self, tmp_path):
+        """Test requests arriving during a fetch wait for it instead of refetching."""
+        s3_service = FakeS3Service({"big.bin": (b"x" * 100, '"e"')})
+        s3_service.release.clear()
+        cache = DownloadCache(DiskLRUCache(tmp_path, 1024))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                executor.submit(read, cache, s3_service, "big.bin") for _ in range(8)
+            ]
+            s3_service.release.set()
+            results = [future.result() for future in futures]
+
+        assert results == [b"x" * 100] * 8
+        assert s3_service.downloads == ["big.bin"]
+
+    def test_size_is_bounded(self, tmp_path):
+        """Test old objects are evicted and oversized ones are not cached."""
+        objects = {key: (key.encode() * 10, f'"{key}"') for key in "abcde"}
+        objects["huge"] = (b"h" * 50, '"h"')
+        s3_service = FakeS3Service(objects)
+        disk_cache = DiskLRUCache(tmp_path, 40)
+        cache = DownloadCache(disk_cache)
+
+        assert read(cache, s3_service, "huge") == b"h" * 50
+        assert list(tmp_path.iterdir()) == []
+
+        for key in "abcde":
+            assert read(cache, s3_service, key) == key.encode() * 10
+
+        assert len(disk_cache) == 4
+        assert disk_cache.total_bytes == 40
+        assert disk_cache.get('"a":a') is None
+
+    def test_missing_and_failed(self, tmp_path):
+        """Test missing keys and failed fetches raise and cache nothing."""
+        s3_service = FakeS3Service({"a": (b"a", '"e"')})
+        cache = DownloadCache(DiskLRUCache(tmp_path, 1024))
+
+        with pytest.raises(FileNotFoundError):
+            cache.open(s3_service, "nope")
+
+        s3_service.get_object_info = lambda key: {"size": 1, "etag": '"stale"'}
+        with pytest.raises(RuntimeError):
+            cache.open(s3_service, "a")
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,118 @@
+"""Tests for applying S3 event notifications to the shared cache."""
+
+import json
+
+import pytest
+
+from cloud_storage_syncer.services.caching_s3_service import CachingS3Service
+from cloud_storage_syncer.services.event_consumer import (
+    S3EventConsumer,
+    parse_event_keys,
+)
+from cloud_storage_syncer.services.shared_cache import MemoryCache
+
+from .conftest import BUCKET, CONFIG, stub_list, stubbed
+
+QUEUE_URL = "http://localhost:9324/000000000000/events"
+
+
+def notification(*changes, bucket=BUCKET):
+    """Build an S3 event notification body from (event name, raw key) pairs."""
+    return json.dumps(
+        {
+            "Records": [
+                {
+                    "eventName": name,
+                    "s3": {"bucket": {"name": bucket}, "object": {"key": key}},
+                }
+                for name, key in changes
+            ]
+        }
+    )
+
+
+class FakeSQS:
+    """In-memory stand-in for the SQS client calls the consumer makes."""
+
+    def __init__(self, bodies):
+        self.messages = [
+            {"MessageId": f"m{i}", "ReceiptHandle": f"r{i}", "Body": body}
+            for i, body in enumerate(bodies)
+        ]
+        self.deleted = []
+
+    def receive_message(self, QueueUrl, MaxNumberOfMessages, WaitTimeSeconds):
+        assert QueueUrl == QUEUE_URL
+        batch = self.messages[:MaxNumberOfMessages]
+        self.messages = self.messages[MaxNumberOfMessages:]
+        return {"Messages": batch} if batch else {}
+
+    def delete_message_batch(self, QueueUrl, Entries):
+        self.deleted.extend(entry["ReceiptHandle"] for entry in Entries)
+        return {"Successful": [{"Id": entry["Id"]} for entry in Entries]}
+
+
+@pytest.fixture
+def service():
+    """Caching service with a stubbed client and a memory cache."""
+    with stubbed(CachingS3Service(CONFIG, MemoryCache())) as s3_service:
+        yield s3_service
+
+
+class TestParseEventKeys:
+    """Test notification bodies are turned into changed keys."""
+
+    def test_direct_and_sns_wrapped(self):
+        """Test keys are decoded and SNS envelopes are unwrapped."""
+        body = notification(
+            ("ObjectCreated:Put", "docs/my+report%282%29.pdf"),
+            ("ObjectRemoved:Delete", "docs/old.txt"),
+        )
+        expected = ["docs/my report(2).pdf", "docs/old.txt"]
+        assert parse_event_keys(body, BUCKET) == expected
+
+        wrapped = json.dumps({"Type": "Notification", "Message": body})
+        assert parse_event_keys(wrapped, BUCKET) == expected
+
+    def test_irrelevant_events_are_ignored(self):
+        """Test test events, other event types and other buckets yield nothing."""
+        assert parse_event_keys(json.dumps({"Event": "s3:TestEvent"}), BUCKET) == []
+        assert parse_event_keys(notification(("Replication:Failed", "a")), BUCKET) == []
+        other = notification(("ObjectCreated:Put", "a"), bucket="other")
+        assert parse_event_keys(other, BUCKET) == []
+
+    def test_malformed_body(self):
+        """Test bodies that are not notifications are rejected."""
+        for body in ("not json", "[]", json.dumps({"Records": [{}]})):
+            with pytest.raises(ValueError):
+                parse_event_keys(body, BUCKET)
+
+
+class TestS3EventConsumer:
+    """Test events refresh only the affected cached listings."""
+
+    def test_events_invalidate_affected_listings(self, service):
+        """Test a created key re-lists its directories and nothing else."""
+        stub_list(service, "docs/", ["docs/a.txt"])
+        stub_list(service, "photos/", ["photos/1.jpg"])
+        service.list_objects("docs/")
+        service.list_objects("photos/")
+
+        sqs = FakeSQS([notification(("ObjectCreated:Put", "docs/b.txt"))])
+        consumer = S3EventConsumer(service, QUEUE_URL, sqs)
+        assert consumer.poll(wait_seconds=0) == 1
+        assert sqs.deleted == ["r0"]
+
+        stub_list(service, "docs/", ["docs/a.txt", "docs/b.txt"])
+        assert len(service.list_objects("docs/")) == 2
+        # Served from the cache: no listing is queued for photos/
+        assert len(service.list_objects("photos/")) == 1
+
+    def test_malformed_messages_are_dropped(self, service):
+        """Test a bad message is deleted along with the good ones."""
+        sqs = FakeSQS(["garbage", notification(("ObjectRemoved:Delete", "x"))])
+        consumer = S3EventConsumer(service, QUEUE_URL, sqs)
+
+        assert consumer.poll(wait_seconds=0) == 1
+        assert sqs.deleted == ["r0", "r1"]
+        assert consumer.poll(wait_seconds=0) == 0
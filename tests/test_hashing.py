@@ -0,0 +1,118 @@
+"""Tests for local file hashing and the hash cache."""
+
+import base64
+import hashlib
+import os
+
+import pytest
+
+from cloud_storage_syncer.core import hashing
+from cloud_storage_syncer.core.hashing import effective_part_size, hash_file
+from cloud_storage_syncer.services.hash_service import HashCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Hash cache in a temporary database."""
+    hash_cache = HashCache(tmp_path / "hashes.db", max_workers=4)
+    yield hash_cache
+    hash_cache.close()
+
+
+class TestHashing:
+    """Test digest computation."""
+
+    def test_digests_match_hashlib(self, tmp_path):
+        """Test mmap hashing agrees with hashlib, including empty files."""
+        path = tmp_path / "data.bin"
+        for data in (b"", b"hello world" * 1000):
+            path.write_bytes(data)
+            assert hash_file(path, "md5") == hashlib.md5(data).hexdigest()
+            assert hash_file(path, "sha256") == hashlib.sha256(data).hexdigest()
+
+    def test_multipart_etag(self, tmp_path, monkeypatch):
+        """Test the ETag follows S3's md5-of-part-md5s scheme above the threshold."""
+        monkeypatch.setattr(hashing, "MULTIPART_THRESHOLD", 4)
+        data = b"abcdefghij"
+        path = tmp_path / "data.bin"
+        path.write_bytes(data)
+
+        parts = [data[0:4], data[4:8], data[8:10]]
+        combined = hashlib.md5(b"".join(hashlib.md5(p).digest() for p in parts))
+
+        assert hash_file(path, "etag", part_size=4) == f'"{combined.hexdigest()}-3"'
+
+    def test_single_part_etag_is_md5(self, tmp_path):
+        """Test files below the threshold get a plain quoted MD5."""
+        path = tmp_path / "small.txt"
+        path.write_bytes(b"small")
+        assert hash_file(path, "etag") == f'"{hashlib.md5(b"small").hexdigest()}"'
+
+    def test_s3_checksums(self, tmp_path):
+        """Test whole-object and composite checksums follow S3's scheme."""
+        data = b"abcdefghij"
+        path = tmp_path / "data.bin"
+        path.write_bytes(data)
+
+        def b64(digest):
+            return base64.b64encode(digest).decode()
+
+        parts = [data[0:4], data[4:8], data[8:10]]
+        composite = hashlib.sha256(
+            b"".join(hashlib.sha256(p).digest() for p in parts)
+        ).digest()
+
+        assert hash_file(path, "s3-sha256", 0) == b64(hashlib.sha256(data).digest())
+        assert hash_file(path, "s3-sha256", 4) == f"{b64(composite)}-3"
+        assert hash_file(path, "s3-crc32", 0) == hash_file(path, "crc32")
+
+    def test_part_size_grows_to_fit_part_limit(self):
+        """Test the part size doubles until the upload fits in 10,000 parts."""
+        size = 8 * 1024**2 * 10000 + 1
+        assert effective_part_size(size) == 16 * 1024**2
+
+
+class TestHashCache:
+    """Test the persistent hash cache."""
+
+    def test_unchanged_files_are_not_reread(self, cache, tmp_path, monkeypatch):
+        """Test a second lookup is served from the cache."""
+        path = tmp_path / "a.txt"
+        path.write_bytes(b"one")
+        first = cache.get(path, "sha256")
+
+        calls = []
+        monkeypatch.setattr(
+            "cloud_storage_syncer.services.hash_service.hash_file",
+            lambda *args: calls.append(args),
+        )
+
+        assert cache.get(path, "sha256") == first
+        assert calls == []
+
+    def test_modified_files_are_rehashed(self, cache, tmp_path):
+        """Test a changed mtime invalidates the cached digest."""
+        path = tmp_path / "a.txt"
+        path.write_bytes(b"one")
+        cache.get(path, "md5")
+
+        path.write_bytes(b"two")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert cache.get(path, "md5") == hashlib.md5(b"two").hexdigest()
+
+    def test_hash_files_in_parallel(self, cache, tmp_path):
+        """Test batch hashing returns a digest per file and None for failures."""
+        paths = []
+        for index in range(10):
+            path = tmp_path / f"{index}.txt"
+            path.write_bytes(str(index).encode())
+            paths.append(path)
+        missing = tmp_path / "missing.txt"
+
+        digests = cache.hash_files([*paths, missing], "crc32")
+
+        assert len(digests) == 11
+        assert digests[missing] is None
+        assert all(digests[path] for path in paths)
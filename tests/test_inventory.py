@@ -0,0 +1,107 @@
+"""Tests for S3 Inventory ingestion."""
+
+import gzip
+import json
+
+import pytest
+
+from cloud_storage_syncer.core.inventory import parse_manifest
+from cloud_storage_syncer.services.inventory_service import InventoryService
+
+SCHEMA = "Bucket, Key, VersionId, IsLatest, IsDeleteMarker, Size, LastModifiedDate, ETag, StorageClass"
+
+
+def write_inventory(root, rows, timestamp="2025-01-02T01-00Z"):
+    """Lay out a CSV inventory delivery the way S3 writes it."""
+    data_key = f"src-bucket/daily/data/{timestamp}.csv.gz"
+    data_path = root / data_key
+    data_path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(data_path, "wt", encoding="utf-8") as f:
+        f.writelines(",".join(f'"{value}"' for value in row) + "\n" for row in rows)
+
+    manifest_path = root / "src-bucket" / "daily" / timestamp / "manifest.json"
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(
+        json.dumps(
+            {
+                "sourceBucket": "src-bucket",
+                "destinationBucket": "arn:aws:s3:::inventory-bucket",
+                "fileFormat": "CSV",
+                "fileSchema": SCHEMA,
+                "creationTimestamp": "1735779600000",
+                "files": [{"key": data_key, "size": 1, "MD5checksum": "x"}],
+            }
+        )
+    )
+    return manifest_path
+
+
+def row(key, size, storage_class="STANDARD", latest="true", deleted="false"):
+    """Build one CSV inventory row."""
+    return [
+        "src-bucket",
+        key,
+        "v1",
+        latest,
+        deleted,
+        str(size),
+        "2025-01-01T12:00:00.000Z",
+        "abc",
+        storage_class,
+    ]
+
+
+class TestInventory:
+    """Test reading inventory snapshots."""
+
+    def test_streams_current_objects_under_prefix(self, tmp_path):
+        """Test keys are decoded and old versions and delete markers skipped."""
+        write_inventory(
+            tmp_path,
+            [
+                row("photos/my+trip/a%2Bb.jpg", 10, "GLACIER"),
+                row("photos/old.jpg", 5, latest="false"),
+                row("photos/gone.jpg", 0, deleted="true"),
+                row("docs/readme.txt", 3),
+            ],
+        )
+
+        entries = list(
+            InventoryService().iter_objects(str(tmp_path), prefix="photos/")
+        )
+
+        assert [entry.key for entry in entries] == ["photos/my trip/a+b.jpg"]
+        assert entries[0].size == 10
+        assert entries[0].storage_class == "GLACIER"
+        assert entries[0].etag == '"abc"'
+        assert entries[0].mtime == 1735732800
+
+    def test_picks_newest_delivery(self, tmp_path):
+        """Test a directory source resolves to its latest manifest."""
+        write_inventory(tmp_path, [row("old.txt", 1)], "2025-01-01T01-00Z")
+        write_inventory(tmp_path, [row("new.txt", 1)], "2025-01-02T01-00Z")
+
+        service = InventoryService()
+        keys = [entry.key for entry in service.iter_objects(str(tmp_path))]
+
+        assert keys == ["new.txt"]
+
+    def test_search_filters_snapshot(self, tmp_path):
+        """Test glob search runs over the snapshot."""
+        manifest_path = write_inventory(
+            tmp_path, [row("a/1.jpg", 1), row("a/2.png", 1), row("b/3.jpg", 1)]
+        )
+
+        matches = InventoryService().search_objects(str(manifest_path), "a/*.jpg")
+
+        assert [entry.key for entry in matches] == ["a/1.jpg"]
+
+    def test_rejects_unsupported_format(self):
+        """Test ORC inventories are reported as unsupported."""
+        with pytest.raises(ValueError, match="Unsupported"):
+            parse_manifest(json.dumps({"fileFormat": "ORC", "files": []}).encode())
+
+    def test_s3_source_requires_configuration(self):
+        """Test S3 sources fail clearly without a configured service."""
+        with pytest.raises(ValueError, match="configuration"):
+            InventoryService().load_manifest("s3://inventory-bucket/manifest.json")
@@ -0,0 +1,162 @@
+"""Tests for small-file packing."""
+
+import io
+import tarfile
+
+from botocore.response import StreamingBody
+
+from cloud_storage_syncer.core.packing import (
+    dump_index,
+    group_files,
+    index_key_for,
+    is_index_key,
+    load_index,
+    new_pack_key,
+    pack_root,
+    write_pack,
+)
+from cloud_storage_syncer.services.pack_service import PackService
+
+from .conftest import BUCKET, listed, stub_list
+
+
+class TestPacking:
+    """Test pack writing and index parsing."""
+
+    def test_offsets_address_member_bytes(self, tmp_path):
+        """Test each index entry points at the member's bytes in the pack."""
+        contents = {
+            "a.txt": b"alpha",
+            "nested/b.bin": bytes(range(256)) * 3,
+            "nested/" + "long-name-" * 15 + ".txt": b"pax header",
+            "empty.txt": b"",
+        }
+        files = []
+        for relative_key, data in contents.items():
+            local_path = tmp_path / "src" / relative_key
+            local_path.parent.mkdir(parents=True, exist_ok=True)
+            local_path.write_bytes(data)
+            files.append((local_path, relative_key, len(data)))
+
+        pack_path = tmp_path / "pack.tar"
+        index = write_pack(files, pack_path)
+
+        raw = pack_path.read_bytes()
+        for relative_key, data in contents.items():
+            entry = index["files"][relative_key]
+            assert entry["size"] == len(data)
+            assert raw[entry["offset"] : entry["offset"] + entry["size"]] == data
+
+        # Packs stay readable with standard tar tooling
+        with tarfile.open(pack_path) as tar:
+            assert sorted(tar.getnames()) == sorted(contents)
+
+    def test_index_round_trip(self, tmp_path):
+        """Test member keys are resolved against the pack's root."""
+        local_path = tmp_path / "x.txt"
+        local_path.write_bytes(b"hello")
+        index = write_pack([(local_path, "docs/x.txt", 5)], tmp_path / "p.tar")
+
+        pack_key = new_pack_key(pack_root("backup"))
+        index_key = index_key_for(pack_key)
+        assert pack_key.startswith("backup/.packs/")
+        assert is_index_key(index_key)
+
+        members = load_index(dump_index(index, pack_key), index_key)
+        assert len(members) == 1
+        assert members[0].s3_key == "backup/docs/x.txt"
+        assert members[0].pack_key == pack_key
+        assert members[0].byte_range == f"bytes={members[0].offset}-{members[0].offset + 4}"
+
+    def test_group_files(self, tmp_path):
+        """Test files are split into packs by total size."""
+        files = [(tmp_path / str(i), str(i), 40) for i in range(5)]
+        groups = group_files(files, max_pack_size=100)
+        assert [len(g) for g in groups] == [2, 2, 1]
+
+
+class TestPackedDownload:
+    """Test packed files are fetched back with ranged GETs."""
+
+    def test_empty_member_skips_get(self, service, tmp_path):
+        """Test an empty packed file is written without requesting the pack."""
+        empty = tmp_path / "src.txt"
+        empty.write_bytes(b"")
+        index = write_pack([(empty, "empty.txt", 0)], tmp_path / "p.tar")
+        pack_key = new_pack_key(pack_root("docs"))
+        [member] = load_index(dump_index(index, pack_key), index_key_for(pack_key))
+        assert member.byte_range is None
+
+        # Nothing is queued on the stubbed client, so any request would fail
+        local_path = tmp_path / "empty.txt"
+        result = PackService(service).download_member(member, local_path)
+
+        assert result.success, result.error_message
+        assert local_path.read_bytes() == b""
+
+    def test_find_member_pages_pack_listing(self, service, tmp_path):
+        """Test packs are found past the first page of a .packs/ listing."""
+        src = tmp_path / "src.txt"
+        src.write_bytes(b"hello")
+        index = write_pack([(src, "x.txt", 5)], tmp_path / "p.tar")
+        pack_key = new_pack_key(pack_root("docs"))
+        index_key = index_key_for(pack_key)
+
+        params = {"Bucket": BUCKET, "Prefix": "docs/.packs/", "MaxKeys": 1000}
+        service.stubber.add_response(
+            "list_objects_v2",
+            {
+                "Contents": [listed(pack_key)],
+                "IsTruncated": True,
+                "NextContinuationToken": "next",
+            },
+            params,
+        )
+        service.stubber.add_response(
+            "list_objects_v2",
+            {"Contents": [listed(index_key)]},
+            {**params, "ContinuationToken": "next"},
+        )
+        service.stubber.add_response(
+            "get_object",
+            {"Body": io.BytesIO(dump_index(index, pack_key))},
+            {"Bucket": BUCKET, "Key": index_key},
+        )
+
+        member = PackService(service).find_member("docs/x.txt")
+
+        assert member is not None
+        assert member.pack_key == pack_key
+
+    def test_download_directory_expands_packs(self, service, tmp_path):
+        """Test a directory download writes packed files, not the packs."""
+        src = tmp_path / "src.txt"
+        src.write_bytes(b"hello")
+        pack_path = tmp_path / "p.tar"
+        index = write_pack([(src, "sub/x.txt", 5)], pack_path)
+        pack_key = new_pack_key(pack_root("docs"))
+        index_key = index_key_for(pack_key)
+        [member] = load_index(dump_index(index, pack_key), index_key)
+        start, end = member.byte_range.removeprefix("bytes=").split("-")
+        body = pack_path.read_bytes()[int(start) : int(end) + 1]
+
+        stub_list(service, "docs/", [pack_key, index_key], restore_status=True)
+        stub_list(service, ".packs/", [])
+        service.stubber.add_response(
+            "get_object",
+            {"Body": io.BytesIO(dump_index(index, pack_key))},
+            {"Bucket": BUCKET, "Key": index_key},
+        )
+        service.stubber.add_response(
+            "get_object",
+            {"Body": StreamingBody(io.BytesIO(body), len(body))},
+            {"Bucket": BUCKET, "Key": pack_key, "Range": member.byte_range},
+        )
+
+        out = tmp_path / "out"
+        results = PackService(service).download_directory("docs", out)
+
+        assert [r.s3_key for r in results] == ["docs/sub/x.txt"]
+        assert results[0].success, results[0].error_message
+        assert (out / "sub" / "x.txt").read_bytes() == b"hello"
+        assert not (out / ".packs").exists()
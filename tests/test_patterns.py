@@ -0,0 +1,85 @@
+"""Tests for key pattern matching."""
+
+import pytest
+
+from cloud_storage_syncer.core.patterns import (
+    compile_pattern,
+    listing_prefix,
+    regex_literal_prefix,
+)
+
+
+class TestCompilePattern:
+    """Test compile_pattern."""
+
+    def test_auto_substring(self):
+        """Test plain text keeps the case-insensitive substring behavior."""
+        matcher = compile_pattern("Report")
+        assert matcher.mode == "substring"
+        assert matcher.prefix == ""
+        assert matcher.matches("docs/annual-report.pdf")
+
+    def test_auto_glob(self):
+        """Test wildcards select glob matching over the whole key."""
+        matcher = compile_pattern("photos/2024/*.jpg")
+        assert matcher.mode == "glob"
+        assert matcher.prefix == "photos/2024/"
+        assert matcher.matches("photos/2024/a.jpg")
+        assert matcher.matches("photos/2024/trip/b.jpg")
+        assert not matcher.matches("photos/2024/a.jpg.bak")
+        assert not matcher.matches("photos/2023/a.jpg")
+
+    def test_leading_wildcard_has_no_prefix(self):
+        """Test a pattern starting with a wildcard lists everything."""
+        matcher = compile_pattern("*.jpg")
+        assert matcher.prefix == ""
+        assert matcher.matches("deep/dir/x.jpg")
+
+    def test_regex(self):
+        """Test regex search and prefix extraction."""
+        matcher = compile_pattern(r"^logs/app-\d+\.gz$", mode="regex")
+        assert matcher.prefix == "logs/app-"
+        assert matcher.matches("logs/app-12.gz")
+        assert not matcher.matches("logs/app-x.gz")
+
+    def test_ignore_case_disables_prefix(self):
+        """Test case-insensitive patterns cannot be pushed down."""
+        matcher = compile_pattern("Photos/*.JPG", ignore_case=True)
+        assert matcher.prefix == ""
+        assert matcher.matches("photos/a.jpg")
+
+    def test_invalid(self):
+        """Test invalid modes and regexes are rejected."""
+        with pytest.raises(ValueError):
+            compile_pattern("x", mode="fuzzy")
+        with pytest.raises(ValueError):
+            compile_pattern("(", mode="regex")
+
+
+class TestLiteralPrefix:
+    """Test literal prefix extraction."""
+
+    @pytest.mark.parametrize(
+        ("pattern", "prefix"),
+        [
+            (r"^a/b\.c", "a/b.c"),
+            ("^abc?", "ab"),
+            ("^abc*", "ab"),
+            ("^abc+", "abc"),
+            ("^ab{0,2}", "a"),
+            ("^a|^b", ""),
+            ("abc", ""),
+            (r"\Adata/\w+", "data/"),
+        ],
+    )
+    def test_regex_literal_prefix(self, pattern, prefix):
+        """Test only guaranteed leading literals are extracted."""
+        assert regex_literal_prefix(pattern) == prefix
+
+    def test_listing_prefix(self):
+        """Test the narrower of scope and pattern prefix is listed."""
+        matcher = compile_pattern("photos/2024/*.jpg")
+        assert listing_prefix(matcher, "") == "photos/2024/"
+        assert listing_prefix(matcher, "photos/") == "photos/2024/"
+        assert listing_prefix(matcher, "photos/2024/trip/") == "photos/2024/trip/"
+        assert listing_prefix(matcher, "videos/") is None
@@ -0,0 +1,143 @@
+"""Tests for dry-run transfer plans and throughput estimates."""
+
+import json
+
+from typer.testing import CliRunner
+
+from cloud_storage_syncer.cli.main import app
+from cloud_storage_syncer.models import DownloadRequest, TransferPlan
+from cloud_storage_syncer.services.plan_service import PlanService
+from cloud_storage_syncer.services.throughput_history import ThroughputHistory
+
+from .conftest import CONFIG, listed, stub_list
+
+MiB = 1024 * 1024
+
+
+class TestPlanService:
+    """Test plans count objects, bytes and requests like the real runs."""
+
+    def test_upload(self, tmp_path, service):
+        """Test small files are single PUTs and large ones multipart."""
+        (tmp_path / "small.txt").write_bytes(b"x" * 100)
+        (tmp_path / "sub").mkdir()
+        with open(tmp_path / "sub" / "big.bin", "wb") as f:
+            f.truncate(20 * MiB)
+
+        flat = PlanService(service).plan_upload(tmp_path)
+        assert (flat.objects, flat.total_bytes) == (1, 100)
+
+        plan = PlanService(service).plan_upload(tmp_path, recursive=True)
+        assert plan.objects == 2
+        assert plan.total_bytes == 100 + 20 * MiB
+        assert plan.requests == {
+            "ListObjectsV2": 1,
+            "PutObject": 1,
+            "CreateMultipartUpload": 1,
+            "UploadPart": 3,
+            "CompleteMultipartUpload": 1,
+        }
+
+    def test_download_directory(self, tmp_path, service):
+        """Test archived and existing files are skipped with their reasons."""
+        (tmp_path / "have.txt").write_text("local")
+        stub_list(
+            service,
+            "docs/",
+            [
+                listed("docs/a.txt", 10),
+                listed("docs/big.bin", 16 * MiB),
+                listed("docs/have.txt", 5),
+                listed("docs/cold.txt", 7, StorageClass="GLACIER"),
+            ],
+            restore_status=True,
+        )
+
+        plan = PlanService(service).plan_download_directory("docs", tmp_path)
+        assert plan.objects == 2
+        assert plan.total_bytes == 10 + 16 * MiB
+        assert [key for key, _ in plan.skipped] == ["docs/have.txt", "docs/cold.txt"]
+        assert plan.requests == {
+            "HeadObject": 1 + 2 * 2 + 1,
+            "ListObjectsV2": 2,
+            "GetObject": 1 + 2,
+        }
+
+    def test_download_missing_file(self, tmp_path, service):
+        """Test a vanished object is reported as skipped."""
+        service.stubber.add_client_error("head_object", "404", http_status_code=404)
+
+        request = DownloadRequest(s3_key="gone.txt", output_path=str(tmp_path / "g"))
+        plan = PlanService(service).plan_download_file(request)
+        assert plan.objects == 0
+        assert plan.skipped == [("gone.txt", "Not found")]
+
+    def test_delete_directory(self, service):
+        """Test each object costs a HEAD and a DELETE."""
+        stub_list(service, "tmp/", ["tmp/a", "tmp/b", "tmp/c"])
+
+        plan = PlanService(service).plan_delete("tmp/", directory=True)
+        assert plan.objects == 3
+        assert plan.requests == {"ListObjectsV2": 2, "HeadObject": 3, "DeleteObject": 3}
+
+
+class TestThroughputHistory:
+    """Test time estimates from recorded runs."""
+
+    def test_estimate_from_recorded_runs(self, tmp_path):
+        """Test the slower of the object and byte rates bounds the estimate."""
+        history = ThroughputHistory(tmp_path / "throughput.json")
+        assert history.estimate(TransferPlan("upload", objects=10)) is None
+
+        history.record("upload", 100, 100 * MiB, 10.0)
+        history.record("upload", 0, 0, 5.0)  # Nothing done: not a sample
+        assert history.rates("upload") == (10.0, 10 * MiB)
+
+        # 50 objects at 10/s beat 10 MiB at 10 MiB/s
+        assert history.estimate(TransferPlan("upload", 50, 10 * MiB)) == 5.0
+        # 1 GiB at 10 MiB/s dominates one object
+        assert history.estimate(TransferPlan("upload", 1, 1024 * MiB)) == 102.4
+        # A bandwidth limit below the measured rate slows the run further
+        plan = TransferPlan("upload", 1, 100 * MiB)
+        assert history.estimate(plan, max_bandwidth=MiB) == 100.0
+        assert history.estimate(TransferPlan("download", objects=1)) is None
+
+    def test_keeps_recent_samples(self, tmp_path):
+        """Test old runs drop out and a corrupt file is treated as empty."""
+        path = tmp_path / "throughput.json"
+        history = ThroughputHistory(path)
+        for _ in range(25):
+            history.record("delete", 10, 0, 1.0)
+        assert len(json.loads(path.read_text())["delete"]) == 20
+
+        path.write_text("{not json")
+        assert history.rates("delete") is None
+
+
+class TestDryRunCommand:
+    """Test the CLI prints a plan without touching S3."""
+
+    def test_upload_dry_run(self, tmp_path, monkeypatch):
+        """Test upload --dry-run reports files, bytes and requests."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps(CONFIG.__dict__))
+        (tmp_path / "data").mkdir()
+        (tmp_path / "data" / "a.txt").write_bytes(b"x" * 2048)
+
+        result = CliRunner().invoke(
+            app,
+            [
+                "upload",
+                "file",
+                str(tmp_path / "data"),
+                "--dry-run",
+                "--config-path",
+                str(config_path),
+            ],
+        )
+        assert result.exit_code == 0, result.stdout
+        assert "Objects: 1" in result.stdout
+        assert "2.00 KB" in result.stdout
+        assert "PutObject: 1" in result.stdout
+        assert "unknown until a real upload has run" in result.stdout
@@ -0,0 +1,165 @@
+"""Tests for previews and the on-disk LRU cache."""
+
+import gzip
+import io
+import json
+import os
+
+import pytest
+
+from cloud_storage_syncer.core.preview import (
+    IMAGE,
+    TABLE,
+    TEXT,
+    preview_kind,
+    table_preview,
+    text_preview,
+)
+from cloud_storage_syncer.services.disk_cache import DiskLRUCache
+from cloud_storage_syncer.services.preview_service import PreviewService
+
+
+class FakeS3Service:
+    """Stand-in for S3Service serving bodies and HEAD info."""
+
+    def __init__(self, objects):
+        # key -> (body, etag, content encoding)
+        self.objects = objects
+        self.reads = []
+
+    def get_object_info(self, s3_key):
+        if s3_key not in self.objects:
+            return None
+        body, etag, encoding = self.objects[s3_key]
+        return {"size": len(body), "etag": etag, "content_encoding": encoding}
+
+    def read_bytes(self, s3_key, length=None, etag=None):
+        self.reads.append(s3_key)
+        body, current_etag, _ = self.objects[s3_key]
+        assert etag == current_etag
+        return body if length is None else body[:length]
+
+
+class TestDiskLRUCache:
+    """Test the size-bounded disk cache."""
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test reads refresh recency and the oldest entry goes first."""
+        cache = DiskLRUCache(tmp_path, max_bytes=10)
+        cache.put("a", b"aaaa")
+        cache.put("b", b"bbbb")
+        assert cache.get("a").read_bytes() == b"aaaa"
+
+        cache.put("c", b"cccc")
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.total_bytes == 8
+
+    def test_survives_restart(self, tmp_path):
+        """Test entries and their order are rebuilt from the directory."""
+        cache = DiskLRUCache(tmp_path, max_bytes=100)
+        cache.put("old", b"1")
+        cache.put("new", b"2")
+        os.utime(cache.path_for("old"), ns=(1, 1))
+        (tmp_path / ".tmp-partial").write_bytes(b"junk")
+
+        reopened = DiskLRUCache(tmp_path, max_bytes=1)
+
+        assert len(reopened) == 1
+        assert reopened.get("new").read_bytes() == b"2"
+        assert not (tmp_path / ".tmp-partial").exists()
+
+    def test_limit_is_shared_between_processes(self, tmp_path):
+        """Test entries added through another instance count towards the limit."""
+        first = DiskLRUCache(tmp_path, max_bytes=10)
+        second = DiskLRUCache(tmp_path, max_bytes=10)
+        first.put("a", b"aaaa")
+        os.utime(first.path_for("a"), ns=(1, 1))
+        second.put("b", b"bbbb")
+
+        assert first.get("b").read_bytes() == b"bbbb"
+
+        first.put("c", b"cccc")
+
+        assert not first.path_for("a").exists()
+        assert second.get("a") is None
+        assert first.total_bytes == 8
+
+
+class TestPreviews:
+    """Test preview builders."""
+
+    def test_kinds(self):
+        """Test preview kinds are chosen by suffix."""
+        assert preview_kind("photos/a.JPG") == IMAGE
+        assert preview_kind("data/x.tsv") == TABLE
+        assert preview_kind("logs/app.log") == TEXT
+        assert preview_kind("bin/tool.exe") is None
+
+    def test_text_drops_cut_off_line(self):
+        """Test a partial last line of a truncated prefix is not shown."""
+        assert text_preview(b"one\ntwo\nthr", lines=10, complete=False) == b"one\ntwo"
+        assert text_preview(b"one\ntwo\nthr", lines=2, complete=True) == b"one\ntwo"
+
+    def test_table(self):
+        """Test the header and rows are parsed with quoting."""
+        preview = json.loads(
+            table_preview(b'id,name\n1,"a, b"\n2,c\n3,d\n', 2, ",", complete=True)
+        )
+        assert preview == {
+            "header": ["id", "name"],
+            "rows": [["1", "a, b"], ["2", "c"]],
+            "truncated": True,
+        }
+
+
+class TestPreviewService:
+    """Test preview generation and caching by ETag."""
+
+    def test_repeat_views_hit_the_cache(self, tmp_path):
+        """Test a second view reads nothing and a new ETag regenerates."""
+        s3_service = FakeS3Service({"logs/a.log": (b"x\ny\n", '"v1"', None)})
+        service = PreviewService(s3_service, DiskLRUCache(tmp_path, 1024))
+
+        assert service.get_preview("logs/a.log") == (b"x\ny", "text/plain; charset=utf-8")
+        assert service.get_preview("logs/a.log")[0] == b"x\ny"
+        assert s3_service.reads == ["logs/a.log"]
+
+        s3_service.objects["logs/a.log"] = (b"z\n", '"v2"', None)
+        assert service.get_preview("logs/a.log")[0] == b"z"
+        assert len(s3_service.reads) == 2
+
+    def test_compressed_text(self, tmp_path):
+        """Test gzip-encoded objects are previewed decompressed."""
+        body = gzip.compress(b"a,b\n1,2\n")
+        s3_service = FakeS3Service({"t.csv": (body, '"e"', "gzip")})
+        service = PreviewService(s3_service, DiskLRUCache(tmp_path, 1024))
+
+        content, media_type = service.get_preview("t.csv")
+
+        assert media_type == "application/json"
+        assert json.loads(content)["rows"] == [["1", "2"]]
+
+    def test_missing_and_unsupported(self, tmp_path):
+        """Test missing keys and unknown types raise distinct errors."""
+        service = PreviewService(FakeS3Service({}), DiskLRUCache(tmp_path, 1024))
+        with pytest.raises(FileNotFoundError):
+            service.get_preview("nope.txt")
+        with pytest.raises(ValueError):
+            service.get_preview("tool.exe")
+
+    def test_image_thumbnail(self, tmp_path):
+        """Test images are downsized to JPEG thumbnails."""
+        image_module = pytest.importorskip("PIL.Image")
+        source = io.BytesIO()
+        image_module.new("RGBA", (800, 400), (255, 0, 0, 128)).save(source, "PNG")
+        s3_service = FakeS3Service({"a.png": (source.getvalue(), '"e"', None)})
+        service = PreviewService(s3_service, DiskLRUCache(tmp_path, 1 << 20))
+
+        content, media_type = service.get_preview("a.png", size=100)
+
+        assert media_type == "image/jpeg"
+        with image_module.open(io.BytesIO(content)) as thumbnail:
+            assert thumbnail.size == (100, 50)
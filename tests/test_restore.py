@@ -0,0 +1,132 @@
+"""Tests for bulk Glacier restores."""
+
+import pytest
+
+from cloud_storage_syncer.models import DownloadResult, KeyKind, ObjectEntry
+from cloud_storage_syncer.models.storage import RESTORE_DONE, RESTORE_ONGOING
+from cloud_storage_syncer.services.restore_service import RestoreService
+from cloud_storage_syncer.services.s3_service import RESTORE_REQUESTED
+
+
+class FakeS3Service:
+    """Stand-in for S3Service whose restores finish after some listings."""
+
+    def __init__(self, objects, polls_to_restore=1):
+        # key -> [storage class, restore status]
+        self.objects = objects
+        self.polls_to_restore = polls_to_restore
+        self.restore_requests = []
+        self.listings = 0
+        self.downloaded = []
+        self._started = {}
+
+    def resolve_key(self, s3_key):
+        if s3_key in self.objects:
+            return KeyKind.OBJECT
+        if any(key.startswith(s3_key.rstrip("/") + "/") for key in self.objects):
+            return KeyKind.PREFIX
+        return KeyKind.NONE
+
+    def iter_objects(self, prefix="", max_keys=None, restore_status=False):
+        self.listings += 1
+        for key, started in self._started.items():
+            if self.listings - started >= self.polls_to_restore:
+                self.objects[key][1] = RESTORE_DONE
+        keys = sorted(key for key in self.objects if key.startswith(prefix))
+        for key in keys[:max_keys]:
+            storage_class, status = self.objects[key]
+            yield ObjectEntry(key, 1, 0, '"e"', storage_class, restore_status=status)
+
+    def restore_object(self, s3_key, days, tier):
+        self.restore_requests.append((s3_key, days, tier))
+        if s3_key == "photos/broken.raw":
+            raise RuntimeError("AccessDenied")
+        self.objects[s3_key][1] = RESTORE_ONGOING
+        self._started[s3_key] = self.listings
+        return RESTORE_REQUESTED
+
+    def download_file(self, request):
+        self.downloaded.append(request.s3_key)
+        return DownloadResult.success_result(request.s3_key, request.output_path, 1)
+
+
+@pytest.fixture
+def s3_service():
+    """Fake bucket with a mix of archived, restoring and standard objects."""
+    return FakeS3Service(
+        {
+            "photos/a.raw": ["GLACIER", None],
+            "photos/b.raw": ["DEEP_ARCHIVE", RESTORE_ONGOING],
+            "photos/c.raw": ["GLACIER", RESTORE_DONE],
+            "photos/index.txt": ["STANDARD", None],
+        }
+    )
+
+
+class TestRestoreService:
+    """Test restore requests, polling and downloads."""
+
+    def test_requests_only_unrestored_archives(self, s3_service):
+        """Test restores are requested once, with the chosen tier and days."""
+        result = RestoreService(s3_service).restore("photos", days=3, tier="Bulk")
+
+        assert s3_service.restore_requests == [("photos/a.raw", 3, "Bulk")]
+        assert result.requested == ["photos/a.raw"]
+        assert result.in_progress == ["photos/b.raw"]
+        assert result.restored == ["photos/c.raw"]
+        assert result.pending == ["photos/a.raw", "photos/b.raw"]
+        assert s3_service.downloaded == []
+        assert result.ok
+
+    def test_downloads_as_objects_become_available(self, s3_service, tmp_path):
+        """Test readable objects download at once and the rest after polling."""
+        s3_service.objects["photos/b.raw"][1] = None
+        s3_service.polls_to_restore = 2
+        events = []
+
+        result = RestoreService(s3_service, poll_interval=0).restore(
+            "photos",
+            download_to=tmp_path,
+            on_event=lambda event, key, detail: events.append((event, key)),
+        )
+
+        assert result.pending == []
+        assert sorted(result.restored) == [
+            "photos/a.raw",
+            "photos/b.raw",
+            "photos/c.raw",
+        ]
+        assert sorted(s3_service.downloaded) == [
+            "photos/a.raw",
+            "photos/b.raw",
+            "photos/c.raw",
+            "photos/index.txt",
+        ]
+        # Already readable objects are downloaded before any status check
+        assert s3_service.downloaded.index("photos/index.txt") < 2
+        assert ("restored", "photos/a.raw") in events
+        assert {r.local_path for r in result.downloads} >= {str(tmp_path / "a.raw")}
+        # One listing to find objects, then one per poll for both keys
+        assert s3_service.listings == 3
+
+    def test_failures_and_timeout(self, s3_service):
+        """Test failed requests are reported and waiting gives up."""
+        s3_service.objects["photos/broken.raw"] = ["GLACIER", None]
+        s3_service.polls_to_restore = 1000
+
+        result = RestoreService(s3_service, poll_interval=0).restore(
+            "photos", wait=True, timeout=0.05
+        )
+
+        assert result.failed == [("photos/broken.raw", "AccessDenied")]
+        assert not result.ok
+        assert result.pending == ["photos/a.raw", "photos/b.raw"]
+
+    def test_invalid_arguments(self, s3_service):
+        """Test unknown tiers and missing keys are rejected before requests."""
+        service = RestoreService(s3_service)
+        with pytest.raises(ValueError):
+            service.restore("photos", tier="Instant")
+        with pytest.raises(FileNotFoundError):
+            service.restore("videos")
+        assert s3_service.restore_requests == []
@@ -0,0 +1,514 @@
+"""Tests for S3Service using botocore's Stubber."""
+
+import io
+
+import pytest
+from botocore.awsrequest import AWSResponse
+from botocore.response import StreamingBody
+from botocore.stub import Stubber
+
+from cloud_storage_syncer.models import (
+    DownloadRequest,
+    KeyKind,
+    ObjectEntry,
+    S3StorageClass,
+)
+from cloud_storage_syncer.services import S3Service
+from cloud_storage_syncer.services import s3_service as s3_service_module
+
+from .conftest import BUCKET, CONFIG, MODIFIED, listed, stub_head, stub_list
+
+
+class RawBody(io.BytesIO):
+    """Raw HTTP body for responses returned from a before-send handler."""
+
+    def stream(self, **kwargs):
+        """Yield the whole body at once."""
+        yield self.getvalue()
+
+
+def stub_children(service, prefix, has_children):
+    """Queue a delimited single-key LIST response."""
+    response = {"KeyCount": 0}
+    if has_children:
+        response = {"KeyCount": 1, "CommonPrefixes": [{"Prefix": prefix + "x/"}]}
+    service.stubber.add_response(
+        "list_objects_v2",
+        response,
+        {"Bucket": BUCKET, "Prefix": prefix, "Delimiter": "/", "MaxKeys": 1},
+    )
+
+
+class TestResolveKey:
+    """Test S3Service.resolve_key."""
+
+    @pytest.mark.parametrize(
+        ("found", "has_children", "expected"),
+        [
+            (True, False, KeyKind.OBJECT),
+            (False, True, KeyKind.PREFIX),
+            (True, True, KeyKind.BOTH),
+            (False, False, KeyKind.NONE),
+        ],
+    )
+    def test_resolution(self, service, found, has_children, expected):
+        """Test one HEAD and one single-key LIST decide the kind."""
+        stub_head(service, "photos", found)
+        stub_children(service, "photos/", has_children)
+        assert service.resolve_key("photos") == expected
+
+    def test_trailing_slash_skips_head(self, service):
+        """Test a key ending in "/" is only checked as a prefix."""
+        stub_children(service, "photos/", True)
+        assert service.resolve_key("photos/") == KeyKind.PREFIX
+
+
+class TestIterObjects:
+    """Test S3Service.iter_objects."""
+
+    def test_follows_continuation_tokens(self, service):
+        """Test listing continues past the first page."""
+        service.stubber.add_response(
+            "list_objects_v2",
+            {
+                "IsTruncated": True,
+                "NextContinuationToken": "token",
+                "Contents": [listed("a/1", 1)],
+            },
+            {"Bucket": BUCKET, "Prefix": "a/", "MaxKeys": 1000},
+        )
+        service.stubber.add_response(
+            "list_objects_v2",
+            {"IsTruncated": False, "Contents": [listed("a/2", 2)]},
+            {
+                "Bucket": BUCKET,
+                "Prefix": "a/",
+                "MaxKeys": 1000,
+                "ContinuationToken": "token",
+            },
+        )
+        keys = [obj.key for obj in service.iter_objects(prefix="a/")]
+        assert keys == ["a/1", "a/2"]
+
+
+class TestGetObjectAttributes:
+    """Test checksum lookups without object bodies."""
+
+    def test_parses_checksums_and_parts(self, service):
+        """Test checksums are keyed by algorithm and the ETag is quoted."""
+        service.stubber.add_response(
+            "get_object_attributes",
+            {
+                "ETag": "abc-2",
+                "ObjectSize": 10,
+                "Checksum": {"ChecksumSHA256": "c2hh", "ChecksumType": "COMPOSITE"},
+                "ObjectParts": {"TotalPartsCount": 2, "Parts": [{"Size": 8}]},
+            },
+            {
+                "Bucket": BUCKET,
+                "Key": "k",
+                "ObjectAttributes": ["ETag", "Checksum", "ObjectParts", "ObjectSize"],
+                "MaxParts": 1,
+            },
+        )
+
+        assert service.get_object_attributes("k") == {
+            "size": 10,
+            "etag": '"abc-2"',
+            "checksums": {"SHA256": "c2hh"},
+            "checksum_type": "COMPOSITE",
+            "parts": 2,
+            "part_size": 8,
+        }
+
+    def test_missing_object(self, service):
+        """Test a missing key gives None."""
+        service.stubber.add_client_error(
+            "get_object_attributes", "NoSuchKey", http_status_code=404
+        )
+        assert service.get_object_attributes("k") is None
+
+
+class TestObjectEntry:
+    """Test the compact listing entry."""
+
+    def test_from_s3_keeps_listing_shape(self):
+        """Test entries round-trip to the dictionary shape the web API returns."""
+        entry = ObjectEntry.from_s3(listed("a/1", 7, StorageClass="GLACIER"))
+
+        assert entry.to_dict() == {
+            "key": "a/1",
+            "size": 7,
+            "last_modified": MODIFIED,
+            "etag": '"e"',
+            "storage_class": "GLACIER",
+        }
+
+    def test_storage_class_is_interned(self):
+        """Test equal storage classes share one string object."""
+        first = ObjectEntry("a", 1, 0, '"e"', "".join(["STAND", "ARD"]))
+        second = ObjectEntry("b", 1, 0, '"e"', "".join(["STA", "NDARD"]))
+
+        assert first.storage_class is second.storage_class
+        assert not hasattr(first, "__dict__")
+
+
+class TestCopyObject:
+    """Test server-side copies."""
+
+    def test_small_copy_uses_copy_object(self, service):
+        """Test sources up to 5 GiB are copied with a single CopyObject."""
+        service.stubber.add_response(
+            "copy_object",
+            {},
+            {
+                "Bucket": BUCKET,
+                "Key": "dst",
+                "CopySource": {"Bucket": BUCKET, "Key": "src"},
+                "StorageClass": "STANDARD",
+                "MetadataDirective": "COPY",
+            },
+        )
+
+        result = service.copy_object("src", "dst", source_info={"size": 10})
+
+        assert result.success is True
+        assert result.copied_from == "src"
+
+    def test_large_copy_uses_part_copies(self, service, monkeypatch):
+        """Test large sources are copied in ranged parts and completed."""
+        monkeypatch.setattr(s3_service_module, "MAX_COPY_OBJECT_SIZE", 8)
+        monkeypatch.setattr(s3_service_module, "COPY_PART_SIZE", 6)
+        monkeypatch.setattr(s3_service_module, "COPY_WORKERS", 1)
+        service.stubber.add_response(
+            "create_multipart_upload",
+            {"UploadId": "u1"},
+            {
+                "Bucket": BUCKET,
+                "Key": "dst",
+                "StorageClass": "GLACIER_IR",
+                "Metadata": {"sha256": "abc"},
+                "ContentType": "text/plain",
+                "ContentEncoding": "zstd",
+            },
+        )
+        for number, byte_range in ((1, "bytes=0-5"), (2, "bytes=6-9")):
+            service.stubber.add_response(
+                "upload_part_copy",
+                {"CopyPartResult": {"ETag": f'"p{number}"'}},
+                {
+                    "Bucket": BUCKET,
+                    "Key": "dst",
+                    "UploadId": "u1",
+                    "PartNumber": number,
+                    "CopySource": {"Bucket": BUCKET, "Key": "src"},
+                    "CopySourceRange": byte_range,
+                },
+            )
+        service.stubber.add_response(
+            "complete_multipart_upload",
+            {},
+            {
+                "Bucket": BUCKET,
+                "Key": "dst",
+                "UploadId": "u1",
+                "MultipartUpload": {
+                    "Parts": [
+                        {"PartNumber": 1, "ETag": '"p1"'},
+                        {"PartNumber": 2, "ETag": '"p2"'},
+                    ]
+                },
+            },
+        )
+
+        result = service.copy_object(
+            "src",
+            "dst",
+            S3StorageClass.GLACIER_IR,
+            source_info={
+                "size": 10,
+                "metadata": {"sha256": "abc"},
+                "content_type": "text/plain",
+                "content_encoding": "zstd",
+                "cache_control": None,
+            },
+        )
+
+        assert result.success is True
+        assert result.storage_class == "GLACIER_IR"
+
+    def test_failed_part_copy_aborts_upload(self, service, monkeypatch):
+        """Test a failed part copy aborts the upload instead of leaving parts."""
+        monkeypatch.setattr(s3_service_module, "MAX_COPY_OBJECT_SIZE", 8)
+        monkeypatch.setattr(s3_service_module, "COPY_PART_SIZE", 10)
+        service.stubber.add_response(
+            "create_multipart_upload",
+            {"UploadId": "u1"},
+            {"Bucket": BUCKET, "Key": "dst", "StorageClass": "STANDARD", "Metadata": {}},
+        )
+        service.stubber.add_client_error("upload_part_copy", "AccessDenied")
+        service.stubber.add_response(
+            "abort_multipart_upload",
+            {},
+            {"Bucket": BUCKET, "Key": "dst", "UploadId": "u1"},
+        )
+
+        result = service.copy_object(
+            "src", "dst", source_info={"size": 10, "metadata": {}}
+        )
+
+        assert result.success is False
+        assert "AccessDenied" in result.error_message
+
+
+class TestMoveDirectory:
+    """Test prefix-wide server-side moves."""
+
+    def stub_copy(self, service, source_key, dest_key):
+        """Queue a CopyObject response."""
+        service.stubber.add_response(
+            "copy_object",
+            {},
+            {
+                "Bucket": BUCKET,
+                "Key": dest_key,
+                "CopySource": {"Bucket": BUCKET, "Key": source_key},
+                "StorageClass": "STANDARD",
+                "MetadataDirective": "COPY",
+            },
+        )
+
+    def test_copies_then_batch_deletes(self, service):
+        """Test every object is copied and sources go in one DeleteObjects."""
+        stub_list(service, "a/", [listed("a/1", 1), listed("a/x/2", 2)])
+        self.stub_copy(service, "a/1", "b/1")
+        self.stub_copy(service, "a/x/2", "b/x/2")
+        service.stubber.add_response(
+            "delete_objects",
+            {"Errors": [{"Key": "a/x/2", "Code": "AccessDenied", "Message": "no"}]},
+            {
+                "Bucket": BUCKET,
+                "Delete": {
+                    "Objects": [{"Key": "a/1"}, {"Key": "a/x/2"}],
+                    "Quiet": True,
+                },
+            },
+        )
+
+        results = service.move_directory("a", "b", max_workers=1)
+
+        assert [(r.source_key, r.dest_key, r.success) for r in results] == [
+            ("a/1", "b/1", True),
+            ("a/x/2", "b/x/2", False),
+        ]
+        assert "AccessDenied" in results[1].error_message
+
+    def test_rejects_destination_inside_source(self, service):
+        """Test copying a prefix into itself is refused before any request."""
+        with pytest.raises(ValueError):
+            service.copy_directory("a", "a/backup")
+
+    def test_rejects_move_onto_itself(self, service):
+        """Test a move to the same key or prefix makes no request at all."""
+        result = service.move_file("a.txt", "a.txt", S3StorageClass.STANDARD_IA)
+        assert not result.success
+        assert "same key" in result.error_message
+
+        with pytest.raises(ValueError):
+            service.move_directory("a", "a/")
+
+
+class TestPresign:
+    """Test presigned downloads and direct multipart uploads."""
+
+    def test_download_url(self, service):
+        """Test download URLs are signed locally and name the file."""
+        url = service.presign_download("docs/ré port.pdf", expires_in=60)
+
+        assert url.startswith(f"https://{BUCKET}.s3.amazonaws.com/docs/")
+        assert "X-Amz-Expires=60" in url
+        assert "response-content-disposition=attachment" in url
+
+        with pytest.raises(ValueError):
+            service.presign_download("a", expires_in=8 * 24 * 3600)
+
+    def test_upload_parts_match_transfer_part_size(self, service):
+        """Test one URL is issued per 8 MiB part and completion sends the ETags."""
+        service.stubber.add_response(
+            "create_multipart_upload",
+            {"UploadId": "u1"},
+            {"Bucket": BUCKET, "Key": "big.bin", "StorageClass": "STANDARD_IA"},
+        )
+        service.stubber.add_response(
+            "complete_multipart_upload",
+            {},
+            {
+                "Bucket": BUCKET,
+                "Key": "big.bin",
+                "UploadId": "u1",
+                "MultipartUpload": {
+                    "Parts": [
+                        {"PartNumber": 1, "ETag": '"p1"'},
+                        {"PartNumber": 2, "ETag": '"p2"'},
+                        {"PartNumber": 3, "ETag": '"p3"'},
+                    ]
+                },
+            },
+        )
+
+        upload = service.presign_upload(
+            "big.bin", 20 * 1024**2, S3StorageClass.STANDARD_IA
+        )
+
+        assert upload["upload_id"] == "u1"
+        assert upload["part_size"] == 8 * 1024**2
+        assert [part["part_number"] for part in upload["parts"]] == [1, 2, 3]
+        assert "partNumber=3" in upload["parts"][2]["url"]
+        assert "uploadId=u1" in upload["parts"][2]["url"]
+
+        result = service.complete_presigned_upload(
+            "big.bin", "u1", {3: '"p3"', 1: '"p1"', 2: '"p2"'}
+        )
+        assert result.success is True
+
+    def test_abort_tolerates_finished_upload(self, service):
+        """Test aborting an upload S3 no longer knows about still succeeds."""
+        service.stubber.add_client_error("abort_multipart_upload", "NoSuchUpload")
+
+        assert service.abort_presigned_upload("big.bin", "u1") is True
+
+
+class TestRestore:
+    """Test restore requests and archive-aware listings and downloads."""
+
+    def stub_restore(self, service, status):
+        """Queue a RestoreObject response with the given HTTP status."""
+        service.stubber.add_response(
+            "restore_object",
+            {"ResponseMetadata": {"HTTPStatusCode": status}},
+            {
+                "Bucket": BUCKET,
+                "Key": "cold",
+                "RestoreRequest": {
+                    "Days": 2,
+                    "GlacierJobParameters": {"Tier": "Bulk"},
+                },
+            },
+        )
+
+    def test_restore_outcomes(self, service):
+        """Test accepted, already restored and in-progress restores."""
+        self.stub_restore(service, 202)
+        self.stub_restore(service, 200)
+        service.stubber.add_client_error(
+            "restore_object", "RestoreAlreadyInProgress", http_status_code=409
+        )
+
+        assert service.restore_object("cold", 2, "Bulk") == "requested"
+        assert service.restore_object("cold", 2, "Bulk") == "restored"
+        assert service.restore_object("cold", 2, "Bulk") == "ongoing"
+
+    def test_directory_download_skips_archived(self, service, tmp_path):
+        """Test archived objects fail without a HEAD or GET of their own."""
+        archived = listed("d/a", StorageClass="GLACIER")
+        restoring = listed(
+            "d/b",
+            StorageClass="DEEP_ARCHIVE",
+            RestoreStatus={"IsRestoreInProgress": True},
+        )
+        stub_list(service, "d/", [archived, restoring], restore_status=True)
+
+        results = service.download_directory("d", tmp_path)
+
+        assert [r.success for r in results] == [False, False]
+        assert "Archived in GLACIER" in results[0].error_message
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestDownloadFile:
+    """Test single-object downloads pinned to an ETag."""
+
+    @pytest.fixture
+    def transfer_stubber(self, service):
+        """Stubber for the client the transfer manager uses."""
+        with Stubber(service.transfer_client) as stubber:
+            yield stubber
+            stubber.assert_no_pending_responses()
+
+    def stub_head_etag(self, stubber, etag):
+        """Queue a HEAD response for the object with the given ETag."""
+        stubber.add_response(
+            "head_object",
+            {"ContentLength": 5, "ETag": etag, "LastModified": MODIFIED},
+            {"Bucket": BUCKET, "Key": "a.txt"},
+        )
+
+    def stub_transfer(self, stubber):
+        """Queue the HEAD and GET the transfer manager makes."""
+        self.stub_head_etag(stubber, '"e1"')
+        stubber.add_response(
+            "get_object",
+            {"Body": StreamingBody(io.BytesIO(b"hello"), 5), "ContentLength": 5},
+        )
+
+    def test_download_with_etag(self, service, transfer_stubber, tmp_path):
+        """Test an etag is checked by HEAD, not sent to the transfer manager."""
+        self.stub_head_etag(service.stubber, '"e1"')
+        self.stub_transfer(transfer_stubber)
+        self.stub_head_etag(service.stubber, '"e1"')
+
+        result = service.download_file(
+            DownloadRequest("a.txt", str(tmp_path / "a.txt"), etag='"e1"')
+        )
+
+        assert result.success, result.error_message
+        assert (tmp_path / "a.txt").read_bytes() == b"hello"
+
+    def test_changed_during_download(self, service, transfer_stubber, tmp_path):
+        """Test a version replaced mid-transfer fails and leaves no file."""
+        self.stub_head_etag(service.stubber, '"e1"')
+        self.stub_transfer(transfer_stubber)
+        self.stub_head_etag(service.stubber, '"e2"')
+
+        result = service.download_file(
+            DownloadRequest("a.txt", str(tmp_path / "a.txt"), etag='"e1"')
+        )
+
+        assert not result.success
+        assert "changed during download" in result.error_message
+        assert not (tmp_path / "a.txt").exists()
+
+
+class TestTransferRetries:
+    """Test failed part requests are retried without restarting the transfer."""
+
+    def test_part_failing_once_is_retried(self, tmp_path):
+        """Test one failed ranged GET is retried alone, not the whole download."""
+        data = bytes(range(256)) * (9 * 4096)  # 9 MiB, two 8 MiB-part GETs
+        requests = []  # Range of every GET
+
+        def respond(request, **kwargs):
+            """Serve the object, failing the second part's first attempt."""
+            if request.method == "HEAD":
+                headers = {"Content-Length": str(len(data)), "ETag": '"e"'}
+                return AWSResponse(request.url, 200, headers, RawBody(b""))
+            ranged = request.headers["Range"].decode()
+            requests.append(ranged)
+            start, end = ranged[len("bytes=") :].split("-")
+            start, end = int(start), int(end or len(data) - 1)
+            if start > 0 and requests.count(ranged) == 1:
+                return AWSResponse(request.url, 500, {}, RawBody(b""))
+            body = data[start : end + 1]
+            headers = {"Content-Length": str(len(body)), "ETag": '"e"'}
+            return AWSResponse(request.url, 206, headers, RawBody(body))
+
+        s3_service = S3Service(CONFIG)
+        s3_service.transfer_client.meta.events.register("before-send.s3", respond)
+
+        # Called without the limiter, so only botocore can retry the part
+        s3_service._transfer_download("big.bin", tmp_path / "big.bin")
+
+        assert (tmp_path / "big.bin").read_bytes() == data
+        # The first part once, the failed part twice
+        assert len(requests) == 3
+        assert len(set(requests)) == 2
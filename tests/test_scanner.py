@@ -0,0 +1,84 @@
+"""Tests for the parallel local tree scanner."""
+
+import os
+
+import pytest
+
+from cloud_storage_syncer.core import scanner
+from cloud_storage_syncer.core.scanner import scan_tree
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Small directory tree with nested, hidden and symlinked entries."""
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+    (tmp_path / "top.txt").write_bytes(b"top")
+    (tmp_path / "a" / "one.log").write_bytes(b"1")
+    (tmp_path / "a" / "b" / "two.txt").write_bytes(b"22")
+    (tmp_path / "node_modules" / "pkg" / "index.js").write_bytes(b"js")
+    os.symlink(tmp_path / "a", tmp_path / "link")
+    return tmp_path
+
+
+def relatives(files):
+    return sorted(f.relative for f in files)
+
+
+class TestScanTree:
+    """Test scandir-based tree scanning."""
+
+    def test_recursive_scan(self, tree):
+        """Test every regular file is found with its size and mtime."""
+        files = {f.relative: f for f in scan_tree(tree, max_workers=3)}
+
+        assert sorted(files) == [
+            "a/b/two.txt",
+            "a/one.log",
+            "node_modules/pkg/index.js",
+            "top.txt",
+        ]
+        two = files["a/b/two.txt"]
+        assert two.path == tree / "a" / "b" / "two.txt"
+        assert two.size == 2
+        assert two.mtime_ns == two.path.stat().st_mtime_ns
+
+    def test_non_recursive_scan(self, tree):
+        """Test only the root's files are found without recursion."""
+        assert relatives(scan_tree(tree, recursive=False)) == ["top.txt"]
+
+    def test_include_and_exclude(self, tree):
+        """Test include filters files and exclude prunes directories."""
+        assert relatives(scan_tree(tree, include=["*.txt"])) == [
+            "a/b/two.txt",
+            "top.txt",
+        ]
+        assert relatives(scan_tree(tree, exclude=["node_modules", "*.log"])) == [
+            "a/b/two.txt",
+            "top.txt",
+        ]
+
+    def test_many_batches(self, tmp_path, monkeypatch):
+        """Test large directories stream through several small batches."""
+        monkeypatch.setattr(scanner, "BATCH_SIZE", 3)
+        monkeypatch.setattr(scanner, "MAX_QUEUED_BATCHES", 1)
+        for index in range(20):
+            (tmp_path / f"f{index}").write_bytes(b"")
+
+        assert len(list(scan_tree(tmp_path, max_workers=2))) == 20
+
+    def test_consumer_can_stop_early(self, tmp_path, monkeypatch):
+        """Test abandoning the iterator stops the scanner threads."""
+        monkeypatch.setattr(scanner, "BATCH_SIZE", 1)
+        monkeypatch.setattr(scanner, "MAX_QUEUED_BATCHES", 1)
+        for index in range(10):
+            (tmp_path / f"d{index}").mkdir()
+            (tmp_path / f"d{index}" / "f").write_bytes(b"")
+
+        files = scan_tree(tmp_path, max_workers=4)
+        next(files)
+        files.close()
+
+    def test_missing_root(self, tmp_path):
+        """Test an unreadable root yields nothing instead of raising."""
+        assert list(scan_tree(tmp_path / "missing")) == []
@@ -0,0 +1,137 @@
+"""Tests for the shared cache backends and CachingS3Service."""
+
+from contextlib import ExitStack
+
+import pytest
+
+from cloud_storage_syncer.services import shared_cache as shared_cache_module
+from cloud_storage_syncer.services.caching_s3_service import CachingS3Service
+from cloud_storage_syncer.services.service_pool import S3ServicePool
+from cloud_storage_syncer.services.shared_cache import (
+    MemoryCache,
+    SQLiteCache,
+    open_shared_cache,
+)
+
+from .conftest import BUCKET, CONFIG, MODIFIED, stub_head, stub_list, stubbed
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    """Each local backend."""
+    if request.param == "memory":
+        return MemoryCache()
+    return SQLiteCache(tmp_path / "shared.db")
+
+
+@pytest.fixture
+def workers(tmp_path):
+    """Two caching services sharing one SQLite file, like two web workers."""
+    with ExitStack() as stack:
+        yield [
+            stack.enter_context(
+                stubbed(CachingS3Service(CONFIG, SQLiteCache(tmp_path / "shared.db")))
+            )
+            for _ in range(2)
+        ]
+
+
+class TestSharedCache:
+    """Test the backends behave alike."""
+
+    def test_values_expire(self, cache, monkeypatch):
+        """Test values are returned as stored until their TTL passes."""
+        now = [1000.0]
+        monkeypatch.setattr(shared_cache_module.time, "time", lambda: now[0])
+
+        cache.set("k", {"rows": [["a", 1]]}, ttl=10)
+        assert cache.get("k") == {"rows": [["a", 1]]}
+        now[0] += 11
+        assert cache.get("k") is None
+
+        cache.set("k", 1, ttl=10)
+        cache.delete("k")
+        assert cache.get("k") is None
+
+    def test_counters(self, cache):
+        """Test counters start at zero and count up."""
+        assert cache.counter("gen") == 0
+        assert cache.incr("gen") == 1
+        assert cache.incr("gen") == 2
+        assert cache.counter("gen") == 2
+
+    def test_sqlite_is_shared_between_connections(self, tmp_path):
+        """Test a second connection, as in another process, sees the writes."""
+        first = SQLiteCache(tmp_path / "shared.db")
+        second = SQLiteCache(tmp_path / "shared.db")
+
+        first.set("k", "v", ttl=60)
+        first.incr("gen")
+        assert second.get("k") == "v"
+        assert second.incr("gen") == 2
+
+    def test_open_from_url(self, tmp_path):
+        """Test backends are chosen by URL scheme."""
+        assert isinstance(open_shared_cache("memory://"), MemoryCache)
+        sqlite = open_shared_cache(f"sqlite://{tmp_path}/c.db")
+        assert isinstance(sqlite, SQLiteCache)
+        assert sqlite.db_path == tmp_path / "c.db"
+        with pytest.raises(ValueError):
+            open_shared_cache("ftp://host/cache")
+
+
+class TestCachingS3Service:
+    """Test workers share listings and metadata and writes invalidate them."""
+
+    def test_listing_is_fetched_once_across_workers(self, workers):
+        """Test the second worker reuses the first worker's listing."""
+        first, second = workers
+        stub_list(first, "docs/", ["docs/a.txt", "docs/b.txt"])
+
+        listed = first.list_objects("docs/")
+        assert [obj.key for obj in listed] == ["docs/a.txt", "docs/b.txt"]
+        assert second.list_objects("docs/") == listed
+
+    def test_delete_invalidates_listing_and_head(self, workers):
+        """Test a delete on one worker is visible on the other at once."""
+        first, second = workers
+        stub_list(first, "docs/", ["docs/a.txt", "docs/b.txt"])
+        stub_head(first, "docs/a.txt", size=3)
+        first.list_objects("docs/")
+        info = first.get_object_info("docs/a.txt")
+        assert second.get_object_info("docs/a.txt") == info
+        assert info["last_modified"] == MODIFIED
+
+        stub_head(second, "docs/a.txt", size=3)
+        second.stubber.add_response(
+            "delete_object", {}, {"Bucket": BUCKET, "Key": "docs/a.txt"}
+        )
+        assert second.delete_file("docs/a.txt").success
+
+        stub_list(first, "docs/", ["docs/b.txt"])
+        assert [obj.key for obj in first.list_objects("docs/")] == ["docs/b.txt"]
+        first.stubber.add_client_error("head_object", "404", http_status_code=404)
+        assert first.get_object_info("docs/a.txt") is None
+
+    def test_failed_listing_is_not_cached(self, workers):
+        """Test an error is retried on the next call instead of served empty."""
+        first, second = workers
+        first.stubber.add_client_error("list_objects_v2", "AccessDenied")
+        assert first.list_objects("docs/") == []
+
+        stub_list(second, "docs/", ["docs/a.txt"])
+        assert len(second.list_objects("docs/")) == 1
+
+
+class TestS3ServicePoolCache:
+    """Test the pool hands out caching services when given a cache."""
+
+    def test_pool_uses_cache(self):
+        """Test services are plain without a cache and caching with one."""
+        assert not isinstance(S3ServicePool().get("default", CONFIG), CachingS3Service)
+
+        cache = MemoryCache()
+        service = S3ServicePool(cache=cache, cache_ttl=5).get("default", CONFIG)
+        assert isinstance(service, CachingS3Service)
+        assert service.cache is cache
+        assert service.ttl == 5
@@ -0,0 +1,248 @@
+"""Tests for directory sync and change coalescing."""
+
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from cloud_storage_syncer.core.coalesce import (
+    DELETE,
+    DELETE_TREE,
+    MOVE,
+    UPLOAD,
+    Change,
+    ChangeCoalescer,
+)
+from cloud_storage_syncer.models import ObjectEntry
+from cloud_storage_syncer.services.hash_service import HashCache
+from cloud_storage_syncer.services.sync_service import SyncService, _WatchHandler
+
+from .conftest import MemoryS3Service, etag
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def hash_cache(tmp_path):
+    """Hash cache in a temporary database."""
+    cache = HashCache(tmp_path / "hashes.db")
+    yield cache
+    cache.close()
+
+
+class TestChangeCoalescer:
+    """Test debouncing and coalescing of file events."""
+
+    def test_bursts_collapse_after_debounce(self):
+        """Test repeated writes become one upload once the file is quiet."""
+        clock = FakeClock()
+        coalescer = ChangeCoalescer(debounce=1.0, clock=clock)
+        for _ in range(5):
+            coalescer.modified(Path("a"))
+            clock.now += 0.5
+
+        assert coalescer.drain() == []
+        clock.now += 1.0
+        assert coalescer.drain() == [Change(UPLOAD, Path("a"))]
+        assert len(coalescer) == 0
+
+    def test_rename_of_synced_file_is_a_move(self):
+        """Test renames chain into a single server-side move."""
+        coalescer = ChangeCoalescer(debounce=0)
+        coalescer.moved(Path("a"), Path("b"))
+        coalescer.moved(Path("b"), Path("c"))
+
+        assert coalescer.drain() == [Change(MOVE, Path("c"), Path("a"))]
+
+    def test_rename_of_new_file_uploads_at_new_name(self):
+        """Test a file written then renamed (atomic save) uploads once."""
+        coalescer = ChangeCoalescer(debounce=0)
+        coalescer.modified(Path("tmp123"))
+        coalescer.moved(Path("tmp123"), Path("report.csv"))
+
+        changes = coalescer.drain()
+
+        assert Change(UPLOAD, Path("report.csv")) in changes
+        assert Change(DELETE, Path("tmp123")) in changes
+
+    def test_busy_paths_wait(self):
+        """Test a path being applied keeps its next change queued."""
+        coalescer = ChangeCoalescer(debounce=0)
+        coalescer.modified(Path("a"))
+        coalescer.moved(Path("x"), Path("b"))
+
+        assert coalescer.drain(busy={Path("a"), Path("x")}) == []
+        assert len(coalescer.drain()) == 2
+
+    def test_tree_delete_replaces_pending_changes_below(self):
+        """Test a deleted directory drops its files' changes but not a source."""
+        coalescer = ChangeCoalescer(debounce=0)
+        coalescer.modified(Path("d/a"))
+        coalescer.moved(Path("b"), Path("d/b"))
+        coalescer.modified(Path("e"))
+        coalescer.deleted_tree(Path("d"))
+
+        assert sorted(coalescer.drain(), key=lambda c: c.path) == [
+            Change(DELETE, Path("b")),
+            Change(DELETE_TREE, Path("d")),
+            Change(UPLOAD, Path("e")),
+        ]
+
+    def test_handler_maps_events(self):
+        """Test watchdog events map to coalescer calls."""
+        coalescer = ChangeCoalescer(debounce=0)
+        handler = _WatchHandler(coalescer, Path("/root"))
+
+        def event(event_type, src, dest="", is_directory=False):
+            return SimpleNamespace(
+                event_type=event_type,
+                src_path=src,
+                dest_path=dest,
+                is_directory=is_directory,
+            )
+
+        handler.dispatch(event("created", "/root/d", is_directory=True))
+        handler.dispatch(event("modified", "/root/a"))
+        handler.dispatch(event("moved", "/root/b", "/root/c"))
+        handler.dispatch(event("moved", "/root/e", "/elsewhere/e"))
+        handler.dispatch(event("deleted", "/root/gone", is_directory=True))
+        handler.dispatch(event("moved", "/root/away", "/elsewhere", is_directory=True))
+
+        assert sorted(coalescer.drain(), key=lambda c: c.path) == [
+            Change(UPLOAD, Path("/root/a")),
+            Change(DELETE_TREE, Path("/root/away")),
+            Change(MOVE, Path("/root/c"), Path("/root/b")),
+            Change(DELETE, Path("/root/e")),
+            Change(DELETE_TREE, Path("/root/gone")),
+        ]
+
+    def test_handler_expands_directory_moves(self, tmp_path):
+        """Test a directory renamed inside the root moves each of its files."""
+        coalescer = ChangeCoalescer(debounce=0)
+        handler = _WatchHandler(coalescer, tmp_path)
+        (tmp_path / "new" / "sub").mkdir(parents=True)
+        (tmp_path / "new" / "sub" / "f").write_bytes(b"f")
+
+        handler.dispatch(
+            SimpleNamespace(
+                event_type="moved",
+                src_path=str(tmp_path / "old"),
+                dest_path=str(tmp_path / "new"),
+                is_directory=True,
+            )
+        )
+
+        assert coalescer.drain() == [
+            Change(MOVE, tmp_path / "new" / "sub" / "f", tmp_path / "old" / "sub" / "f")
+        ]
+
+
+class TestSyncService:
+    """Test one-shot sync and change application."""
+
+    def test_plan_uploads_only_changed_files(self, tmp_path, hash_cache):
+        """Test unchanged files are skipped by size and ETag."""
+        root = tmp_path / "src"
+        (root / "sub").mkdir(parents=True)
+        (root / "same.txt").write_bytes(b"same")
+        (root / "edited.txt").write_bytes(b"new!")
+        (root / "sub" / "added.txt").write_bytes(b"added")
+        s3_service = MemoryS3Service(
+            {
+                "backup/same.txt": b"same",
+                "backup/edited.txt": b"old!",
+                "backup/stale.txt": b"stale",
+                "backup/.packs/pack-1.tar": b"pack",
+            }
+        )
+        service = SyncService(s3_service, root, "backup", hash_cache=hash_cache)
+
+        changes = service.plan(delete=True)
+
+        assert [(c.action, service.key_for(c.path)) for c in changes] == [
+            (UPLOAD, "backup/edited.txt"),
+            (UPLOAD, "backup/sub/added.txt"),
+            (DELETE, "backup/stale.txt"),
+        ]
+
+    def test_plan_against_snapshot(self, tmp_path, hash_cache):
+        """Test a given remote listing is used instead of listing the prefix."""
+        root = tmp_path / "src"
+        root.mkdir()
+        (root / "a.txt").write_bytes(b"a")
+        (root / "b.txt").write_bytes(b"b")
+        s3_service = MemoryS3Service({"backup/a.txt": b"a", "backup/b.txt": b"b"})
+        service = SyncService(s3_service, root, "backup", hash_cache=hash_cache)
+        snapshot = [
+            ObjectEntry(key="backup/a.txt", size=1, mtime=0, etag=etag(b"a")),
+            ObjectEntry(key="backup/gone.txt", size=1, mtime=0, etag=etag(b"x")),
+        ]
+
+        changes = service.plan(delete=True, remote_objects=snapshot)
+
+        assert [(c.action, service.key_for(c.path)) for c in changes] == [
+            (UPLOAD, "backup/b.txt"),
+            (DELETE, "backup/gone.txt"),
+        ]
+
+    def test_sync_applies_plan(self, tmp_path, hash_cache):
+        """Test sync leaves the remote prefix matching the directory."""
+        root = tmp_path / "src"
+        root.mkdir()
+        (root / "a.txt").write_bytes(b"a")
+        s3_service = MemoryS3Service({"old.txt": b"x"})
+        service = SyncService(s3_service, root, hash_cache=hash_cache, max_workers=2)
+
+        assert service.sync(delete=True) == (2, 0)
+        assert s3_service.objects == {"a.txt": b"a"}
+
+    def test_move_falls_back_to_upload(self, tmp_path, hash_cache):
+        """Test a move whose source was never uploaded sends the file."""
+        root = tmp_path / "src"
+        root.mkdir()
+        (root / "b.txt").write_bytes(b"b")
+        s3_service = MemoryS3Service()
+        service = SyncService(s3_service, root, hash_cache=hash_cache)
+
+        assert service.apply(Change(MOVE, root / "b.txt", root / "a.txt")) == (
+            True,
+            "",
+        )
+        assert s3_service.objects == {"b.txt": b"b"}
+
+    def test_tree_delete_removes_prefix(self, tmp_path, hash_cache):
+        """Test a deleted directory's keys go, except files put back since."""
+        root = tmp_path / "src"
+        (root / "d").mkdir(parents=True)
+        (root / "d" / "back.txt").write_bytes(b"b")
+        s3_service = MemoryS3Service(
+            {"d/a.txt": b"a", "d/back.txt": b"b", "d2/x.txt": b"x"}
+        )
+        service = SyncService(s3_service, root, hash_cache=hash_cache)
+
+        assert service.apply(Change(DELETE_TREE, root / "d")) == (True, "")
+        assert sorted(s3_service.objects) == ["d/back.txt", "d2/x.txt"]
+
+    def test_stopping_flushes_debouncing_changes(self, tmp_path, hash_cache):
+        """Test changes still inside the debounce window are applied on stop."""
+        root = tmp_path / "src"
+        root.mkdir()
+        (root / "a.txt").write_bytes(b"a")
+        s3_service = MemoryS3Service()
+        service = SyncService(s3_service, root, hash_cache=hash_cache)
+        coalescer = ChangeCoalescer(debounce=60)
+        coalescer.modified(root / "a.txt")
+        stop = threading.Event()
+        stop.set()
+
+        assert service.apply_changes(coalescer, stop=stop, flush=True) == (1, 0)
+        assert s3_service.objects == {"a.txt": b"a"}
@@ -0,0 +1,135 @@
+"""Tests for the adaptive S3 request limiter."""
+
+import random
+
+import pytest
+from botocore.exceptions import ClientError
+
+from cloud_storage_syncer.core.throttle import AdaptiveLimiter, is_throttle_error
+
+
+def client_error(code: str, status: int) -> ClientError:
+    """Build a botocore ClientError."""
+    return ClientError(
+        {"Error": {"Code": code}, "ResponseMetadata": {"HTTPStatusCode": status}},
+        "PutObject",
+    )
+
+
+class FakeClock:
+    """Manually advanced clock whose sleep advances time."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_limiter(clock: FakeClock, **kwargs) -> AdaptiveLimiter:
+    """Create a limiter driven by the fake clock."""
+    return AdaptiveLimiter(
+        clock=clock.time, sleep=clock.sleep, rng=random.Random(0), **kwargs
+    )
+
+
+class TestAdaptiveLimiter:
+    """Test AdaptiveLimiter."""
+
+    def test_throttle_detection(self):
+        """Test SlowDown and 503 count as throttling, 403 does not."""
+        assert is_throttle_error(client_error("SlowDown", 503))
+        assert is_throttle_error(client_error("ServiceUnavailable", 503))
+        assert not is_throttle_error(client_error("AccessDenied", 403))
+
+    def test_additive_increase_multiplicative_decrease(self):
+        """Test the window grows on success and halves on throttling."""
+        clock = FakeClock()
+        limiter = make_limiter(clock, initial_concurrency=8)
+
+        for _ in range(16):
+            limiter.acquire()
+            limiter.release()
+        assert limiter.concurrency == 9
+
+        # A burst of throttles in the same window is one congestion event
+        limiter.acquire()
+        limiter.acquire()
+        limiter.release(throttled=True)
+        limiter.release(throttled=True)
+        assert limiter.concurrency == 4
+
+    def test_retries_throttled_calls_with_backoff(self):
+        """Test throttled calls are retried after a jittered delay."""
+        clock = FakeClock()
+        limiter = make_limiter(clock, base_delay=0.5)
+        outcomes = [client_error("SlowDown", 503), client_error("SlowDown", 503), "ok"]
+
+        def flaky():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        assert limiter.call(flaky, s3_key="logs/a.txt") == "ok"
+        assert outcomes == []
+        assert 0 <= clock.sleeps[0] <= 0.5
+
+    def test_does_not_retry_permanent_errors(self):
+        """Test non-retryable errors surface immediately."""
+        clock = FakeClock()
+        limiter = make_limiter(clock)
+        calls = []
+
+        def denied():
+            calls.append(1)
+            raise client_error("AccessDenied", 403)
+
+        with pytest.raises(ClientError):
+            limiter.call(denied)
+        assert len(calls) == 1
+
+    def test_gives_up_after_max_attempts(self):
+        """Test retries stop at max_attempts."""
+        clock = FakeClock()
+        limiter = make_limiter(clock, max_attempts=3)
+        calls = []
+
+        def throttled():
+            calls.append(1)
+            raise client_error("SlowDown", 503)
+
+        with pytest.raises(ClientError):
+            limiter.call(throttled)
+        assert len(calls) == 3
+
+    def test_prefix_rate_tracking(self):
+        """Test a throttled prefix is paced and records its sustained rate."""
+        clock = FakeClock()
+        limiter = make_limiter(clock, rate_window=1.0)
+
+        # A clean window of 10 requests/s on the "logs" prefix
+        for i in range(10):
+            clock.now = i / 10
+            limiter.call(lambda: None, s3_key="logs/a")
+        clock.now = 1.0
+        limiter.call(lambda: None, s3_key="logs/a")
+        assert limiter.sustained_rate("logs") == pytest.approx(10.0)
+
+        # Throttling caps the prefix rate, so further requests are paced
+        limiter.acquire("logs")
+        limiter.release("logs", throttled=True)
+        clock.sleeps.clear()
+        for _ in range(5):
+            limiter.call(lambda: None, s3_key="logs/b")
+        assert clock.sleeps
+
+        # Other prefixes are unaffected
+        clock.sleeps.clear()
+        limiter.call(lambda: None, s3_key="images/c")
+        assert clock.sleeps == []
@@ -0,0 +1,80 @@
+"""Tests for in-place storage class transitions."""
+
+import time
+
+from cloud_storage_syncer.models import ObjectEntry, S3StorageClass, UploadResult
+from cloud_storage_syncer.models.storage import RESTORE_DONE
+from cloud_storage_syncer.services.transition_service import TransitionService
+
+DAY = 24 * 3600
+
+
+class FakeS3Service:
+    """Stand-in for S3Service recording in-place copies."""
+
+    def __init__(self, objects):
+        self.objects = objects
+        self.copies = []
+
+    def iter_objects(self, prefix="", max_keys=None, restore_status=False):
+        assert restore_status
+        yield from (obj for obj in self.objects if obj.key.startswith(prefix))
+
+    def copy_object(self, source_key, dest_key, storage_class, source_info):
+        self.copies.append((source_key, dest_key, storage_class, source_info["size"]))
+        if source_key == "logs/locked.log":
+            return UploadResult.error("AWS error (AccessDenied): no")
+        return UploadResult.success(f"s3://b/{dest_key}", storage_class.value)
+
+
+def entry(key, size, age_days, storage_class="STANDARD", restore_status=None):
+    """Build a listing entry modified age_days ago."""
+    mtime = int(time.time() - age_days * DAY)
+    return ObjectEntry(key, size, mtime, '"e"', storage_class, None, restore_status)
+
+
+class TestTransitionService:
+    """Test planning and applying storage class changes."""
+
+    def test_plan_filters(self):
+        """Test size and age filters, unchanged and archived objects."""
+        s3_service = FakeS3Service(
+            [
+                entry("logs/old.log", 500_000, 90),
+                entry("logs/new.log", 500_000, 1),
+                entry("logs/tiny.log", 100, 90),
+                entry("logs/ia.log", 500_000, 90, "STANDARD_IA"),
+                entry("logs/cold.log", 500_000, 90, "GLACIER"),
+                entry("logs/thawed.log", 700_000, 90, "GLACIER", RESTORE_DONE),
+                entry("other/old.log", 500_000, 90),
+            ]
+        )
+        service = TransitionService(s3_service)
+
+        plan = service.plan(
+            "logs", S3StorageClass.STANDARD_IA, min_size=128 * 1024, older_than_days=30
+        )
+
+        assert [obj.key for obj in plan.objects] == ["logs/old.log", "logs/thawed.log"]
+        assert plan.total_bytes == 1_200_000
+        assert plan.unchanged == 1
+        assert plan.archived == ["logs/cold.log"]
+        assert s3_service.copies == []
+
+    def test_apply_copies_in_place(self):
+        """Test each object is copied onto itself and failures are reported."""
+        s3_service = FakeS3Service(
+            [entry(f"logs/{n}.log", n, 90) for n in range(1, 6)]
+            + [entry("logs/locked.log", 9, 90)]
+        )
+        service = TransitionService(s3_service, max_workers=2)
+        plan = service.plan("logs/", S3StorageClass.GLACIER_IR)
+
+        results = service.apply(plan)
+
+        assert sorted(s3_service.copies) == sorted(
+            (obj.key, obj.key, S3StorageClass.GLACIER_IR, obj.size)
+            for obj in plan.objects
+        )
+        assert [r.source_key for r in results] == sorted(obj.key for obj in plan.objects)
+        assert [r.source_key for r in results if not r.success] == ["logs/locked.log"]
@@ -0,0 +1,136 @@
+"""Tests for verifying local directories against S3."""
+
+import base64
+import hashlib
+
+import pytest
+
+from cloud_storage_syncer.models import ObjectEntry
+from cloud_storage_syncer.services.hash_service import HashCache
+from cloud_storage_syncer.services.verify_service import VerifyService
+
+
+def etag(data):
+    return f'"{hashlib.md5(data).hexdigest()}"'
+
+
+def sha256_b64(data):
+    return base64.b64encode(hashlib.sha256(data).digest()).decode()
+
+
+class FakeS3Service:
+    """Stand-in for S3Service answering listings and attribute lookups."""
+
+    def __init__(self, objects):
+        # key -> (body, attributes overrides)
+        self.objects = objects
+        self.attribute_calls = []
+
+    def iter_objects(self, prefix=""):
+        for key, (data, _) in sorted(self.objects.items()):
+            if key.startswith(prefix):
+                yield ObjectEntry(key=key, size=len(data), mtime=0, etag=etag(data))
+
+    def get_object_attributes(self, s3_key):
+        self.attribute_calls.append(s3_key)
+        data, overrides = self.objects[s3_key]
+        attributes = {
+            "size": len(data),
+            "etag": etag(data),
+            "checksums": {"SHA256": sha256_b64(data)},
+            "checksum_type": "FULL_OBJECT",
+            "parts": 0,
+            "part_size": None,
+        }
+        attributes.update(overrides)
+        return attributes
+
+
+@pytest.fixture
+def hash_cache(tmp_path):
+    """Hash cache in a temporary database."""
+    cache = HashCache(tmp_path / "hashes.db")
+    yield cache
+    cache.close()
+
+
+class TestVerifyService:
+    """Test checksum comparison of local trees and prefixes."""
+
+    def test_reports_every_category(self, tmp_path, hash_cache):
+        """Test matches, mismatches, missing and extra keys are separated."""
+        root = tmp_path / "src"
+        (root / "sub").mkdir(parents=True)
+        (root / "same.txt").write_bytes(b"same")
+        (root / "sub" / "changed.txt").write_bytes(b"new!")
+        (root / "resized.txt").write_bytes(b"short")
+        (root / "local-only.txt").write_bytes(b"x")
+        s3_service = FakeS3Service(
+            {
+                "backup/same.txt": (b"same", {}),
+                "backup/sub/changed.txt": (b"old!", {}),
+                "backup/resized.txt": (b"longer", {}),
+                "backup/remote-only.txt": (b"y", {}),
+                "backup/.packs/pack-1.tar": (b"pack", {}),
+            }
+        )
+
+        result = VerifyService(s3_service, hash_cache).verify(root, "backup")
+
+        assert result.matched == ["backup/same.txt"]
+        assert result.mismatched == [
+            ("backup/resized.txt", "size 6 != local 5"),
+            ("backup/sub/changed.txt", "SHA256 differs"),
+        ]
+        assert result.missing == ["backup/local-only.txt"]
+        assert result.extra == ["backup/remote-only.txt"]
+        assert not result.ok
+        # Size mismatches are settled by the listing alone
+        assert "backup/resized.txt" not in s3_service.attribute_calls
+
+    def test_composite_checksum_uses_reported_part_size(self, tmp_path, hash_cache):
+        """Test multipart checksums are recomputed with the object's parts."""
+        root = tmp_path / "src"
+        root.mkdir()
+        data = b"abcdefghij"
+        (root / "big.bin").write_bytes(data)
+        parts = [data[0:4], data[4:8], data[8:10]]
+        composite = base64.b64encode(
+            hashlib.sha256(b"".join(hashlib.sha256(p).digest() for p in parts)).digest()
+        ).decode()
+        s3_service = FakeS3Service(
+            {
+                "big.bin": (
+                    data,
+                    {
+                        "checksums": {"SHA256": composite},
+                        "checksum_type": "COMPOSITE",
+                        "parts": 3,
+                        "part_size": 4,
+                    },
+                )
+            }
+        )
+
+        result = VerifyService(s3_service, hash_cache).verify(root)
+
+        assert result.matched == ["big.bin"]
+        assert result.ok
+
+    def test_falls_back_to_etag(self, tmp_path, hash_cache):
+        """Test objects without a usable checksum are compared by ETag."""
+        root = tmp_path / "src"
+        root.mkdir()
+        (root / "a.txt").write_bytes(b"a")
+        (root / "b.txt").write_bytes(b"b")
+        s3_service = FakeS3Service(
+            {
+                "a.txt": (b"a", {"checksums": {"CRC64NVME": "AAAAAAAAAAA="}}),
+                "b.txt": (b"b", {"checksums": {}, "etag": etag(b"other")}),
+            }
+        )
+
+        result = VerifyService(s3_service, hash_cache).verify(root)
+
+        assert result.matched == ["a.txt"]
+        assert result.mismatched == [("b.txt", "ETag differs")]